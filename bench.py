@@ -0,0 +1,105 @@
+import base64
+import json
+import os
+import subprocess
+import sys
+import timeit
+
+from chrome_control import DOM, Input, Page
+from chrome_control.chrome import method_name
+from chrome_control.codec import JSONCodec, OrjsonCodec, orjson
+
+# how params were serialized before the generated to_wire methods, kept
+# around to compare against
+class ReflectionEncoder(json.JSONEncoder):
+    def default(self, obj):
+        if isinstance(obj, (str, int, float, list, bool, dict)):
+            return json.JSONEncoder.default(self, obj)
+        attrs = [x for x in dir(obj) if not x.startswith('_') and x != 'to_wire']
+        return {key: getattr(obj, key) for key in attrs if getattr(obj, key) is not None}
+
+def report(name, n, seconds):
+    print(f'{name:<50} {n / seconds:>12,.0f} msgs/sec')
+
+def bench_encode(n=100000):
+    cmds = {
+        "Input.dispatchMouseEvent": Input.dispatchMouseEvent("mouseMoved", 100, 200, modifiers=0, button="none"),
+        "Page.screencastFrameAck": Page.screencastFrameAck(1),
+    }
+    for name, cmd in cmds.items():
+        def reflection():
+            return json.dumps({"id": 1, "method": method_name(cmd), "params": cmd}, cls=ReflectionEncoder)
+        def to_wire():
+            return json.dumps({"id": 1, "method": method_name(cmd), "params": cmd.to_wire()})
+
+        assert json.loads(reflection()) == json.loads(to_wire())
+        report(f'{name} (dir/getattr)', n, timeit.timeit(reflection, number=n))
+        report(f'{name} (to_wire)', n, timeit.timeit(to_wire, number=n))
+
+def dom_node(node_id, depth, breadth):
+    node = {"nodeId": node_id, "backendNodeId": node_id, "nodeType": 1, "nodeName": "DIV",
+            "localName": "div", "nodeValue": "", "attributes": ["class", f"node-{node_id}"]}
+    if depth:
+        node["childNodeCount"] = breadth
+        node["children"] = [dom_node(node_id * breadth + i, depth - 1, breadth) for i in range(breadth)]
+    return node
+
+def bench_codec(n=20):
+    # a DOM.getDocument(depth=-1) reply with ~56k nodes, and a 2MB screenshot
+    frames = {
+        "DOM.getDocument": json.dumps({"id": 1, "result": {"root": dom_node(1, 5, 8)}}).encode(),
+        "Page.captureScreenshot": json.dumps({"id": 1, "result": {"data": base64.b64encode(os.urandom(1500000)).decode()}}).encode(),
+    }
+    codecs = [JSONCodec()] + ([OrjsonCodec()] if orjson is not None else [])
+    for name, frame in frames.items():
+        for codec in codecs:
+            seconds = timeit.timeit(lambda: codec.loads(frame), number=n)
+            report(f'{name} {len(frame) >> 10}KB ({codec.__class__.__name__})', n, seconds)
+
+def walk(node):
+    # read a few fields of every node, as code that wants the whole tree would
+    node.nodeName, node.attributes, node.pseudoType
+    n = 1
+    for child in node.children or ():
+        n += walk(child)
+    return n
+
+def walk_dict(node):
+    node["nodeName"], node["attributes"], node.get("pseudoType")
+    n = 1
+    for child in node.get("children", ()):
+        n += walk_dict(child)
+    return n
+
+def bench_decode(n=5):
+    # a DOM.getDocument(depth=-1) reply with ~54k nodes
+    reply = {"root": dom_node(1, 4, 15)}
+    nodes = walk_dict(reply["root"])
+    decoders = {
+        "dicts": lambda: walk_dict(reply["root"]),
+        "lazy decode": lambda: walk(DOM.getDocumentResult(reply).root),
+        "from_wire": lambda: walk(DOM.Node.from_wire(reply["root"])),
+    }
+    for name, decoder in decoders.items():
+        assert decoder() == nodes
+        seconds = timeit.timeit(decoder, number=n)
+        print(f'{f"DOM.getDocument {nodes} nodes ({name})":<50} {nodes * n / seconds:>12,.0f} nodes/sec')
+
+def bench_import(n=20):
+    # each import is timed in a fresh interpreter, so nothing is cached
+    statements = {
+        "python": "pass",
+        "import chrome_control": "import chrome_control",
+        "from chrome_control import Page, Runtime": "from chrome_control import Page, Runtime",
+        # what `import chrome_control` used to do
+        "every domain, and Chrome": "import chrome_control as c; [getattr(c, d) for d in c._domains]; c.Chrome",
+    }
+    for name, statement in statements.items():
+        seconds = timeit.timeit(lambda: subprocess.run([sys.executable, "-c", statement], check=True), number=n)
+        print(f'{name:<50} {seconds / n * 1000:>12.1f} ms')
+
+if __name__ == "__main__":
+    bench_encode()
+    bench_codec()
+    bench_decode()
+    bench_import()
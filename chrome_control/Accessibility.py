@@ -1,9 +1,11 @@
+# schema hash: b8aad9044731ee8943810bbb1354d32756bb1d13
 from enum import Enum
-from typing import Any, List
+from typing import TYPE_CHECKING, Any, List
 
-from .base import ChromeCommand
+from .base import ChromeCommand, ChromeEvent, ChromeResult, ChromeType, encode, resolve
 
-from . import DOM
+if TYPE_CHECKING:
+    from . import DOM
 
 # Unique accessibility node identifier.
 AXNodeId = str
@@ -17,9 +19,76 @@ AXValueSourceType.__doc__ = """Enum of possible property sources."""
 AXValueNativeSourceType = Enum("AXValueNativeSourceType", "figcaption label labelfor labelwrapped legend tablecaption title other")
 AXValueNativeSourceType.__doc__ = """Enum of possible native property sources (as a subtype of a particular AXValueSourceType)."""
 
-class AXValueSource:
+class AXRelatedNode(ChromeType):
+    _fields = ('backendDOMNodeId', 'idref', 'text')
+    __slots__ = _fields
+
+    def __init__(self, backendDOMNodeId: "DOM.BackendNodeId", idref: str=None, text: str=None):
+        # The BackendNodeId of the related DOM node.
+        self.backendDOMNodeId = backendDOMNodeId
+        # The IDRef value provided, if any.
+        self.idref = idref
+        # The text alternative of this node in the current context.
+        self.text = text
+
+    def to_wire(self):
+        wire = {"backendDOMNodeId": self.backendDOMNodeId}
+        if self.idref is not None:
+            wire["idref"] = self.idref
+        if self.text is not None:
+            wire["text"] = self.text
+        return wire
+
+    @classmethod
+    def from_wire(cls, wire: dict):
+        obj = cls.__new__(cls)
+        obj.backendDOMNodeId = wire["backendDOMNodeId"]
+        obj.idref = wire.get("idref")
+        obj.text = wire.get("text")
+        return obj
+
+class AXValue(ChromeType):
+    """A single computed AX property."""
+    _fields = ('type', 'value', 'relatedNodes', 'sources')
+    __slots__ = _fields
+    _types = {'type': AXValueType, 'relatedNodes': [AXRelatedNode], 'sources': ['Accessibility.AXValueSource']}
+
+    def __init__(self, type: AXValueType, value: Any=None, relatedNodes: List=None, sources: List=None):
+        # The type of this value.
+        self.type = type
+        # The computed value of this property.
+        self.value = value
+        # One or more related nodes, if applicable.
+        self.relatedNodes = relatedNodes
+        # The sources which contributed to the computation of this property.
+        self.sources = sources
+
+    def to_wire(self):
+        wire = {"type": encode(self.type)}
+        if self.value is not None:
+            wire["value"] = self.value
+        if self.relatedNodes is not None:
+            wire["relatedNodes"] = encode(self.relatedNodes)
+        if self.sources is not None:
+            wire["sources"] = encode(self.sources)
+        return wire
+
+    @classmethod
+    def from_wire(cls, wire: dict):
+        obj = cls.__new__(cls)
+        obj.type = AXValueType.__members__.get(wire["type"], wire["type"])
+        obj.value = wire.get("value")
+        obj.relatedNodes = [AXRelatedNode.from_wire(x0) for x0 in wire["relatedNodes"]] if "relatedNodes" in wire else None
+        obj.sources = [AXValueSource.from_wire(x0) for x0 in wire["sources"]] if "sources" in wire else None
+        return obj
+
+class AXValueSource(ChromeType):
     """A single source for a computed AX property."""
-    def __init__(self, type: "AXValueSourceType", value: "AXValue"=None, attribute: str=None, attributeValue: "AXValue"=None, superseded: bool=None, nativeSource: "AXValueNativeSourceType"=None, nativeSourceValue: "AXValue"=None, invalid: bool=None, invalidReason: str=None):
+    _fields = ('type', 'value', 'attribute', 'attributeValue', 'superseded', 'nativeSource', 'nativeSourceValue', 'invalid', 'invalidReason')
+    __slots__ = _fields
+    _types = {'type': AXValueSourceType, 'value': AXValue, 'attributeValue': AXValue, 'nativeSource': AXValueNativeSourceType, 'nativeSourceValue': AXValue}
+
+    def __init__(self, type: AXValueSourceType, value: AXValue=None, attribute: str=None, attributeValue: AXValue=None, superseded: bool=None, nativeSource: AXValueNativeSourceType=None, nativeSourceValue: AXValue=None, invalid: bool=None, invalidReason: str=None):
         # What type of source this is.
         self.type = type
         # The value of this property source.
@@ -39,33 +108,61 @@ class AXValueSource:
         # Reason for the value being invalid, if it is.
         self.invalidReason = invalidReason
 
-class AXRelatedNode:
-    def __init__(self, backendDOMNodeId: "DOM.BackendNodeId", idref: str=None, text: str=None):
-        # The BackendNodeId of the related DOM node.
-        self.backendDOMNodeId = backendDOMNodeId
-        # The IDRef value provided, if any.
-        self.idref = idref
-        # The text alternative of this node in the current context.
-        self.text = text
+    def to_wire(self):
+        wire = {"type": encode(self.type)}
+        if self.value is not None:
+            wire["value"] = encode(self.value)
+        if self.attribute is not None:
+            wire["attribute"] = self.attribute
+        if self.attributeValue is not None:
+            wire["attributeValue"] = encode(self.attributeValue)
+        if self.superseded is not None:
+            wire["superseded"] = self.superseded
+        if self.nativeSource is not None:
+            wire["nativeSource"] = encode(self.nativeSource)
+        if self.nativeSourceValue is not None:
+            wire["nativeSourceValue"] = encode(self.nativeSourceValue)
+        if self.invalid is not None:
+            wire["invalid"] = self.invalid
+        if self.invalidReason is not None:
+            wire["invalidReason"] = self.invalidReason
+        return wire
+
+    @classmethod
+    def from_wire(cls, wire: dict):
+        obj = cls.__new__(cls)
+        obj.type = AXValueSourceType.__members__.get(wire["type"], wire["type"])
+        obj.value = AXValue.from_wire(wire["value"]) if "value" in wire else None
+        obj.attribute = wire.get("attribute")
+        obj.attributeValue = AXValue.from_wire(wire["attributeValue"]) if "attributeValue" in wire else None
+        obj.superseded = wire.get("superseded")
+        obj.nativeSource = AXValueNativeSourceType.__members__.get(wire["nativeSource"], wire["nativeSource"]) if "nativeSource" in wire else None
+        obj.nativeSourceValue = AXValue.from_wire(wire["nativeSourceValue"]) if "nativeSourceValue" in wire else None
+        obj.invalid = wire.get("invalid")
+        obj.invalidReason = wire.get("invalidReason")
+        return obj
+
+class AXProperty(ChromeType):
+    _fields = ('name', 'value')
+    __slots__ = _fields
+    _types = {'value': AXValue}
 
-class AXProperty:
-    def __init__(self, name: str, value: "AXValue"):
+    def __init__(self, name: str, value: AXValue):
         # The name of this property.
         self.name = name
         # The value of this property.
         self.value = value
 
-class AXValue:
-    """A single computed AX property."""
-    def __init__(self, type: "AXValueType", value: Any=None, relatedNodes: List=None, sources: List=None):
-        # The type of this value.
-        self.type = type
-        # The computed value of this property.
-        self.value = value
-        # One or more related nodes, if applicable.
-        self.relatedNodes = relatedNodes
-        # The sources which contributed to the computation of this property.
-        self.sources = sources
+    def to_wire(self):
+        wire = {"name": self.name, "value": encode(self.value)}
+        return wire
+
+    @classmethod
+    def from_wire(cls, wire: dict):
+        obj = cls.__new__(cls)
+        obj.name = wire["name"]
+        obj.value = AXValue.from_wire(wire["value"])
+        return obj
 
 AXGlobalStates = Enum("AXGlobalStates", "disabled hidden hiddenRoot invalid")
 AXGlobalStates.__doc__ = """States which apply to every AX node."""
@@ -82,9 +179,13 @@ AXWidgetStates.__doc__ = """States which apply to widgets."""
 AXRelationshipAttributes = Enum("AXRelationshipAttributes", "activedescendant flowto controls describedby labelledby owns")
 AXRelationshipAttributes.__doc__ = """Relationships between elements other than parent/child/sibling."""
 
-class AXNode:
+class AXNode(ChromeType):
     """A node in the accessibility tree."""
-    def __init__(self, nodeId: "AXNodeId", ignored: bool, ignoredReasons: List=None, role: "AXValue"=None, name: "AXValue"=None, description: "AXValue"=None, value: "AXValue"=None, properties: List=None, childIds: List=None, backendDOMNodeId: "DOM.BackendNodeId"=None):
+    _fields = ('nodeId', 'ignored', 'ignoredReasons', 'role', 'name', 'description', 'value', 'properties', 'childIds', 'backendDOMNodeId')
+    __slots__ = _fields
+    _types = {'ignoredReasons': [AXProperty], 'role': AXValue, 'name': AXValue, 'description': AXValue, 'value': AXValue, 'properties': [AXProperty]}
+
+    def __init__(self, nodeId: AXNodeId, ignored: bool, ignoredReasons: List=None, role: AXValue=None, name: AXValue=None, description: AXValue=None, value: AXValue=None, properties: List=None, childIds: List=None, backendDOMNodeId: "DOM.BackendNodeId"=None):
         # Unique identifier for this node.
         self.nodeId = nodeId
         # Whether this node is ignored for accessibility
@@ -106,8 +207,53 @@ class AXNode:
         # The backend ID for the associated DOM node, if any.
         self.backendDOMNodeId = backendDOMNodeId
 
+    def to_wire(self):
+        wire = {"nodeId": self.nodeId, "ignored": self.ignored}
+        if self.ignoredReasons is not None:
+            wire["ignoredReasons"] = encode(self.ignoredReasons)
+        if self.role is not None:
+            wire["role"] = encode(self.role)
+        if self.name is not None:
+            wire["name"] = encode(self.name)
+        if self.description is not None:
+            wire["description"] = encode(self.description)
+        if self.value is not None:
+            wire["value"] = encode(self.value)
+        if self.properties is not None:
+            wire["properties"] = encode(self.properties)
+        if self.childIds is not None:
+            wire["childIds"] = self.childIds
+        if self.backendDOMNodeId is not None:
+            wire["backendDOMNodeId"] = self.backendDOMNodeId
+        return wire
+
+    @classmethod
+    def from_wire(cls, wire: dict):
+        obj = cls.__new__(cls)
+        obj.nodeId = wire["nodeId"]
+        obj.ignored = wire["ignored"]
+        obj.ignoredReasons = [AXProperty.from_wire(x0) for x0 in wire["ignoredReasons"]] if "ignoredReasons" in wire else None
+        obj.role = AXValue.from_wire(wire["role"]) if "role" in wire else None
+        obj.name = AXValue.from_wire(wire["name"]) if "name" in wire else None
+        obj.description = AXValue.from_wire(wire["description"]) if "description" in wire else None
+        obj.value = AXValue.from_wire(wire["value"]) if "value" in wire else None
+        obj.properties = [AXProperty.from_wire(x0) for x0 in wire["properties"]] if "properties" in wire else None
+        obj.childIds = wire.get("childIds")
+        obj.backendDOMNodeId = wire.get("backendDOMNodeId")
+        return obj
+
+class getPartialAXTreeResult(ChromeResult):
+    __slots__ = ()
+    _fields = ('nodes',)
+    # The <code>Accessibility.AXNode</code> for this DOM node, if it exists, plus its ancestors, siblings and children, if requested.
+    nodes: List
+    _types = {'nodes': [AXNode]}
+
 class getPartialAXTree(ChromeCommand):
     """Fetches the accessibility node and partial accessibility tree for this DOM node, if it exists."""
+    _fields = ('nodeId', 'fetchRelatives')
+    __slots__ = _fields
+    _result = getPartialAXTreeResult
 
     def __init__(self, nodeId: "DOM.NodeId", fetchRelatives: bool=None):
         # ID of node to get the partial accessibility tree for.
@@ -115,5 +261,11 @@ class getPartialAXTree(ChromeCommand):
         # Whether to fetch this nodes ancestors, siblings and children. Defaults to true.
         self.fetchRelatives = fetchRelatives
 
+    def to_wire(self):
+        wire = {"nodeId": self.nodeId}
+        if self.fetchRelatives is not None:
+            wire["fetchRelatives"] = self.fetchRelatives
+        return wire
+
 
 
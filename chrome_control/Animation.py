@@ -1,37 +1,67 @@
+# schema hash: d0e27170665295df8c4ae1bc5e62b756acc7546a
 from enum import Enum
-from typing import Any, List
+from typing import TYPE_CHECKING, Any, List
 
-from .base import ChromeCommand
+from .base import ChromeCommand, ChromeEvent, ChromeResult, ChromeType, encode, resolve
 
-from . import DOM
+if TYPE_CHECKING:
+    from . import DOM
+    from . import Runtime
 
-class Animation:
-    """Animation instance."""
-    def __init__(self, id: str, name: str, pausedState: bool, playState: str, playbackRate: float, startTime: float, currentTime: float, source: "AnimationEffect", type: str, cssId: str=None):
-        # <code>Animation</code>'s id.
-        self.id = id
-        # <code>Animation</code>'s name.
+class KeyframeStyle(ChromeType):
+    """Keyframe Style"""
+    _fields = ('offset', 'easing')
+    __slots__ = _fields
+
+    def __init__(self, offset: str, easing: str):
+        # Keyframe's time offset.
+        self.offset = offset
+        # <code>AnimationEffect</code>'s timing function.
+        self.easing = easing
+
+    def to_wire(self):
+        wire = {"offset": self.offset, "easing": self.easing}
+        return wire
+
+    @classmethod
+    def from_wire(cls, wire: dict):
+        obj = cls.__new__(cls)
+        obj.offset = wire["offset"]
+        obj.easing = wire["easing"]
+        return obj
+
+class KeyframesRule(ChromeType):
+    """Keyframes Rule"""
+    _fields = ('keyframes', 'name')
+    __slots__ = _fields
+    _types = {'keyframes': [KeyframeStyle]}
+
+    def __init__(self, keyframes: List, name: str=None):
+        # List of animation keyframes.
+        self.keyframes = keyframes
+        # CSS keyframed animation's name.
         self.name = name
-        # <code>Animation</code>'s internal paused state.
-        self.pausedState = pausedState
-        # <code>Animation</code>'s play state.
-        self.playState = playState
-        # <code>Animation</code>'s playback rate.
-        self.playbackRate = playbackRate
-        # <code>Animation</code>'s start time.
-        self.startTime = startTime
-        # <code>Animation</code>'s current time.
-        self.currentTime = currentTime
-        # <code>Animation</code>'s source animation node.
-        self.source = source
-        # Animation type of <code>Animation</code>.
-        self.type = type
-        # A unique ID for <code>Animation</code> representing the sources that triggered this CSS animation/transition.
-        self.cssId = cssId
 
-class AnimationEffect:
+    def to_wire(self):
+        wire = {"keyframes": encode(self.keyframes)}
+        if self.name is not None:
+            wire["name"] = self.name
+        return wire
+
+    @classmethod
+    def from_wire(cls, wire: dict):
+        obj = cls.__new__(cls)
+        obj.keyframes = [KeyframeStyle.from_wire(x0) for x0 in wire["keyframes"]]
+        obj.name = wire.get("name")
+        return obj
+
+class AnimationEffect(ChromeType):
     """AnimationEffect instance"""
-    def __init__(self, delay: float, endDelay: float, iterationStart: float, iterations: float, duration: float, direction: str, fill: str, backendNodeId: "DOM.BackendNodeId", easing: str, keyframesRule: "KeyframesRule"=None):
+    _fields = ('delay', 'endDelay', 'iterationStart', 'iterations', 'duration', 'direction', 'fill', 'backendNodeId', 'easing', 'keyframesRule')
+    __slots__ = _fields
+    _types = {'keyframesRule': KeyframesRule}
+
+    def __init__(self, delay: float, endDelay: float, iterationStart: float, iterations: float, duration: float, direction: str, fill: str, backendNodeId: "DOM.BackendNodeId", easing: str, keyframesRule: KeyframesRule=None):
         # <code>AnimationEffect</code>'s delay.
         self.delay = delay
         # <code>AnimationEffect</code>'s end delay.
@@ -53,57 +83,145 @@ class AnimationEffect:
         # <code>AnimationEffect</code>'s keyframes.
         self.keyframesRule = keyframesRule
 
-class KeyframesRule:
-    """Keyframes Rule"""
-    def __init__(self, keyframes: List, name: str=None):
-        # List of animation keyframes.
-        self.keyframes = keyframes
-        # CSS keyframed animation's name.
+    def to_wire(self):
+        wire = {"delay": self.delay, "endDelay": self.endDelay, "iterationStart": self.iterationStart, "iterations": self.iterations, "duration": self.duration, "direction": self.direction, "fill": self.fill, "backendNodeId": self.backendNodeId, "easing": self.easing}
+        if self.keyframesRule is not None:
+            wire["keyframesRule"] = encode(self.keyframesRule)
+        return wire
+
+    @classmethod
+    def from_wire(cls, wire: dict):
+        obj = cls.__new__(cls)
+        obj.delay = wire["delay"]
+        obj.endDelay = wire["endDelay"]
+        obj.iterationStart = wire["iterationStart"]
+        obj.iterations = wire["iterations"]
+        obj.duration = wire["duration"]
+        obj.direction = wire["direction"]
+        obj.fill = wire["fill"]
+        obj.backendNodeId = wire["backendNodeId"]
+        obj.easing = wire["easing"]
+        obj.keyframesRule = KeyframesRule.from_wire(wire["keyframesRule"]) if "keyframesRule" in wire else None
+        return obj
+
+class Animation(ChromeType):
+    """Animation instance."""
+    _fields = ('id', 'name', 'pausedState', 'playState', 'playbackRate', 'startTime', 'currentTime', 'source', 'type', 'cssId')
+    __slots__ = _fields
+    _types = {'source': AnimationEffect}
+
+    def __init__(self, id: str, name: str, pausedState: bool, playState: str, playbackRate: float, startTime: float, currentTime: float, source: AnimationEffect, type: str, cssId: str=None):
+        # <code>Animation</code>'s id.
+        self.id = id
+        # <code>Animation</code>'s name.
         self.name = name
+        # <code>Animation</code>'s internal paused state.
+        self.pausedState = pausedState
+        # <code>Animation</code>'s play state.
+        self.playState = playState
+        # <code>Animation</code>'s playback rate.
+        self.playbackRate = playbackRate
+        # <code>Animation</code>'s start time.
+        self.startTime = startTime
+        # <code>Animation</code>'s current time.
+        self.currentTime = currentTime
+        # <code>Animation</code>'s source animation node.
+        self.source = source
+        # Animation type of <code>Animation</code>.
+        self.type = type
+        # A unique ID for <code>Animation</code> representing the sources that triggered this CSS animation/transition.
+        self.cssId = cssId
 
-class KeyframeStyle:
-    """Keyframe Style"""
-    def __init__(self, offset: str, easing: str):
-        # Keyframe's time offset.
-        self.offset = offset
-        # <code>AnimationEffect</code>'s timing function.
-        self.easing = easing
+    def to_wire(self):
+        wire = {"id": self.id, "name": self.name, "pausedState": self.pausedState, "playState": self.playState, "playbackRate": self.playbackRate, "startTime": self.startTime, "currentTime": self.currentTime, "source": encode(self.source), "type": self.type}
+        if self.cssId is not None:
+            wire["cssId"] = self.cssId
+        return wire
+
+    @classmethod
+    def from_wire(cls, wire: dict):
+        obj = cls.__new__(cls)
+        obj.id = wire["id"]
+        obj.name = wire["name"]
+        obj.pausedState = wire["pausedState"]
+        obj.playState = wire["playState"]
+        obj.playbackRate = wire["playbackRate"]
+        obj.startTime = wire["startTime"]
+        obj.currentTime = wire["currentTime"]
+        obj.source = AnimationEffect.from_wire(wire["source"])
+        obj.type = wire["type"]
+        obj.cssId = wire.get("cssId")
+        return obj
 
 class enable(ChromeCommand):
     """Enables animation domain notifications."""
+    _fields = ()
+    __slots__ = _fields
 
     def __init__(self): pass
 
 class disable(ChromeCommand):
     """Disables animation domain notifications."""
+    _fields = ()
+    __slots__ = _fields
 
     def __init__(self): pass
 
+class getPlaybackRateResult(ChromeResult):
+    __slots__ = ()
+    _fields = ('playbackRate',)
+    # Playback rate for animations on page.
+    playbackRate: float
+
 class getPlaybackRate(ChromeCommand):
     """Gets the playback rate of the document timeline."""
+    _fields = ()
+    __slots__ = _fields
+    _result = getPlaybackRateResult
 
     def __init__(self): pass
 
 class setPlaybackRate(ChromeCommand):
     """Sets the playback rate of the document timeline."""
+    _fields = ('playbackRate',)
+    __slots__ = _fields
 
     def __init__(self, playbackRate: float):
         # Playback rate for animations on page
         self.playbackRate = playbackRate
 
+    def to_wire(self):
+        wire = {"playbackRate": self.playbackRate}
+        return wire
+
+
 
+class getCurrentTimeResult(ChromeResult):
+    __slots__ = ()
+    _fields = ('currentTime',)
+    # Current time of the page.
+    currentTime: float
 
 class getCurrentTime(ChromeCommand):
     """Returns the current time of the an animation."""
+    _fields = ('id',)
+    __slots__ = _fields
+    _result = getCurrentTimeResult
 
     def __init__(self, id: str):
         # Id of animation.
         self.id = id
 
+    def to_wire(self):
+        wire = {"id": self.id}
+        return wire
+
 
 
 class setPaused(ChromeCommand):
     """Sets the paused state of a set of animations."""
+    _fields = ('animations', 'paused')
+    __slots__ = _fields
 
     def __init__(self, animations: List, paused: bool):
         # Animations to set the pause state of.
@@ -111,10 +229,16 @@ class setPaused(ChromeCommand):
         # Paused state to set to.
         self.paused = paused
 
+    def to_wire(self):
+        wire = {"animations": self.animations, "paused": self.paused}
+        return wire
+
 
 
 class setTiming(ChromeCommand):
     """Sets the timing of an animation node."""
+    _fields = ('animationId', 'duration', 'delay')
+    __slots__ = _fields
 
     def __init__(self, animationId: str, duration: float, delay: float):
         # Animation id.
@@ -124,10 +248,16 @@ class setTiming(ChromeCommand):
         # Delay of the animation.
         self.delay = delay
 
+    def to_wire(self):
+        wire = {"animationId": self.animationId, "duration": self.duration, "delay": self.delay}
+        return wire
+
 
 
 class seekAnimations(ChromeCommand):
     """Seek a set of animations to a particular time within each animation."""
+    _fields = ('animations', 'currentTime')
+    __slots__ = _fields
 
     def __init__(self, animations: List, currentTime: float):
         # List of animation ids to seek.
@@ -135,23 +265,69 @@ class seekAnimations(ChromeCommand):
         # Set the current time of each animation.
         self.currentTime = currentTime
 
+    def to_wire(self):
+        wire = {"animations": self.animations, "currentTime": self.currentTime}
+        return wire
+
 
 
 class releaseAnimations(ChromeCommand):
     """Releases a set of animations to no longer be manipulated."""
+    _fields = ('animations',)
+    __slots__ = _fields
 
     def __init__(self, animations: List):
         # List of animation ids to seek.
         self.animations = animations
 
+    def to_wire(self):
+        wire = {"animations": self.animations}
+        return wire
+
 
 
+class resolveAnimationResult(ChromeResult):
+    __slots__ = ()
+    _fields = ('remoteObject',)
+    # Corresponding remote object.
+    remoteObject: "Runtime.RemoteObject"
+    _types = {'remoteObject': 'Runtime.RemoteObject'}
+
 class resolveAnimation(ChromeCommand):
     """Gets the remote object of the Animation."""
+    _fields = ('animationId',)
+    __slots__ = _fields
+    _result = resolveAnimationResult
 
     def __init__(self, animationId: str):
         # Animation id.
         self.animationId = animationId
 
-
+    def to_wire(self):
+        wire = {"animationId": self.animationId}
+        return wire
+
+
+
+class animationCreated(ChromeEvent):
+    """Event for each animation that has been created."""
+    __slots__ = ()
+    _fields = ('id',)
+    # Id of the animation that was created.
+    id: str
+
+class animationStarted(ChromeEvent):
+    """Event for animation that has been started."""
+    __slots__ = ()
+    _fields = ('animation',)
+    # Animation that was started.
+    animation: Animation
+    _types = {'animation': Animation}
+
+class animationCanceled(ChromeEvent):
+    """Event for when an animation has been cancelled."""
+    __slots__ = ()
+    _fields = ('id',)
+    # Id of the animation that was cancelled.
+    id: str
 
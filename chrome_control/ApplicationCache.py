@@ -1,12 +1,17 @@
+# schema hash: 649ee3fbc08ce22534c3bb543fef21a234b089cc
 from enum import Enum
-from typing import Any, List
+from typing import TYPE_CHECKING, Any, List
 
-from .base import ChromeCommand
+from .base import ChromeCommand, ChromeEvent, ChromeResult, ChromeType, encode, resolve
 
-from . import Page
+if TYPE_CHECKING:
+    from . import Page
 
-class ApplicationCacheResource:
+class ApplicationCacheResource(ChromeType):
     """Detailed application cache resource information."""
+    _fields = ('url', 'size', 'type')
+    __slots__ = _fields
+
     def __init__(self, url: str, size: int, type: str):
         # Resource url.
         self.url = url
@@ -15,8 +20,24 @@ class ApplicationCacheResource:
         # Resource type.
         self.type = type
 
-class ApplicationCache:
+    def to_wire(self):
+        wire = {"url": self.url, "size": self.size, "type": self.type}
+        return wire
+
+    @classmethod
+    def from_wire(cls, wire: dict):
+        obj = cls.__new__(cls)
+        obj.url = wire["url"]
+        obj.size = wire["size"]
+        obj.type = wire["type"]
+        return obj
+
+class ApplicationCache(ChromeType):
     """Detailed application cache information."""
+    _fields = ('manifestURL', 'size', 'creationTime', 'updateTime', 'resources')
+    __slots__ = _fields
+    _types = {'resources': [ApplicationCacheResource]}
+
     def __init__(self, manifestURL: str, size: float, creationTime: float, updateTime: float, resources: List):
         # Manifest URL.
         self.manifestURL = manifestURL
@@ -29,8 +50,25 @@ class ApplicationCache:
         # Application cache resources.
         self.resources = resources
 
-class FrameWithManifest:
+    def to_wire(self):
+        wire = {"manifestURL": self.manifestURL, "size": self.size, "creationTime": self.creationTime, "updateTime": self.updateTime, "resources": encode(self.resources)}
+        return wire
+
+    @classmethod
+    def from_wire(cls, wire: dict):
+        obj = cls.__new__(cls)
+        obj.manifestURL = wire["manifestURL"]
+        obj.size = wire["size"]
+        obj.creationTime = wire["creationTime"]
+        obj.updateTime = wire["updateTime"]
+        obj.resources = [ApplicationCacheResource.from_wire(x0) for x0 in wire["resources"]]
+        return obj
+
+class FrameWithManifest(ChromeType):
     """Frame identifier - manifest URL pair."""
+    _fields = ('frameId', 'manifestURL', 'status')
+    __slots__ = _fields
+
     def __init__(self, frameId: "Page.FrameId", manifestURL: str, status: int):
         # Frame identifier.
         self.frameId = frameId
@@ -39,31 +77,97 @@ class FrameWithManifest:
         # Application cache status.
         self.status = status
 
+    def to_wire(self):
+        wire = {"frameId": self.frameId, "manifestURL": self.manifestURL, "status": self.status}
+        return wire
+
+    @classmethod
+    def from_wire(cls, wire: dict):
+        obj = cls.__new__(cls)
+        obj.frameId = wire["frameId"]
+        obj.manifestURL = wire["manifestURL"]
+        obj.status = wire["status"]
+        return obj
+
+class getFramesWithManifestsResult(ChromeResult):
+    __slots__ = ()
+    _fields = ('frameIds',)
+    # Array of frame identifiers with manifest urls for each frame containing a document associated with some application cache.
+    frameIds: List
+    _types = {'frameIds': [FrameWithManifest]}
+
 class getFramesWithManifests(ChromeCommand):
     """Returns array of frame identifiers with manifest urls for each frame containing a document associated with some application cache."""
+    _fields = ()
+    __slots__ = _fields
+    _result = getFramesWithManifestsResult
 
     def __init__(self): pass
 
 class enable(ChromeCommand):
     """Enables application cache domain notifications."""
+    _fields = ()
+    __slots__ = _fields
 
     def __init__(self): pass
 
+class getManifestForFrameResult(ChromeResult):
+    __slots__ = ()
+    _fields = ('manifestURL',)
+    # Manifest URL for document in the given frame.
+    manifestURL: str
+
 class getManifestForFrame(ChromeCommand):
     """Returns manifest URL for document in the given frame."""
+    _fields = ('frameId',)
+    __slots__ = _fields
+    _result = getManifestForFrameResult
 
     def __init__(self, frameId: "Page.FrameId"):
         # Identifier of the frame containing document whose manifest is retrieved.
         self.frameId = frameId
 
+    def to_wire(self):
+        wire = {"frameId": self.frameId}
+        return wire
+
+
 
+class getApplicationCacheForFrameResult(ChromeResult):
+    __slots__ = ()
+    _fields = ('applicationCache',)
+    # Relevant application cache data for the document in given frame.
+    applicationCache: ApplicationCache
+    _types = {'applicationCache': ApplicationCache}
 
 class getApplicationCacheForFrame(ChromeCommand):
     """Returns relevant application cache data for the document in given frame."""
+    _fields = ('frameId',)
+    __slots__ = _fields
+    _result = getApplicationCacheForFrameResult
 
     def __init__(self, frameId: "Page.FrameId"):
         # Identifier of the frame containing document whose application cache is retrieved.
         self.frameId = frameId
 
+    def to_wire(self):
+        wire = {"frameId": self.frameId}
+        return wire
+
+
+
+class applicationCacheStatusUpdated(ChromeEvent):
+    __slots__ = ()
+    _fields = ('frameId', 'manifestURL', 'status')
+    # Identifier of the frame containing document whose application cache updated status.
+    frameId: "Page.FrameId"
+    # Manifest URL.
+    manifestURL: str
+    # Updated application cache status.
+    status: int
 
+class networkStateUpdated(ChromeEvent):
+    __slots__ = ()
+    _fields = ('isNowOnline',)
+    isNowOnline: bool
 
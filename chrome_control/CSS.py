@@ -1,121 +1,151 @@
+# schema hash: c2b4f56fa0761932aabc374fe7468c7a2f7eec51
 from enum import Enum
-from typing import Any, List
+from typing import TYPE_CHECKING, Any, List
 
-from .base import ChromeCommand
+from .base import ChromeCommand, ChromeEvent, ChromeResult, ChromeType, encode, resolve
 
-from . import Page
-from . import DOM
+if TYPE_CHECKING:
+    from . import DOM
+    from . import Page
 
 StyleSheetId = str
 
 StyleSheetOrigin = Enum("StyleSheetOrigin", "injected user-agent inspector regular")
 StyleSheetOrigin.__doc__ = """Stylesheet type: "injected" for stylesheets injected via extension, "user-agent" for user-agent stylesheets, "inspector" for stylesheets created by the inspector (i.e. those holding the "via inspector" rules), "regular" for regular stylesheets."""
 
-class PseudoElementMatches:
-    """CSS rule collection for a single pseudo style."""
-    def __init__(self, pseudoType: "DOM.PseudoType", matches: List):
-        # Pseudo element type.
-        self.pseudoType = pseudoType
-        # Matches of CSS rules applicable to the pseudo style.
-        self.matches = matches
+class SourceRange(ChromeType):
+    """Text range within a resource. All numbers are zero-based."""
+    _fields = ('startLine', 'startColumn', 'endLine', 'endColumn')
+    __slots__ = _fields
 
-class InheritedStyleEntry:
-    """Inherited CSS rule collection from ancestor node."""
-    def __init__(self, matchedCSSRules: List, inlineStyle: "CSSStyle"=None):
-        # Matches of CSS rules matching the ancestor node in the style inheritance chain.
-        self.matchedCSSRules = matchedCSSRules
-        # The ancestor node's inline style, if any, in the style inheritance chain.
-        self.inlineStyle = inlineStyle
+    def __init__(self, startLine: int, startColumn: int, endLine: int, endColumn: int):
+        # Start line of range.
+        self.startLine = startLine
+        # Start column of range (inclusive).
+        self.startColumn = startColumn
+        # End line of range
+        self.endLine = endLine
+        # End column of range (exclusive).
+        self.endColumn = endColumn
 
-class RuleMatch:
-    """Match data for a CSS rule."""
-    def __init__(self, rule: "CSSRule", matchingSelectors: List):
-        # CSS rule in the match.
-        self.rule = rule
-        # Matching selector indices in the rule's selectorList selectors (0-based).
-        self.matchingSelectors = matchingSelectors
+    def to_wire(self):
+        wire = {"startLine": self.startLine, "startColumn": self.startColumn, "endLine": self.endLine, "endColumn": self.endColumn}
+        return wire
+
+    @classmethod
+    def from_wire(cls, wire: dict):
+        obj = cls.__new__(cls)
+        obj.startLine = wire["startLine"]
+        obj.startColumn = wire["startColumn"]
+        obj.endLine = wire["endLine"]
+        obj.endColumn = wire["endColumn"]
+        return obj
 
-class Value:
+class Value(ChromeType):
     """Data for a simple selector (these are delimited by commas in a selector list)."""
-    def __init__(self, text: str, range: "SourceRange"=None):
+    _fields = ('text', 'range')
+    __slots__ = _fields
+    _types = {'range': SourceRange}
+
+    def __init__(self, text: str, range: SourceRange=None):
         # Value text.
         self.text = text
         # Value range in the underlying resource (if available).
         self.range = range
 
-class SelectorList:
+    def to_wire(self):
+        wire = {"text": self.text}
+        if self.range is not None:
+            wire["range"] = encode(self.range)
+        return wire
+
+    @classmethod
+    def from_wire(cls, wire: dict):
+        obj = cls.__new__(cls)
+        obj.text = wire["text"]
+        obj.range = SourceRange.from_wire(wire["range"]) if "range" in wire else None
+        return obj
+
+class SelectorList(ChromeType):
     """Selector list data."""
+    _fields = ('selectors', 'text')
+    __slots__ = _fields
+    _types = {'selectors': [Value]}
+
     def __init__(self, selectors: List, text: str):
         # Selectors in the list.
         self.selectors = selectors
         # Rule selector text.
         self.text = text
 
-class CSSStyleSheetHeader:
-    """CSS stylesheet metainformation."""
-    def __init__(self, styleSheetId: "StyleSheetId", frameId: "Page.FrameId", sourceURL: str, origin: "StyleSheetOrigin", title: str, disabled: bool, isInline: bool, startLine: float, startColumn: float, sourceMapURL: str=None, ownerNode: "DOM.BackendNodeId"=None, hasSourceURL: bool=None):
-        # The stylesheet identifier.
-        self.styleSheetId = styleSheetId
-        # Owner frame identifier.
-        self.frameId = frameId
-        # Stylesheet resource URL.
-        self.sourceURL = sourceURL
-        # Stylesheet origin.
-        self.origin = origin
-        # Stylesheet title.
-        self.title = title
-        # Denotes whether the stylesheet is disabled.
-        self.disabled = disabled
-        # Whether this stylesheet is created for STYLE tag by parser. This flag is not set for document.written STYLE tags.
-        self.isInline = isInline
-        # Line offset of the stylesheet within the resource (zero based).
-        self.startLine = startLine
-        # Column offset of the stylesheet within the resource (zero based).
-        self.startColumn = startColumn
-        # URL of source map associated with the stylesheet (if any).
-        self.sourceMapURL = sourceMapURL
-        # The backend id for the owner node of the stylesheet.
-        self.ownerNode = ownerNode
-        # Whether the sourceURL field value comes from the sourceURL comment.
-        self.hasSourceURL = hasSourceURL
+    def to_wire(self):
+        wire = {"selectors": encode(self.selectors), "text": self.text}
+        return wire
 
-class CSSRule:
-    """CSS rule representation."""
-    def __init__(self, selectorList: "SelectorList", origin: "StyleSheetOrigin", style: "CSSStyle", styleSheetId: "StyleSheetId"=None, media: List=None):
-        # Rule selector data.
-        self.selectorList = selectorList
-        # Parent stylesheet's origin.
-        self.origin = origin
-        # Associated style declaration.
-        self.style = style
-        # The css style sheet identifier (absent for user agent stylesheet and user-specified stylesheet rules) this rule came from.
-        self.styleSheetId = styleSheetId
-        # Media list array (for rules involving media queries). The array enumerates media queries starting with the innermost one, going outwards.
-        self.media = media
+    @classmethod
+    def from_wire(cls, wire: dict):
+        obj = cls.__new__(cls)
+        obj.selectors = [Value.from_wire(x0) for x0 in wire["selectors"]]
+        obj.text = wire["text"]
+        return obj
 
-class RuleUsage:
-    """CSS rule usage information."""
-    def __init__(self, styleSheetId: "StyleSheetId", range: "SourceRange", used: bool):
-        # The css style sheet identifier (absent for user agent stylesheet and user-specified stylesheet rules) this rule came from.
-        self.styleSheetId = styleSheetId
-        # Style declaration range in the enclosing stylesheet (if available).
+class CSSProperty(ChromeType):
+    """CSS property declaration data."""
+    _fields = ('name', 'value', 'important', 'implicit', 'text', 'parsedOk', 'disabled', 'range')
+    __slots__ = _fields
+    _types = {'range': SourceRange}
+
+    def __init__(self, name: str, value: str, important: bool=None, implicit: bool=None, text: str=None, parsedOk: bool=None, disabled: bool=None, range: SourceRange=None):
+        # The property name.
+        self.name = name
+        # The property value.
+        self.value = value
+        # Whether the property has "!important" annotation (implies <code>false</code> if absent).
+        self.important = important
+        # Whether the property is implicit (implies <code>false</code> if absent).
+        self.implicit = implicit
+        # The full property text as specified in the style.
+        self.text = text
+        # Whether the property is understood by the browser (implies <code>true</code> if absent).
+        self.parsedOk = parsedOk
+        # Whether the property is disabled by the user (present for source-based properties only).
+        self.disabled = disabled
+        # The entire property range in the enclosing style declaration (if available).
         self.range = range
-        # Indicates whether the rule was actually used by some element in the page.
-        self.used = used
 
-class SourceRange:
-    """Text range within a resource. All numbers are zero-based."""
-    def __init__(self, startLine: int, startColumn: int, endLine: int, endColumn: int):
-        # Start line of range.
-        self.startLine = startLine
-        # Start column of range (inclusive).
-        self.startColumn = startColumn
-        # End line of range
-        self.endLine = endLine
-        # End column of range (exclusive).
-        self.endColumn = endColumn
+    def to_wire(self):
+        wire = {"name": self.name, "value": self.value}
+        if self.important is not None:
+            wire["important"] = self.important
+        if self.implicit is not None:
+            wire["implicit"] = self.implicit
+        if self.text is not None:
+            wire["text"] = self.text
+        if self.parsedOk is not None:
+            wire["parsedOk"] = self.parsedOk
+        if self.disabled is not None:
+            wire["disabled"] = self.disabled
+        if self.range is not None:
+            wire["range"] = encode(self.range)
+        return wire
+
+    @classmethod
+    def from_wire(cls, wire: dict):
+        obj = cls.__new__(cls)
+        obj.name = wire["name"]
+        obj.value = wire["value"]
+        obj.important = wire.get("important")
+        obj.implicit = wire.get("implicit")
+        obj.text = wire.get("text")
+        obj.parsedOk = wire.get("parsedOk")
+        obj.disabled = wire.get("disabled")
+        obj.range = SourceRange.from_wire(wire["range"]) if "range" in wire else None
+        return obj
+
+class ShorthandEntry(ChromeType):
+    _fields = ('name', 'value', 'important')
+    __slots__ = _fields
 
-class ShorthandEntry:
     def __init__(self, name: str, value: str, important: bool=None):
         # Shorthand name.
         self.name = name
@@ -124,16 +154,27 @@ class ShorthandEntry:
         # Whether the property has "!important" annotation (implies <code>false</code> if absent).
         self.important = important
 
-class CSSComputedStyleProperty:
-    def __init__(self, name: str, value: str):
-        # Computed style property name.
-        self.name = name
-        # Computed style property value.
-        self.value = value
-
-class CSSStyle:
+    def to_wire(self):
+        wire = {"name": self.name, "value": self.value}
+        if self.important is not None:
+            wire["important"] = self.important
+        return wire
+
+    @classmethod
+    def from_wire(cls, wire: dict):
+        obj = cls.__new__(cls)
+        obj.name = wire["name"]
+        obj.value = wire["value"]
+        obj.important = wire.get("important")
+        return obj
+
+class CSSStyle(ChromeType):
     """CSS style representation."""
-    def __init__(self, cssProperties: List, shorthandEntries: List, styleSheetId: "StyleSheetId"=None, cssText: str=None, range: "SourceRange"=None):
+    _fields = ('cssProperties', 'shorthandEntries', 'styleSheetId', 'cssText', 'range')
+    __slots__ = _fields
+    _types = {'cssProperties': [CSSProperty], 'shorthandEntries': [ShorthandEntry], 'range': SourceRange}
+
+    def __init__(self, cssProperties: List, shorthandEntries: List, styleSheetId: StyleSheetId=None, cssText: str=None, range: SourceRange=None):
         # CSS properties in the style.
         self.cssProperties = cssProperties
         # Computed values for all shorthands found in the style.
@@ -145,29 +186,92 @@ class CSSStyle:
         # Style declaration range in the enclosing stylesheet (if available).
         self.range = range
 
-class CSSProperty:
-    """CSS property declaration data."""
-    def __init__(self, name: str, value: str, important: bool=None, implicit: bool=None, text: str=None, parsedOk: bool=None, disabled: bool=None, range: "SourceRange"=None):
-        # The property name.
-        self.name = name
-        # The property value.
+    def to_wire(self):
+        wire = {"cssProperties": encode(self.cssProperties), "shorthandEntries": encode(self.shorthandEntries)}
+        if self.styleSheetId is not None:
+            wire["styleSheetId"] = self.styleSheetId
+        if self.cssText is not None:
+            wire["cssText"] = self.cssText
+        if self.range is not None:
+            wire["range"] = encode(self.range)
+        return wire
+
+    @classmethod
+    def from_wire(cls, wire: dict):
+        obj = cls.__new__(cls)
+        obj.cssProperties = [CSSProperty.from_wire(x0) for x0 in wire["cssProperties"]]
+        obj.shorthandEntries = [ShorthandEntry.from_wire(x0) for x0 in wire["shorthandEntries"]]
+        obj.styleSheetId = wire.get("styleSheetId")
+        obj.cssText = wire.get("cssText")
+        obj.range = SourceRange.from_wire(wire["range"]) if "range" in wire else None
+        return obj
+
+class MediaQueryExpression(ChromeType):
+    """Media query expression descriptor."""
+    _fields = ('value', 'unit', 'feature', 'valueRange', 'computedLength')
+    __slots__ = _fields
+    _types = {'valueRange': SourceRange}
+
+    def __init__(self, value: float, unit: str, feature: str, valueRange: SourceRange=None, computedLength: float=None):
+        # Media query expression value.
         self.value = value
-        # Whether the property has "!important" annotation (implies <code>false</code> if absent).
-        self.important = important
-        # Whether the property is implicit (implies <code>false</code> if absent).
-        self.implicit = implicit
-        # The full property text as specified in the style.
-        self.text = text
-        # Whether the property is understood by the browser (implies <code>true</code> if absent).
-        self.parsedOk = parsedOk
-        # Whether the property is disabled by the user (present for source-based properties only).
-        self.disabled = disabled
-        # The entire property range in the enclosing style declaration (if available).
-        self.range = range
+        # Media query expression units.
+        self.unit = unit
+        # Media query expression feature.
+        self.feature = feature
+        # The associated range of the value text in the enclosing stylesheet (if available).
+        self.valueRange = valueRange
+        # Computed length of media query expression (if applicable).
+        self.computedLength = computedLength
 
-class CSSMedia:
+    def to_wire(self):
+        wire = {"value": self.value, "unit": self.unit, "feature": self.feature}
+        if self.valueRange is not None:
+            wire["valueRange"] = encode(self.valueRange)
+        if self.computedLength is not None:
+            wire["computedLength"] = self.computedLength
+        return wire
+
+    @classmethod
+    def from_wire(cls, wire: dict):
+        obj = cls.__new__(cls)
+        obj.value = wire["value"]
+        obj.unit = wire["unit"]
+        obj.feature = wire["feature"]
+        obj.valueRange = SourceRange.from_wire(wire["valueRange"]) if "valueRange" in wire else None
+        obj.computedLength = wire.get("computedLength")
+        return obj
+
+class MediaQuery(ChromeType):
+    """Media query descriptor."""
+    _fields = ('expressions', 'active')
+    __slots__ = _fields
+    _types = {'expressions': [MediaQueryExpression]}
+
+    def __init__(self, expressions: List, active: bool):
+        # Array of media query expressions.
+        self.expressions = expressions
+        # Whether the media query condition is satisfied.
+        self.active = active
+
+    def to_wire(self):
+        wire = {"expressions": encode(self.expressions), "active": self.active}
+        return wire
+
+    @classmethod
+    def from_wire(cls, wire: dict):
+        obj = cls.__new__(cls)
+        obj.expressions = [MediaQueryExpression.from_wire(x0) for x0 in wire["expressions"]]
+        obj.active = wire["active"]
+        return obj
+
+class CSSMedia(ChromeType):
     """CSS media rule descriptor."""
-    def __init__(self, text: str, source: str, sourceURL: str=None, range: "SourceRange"=None, styleSheetId: "StyleSheetId"=None, mediaList: List=None):
+    _fields = ('text', 'source', 'sourceURL', 'range', 'styleSheetId', 'mediaList')
+    __slots__ = _fields
+    _types = {'range': SourceRange, 'mediaList': [MediaQuery]}
+
+    def __init__(self, text: str, source: str, sourceURL: str=None, range: SourceRange=None, styleSheetId: StyleSheetId=None, mediaList: List=None):
         # Media query text.
         self.text = text
         # Source of the media query: "mediaRule" if specified by a @media rule, "importRule" if specified by an @import rule, "linkedSheet" if specified by a "media" attribute in a linked stylesheet's LINK tag, "inlineSheet" if specified by a "media" attribute in an inline stylesheet's STYLE tag.
@@ -181,30 +285,251 @@ class CSSMedia:
         # Array of media queries.
         self.mediaList = mediaList
 
-class MediaQuery:
-    """Media query descriptor."""
-    def __init__(self, expressions: List, active: bool):
-        # Array of media query expressions.
-        self.expressions = expressions
-        # Whether the media query condition is satisfied.
-        self.active = active
+    def to_wire(self):
+        wire = {"text": self.text, "source": self.source}
+        if self.sourceURL is not None:
+            wire["sourceURL"] = self.sourceURL
+        if self.range is not None:
+            wire["range"] = encode(self.range)
+        if self.styleSheetId is not None:
+            wire["styleSheetId"] = self.styleSheetId
+        if self.mediaList is not None:
+            wire["mediaList"] = encode(self.mediaList)
+        return wire
+
+    @classmethod
+    def from_wire(cls, wire: dict):
+        obj = cls.__new__(cls)
+        obj.text = wire["text"]
+        obj.source = wire["source"]
+        obj.sourceURL = wire.get("sourceURL")
+        obj.range = SourceRange.from_wire(wire["range"]) if "range" in wire else None
+        obj.styleSheetId = wire.get("styleSheetId")
+        obj.mediaList = [MediaQuery.from_wire(x0) for x0 in wire["mediaList"]] if "mediaList" in wire else None
+        return obj
+
+class CSSRule(ChromeType):
+    """CSS rule representation."""
+    _fields = ('selectorList', 'origin', 'style', 'styleSheetId', 'media')
+    __slots__ = _fields
+    _types = {'selectorList': SelectorList, 'origin': StyleSheetOrigin, 'style': CSSStyle, 'media': [CSSMedia]}
 
-class MediaQueryExpression:
-    """Media query expression descriptor."""
-    def __init__(self, value: float, unit: str, feature: str, valueRange: "SourceRange"=None, computedLength: float=None):
-        # Media query expression value.
+    def __init__(self, selectorList: SelectorList, origin: StyleSheetOrigin, style: CSSStyle, styleSheetId: StyleSheetId=None, media: List=None):
+        # Rule selector data.
+        self.selectorList = selectorList
+        # Parent stylesheet's origin.
+        self.origin = origin
+        # Associated style declaration.
+        self.style = style
+        # The css style sheet identifier (absent for user agent stylesheet and user-specified stylesheet rules) this rule came from.
+        self.styleSheetId = styleSheetId
+        # Media list array (for rules involving media queries). The array enumerates media queries starting with the innermost one, going outwards.
+        self.media = media
+
+    def to_wire(self):
+        wire = {"selectorList": encode(self.selectorList), "origin": encode(self.origin), "style": encode(self.style)}
+        if self.styleSheetId is not None:
+            wire["styleSheetId"] = self.styleSheetId
+        if self.media is not None:
+            wire["media"] = encode(self.media)
+        return wire
+
+    @classmethod
+    def from_wire(cls, wire: dict):
+        obj = cls.__new__(cls)
+        obj.selectorList = SelectorList.from_wire(wire["selectorList"])
+        obj.origin = StyleSheetOrigin.__members__.get(wire["origin"], wire["origin"])
+        obj.style = CSSStyle.from_wire(wire["style"])
+        obj.styleSheetId = wire.get("styleSheetId")
+        obj.media = [CSSMedia.from_wire(x0) for x0 in wire["media"]] if "media" in wire else None
+        return obj
+
+class RuleMatch(ChromeType):
+    """Match data for a CSS rule."""
+    _fields = ('rule', 'matchingSelectors')
+    __slots__ = _fields
+    _types = {'rule': CSSRule}
+
+    def __init__(self, rule: CSSRule, matchingSelectors: List):
+        # CSS rule in the match.
+        self.rule = rule
+        # Matching selector indices in the rule's selectorList selectors (0-based).
+        self.matchingSelectors = matchingSelectors
+
+    def to_wire(self):
+        wire = {"rule": encode(self.rule), "matchingSelectors": self.matchingSelectors}
+        return wire
+
+    @classmethod
+    def from_wire(cls, wire: dict):
+        obj = cls.__new__(cls)
+        obj.rule = CSSRule.from_wire(wire["rule"])
+        obj.matchingSelectors = wire["matchingSelectors"]
+        return obj
+
+class PseudoElementMatches(ChromeType):
+    """CSS rule collection for a single pseudo style."""
+    _fields = ('pseudoType', 'matches')
+    __slots__ = _fields
+    _types = {'pseudoType': 'DOM.PseudoType', 'matches': [RuleMatch]}
+    _refs = ('DOM.PseudoType',)
+
+    def __init__(self, pseudoType: "DOM.PseudoType", matches: List):
+        # Pseudo element type.
+        self.pseudoType = pseudoType
+        # Matches of CSS rules applicable to the pseudo style.
+        self.matches = matches
+
+    def to_wire(self):
+        wire = {"pseudoType": encode(self.pseudoType), "matches": encode(self.matches)}
+        return wire
+
+    @classmethod
+    def from_wire(cls, wire: dict):
+        refs = cls._refs
+        if refs[0].__class__ is str:
+            refs = cls._refs = tuple(map(resolve, refs))
+        obj = cls.__new__(cls)
+        obj.pseudoType = refs[0].__members__.get(wire["pseudoType"], wire["pseudoType"])
+        obj.matches = [RuleMatch.from_wire(x0) for x0 in wire["matches"]]
+        return obj
+
+class InheritedStyleEntry(ChromeType):
+    """Inherited CSS rule collection from ancestor node."""
+    _fields = ('matchedCSSRules', 'inlineStyle')
+    __slots__ = _fields
+    _types = {'matchedCSSRules': [RuleMatch], 'inlineStyle': CSSStyle}
+
+    def __init__(self, matchedCSSRules: List, inlineStyle: CSSStyle=None):
+        # Matches of CSS rules matching the ancestor node in the style inheritance chain.
+        self.matchedCSSRules = matchedCSSRules
+        # The ancestor node's inline style, if any, in the style inheritance chain.
+        self.inlineStyle = inlineStyle
+
+    def to_wire(self):
+        wire = {"matchedCSSRules": encode(self.matchedCSSRules)}
+        if self.inlineStyle is not None:
+            wire["inlineStyle"] = encode(self.inlineStyle)
+        return wire
+
+    @classmethod
+    def from_wire(cls, wire: dict):
+        obj = cls.__new__(cls)
+        obj.matchedCSSRules = [RuleMatch.from_wire(x0) for x0 in wire["matchedCSSRules"]]
+        obj.inlineStyle = CSSStyle.from_wire(wire["inlineStyle"]) if "inlineStyle" in wire else None
+        return obj
+
+class CSSStyleSheetHeader(ChromeType):
+    """CSS stylesheet metainformation."""
+    _fields = ('styleSheetId', 'frameId', 'sourceURL', 'origin', 'title', 'disabled', 'isInline', 'startLine', 'startColumn', 'sourceMapURL', 'ownerNode', 'hasSourceURL')
+    __slots__ = _fields
+    _types = {'origin': StyleSheetOrigin}
+
+    def __init__(self, styleSheetId: StyleSheetId, frameId: "Page.FrameId", sourceURL: str, origin: StyleSheetOrigin, title: str, disabled: bool, isInline: bool, startLine: float, startColumn: float, sourceMapURL: str=None, ownerNode: "DOM.BackendNodeId"=None, hasSourceURL: bool=None):
+        # The stylesheet identifier.
+        self.styleSheetId = styleSheetId
+        # Owner frame identifier.
+        self.frameId = frameId
+        # Stylesheet resource URL.
+        self.sourceURL = sourceURL
+        # Stylesheet origin.
+        self.origin = origin
+        # Stylesheet title.
+        self.title = title
+        # Denotes whether the stylesheet is disabled.
+        self.disabled = disabled
+        # Whether this stylesheet is created for STYLE tag by parser. This flag is not set for document.written STYLE tags.
+        self.isInline = isInline
+        # Line offset of the stylesheet within the resource (zero based).
+        self.startLine = startLine
+        # Column offset of the stylesheet within the resource (zero based).
+        self.startColumn = startColumn
+        # URL of source map associated with the stylesheet (if any).
+        self.sourceMapURL = sourceMapURL
+        # The backend id for the owner node of the stylesheet.
+        self.ownerNode = ownerNode
+        # Whether the sourceURL field value comes from the sourceURL comment.
+        self.hasSourceURL = hasSourceURL
+
+    def to_wire(self):
+        wire = {"styleSheetId": self.styleSheetId, "frameId": self.frameId, "sourceURL": self.sourceURL, "origin": encode(self.origin), "title": self.title, "disabled": self.disabled, "isInline": self.isInline, "startLine": self.startLine, "startColumn": self.startColumn}
+        if self.sourceMapURL is not None:
+            wire["sourceMapURL"] = self.sourceMapURL
+        if self.ownerNode is not None:
+            wire["ownerNode"] = self.ownerNode
+        if self.hasSourceURL is not None:
+            wire["hasSourceURL"] = self.hasSourceURL
+        return wire
+
+    @classmethod
+    def from_wire(cls, wire: dict):
+        obj = cls.__new__(cls)
+        obj.styleSheetId = wire["styleSheetId"]
+        obj.frameId = wire["frameId"]
+        obj.sourceURL = wire["sourceURL"]
+        obj.origin = StyleSheetOrigin.__members__.get(wire["origin"], wire["origin"])
+        obj.title = wire["title"]
+        obj.disabled = wire["disabled"]
+        obj.isInline = wire["isInline"]
+        obj.startLine = wire["startLine"]
+        obj.startColumn = wire["startColumn"]
+        obj.sourceMapURL = wire.get("sourceMapURL")
+        obj.ownerNode = wire.get("ownerNode")
+        obj.hasSourceURL = wire.get("hasSourceURL")
+        return obj
+
+class RuleUsage(ChromeType):
+    """CSS rule usage information."""
+    _fields = ('styleSheetId', 'range', 'used')
+    __slots__ = _fields
+    _types = {'range': SourceRange}
+
+    def __init__(self, styleSheetId: StyleSheetId, range: SourceRange, used: bool):
+        # The css style sheet identifier (absent for user agent stylesheet and user-specified stylesheet rules) this rule came from.
+        self.styleSheetId = styleSheetId
+        # Style declaration range in the enclosing stylesheet (if available).
+        self.range = range
+        # Indicates whether the rule was actually used by some element in the page.
+        self.used = used
+
+    def to_wire(self):
+        wire = {"styleSheetId": self.styleSheetId, "range": encode(self.range), "used": self.used}
+        return wire
+
+    @classmethod
+    def from_wire(cls, wire: dict):
+        obj = cls.__new__(cls)
+        obj.styleSheetId = wire["styleSheetId"]
+        obj.range = SourceRange.from_wire(wire["range"])
+        obj.used = wire["used"]
+        return obj
+
+class CSSComputedStyleProperty(ChromeType):
+    _fields = ('name', 'value')
+    __slots__ = _fields
+
+    def __init__(self, name: str, value: str):
+        # Computed style property name.
+        self.name = name
+        # Computed style property value.
         self.value = value
-        # Media query expression units.
-        self.unit = unit
-        # Media query expression feature.
-        self.feature = feature
-        # The associated range of the value text in the enclosing stylesheet (if available).
-        self.valueRange = valueRange
-        # Computed length of media query expression (if applicable).
-        self.computedLength = computedLength
 
-class PlatformFontUsage:
+    def to_wire(self):
+        wire = {"name": self.name, "value": self.value}
+        return wire
+
+    @classmethod
+    def from_wire(cls, wire: dict):
+        obj = cls.__new__(cls)
+        obj.name = wire["name"]
+        obj.value = wire["value"]
+        return obj
+
+class PlatformFontUsage(ChromeType):
     """Information about amount of glyphs that were rendered with given font."""
+    _fields = ('familyName', 'isCustomFont', 'glyphCount')
+    __slots__ = _fields
+
     def __init__(self, familyName: str, isCustomFont: bool, glyphCount: float):
         # Font's family name reported by platform.
         self.familyName = familyName
@@ -213,17 +538,25 @@ class PlatformFontUsage:
         # Amount of glyphs that were rendered with this font.
         self.glyphCount = glyphCount
 
-class CSSKeyframesRule:
-    """CSS keyframes rule representation."""
-    def __init__(self, animationName: "Value", keyframes: List):
-        # Animation name.
-        self.animationName = animationName
-        # List of keyframes.
-        self.keyframes = keyframes
+    def to_wire(self):
+        wire = {"familyName": self.familyName, "isCustomFont": self.isCustomFont, "glyphCount": self.glyphCount}
+        return wire
+
+    @classmethod
+    def from_wire(cls, wire: dict):
+        obj = cls.__new__(cls)
+        obj.familyName = wire["familyName"]
+        obj.isCustomFont = wire["isCustomFont"]
+        obj.glyphCount = wire["glyphCount"]
+        return obj
 
-class CSSKeyframeRule:
+class CSSKeyframeRule(ChromeType):
     """CSS keyframe rule representation."""
-    def __init__(self, origin: "StyleSheetOrigin", keyText: "Value", style: "CSSStyle", styleSheetId: "StyleSheetId"=None):
+    _fields = ('origin', 'keyText', 'style', 'styleSheetId')
+    __slots__ = _fields
+    _types = {'origin': StyleSheetOrigin, 'keyText': Value, 'style': CSSStyle}
+
+    def __init__(self, origin: StyleSheetOrigin, keyText: Value, style: CSSStyle, styleSheetId: StyleSheetId=None):
         # Parent stylesheet's origin.
         self.origin = origin
         # Associated key text.
@@ -233,9 +566,51 @@ class CSSKeyframeRule:
         # The css style sheet identifier (absent for user agent stylesheet and user-specified stylesheet rules) this rule came from.
         self.styleSheetId = styleSheetId
 
-class StyleDeclarationEdit:
+    def to_wire(self):
+        wire = {"origin": encode(self.origin), "keyText": encode(self.keyText), "style": encode(self.style)}
+        if self.styleSheetId is not None:
+            wire["styleSheetId"] = self.styleSheetId
+        return wire
+
+    @classmethod
+    def from_wire(cls, wire: dict):
+        obj = cls.__new__(cls)
+        obj.origin = StyleSheetOrigin.__members__.get(wire["origin"], wire["origin"])
+        obj.keyText = Value.from_wire(wire["keyText"])
+        obj.style = CSSStyle.from_wire(wire["style"])
+        obj.styleSheetId = wire.get("styleSheetId")
+        return obj
+
+class CSSKeyframesRule(ChromeType):
+    """CSS keyframes rule representation."""
+    _fields = ('animationName', 'keyframes')
+    __slots__ = _fields
+    _types = {'animationName': Value, 'keyframes': [CSSKeyframeRule]}
+
+    def __init__(self, animationName: Value, keyframes: List):
+        # Animation name.
+        self.animationName = animationName
+        # List of keyframes.
+        self.keyframes = keyframes
+
+    def to_wire(self):
+        wire = {"animationName": encode(self.animationName), "keyframes": encode(self.keyframes)}
+        return wire
+
+    @classmethod
+    def from_wire(cls, wire: dict):
+        obj = cls.__new__(cls)
+        obj.animationName = Value.from_wire(wire["animationName"])
+        obj.keyframes = [CSSKeyframeRule.from_wire(x0) for x0 in wire["keyframes"]]
+        return obj
+
+class StyleDeclarationEdit(ChromeType):
     """A descriptor of operation to mutate style declaration text."""
-    def __init__(self, styleSheetId: "StyleSheetId", range: "SourceRange", text: str):
+    _fields = ('styleSheetId', 'range', 'text')
+    __slots__ = _fields
+    _types = {'range': SourceRange}
+
+    def __init__(self, styleSheetId: StyleSheetId, range: SourceRange, text: str):
         # The css style sheet identifier.
         self.styleSheetId = styleSheetId
         # The range of the style text in the enclosing stylesheet.
@@ -243,8 +618,25 @@ class StyleDeclarationEdit:
         # New style text.
         self.text = text
 
-class InlineTextBox:
+    def to_wire(self):
+        wire = {"styleSheetId": self.styleSheetId, "range": encode(self.range), "text": self.text}
+        return wire
+
+    @classmethod
+    def from_wire(cls, wire: dict):
+        obj = cls.__new__(cls)
+        obj.styleSheetId = wire["styleSheetId"]
+        obj.range = SourceRange.from_wire(wire["range"])
+        obj.text = wire["text"]
+        return obj
+
+class InlineTextBox(ChromeType):
     """Details of post layout rendered text positions. The exact layout should not be regarded as stable and may change between versions."""
+    _fields = ('boundingBox', 'startCharacterIndex', 'numCharacters')
+    __slots__ = _fields
+    _types = {'boundingBox': 'DOM.Rect'}
+    _refs = ('DOM.Rect',)
+
     def __init__(self, boundingBox: "DOM.Rect", startCharacterIndex: int, numCharacters: int):
         # The absolute position bounding box.
         self.boundingBox = boundingBox
@@ -253,8 +645,28 @@ class InlineTextBox:
         # The number of characters in this post layout textbox substring.
         self.numCharacters = numCharacters
 
-class LayoutTreeNode:
+    def to_wire(self):
+        wire = {"boundingBox": encode(self.boundingBox), "startCharacterIndex": self.startCharacterIndex, "numCharacters": self.numCharacters}
+        return wire
+
+    @classmethod
+    def from_wire(cls, wire: dict):
+        refs = cls._refs
+        if refs[0].__class__ is str:
+            refs = cls._refs = tuple(map(resolve, refs))
+        obj = cls.__new__(cls)
+        obj.boundingBox = refs[0].from_wire(wire["boundingBox"])
+        obj.startCharacterIndex = wire["startCharacterIndex"]
+        obj.numCharacters = wire["numCharacters"]
+        return obj
+
+class LayoutTreeNode(ChromeType):
     """Details of an element in the DOM tree with a LayoutObject."""
+    _fields = ('nodeId', 'boundingBox', 'layoutText', 'inlineTextNodes', 'styleIndex')
+    __slots__ = _fields
+    _types = {'boundingBox': 'DOM.Rect', 'inlineTextNodes': [InlineTextBox]}
+    _refs = ('DOM.Rect',)
+
     def __init__(self, nodeId: "DOM.NodeId", boundingBox: "DOM.Rect", layoutText: str=None, inlineTextNodes: List=None, styleIndex: int=None):
         # The id of the related DOM node matching one from DOM.GetDocument.
         self.nodeId = nodeId
@@ -267,129 +679,356 @@ class LayoutTreeNode:
         # Index into the computedStyles array returned by getLayoutTreeAndStyles.
         self.styleIndex = styleIndex
 
-class ComputedStyle:
+    def to_wire(self):
+        wire = {"nodeId": self.nodeId, "boundingBox": encode(self.boundingBox)}
+        if self.layoutText is not None:
+            wire["layoutText"] = self.layoutText
+        if self.inlineTextNodes is not None:
+            wire["inlineTextNodes"] = encode(self.inlineTextNodes)
+        if self.styleIndex is not None:
+            wire["styleIndex"] = self.styleIndex
+        return wire
+
+    @classmethod
+    def from_wire(cls, wire: dict):
+        refs = cls._refs
+        if refs[0].__class__ is str:
+            refs = cls._refs = tuple(map(resolve, refs))
+        obj = cls.__new__(cls)
+        obj.nodeId = wire["nodeId"]
+        obj.boundingBox = refs[0].from_wire(wire["boundingBox"])
+        obj.layoutText = wire.get("layoutText")
+        obj.inlineTextNodes = [InlineTextBox.from_wire(x0) for x0 in wire["inlineTextNodes"]] if "inlineTextNodes" in wire else None
+        obj.styleIndex = wire.get("styleIndex")
+        return obj
+
+class ComputedStyle(ChromeType):
     """A subset of the full ComputedStyle as defined by the request whitelist."""
+    _fields = ('properties',)
+    __slots__ = _fields
+    _types = {'properties': [CSSComputedStyleProperty]}
+
     def __init__(self, properties: List):
         self.properties = properties
 
+    def to_wire(self):
+        wire = {"properties": encode(self.properties)}
+        return wire
+
+    @classmethod
+    def from_wire(cls, wire: dict):
+        obj = cls.__new__(cls)
+        obj.properties = [CSSComputedStyleProperty.from_wire(x0) for x0 in wire["properties"]]
+        return obj
+
 class enable(ChromeCommand):
     """Enables the CSS agent for the given page. Clients should not assume that the CSS agent has been enabled until the result of this command is received."""
+    _fields = ()
+    __slots__ = _fields
 
     def __init__(self): pass
 
 class disable(ChromeCommand):
     """Disables the CSS agent for the given page."""
+    _fields = ()
+    __slots__ = _fields
 
     def __init__(self): pass
 
+class getMatchedStylesForNodeResult(ChromeResult):
+    __slots__ = ()
+    _fields = ('inlineStyle', 'attributesStyle', 'matchedCSSRules', 'pseudoElements', 'inherited', 'cssKeyframesRules')
+    # Inline style for the specified DOM node.
+    inlineStyle: CSSStyle
+    # Attribute-defined element style (e.g. resulting from "width=20 height=100%").
+    attributesStyle: CSSStyle
+    # CSS rules matching this node, from all applicable stylesheets.
+    matchedCSSRules: List
+    # Pseudo style matches for this node.
+    pseudoElements: List
+    # A chain of inherited styles (from the immediate node parent up to the DOM tree root).
+    inherited: List
+    # A list of CSS keyframed animations matching this node.
+    cssKeyframesRules: List
+    _types = {'inlineStyle': CSSStyle, 'attributesStyle': CSSStyle, 'matchedCSSRules': [RuleMatch], 'pseudoElements': [PseudoElementMatches], 'inherited': [InheritedStyleEntry], 'cssKeyframesRules': [CSSKeyframesRule]}
+
 class getMatchedStylesForNode(ChromeCommand):
     """Returns requested styles for a DOM node identified by <code>nodeId</code>."""
+    _fields = ('nodeId',)
+    __slots__ = _fields
+    _result = getMatchedStylesForNodeResult
 
     def __init__(self, nodeId: "DOM.NodeId"):
         self.nodeId = nodeId
 
+    def to_wire(self):
+        wire = {"nodeId": self.nodeId}
+        return wire
+
+
 
+class getInlineStylesForNodeResult(ChromeResult):
+    __slots__ = ()
+    _fields = ('inlineStyle', 'attributesStyle')
+    # Inline style for the specified DOM node.
+    inlineStyle: CSSStyle
+    # Attribute-defined element style (e.g. resulting from "width=20 height=100%").
+    attributesStyle: CSSStyle
+    _types = {'inlineStyle': CSSStyle, 'attributesStyle': CSSStyle}
 
 class getInlineStylesForNode(ChromeCommand):
     """Returns the styles defined inline (explicitly in the "style" attribute and implicitly, using DOM attributes) for a DOM node identified by <code>nodeId</code>."""
+    _fields = ('nodeId',)
+    __slots__ = _fields
+    _result = getInlineStylesForNodeResult
 
     def __init__(self, nodeId: "DOM.NodeId"):
         self.nodeId = nodeId
 
+    def to_wire(self):
+        wire = {"nodeId": self.nodeId}
+        return wire
 
 
+
+class getComputedStyleForNodeResult(ChromeResult):
+    __slots__ = ()
+    _fields = ('computedStyle',)
+    # Computed style for the specified DOM node.
+    computedStyle: List
+    _types = {'computedStyle': [CSSComputedStyleProperty]}
+
 class getComputedStyleForNode(ChromeCommand):
     """Returns the computed style for a DOM node identified by <code>nodeId</code>."""
+    _fields = ('nodeId',)
+    __slots__ = _fields
+    _result = getComputedStyleForNodeResult
 
     def __init__(self, nodeId: "DOM.NodeId"):
         self.nodeId = nodeId
 
+    def to_wire(self):
+        wire = {"nodeId": self.nodeId}
+        return wire
+
 
 
+class getPlatformFontsForNodeResult(ChromeResult):
+    __slots__ = ()
+    _fields = ('fonts',)
+    # Usage statistics for every employed platform font.
+    fonts: List
+    _types = {'fonts': [PlatformFontUsage]}
+
 class getPlatformFontsForNode(ChromeCommand):
     """Requests information about platform fonts which we used to render child TextNodes in the given node."""
+    _fields = ('nodeId',)
+    __slots__ = _fields
+    _result = getPlatformFontsForNodeResult
 
     def __init__(self, nodeId: "DOM.NodeId"):
         self.nodeId = nodeId
 
+    def to_wire(self):
+        wire = {"nodeId": self.nodeId}
+        return wire
+
 
 
+class getStyleSheetTextResult(ChromeResult):
+    __slots__ = ()
+    _fields = ('text',)
+    # The stylesheet text.
+    text: str
+
 class getStyleSheetText(ChromeCommand):
     """Returns the current textual content and the URL for a stylesheet."""
+    _fields = ('styleSheetId',)
+    __slots__ = _fields
+    _result = getStyleSheetTextResult
 
-    def __init__(self, styleSheetId: "StyleSheetId"):
+    def __init__(self, styleSheetId: StyleSheetId):
         self.styleSheetId = styleSheetId
 
+    def to_wire(self):
+        wire = {"styleSheetId": self.styleSheetId}
+        return wire
+
+
 
+class collectClassNamesResult(ChromeResult):
+    __slots__ = ()
+    _fields = ('classNames',)
+    # Class name list.
+    classNames: List
 
 class collectClassNames(ChromeCommand):
     """Returns all class names from specified stylesheet."""
+    _fields = ('styleSheetId',)
+    __slots__ = _fields
+    _result = collectClassNamesResult
 
-    def __init__(self, styleSheetId: "StyleSheetId"):
+    def __init__(self, styleSheetId: StyleSheetId):
         self.styleSheetId = styleSheetId
 
+    def to_wire(self):
+        wire = {"styleSheetId": self.styleSheetId}
+        return wire
+
+
 
+class setStyleSheetTextResult(ChromeResult):
+    __slots__ = ()
+    _fields = ('sourceMapURL',)
+    # URL of source map associated with script (if any).
+    sourceMapURL: str
 
 class setStyleSheetText(ChromeCommand):
     """Sets the new stylesheet text."""
+    _fields = ('styleSheetId', 'text')
+    __slots__ = _fields
+    _result = setStyleSheetTextResult
 
-    def __init__(self, styleSheetId: "StyleSheetId", text: str):
+    def __init__(self, styleSheetId: StyleSheetId, text: str):
         self.styleSheetId = styleSheetId
         self.text = text
 
+    def to_wire(self):
+        wire = {"styleSheetId": self.styleSheetId, "text": self.text}
+        return wire
 
 
+
+class setRuleSelectorResult(ChromeResult):
+    __slots__ = ()
+    _fields = ('selectorList',)
+    # The resulting selector list after modification.
+    selectorList: SelectorList
+    _types = {'selectorList': SelectorList}
+
 class setRuleSelector(ChromeCommand):
     """Modifies the rule selector."""
+    _fields = ('styleSheetId', 'range', 'selector')
+    __slots__ = _fields
+    _result = setRuleSelectorResult
 
-    def __init__(self, styleSheetId: "StyleSheetId", range: "SourceRange", selector: str):
+    def __init__(self, styleSheetId: StyleSheetId, range: SourceRange, selector: str):
         self.styleSheetId = styleSheetId
         self.range = range
         self.selector = selector
 
+    def to_wire(self):
+        wire = {"styleSheetId": self.styleSheetId, "range": encode(self.range), "selector": self.selector}
+        return wire
+
+
 
+class setKeyframeKeyResult(ChromeResult):
+    __slots__ = ()
+    _fields = ('keyText',)
+    # The resulting key text after modification.
+    keyText: Value
+    _types = {'keyText': Value}
 
 class setKeyframeKey(ChromeCommand):
     """Modifies the keyframe rule key text."""
+    _fields = ('styleSheetId', 'range', 'keyText')
+    __slots__ = _fields
+    _result = setKeyframeKeyResult
 
-    def __init__(self, styleSheetId: "StyleSheetId", range: "SourceRange", keyText: str):
+    def __init__(self, styleSheetId: StyleSheetId, range: SourceRange, keyText: str):
         self.styleSheetId = styleSheetId
         self.range = range
         self.keyText = keyText
 
+    def to_wire(self):
+        wire = {"styleSheetId": self.styleSheetId, "range": encode(self.range), "keyText": self.keyText}
+        return wire
 
 
+
+class setStyleTextsResult(ChromeResult):
+    __slots__ = ()
+    _fields = ('styles',)
+    # The resulting styles after modification.
+    styles: List
+    _types = {'styles': [CSSStyle]}
+
 class setStyleTexts(ChromeCommand):
     """Applies specified style edits one after another in the given order."""
+    _fields = ('edits',)
+    __slots__ = _fields
+    _result = setStyleTextsResult
 
     def __init__(self, edits: List):
         self.edits = edits
 
+    def to_wire(self):
+        wire = {"edits": encode(self.edits)}
+        return wire
+
 
 
+class setMediaTextResult(ChromeResult):
+    __slots__ = ()
+    _fields = ('media',)
+    # The resulting CSS media rule after modification.
+    media: CSSMedia
+    _types = {'media': CSSMedia}
+
 class setMediaText(ChromeCommand):
     """Modifies the rule selector."""
+    _fields = ('styleSheetId', 'range', 'text')
+    __slots__ = _fields
+    _result = setMediaTextResult
 
-    def __init__(self, styleSheetId: "StyleSheetId", range: "SourceRange", text: str):
+    def __init__(self, styleSheetId: StyleSheetId, range: SourceRange, text: str):
         self.styleSheetId = styleSheetId
         self.range = range
         self.text = text
 
+    def to_wire(self):
+        wire = {"styleSheetId": self.styleSheetId, "range": encode(self.range), "text": self.text}
+        return wire
+
 
 
+class createStyleSheetResult(ChromeResult):
+    __slots__ = ()
+    _fields = ('styleSheetId',)
+    # Identifier of the created "via-inspector" stylesheet.
+    styleSheetId: StyleSheetId
+
 class createStyleSheet(ChromeCommand):
     """Creates a new special "via-inspector" stylesheet in the frame with given <code>frameId</code>."""
+    _fields = ('frameId',)
+    __slots__ = _fields
+    _result = createStyleSheetResult
 
     def __init__(self, frameId: "Page.FrameId"):
         # Identifier of the frame where "via-inspector" stylesheet should be created.
         self.frameId = frameId
 
+    def to_wire(self):
+        wire = {"frameId": self.frameId}
+        return wire
+
+
 
+class addRuleResult(ChromeResult):
+    __slots__ = ()
+    _fields = ('rule',)
+    # The newly created rule.
+    rule: CSSRule
+    _types = {'rule': CSSRule}
 
 class addRule(ChromeCommand):
     """Inserts a new rule with the given <code>ruleText</code> in a stylesheet with given <code>styleSheetId</code>, at the position specified by <code>location</code>."""
+    _fields = ('styleSheetId', 'ruleText', 'location')
+    __slots__ = _fields
+    _result = addRuleResult
 
-    def __init__(self, styleSheetId: "StyleSheetId", ruleText: str, location: "SourceRange"):
+    def __init__(self, styleSheetId: StyleSheetId, ruleText: str, location: SourceRange):
         # The css style sheet identifier where a new rule should be inserted.
         self.styleSheetId = styleSheetId
         # The text of a new rule.
@@ -397,10 +1036,16 @@ class addRule(ChromeCommand):
         # Text position of a new rule in the target style sheet.
         self.location = location
 
+    def to_wire(self):
+        wire = {"styleSheetId": self.styleSheetId, "ruleText": self.ruleText, "location": encode(self.location)}
+        return wire
+
 
 
 class forcePseudoState(ChromeCommand):
     """Ensures that the given node will have specified pseudo-classes whenever its style is computed by the browser."""
+    _fields = ('nodeId', 'forcedPseudoClasses')
+    __slots__ = _fields
 
     def __init__(self, nodeId: "DOM.NodeId", forcedPseudoClasses: List):
         # The element id for which to force the pseudo state.
@@ -408,15 +1053,30 @@ class forcePseudoState(ChromeCommand):
         # Element pseudo classes to force when computing the element's style.
         self.forcedPseudoClasses = forcedPseudoClasses
 
+    def to_wire(self):
+        wire = {"nodeId": self.nodeId, "forcedPseudoClasses": self.forcedPseudoClasses}
+        return wire
+
 
 
+class getMediaQueriesResult(ChromeResult):
+    __slots__ = ()
+    _fields = ('medias',)
+    medias: List
+    _types = {'medias': [CSSMedia]}
+
 class getMediaQueries(ChromeCommand):
     """Returns all media queries parsed by the rendering engine."""
+    _fields = ()
+    __slots__ = _fields
+    _result = getMediaQueriesResult
 
     def __init__(self): pass
 
 class setEffectivePropertyValueForNode(ChromeCommand):
     """Find a rule with the given active property for the given node and set the new value for this property"""
+    _fields = ('nodeId', 'propertyName', 'value')
+    __slots__ = _fields
 
     def __init__(self, nodeId: "DOM.NodeId", propertyName: str, value: str):
         # The element id for which to set property.
@@ -424,31 +1084,105 @@ class setEffectivePropertyValueForNode(ChromeCommand):
         self.propertyName = propertyName
         self.value = value
 
+    def to_wire(self):
+        wire = {"nodeId": self.nodeId, "propertyName": self.propertyName, "value": self.value}
+        return wire
+
+
 
+class getBackgroundColorsResult(ChromeResult):
+    __slots__ = ()
+    _fields = ('backgroundColors',)
+    # The range of background colors behind this element, if it contains any visible text. If no visible text is present, this will be undefined. In the case of a flat background color, this will consist of simply that color. In the case of a gradient, this will consist of each of the color stops. For anything more complicated, this will be an empty array. Images will be ignored (as if the image had failed to load).
+    backgroundColors: List
 
 class getBackgroundColors(ChromeCommand):
+    _fields = ('nodeId',)
+    __slots__ = _fields
+    _result = getBackgroundColorsResult
+
     def __init__(self, nodeId: "DOM.NodeId"):
         # Id of the node to get background colors for.
         self.nodeId = nodeId
 
+    def to_wire(self):
+        wire = {"nodeId": self.nodeId}
+        return wire
+
 
 
+class getLayoutTreeAndStylesResult(ChromeResult):
+    __slots__ = ()
+    _fields = ('layoutTreeNodes', 'computedStyles')
+    layoutTreeNodes: List
+    computedStyles: List
+    _types = {'layoutTreeNodes': [LayoutTreeNode], 'computedStyles': [ComputedStyle]}
+
 class getLayoutTreeAndStyles(ChromeCommand):
     """For the main document and any content documents, return the LayoutTreeNodes and a whitelisted subset of the computed style. It only returns pushed nodes, on way to pull all nodes is to call DOM.getDocument with a depth of -1."""
+    _fields = ('computedStyleWhitelist',)
+    __slots__ = _fields
+    _result = getLayoutTreeAndStylesResult
 
     def __init__(self, computedStyleWhitelist: List):
         # Whitelist of computed styles to return.
         self.computedStyleWhitelist = computedStyleWhitelist
 
+    def to_wire(self):
+        wire = {"computedStyleWhitelist": self.computedStyleWhitelist}
+        return wire
+
 
 
 class startRuleUsageTracking(ChromeCommand):
     """Enables the selector recording."""
+    _fields = ()
+    __slots__ = _fields
 
     def __init__(self): pass
 
+class stopRuleUsageTrackingResult(ChromeResult):
+    __slots__ = ()
+    _fields = ('ruleUsage',)
+    ruleUsage: List
+    _types = {'ruleUsage': [RuleUsage]}
+
 class stopRuleUsageTracking(ChromeCommand):
     """The list of rules with an indication of whether these were used"""
+    _fields = ()
+    __slots__ = _fields
+    _result = stopRuleUsageTrackingResult
 
     def __init__(self): pass
 
+class mediaQueryResultChanged(ChromeEvent):
+    """Fires whenever a MediaQuery result changes (for example, after a browser window has been resized.) The current implementation considers only viewport-dependent media features."""
+    __slots__ = ()
+    _fields = ()
+
+class fontsUpdated(ChromeEvent):
+    """Fires whenever a web font gets loaded."""
+    __slots__ = ()
+    _fields = ()
+
+class styleSheetChanged(ChromeEvent):
+    """Fired whenever a stylesheet is changed as a result of the client operation."""
+    __slots__ = ()
+    _fields = ('styleSheetId',)
+    styleSheetId: StyleSheetId
+
+class styleSheetAdded(ChromeEvent):
+    """Fired whenever an active document stylesheet is added."""
+    __slots__ = ()
+    _fields = ('header',)
+    # Added stylesheet metainfo.
+    header: CSSStyleSheetHeader
+    _types = {'header': CSSStyleSheetHeader}
+
+class styleSheetRemoved(ChromeEvent):
+    """Fired whenever an active document stylesheet is removed."""
+    __slots__ = ()
+    _fields = ('styleSheetId',)
+    # Identifier of the removed stylesheet.
+    styleSheetId: StyleSheetId
+
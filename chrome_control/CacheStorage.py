@@ -1,23 +1,41 @@
+# schema hash: 2e967a77f6333ab29d28886fa7bd223bd951b625
 from enum import Enum
-from typing import Any, List
+from typing import TYPE_CHECKING, Any, List
 
-from .base import ChromeCommand
+from .base import ChromeCommand, ChromeEvent, ChromeResult, ChromeType, encode, resolve
 
 
 # Unique identifier of the Cache object.
 CacheId = str
 
-class DataEntry:
+class DataEntry(ChromeType):
     """Data entry."""
+    _fields = ('request', 'response')
+    __slots__ = _fields
+
     def __init__(self, request: str, response: str):
         # Request url spec.
         self.request = request
         # Response stataus text.
         self.response = response
 
-class Cache:
+    def to_wire(self):
+        wire = {"request": self.request, "response": self.response}
+        return wire
+
+    @classmethod
+    def from_wire(cls, wire: dict):
+        obj = cls.__new__(cls)
+        obj.request = wire["request"]
+        obj.response = wire["response"]
+        return obj
+
+class Cache(ChromeType):
     """Cache identifier."""
-    def __init__(self, cacheId: "CacheId", securityOrigin: str, cacheName: str):
+    _fields = ('cacheId', 'securityOrigin', 'cacheName')
+    __slots__ = _fields
+
+    def __init__(self, cacheId: CacheId, securityOrigin: str, cacheName: str):
         # An opaque unique id of the cache.
         self.cacheId = cacheId
         # Security origin of the cache.
@@ -25,19 +43,57 @@ class Cache:
         # The name of the cache.
         self.cacheName = cacheName
 
+    def to_wire(self):
+        wire = {"cacheId": self.cacheId, "securityOrigin": self.securityOrigin, "cacheName": self.cacheName}
+        return wire
+
+    @classmethod
+    def from_wire(cls, wire: dict):
+        obj = cls.__new__(cls)
+        obj.cacheId = wire["cacheId"]
+        obj.securityOrigin = wire["securityOrigin"]
+        obj.cacheName = wire["cacheName"]
+        return obj
+
+class requestCacheNamesResult(ChromeResult):
+    __slots__ = ()
+    _fields = ('caches',)
+    # Caches for the security origin.
+    caches: List
+    _types = {'caches': [Cache]}
+
 class requestCacheNames(ChromeCommand):
     """Requests cache names."""
+    _fields = ('securityOrigin',)
+    __slots__ = _fields
+    _result = requestCacheNamesResult
 
     def __init__(self, securityOrigin: str):
         # Security origin.
         self.securityOrigin = securityOrigin
 
+    def to_wire(self):
+        wire = {"securityOrigin": self.securityOrigin}
+        return wire
 
 
+
+class requestEntriesResult(ChromeResult):
+    __slots__ = ()
+    _fields = ('cacheDataEntries', 'hasMore')
+    # Array of object store data entries.
+    cacheDataEntries: List
+    # If true, there are more entries to fetch in the given range.
+    hasMore: bool
+    _types = {'cacheDataEntries': [DataEntry]}
+
 class requestEntries(ChromeCommand):
     """Requests data from cache."""
+    _fields = ('cacheId', 'skipCount', 'pageSize')
+    __slots__ = _fields
+    _result = requestEntriesResult
 
-    def __init__(self, cacheId: "CacheId", skipCount: int, pageSize: int):
+    def __init__(self, cacheId: CacheId, skipCount: int, pageSize: int):
         # ID of cache to get entries from.
         self.cacheId = cacheId
         # Number of records to skip.
@@ -45,25 +101,41 @@ class requestEntries(ChromeCommand):
         # Number of records to fetch.
         self.pageSize = pageSize
 
+    def to_wire(self):
+        wire = {"cacheId": self.cacheId, "skipCount": self.skipCount, "pageSize": self.pageSize}
+        return wire
+
 
 
 class deleteCache(ChromeCommand):
     """Deletes a cache."""
+    _fields = ('cacheId',)
+    __slots__ = _fields
 
-    def __init__(self, cacheId: "CacheId"):
+    def __init__(self, cacheId: CacheId):
         # Id of cache for deletion.
         self.cacheId = cacheId
 
+    def to_wire(self):
+        wire = {"cacheId": self.cacheId}
+        return wire
+
 
 
 class deleteEntry(ChromeCommand):
     """Deletes a cache entry."""
+    _fields = ('cacheId', 'request')
+    __slots__ = _fields
 
-    def __init__(self, cacheId: "CacheId", request: str):
+    def __init__(self, cacheId: CacheId, request: str):
         # Id of cache where the entry will be deleted.
         self.cacheId = cacheId
         # URL spec of the request.
         self.request = request
 
+    def to_wire(self):
+        wire = {"cacheId": self.cacheId, "request": self.request}
+        return wire
+
 
 
@@ -1,11 +1,15 @@
+# schema hash: f4d3be02b75cabf197b8aa2915f9d03487eaad44
 from enum import Enum
-from typing import Any, List
+from typing import TYPE_CHECKING, Any, List
 
-from .base import ChromeCommand
+from .base import ChromeCommand, ChromeEvent, ChromeResult, ChromeType, encode, resolve
 
 
-class ConsoleMessage:
+class ConsoleMessage(ChromeType):
     """Console message."""
+    _fields = ('source', 'level', 'text', 'url', 'line', 'column')
+    __slots__ = _fields
+
     def __init__(self, source: str, level: str, text: str, url: str=None, line: int=None, column: int=None):
         # Message source.
         self.source = source
@@ -20,18 +24,53 @@ class ConsoleMessage:
         # Column number in the resource that generated this message (1-based).
         self.column = column
 
+    def to_wire(self):
+        wire = {"source": self.source, "level": self.level, "text": self.text}
+        if self.url is not None:
+            wire["url"] = self.url
+        if self.line is not None:
+            wire["line"] = self.line
+        if self.column is not None:
+            wire["column"] = self.column
+        return wire
+
+    @classmethod
+    def from_wire(cls, wire: dict):
+        obj = cls.__new__(cls)
+        obj.source = wire["source"]
+        obj.level = wire["level"]
+        obj.text = wire["text"]
+        obj.url = wire.get("url")
+        obj.line = wire.get("line")
+        obj.column = wire.get("column")
+        return obj
+
 class enable(ChromeCommand):
     """Enables console domain, sends the messages collected so far to the client by means of the <code>messageAdded</code> notification."""
+    _fields = ()
+    __slots__ = _fields
 
     def __init__(self): pass
 
 class disable(ChromeCommand):
     """Disables console domain, prevents further console messages from being reported to the client."""
+    _fields = ()
+    __slots__ = _fields
 
     def __init__(self): pass
 
 class clearMessages(ChromeCommand):
     """Does nothing."""
+    _fields = ()
+    __slots__ = _fields
 
     def __init__(self): pass
 
+class messageAdded(ChromeEvent):
+    """Issued when new console message is added."""
+    __slots__ = ()
+    _fields = ('message',)
+    # Console message that has been added.
+    message: ConsoleMessage
+    _types = {'message': ConsoleMessage}
+
@@ -1,9 +1,12 @@
+# schema hash: d67243d019d8730c3ddeb8d14e51984164998737
 from enum import Enum
-from typing import Any, List
+from typing import TYPE_CHECKING, Any, List
 
-from .base import ChromeCommand
+from .base import ChromeCommand, ChromeEvent, ChromeResult, ChromeType, encode, resolve
 
-from . import Page
+if TYPE_CHECKING:
+    from . import Page
+    from . import Runtime
 
 # Unique DOM node identifier.
 NodeId = int
@@ -11,24 +14,43 @@ NodeId = int
 # Unique DOM node identifier used to reference a node that may not have been pushed to the front-end.
 BackendNodeId = int
 
-class BackendNode:
+class BackendNode(ChromeType):
     """Backend node with a friendly name."""
-    def __init__(self, nodeType: int, nodeName: str, backendNodeId: "BackendNodeId"):
+    _fields = ('nodeType', 'nodeName', 'backendNodeId')
+    __slots__ = _fields
+
+    def __init__(self, nodeType: int, nodeName: str, backendNodeId: BackendNodeId):
         # <code>Node</code>'s nodeType.
         self.nodeType = nodeType
         # <code>Node</code>'s nodeName.
         self.nodeName = nodeName
         self.backendNodeId = backendNodeId
 
+    def to_wire(self):
+        wire = {"nodeType": self.nodeType, "nodeName": self.nodeName, "backendNodeId": self.backendNodeId}
+        return wire
+
+    @classmethod
+    def from_wire(cls, wire: dict):
+        obj = cls.__new__(cls)
+        obj.nodeType = wire["nodeType"]
+        obj.nodeName = wire["nodeName"]
+        obj.backendNodeId = wire["backendNodeId"]
+        return obj
+
 PseudoType = Enum("PseudoType", "first-line first-letter before after backdrop selection first-line-inherited scrollbar scrollbar-thumb scrollbar-button scrollbar-track scrollbar-track-piece scrollbar-corner resizer input-list-button")
 PseudoType.__doc__ = """Pseudo element type."""
 
 ShadowRootType = Enum("ShadowRootType", "user-agent open closed")
 ShadowRootType.__doc__ = """Shadow root type."""
 
-class Node:
+class Node(ChromeType):
     """DOM interaction is implemented in terms of mirror objects that represent the actual DOM nodes. DOMNode is a base node mirror type."""
-    def __init__(self, nodeId: "NodeId", backendNodeId: "BackendNodeId", nodeType: int, nodeName: str, localName: str, nodeValue: str, childNodeCount: int=None, children: List=None, attributes: List=None, documentURL: str=None, baseURL: str=None, publicId: str=None, systemId: str=None, internalSubset: str=None, xmlVersion: str=None, name: str=None, value: str=None, pseudoType: "PseudoType"=None, shadowRootType: "ShadowRootType"=None, frameId: "Page.FrameId"=None, contentDocument: "Node"=None, shadowRoots: List=None, templateContent: "Node"=None, pseudoElements: List=None, importedDocument: "Node"=None, distributedNodes: List=None, isSVG: bool=None):
+    _fields = ('nodeId', 'backendNodeId', 'nodeType', 'nodeName', 'localName', 'nodeValue', 'childNodeCount', 'children', 'attributes', 'documentURL', 'baseURL', 'publicId', 'systemId', 'internalSubset', 'xmlVersion', 'name', 'value', 'pseudoType', 'shadowRootType', 'frameId', 'contentDocument', 'shadowRoots', 'templateContent', 'pseudoElements', 'importedDocument', 'distributedNodes', 'isSVG')
+    __slots__ = _fields
+    _types = {'children': ['DOM.Node'], 'pseudoType': PseudoType, 'shadowRootType': ShadowRootType, 'contentDocument': 'DOM.Node', 'shadowRoots': ['DOM.Node'], 'templateContent': 'DOM.Node', 'pseudoElements': ['DOM.Node'], 'importedDocument': 'DOM.Node', 'distributedNodes': [BackendNode]}
+
+    def __init__(self, nodeId: NodeId, backendNodeId: BackendNodeId, nodeType: int, nodeName: str, localName: str, nodeValue: str, childNodeCount: int=None, children: List=None, attributes: List=None, documentURL: str=None, baseURL: str=None, publicId: str=None, systemId: str=None, internalSubset: str=None, xmlVersion: str=None, name: str=None, value: str=None, pseudoType: PseudoType=None, shadowRootType: ShadowRootType=None, frameId: "Page.FrameId"=None, contentDocument: "Node"=None, shadowRoots: List=None, templateContent: "Node"=None, pseudoElements: List=None, importedDocument: "Node"=None, distributedNodes: List=None, isSVG: bool=None):
         # Node identifier that is passed into the rest of the DOM messages as the <code>nodeId</code>. Backend will only push node with given <code>id</code> once. It is aware of all requested nodes and will only fire DOM events for nodes known to the client.
         self.nodeId = nodeId
         # The BackendNodeId for this node.
@@ -84,8 +106,89 @@ class Node:
         # Whether the node is SVG.
         self.isSVG = isSVG
 
-class RGBA:
+    def to_wire(self):
+        wire = {"nodeId": self.nodeId, "backendNodeId": self.backendNodeId, "nodeType": self.nodeType, "nodeName": self.nodeName, "localName": self.localName, "nodeValue": self.nodeValue}
+        if self.childNodeCount is not None:
+            wire["childNodeCount"] = self.childNodeCount
+        if self.children is not None:
+            wire["children"] = encode(self.children)
+        if self.attributes is not None:
+            wire["attributes"] = self.attributes
+        if self.documentURL is not None:
+            wire["documentURL"] = self.documentURL
+        if self.baseURL is not None:
+            wire["baseURL"] = self.baseURL
+        if self.publicId is not None:
+            wire["publicId"] = self.publicId
+        if self.systemId is not None:
+            wire["systemId"] = self.systemId
+        if self.internalSubset is not None:
+            wire["internalSubset"] = self.internalSubset
+        if self.xmlVersion is not None:
+            wire["xmlVersion"] = self.xmlVersion
+        if self.name is not None:
+            wire["name"] = self.name
+        if self.value is not None:
+            wire["value"] = self.value
+        if self.pseudoType is not None:
+            wire["pseudoType"] = encode(self.pseudoType)
+        if self.shadowRootType is not None:
+            wire["shadowRootType"] = encode(self.shadowRootType)
+        if self.frameId is not None:
+            wire["frameId"] = self.frameId
+        if self.contentDocument is not None:
+            wire["contentDocument"] = encode(self.contentDocument)
+        if self.shadowRoots is not None:
+            wire["shadowRoots"] = encode(self.shadowRoots)
+        if self.templateContent is not None:
+            wire["templateContent"] = encode(self.templateContent)
+        if self.pseudoElements is not None:
+            wire["pseudoElements"] = encode(self.pseudoElements)
+        if self.importedDocument is not None:
+            wire["importedDocument"] = encode(self.importedDocument)
+        if self.distributedNodes is not None:
+            wire["distributedNodes"] = encode(self.distributedNodes)
+        if self.isSVG is not None:
+            wire["isSVG"] = self.isSVG
+        return wire
+
+    @classmethod
+    def from_wire(cls, wire: dict):
+        obj = cls.__new__(cls)
+        obj.nodeId = wire["nodeId"]
+        obj.backendNodeId = wire["backendNodeId"]
+        obj.nodeType = wire["nodeType"]
+        obj.nodeName = wire["nodeName"]
+        obj.localName = wire["localName"]
+        obj.nodeValue = wire["nodeValue"]
+        obj.childNodeCount = wire.get("childNodeCount")
+        obj.children = [Node.from_wire(x0) for x0 in wire["children"]] if "children" in wire else None
+        obj.attributes = wire.get("attributes")
+        obj.documentURL = wire.get("documentURL")
+        obj.baseURL = wire.get("baseURL")
+        obj.publicId = wire.get("publicId")
+        obj.systemId = wire.get("systemId")
+        obj.internalSubset = wire.get("internalSubset")
+        obj.xmlVersion = wire.get("xmlVersion")
+        obj.name = wire.get("name")
+        obj.value = wire.get("value")
+        obj.pseudoType = PseudoType.__members__.get(wire["pseudoType"], wire["pseudoType"]) if "pseudoType" in wire else None
+        obj.shadowRootType = ShadowRootType.__members__.get(wire["shadowRootType"], wire["shadowRootType"]) if "shadowRootType" in wire else None
+        obj.frameId = wire.get("frameId")
+        obj.contentDocument = Node.from_wire(wire["contentDocument"]) if "contentDocument" in wire else None
+        obj.shadowRoots = [Node.from_wire(x0) for x0 in wire["shadowRoots"]] if "shadowRoots" in wire else None
+        obj.templateContent = Node.from_wire(wire["templateContent"]) if "templateContent" in wire else None
+        obj.pseudoElements = [Node.from_wire(x0) for x0 in wire["pseudoElements"]] if "pseudoElements" in wire else None
+        obj.importedDocument = Node.from_wire(wire["importedDocument"]) if "importedDocument" in wire else None
+        obj.distributedNodes = [BackendNode.from_wire(x0) for x0 in wire["distributedNodes"]] if "distributedNodes" in wire else None
+        obj.isSVG = wire.get("isSVG")
+        return obj
+
+class RGBA(ChromeType):
     """A structure holding an RGBA color."""
+    _fields = ('r', 'g', 'b', 'a')
+    __slots__ = _fields
+
     def __init__(self, r: int, g: int, b: int, a: float=None):
         # The red component, in the [0-255] range.
         self.r = r
@@ -96,11 +199,55 @@ class RGBA:
         # The alpha component, in the [0-1] range (default: 1).
         self.a = a
 
+    def to_wire(self):
+        wire = {"r": self.r, "g": self.g, "b": self.b}
+        if self.a is not None:
+            wire["a"] = self.a
+        return wire
+
+    @classmethod
+    def from_wire(cls, wire: dict):
+        obj = cls.__new__(cls)
+        obj.r = wire["r"]
+        obj.g = wire["g"]
+        obj.b = wire["b"]
+        obj.a = wire.get("a")
+        return obj
+
 # An array of quad vertices, x immediately followed by y for each point, points clock-wise.
 Quad = List[float]
-class BoxModel:
+class ShapeOutsideInfo(ChromeType):
+    """CSS Shape Outside details."""
+    _fields = ('bounds', 'shape', 'marginShape')
+    __slots__ = _fields
+
+    def __init__(self, bounds: Quad, shape: List, marginShape: List):
+        # Shape bounds
+        self.bounds = bounds
+        # Shape coordinate details
+        self.shape = shape
+        # Margin shape bounds
+        self.marginShape = marginShape
+
+    def to_wire(self):
+        wire = {"bounds": self.bounds, "shape": self.shape, "marginShape": self.marginShape}
+        return wire
+
+    @classmethod
+    def from_wire(cls, wire: dict):
+        obj = cls.__new__(cls)
+        obj.bounds = wire["bounds"]
+        obj.shape = wire["shape"]
+        obj.marginShape = wire["marginShape"]
+        return obj
+
+class BoxModel(ChromeType):
     """Box model."""
-    def __init__(self, content: "Quad", padding: "Quad", border: "Quad", margin: "Quad", width: int, height: int, shapeOutside: "ShapeOutsideInfo"=None):
+    _fields = ('content', 'padding', 'border', 'margin', 'width', 'height', 'shapeOutside')
+    __slots__ = _fields
+    _types = {'shapeOutside': ShapeOutsideInfo}
+
+    def __init__(self, content: Quad, padding: Quad, border: Quad, margin: Quad, width: int, height: int, shapeOutside: ShapeOutsideInfo=None):
         # Content box
         self.content = content
         # Padding box
@@ -116,18 +263,29 @@ class BoxModel:
         # Shape outside coordinates
         self.shapeOutside = shapeOutside
 
-class ShapeOutsideInfo:
-    """CSS Shape Outside details."""
-    def __init__(self, bounds: "Quad", shape: List, marginShape: List):
-        # Shape bounds
-        self.bounds = bounds
-        # Shape coordinate details
-        self.shape = shape
-        # Margin shape bounds
-        self.marginShape = marginShape
-
-class Rect:
+    def to_wire(self):
+        wire = {"content": self.content, "padding": self.padding, "border": self.border, "margin": self.margin, "width": self.width, "height": self.height}
+        if self.shapeOutside is not None:
+            wire["shapeOutside"] = encode(self.shapeOutside)
+        return wire
+
+    @classmethod
+    def from_wire(cls, wire: dict):
+        obj = cls.__new__(cls)
+        obj.content = wire["content"]
+        obj.padding = wire["padding"]
+        obj.border = wire["border"]
+        obj.margin = wire["margin"]
+        obj.width = wire["width"]
+        obj.height = wire["height"]
+        obj.shapeOutside = ShapeOutsideInfo.from_wire(wire["shapeOutside"]) if "shapeOutside" in wire else None
+        return obj
+
+class Rect(ChromeType):
     """Rectangle."""
+    _fields = ('x', 'y', 'width', 'height')
+    __slots__ = _fields
+
     def __init__(self, x: float, y: float, width: float, height: float):
         # X coordinate
         self.x = x
@@ -138,9 +296,26 @@ class Rect:
         # Rectangle height
         self.height = height
 
-class HighlightConfig:
+    def to_wire(self):
+        wire = {"x": self.x, "y": self.y, "width": self.width, "height": self.height}
+        return wire
+
+    @classmethod
+    def from_wire(cls, wire: dict):
+        obj = cls.__new__(cls)
+        obj.x = wire["x"]
+        obj.y = wire["y"]
+        obj.width = wire["width"]
+        obj.height = wire["height"]
+        return obj
+
+class HighlightConfig(ChromeType):
     """Configuration data for the highlighting of page elements."""
-    def __init__(self, showInfo: bool=None, showRulers: bool=None, showExtensionLines: bool=None, displayAsMaterial: bool=None, contentColor: "RGBA"=None, paddingColor: "RGBA"=None, borderColor: "RGBA"=None, marginColor: "RGBA"=None, eventTargetColor: "RGBA"=None, shapeColor: "RGBA"=None, shapeMarginColor: "RGBA"=None, selectorList: str=None):
+    _fields = ('showInfo', 'showRulers', 'showExtensionLines', 'displayAsMaterial', 'contentColor', 'paddingColor', 'borderColor', 'marginColor', 'eventTargetColor', 'shapeColor', 'shapeMarginColor', 'selectorList')
+    __slots__ = _fields
+    _types = {'contentColor': RGBA, 'paddingColor': RGBA, 'borderColor': RGBA, 'marginColor': RGBA, 'eventTargetColor': RGBA, 'shapeColor': RGBA, 'shapeMarginColor': RGBA}
+
+    def __init__(self, showInfo: bool=None, showRulers: bool=None, showExtensionLines: bool=None, displayAsMaterial: bool=None, contentColor: RGBA=None, paddingColor: RGBA=None, borderColor: RGBA=None, marginColor: RGBA=None, eventTargetColor: RGBA=None, shapeColor: RGBA=None, shapeMarginColor: RGBA=None, selectorList: str=None):
         # Whether the node info tooltip should be shown (default: false).
         self.showInfo = showInfo
         # Whether the rulers should be shown (default: false).
@@ -165,21 +340,80 @@ class HighlightConfig:
         # Selectors to highlight relevant nodes.
         self.selectorList = selectorList
 
+    def to_wire(self):
+        wire = {}
+        if self.showInfo is not None:
+            wire["showInfo"] = self.showInfo
+        if self.showRulers is not None:
+            wire["showRulers"] = self.showRulers
+        if self.showExtensionLines is not None:
+            wire["showExtensionLines"] = self.showExtensionLines
+        if self.displayAsMaterial is not None:
+            wire["displayAsMaterial"] = self.displayAsMaterial
+        if self.contentColor is not None:
+            wire["contentColor"] = encode(self.contentColor)
+        if self.paddingColor is not None:
+            wire["paddingColor"] = encode(self.paddingColor)
+        if self.borderColor is not None:
+            wire["borderColor"] = encode(self.borderColor)
+        if self.marginColor is not None:
+            wire["marginColor"] = encode(self.marginColor)
+        if self.eventTargetColor is not None:
+            wire["eventTargetColor"] = encode(self.eventTargetColor)
+        if self.shapeColor is not None:
+            wire["shapeColor"] = encode(self.shapeColor)
+        if self.shapeMarginColor is not None:
+            wire["shapeMarginColor"] = encode(self.shapeMarginColor)
+        if self.selectorList is not None:
+            wire["selectorList"] = self.selectorList
+        return wire
+
+    @classmethod
+    def from_wire(cls, wire: dict):
+        obj = cls.__new__(cls)
+        obj.showInfo = wire.get("showInfo")
+        obj.showRulers = wire.get("showRulers")
+        obj.showExtensionLines = wire.get("showExtensionLines")
+        obj.displayAsMaterial = wire.get("displayAsMaterial")
+        obj.contentColor = RGBA.from_wire(wire["contentColor"]) if "contentColor" in wire else None
+        obj.paddingColor = RGBA.from_wire(wire["paddingColor"]) if "paddingColor" in wire else None
+        obj.borderColor = RGBA.from_wire(wire["borderColor"]) if "borderColor" in wire else None
+        obj.marginColor = RGBA.from_wire(wire["marginColor"]) if "marginColor" in wire else None
+        obj.eventTargetColor = RGBA.from_wire(wire["eventTargetColor"]) if "eventTargetColor" in wire else None
+        obj.shapeColor = RGBA.from_wire(wire["shapeColor"]) if "shapeColor" in wire else None
+        obj.shapeMarginColor = RGBA.from_wire(wire["shapeMarginColor"]) if "shapeMarginColor" in wire else None
+        obj.selectorList = wire.get("selectorList")
+        return obj
+
 InspectMode = Enum("InspectMode", "searchForNode searchForUAShadowDOM none")
 InspectMode.__doc__ = """"""
 
 class enable(ChromeCommand):
     """Enables DOM agent for the given page."""
+    _fields = ()
+    __slots__ = _fields
 
     def __init__(self): pass
 
 class disable(ChromeCommand):
     """Disables DOM agent for the given page."""
+    _fields = ()
+    __slots__ = _fields
 
     def __init__(self): pass
 
+class getDocumentResult(ChromeResult):
+    __slots__ = ()
+    _fields = ('root',)
+    # Resulting node.
+    root: Node
+    _types = {'root': Node}
+
 class getDocument(ChromeCommand):
     """Returns the root DOM node (and optionally the subtree) to the caller."""
+    _fields = ('depth', 'pierce')
+    __slots__ = _fields
+    _result = getDocumentResult
 
     def __init__(self, depth: int=None, pierce: bool=None):
         # The maximum depth at which children should be retrieved, defaults to 1. Use -1 for the entire subtree or provide an integer larger than 0.
@@ -187,21 +421,44 @@ class getDocument(ChromeCommand):
         # Whether or not iframes and shadow roots should be traversed when returning the subtree (default is false).
         self.pierce = pierce
 
+    def to_wire(self):
+        wire = {}
+        if self.depth is not None:
+            wire["depth"] = self.depth
+        if self.pierce is not None:
+            wire["pierce"] = self.pierce
+        return wire
+
 
 
+class collectClassNamesFromSubtreeResult(ChromeResult):
+    __slots__ = ()
+    _fields = ('classNames',)
+    # Class name list.
+    classNames: List
+
 class collectClassNamesFromSubtree(ChromeCommand):
     """Collects class names for the node with given id and all of it's child nodes."""
+    _fields = ('nodeId',)
+    __slots__ = _fields
+    _result = collectClassNamesFromSubtreeResult
 
-    def __init__(self, nodeId: "NodeId"):
+    def __init__(self, nodeId: NodeId):
         # Id of the node to collect class names.
         self.nodeId = nodeId
 
+    def to_wire(self):
+        wire = {"nodeId": self.nodeId}
+        return wire
+
 
 
 class requestChildNodes(ChromeCommand):
     """Requests that children of the node with given id are returned to the caller in form of <code>setChildNodes</code> events where not only immediate children are retrieved, but all children down to the specified depth."""
+    _fields = ('nodeId', 'depth', 'pierce')
+    __slots__ = _fields
 
-    def __init__(self, nodeId: "NodeId", depth: int=None, pierce: bool=None):
+    def __init__(self, nodeId: NodeId, depth: int=None, pierce: bool=None):
         # Id of the node to get children for.
         self.nodeId = nodeId
         # The maximum depth at which children should be retrieved, defaults to 1. Use -1 for the entire subtree or provide an integer larger than 0.
@@ -209,65 +466,126 @@ class requestChildNodes(ChromeCommand):
         # Whether or not iframes and shadow roots should be traversed when returning the sub-tree (default is false).
         self.pierce = pierce
 
+    def to_wire(self):
+        wire = {"nodeId": self.nodeId}
+        if self.depth is not None:
+            wire["depth"] = self.depth
+        if self.pierce is not None:
+            wire["pierce"] = self.pierce
+        return wire
+
 
 
+class querySelectorResult(ChromeResult):
+    __slots__ = ()
+    _fields = ('nodeId',)
+    # Query selector result.
+    nodeId: NodeId
+
 class querySelector(ChromeCommand):
     """Executes <code>querySelector</code> on a given node."""
+    _fields = ('nodeId', 'selector')
+    __slots__ = _fields
+    _result = querySelectorResult
 
-    def __init__(self, nodeId: "NodeId", selector: str):
+    def __init__(self, nodeId: NodeId, selector: str):
         # Id of the node to query upon.
         self.nodeId = nodeId
         # Selector string.
         self.selector = selector
 
+    def to_wire(self):
+        wire = {"nodeId": self.nodeId, "selector": self.selector}
+        return wire
+
 
 
+class querySelectorAllResult(ChromeResult):
+    __slots__ = ()
+    _fields = ('nodeIds',)
+    # Query selector result.
+    nodeIds: List
+
 class querySelectorAll(ChromeCommand):
     """Executes <code>querySelectorAll</code> on a given node."""
+    _fields = ('nodeId', 'selector')
+    __slots__ = _fields
+    _result = querySelectorAllResult
 
-    def __init__(self, nodeId: "NodeId", selector: str):
+    def __init__(self, nodeId: NodeId, selector: str):
         # Id of the node to query upon.
         self.nodeId = nodeId
         # Selector string.
         self.selector = selector
 
+    def to_wire(self):
+        wire = {"nodeId": self.nodeId, "selector": self.selector}
+        return wire
+
+
 
+class setNodeNameResult(ChromeResult):
+    __slots__ = ()
+    _fields = ('nodeId',)
+    # New node's id.
+    nodeId: NodeId
 
 class setNodeName(ChromeCommand):
     """Sets node name for a node with given id."""
+    _fields = ('nodeId', 'name')
+    __slots__ = _fields
+    _result = setNodeNameResult
 
-    def __init__(self, nodeId: "NodeId", name: str):
+    def __init__(self, nodeId: NodeId, name: str):
         # Id of the node to set name for.
         self.nodeId = nodeId
         # New node's name.
         self.name = name
 
+    def to_wire(self):
+        wire = {"nodeId": self.nodeId, "name": self.name}
+        return wire
+
 
 
 class setNodeValue(ChromeCommand):
     """Sets node value for a node with given id."""
+    _fields = ('nodeId', 'value')
+    __slots__ = _fields
 
-    def __init__(self, nodeId: "NodeId", value: str):
+    def __init__(self, nodeId: NodeId, value: str):
         # Id of the node to set value for.
         self.nodeId = nodeId
         # New node's value.
         self.value = value
 
+    def to_wire(self):
+        wire = {"nodeId": self.nodeId, "value": self.value}
+        return wire
+
 
 
 class removeNode(ChromeCommand):
     """Removes node with given id."""
+    _fields = ('nodeId',)
+    __slots__ = _fields
 
-    def __init__(self, nodeId: "NodeId"):
+    def __init__(self, nodeId: NodeId):
         # Id of the node to remove.
         self.nodeId = nodeId
 
+    def to_wire(self):
+        wire = {"nodeId": self.nodeId}
+        return wire
+
 
 
 class setAttributeValue(ChromeCommand):
     """Sets attribute for an element with given id."""
+    _fields = ('nodeId', 'name', 'value')
+    __slots__ = _fields
 
-    def __init__(self, nodeId: "NodeId", name: str, value: str):
+    def __init__(self, nodeId: NodeId, name: str, value: str):
         # Id of the element to set attribute for.
         self.nodeId = nodeId
         # Attribute name.
@@ -275,12 +593,18 @@ class setAttributeValue(ChromeCommand):
         # Attribute value.
         self.value = value
 
+    def to_wire(self):
+        wire = {"nodeId": self.nodeId, "name": self.name, "value": self.value}
+        return wire
+
 
 
 class setAttributesAsText(ChromeCommand):
     """Sets attributes on element with given id. This method is useful when user edits some existing attribute value and types in several attribute name/value pairs."""
+    _fields = ('nodeId', 'text', 'name')
+    __slots__ = _fields
 
-    def __init__(self, nodeId: "NodeId", text: str, name: str=None):
+    def __init__(self, nodeId: NodeId, text: str, name: str=None):
         # Id of the element to set attributes for.
         self.nodeId = nodeId
         # Text with a number of attributes. Will parse this text using HTML parser.
@@ -288,41 +612,83 @@ class setAttributesAsText(ChromeCommand):
         # Attribute name to replace with new attributes derived from text in case text parsed successfully.
         self.name = name
 
+    def to_wire(self):
+        wire = {"nodeId": self.nodeId, "text": self.text}
+        if self.name is not None:
+            wire["name"] = self.name
+        return wire
+
 
 
 class removeAttribute(ChromeCommand):
     """Removes attribute with given name from an element with given id."""
+    _fields = ('nodeId', 'name')
+    __slots__ = _fields
 
-    def __init__(self, nodeId: "NodeId", name: str):
+    def __init__(self, nodeId: NodeId, name: str):
         # Id of the element to remove attribute from.
         self.nodeId = nodeId
         # Name of the attribute to remove.
         self.name = name
 
+    def to_wire(self):
+        wire = {"nodeId": self.nodeId, "name": self.name}
+        return wire
 
 
+
+class getOuterHTMLResult(ChromeResult):
+    __slots__ = ()
+    _fields = ('outerHTML',)
+    # Outer HTML markup.
+    outerHTML: str
+
 class getOuterHTML(ChromeCommand):
     """Returns node's HTML markup."""
+    _fields = ('nodeId',)
+    __slots__ = _fields
+    _result = getOuterHTMLResult
 
-    def __init__(self, nodeId: "NodeId"):
+    def __init__(self, nodeId: NodeId):
         # Id of the node to get markup for.
         self.nodeId = nodeId
 
+    def to_wire(self):
+        wire = {"nodeId": self.nodeId}
+        return wire
+
 
 
 class setOuterHTML(ChromeCommand):
     """Sets node HTML markup, returns new node id."""
+    _fields = ('nodeId', 'outerHTML')
+    __slots__ = _fields
 
-    def __init__(self, nodeId: "NodeId", outerHTML: str):
+    def __init__(self, nodeId: NodeId, outerHTML: str):
         # Id of the node to set markup for.
         self.nodeId = nodeId
         # Outer HTML markup to set.
         self.outerHTML = outerHTML
 
+    def to_wire(self):
+        wire = {"nodeId": self.nodeId, "outerHTML": self.outerHTML}
+        return wire
 
 
+
+class performSearchResult(ChromeResult):
+    __slots__ = ()
+    _fields = ('searchId', 'resultCount')
+    # Unique search session identifier.
+    searchId: str
+    # Number of search results.
+    resultCount: int
+
 class performSearch(ChromeCommand):
     """Searches for a given string in the DOM tree. Use <code>getSearchResults</code> to access search results or <code>cancelSearch</code> to end this search session."""
+    _fields = ('query', 'includeUserAgentShadowDOM')
+    __slots__ = _fields
+    _result = performSearchResult
 
     def __init__(self, query: str, includeUserAgentShadowDOM: bool=None):
         # Plain text or query selector or XPath search query.
@@ -330,10 +696,25 @@ class performSearch(ChromeCommand):
         # True to search in user agent shadow DOM.
         self.includeUserAgentShadowDOM = includeUserAgentShadowDOM
 
+    def to_wire(self):
+        wire = {"query": self.query}
+        if self.includeUserAgentShadowDOM is not None:
+            wire["includeUserAgentShadowDOM"] = self.includeUserAgentShadowDOM
+        return wire
+
 
 
+class getSearchResultsResult(ChromeResult):
+    __slots__ = ()
+    _fields = ('nodeIds',)
+    # Ids of the search result nodes.
+    nodeIds: List
+
 class getSearchResults(ChromeCommand):
     """Returns search results from given <code>fromIndex</code> to given <code>toIndex</code> from the sarch with the given identifier."""
+    _fields = ('searchId', 'fromIndex', 'toIndex')
+    __slots__ = _fields
+    _result = getSearchResultsResult
 
     def __init__(self, searchId: str, fromIndex: int, toIndex: int):
         # Unique search session identifier.
@@ -343,41 +724,74 @@ class getSearchResults(ChromeCommand):
         # End index of the search result to be returned.
         self.toIndex = toIndex
 
+    def to_wire(self):
+        wire = {"searchId": self.searchId, "fromIndex": self.fromIndex, "toIndex": self.toIndex}
+        return wire
+
 
 
 class discardSearchResults(ChromeCommand):
     """Discards search results from the session with the given id. <code>getSearchResults</code> should no longer be called for that search."""
+    _fields = ('searchId',)
+    __slots__ = _fields
 
     def __init__(self, searchId: str):
         # Unique search session identifier.
         self.searchId = searchId
 
+    def to_wire(self):
+        wire = {"searchId": self.searchId}
+        return wire
 
 
+
+class requestNodeResult(ChromeResult):
+    __slots__ = ()
+    _fields = ('nodeId',)
+    # Node id for given object.
+    nodeId: NodeId
+
 class requestNode(ChromeCommand):
     """Requests that the node is sent to the caller given the JavaScript node object reference. All nodes that form the path from the node to the root are also sent to the client as a series of <code>setChildNodes</code> notifications."""
+    _fields = ('objectId',)
+    __slots__ = _fields
+    _result = requestNodeResult
 
     def __init__(self, objectId: "Runtime.RemoteObjectId"):
         # JavaScript object id to convert into node.
         self.objectId = objectId
 
+    def to_wire(self):
+        wire = {"objectId": self.objectId}
+        return wire
+
 
 
 class setInspectMode(ChromeCommand):
     """Enters the 'inspect' mode. In this mode, elements that user is hovering over are highlighted. Backend then generates 'inspectNodeRequested' event upon element selection."""
+    _fields = ('mode', 'highlightConfig')
+    __slots__ = _fields
 
-    def __init__(self, mode: "InspectMode", highlightConfig: "HighlightConfig"=None):
+    def __init__(self, mode: InspectMode, highlightConfig: HighlightConfig=None):
         # Set an inspection mode.
         self.mode = mode
         # A descriptor for the highlight appearance of hovered-over nodes. May be omitted if <code>enabled == false</code>.
         self.highlightConfig = highlightConfig
 
+    def to_wire(self):
+        wire = {"mode": encode(self.mode)}
+        if self.highlightConfig is not None:
+            wire["highlightConfig"] = encode(self.highlightConfig)
+        return wire
+
 
 
 class highlightRect(ChromeCommand):
     """Highlights given rectangle. Coordinates are absolute with respect to the main frame viewport."""
+    _fields = ('x', 'y', 'width', 'height', 'color', 'outlineColor')
+    __slots__ = _fields
 
-    def __init__(self, x: int, y: int, width: int, height: int, color: "RGBA"=None, outlineColor: "RGBA"=None):
+    def __init__(self, x: int, y: int, width: int, height: int, color: RGBA=None, outlineColor: RGBA=None):
         # X coordinate
         self.x = x
         # Y coordinate
@@ -391,12 +805,22 @@ class highlightRect(ChromeCommand):
         # The highlight outline color (default: transparent).
         self.outlineColor = outlineColor
 
+    def to_wire(self):
+        wire = {"x": self.x, "y": self.y, "width": self.width, "height": self.height}
+        if self.color is not None:
+            wire["color"] = encode(self.color)
+        if self.outlineColor is not None:
+            wire["outlineColor"] = encode(self.outlineColor)
+        return wire
+
 
 
 class highlightQuad(ChromeCommand):
     """Highlights given quad. Coordinates are absolute with respect to the main frame viewport."""
+    _fields = ('quad', 'color', 'outlineColor')
+    __slots__ = _fields
 
-    def __init__(self, quad: "Quad", color: "RGBA"=None, outlineColor: "RGBA"=None):
+    def __init__(self, quad: Quad, color: RGBA=None, outlineColor: RGBA=None):
         # Quad to highlight
         self.quad = quad
         # The highlight fill color (default: transparent).
@@ -404,12 +828,22 @@ class highlightQuad(ChromeCommand):
         # The highlight outline color (default: transparent).
         self.outlineColor = outlineColor
 
+    def to_wire(self):
+        wire = {"quad": self.quad}
+        if self.color is not None:
+            wire["color"] = encode(self.color)
+        if self.outlineColor is not None:
+            wire["outlineColor"] = encode(self.outlineColor)
+        return wire
+
 
 
 class highlightNode(ChromeCommand):
     """Highlights DOM node with given id or with the given JavaScript object wrapper. Either nodeId or objectId must be specified."""
+    _fields = ('highlightConfig', 'nodeId', 'backendNodeId', 'objectId')
+    __slots__ = _fields
 
-    def __init__(self, highlightConfig: "HighlightConfig", nodeId: "NodeId"=None, backendNodeId: "BackendNodeId"=None, objectId: "Runtime.RemoteObjectId"=None):
+    def __init__(self, highlightConfig: HighlightConfig, nodeId: NodeId=None, backendNodeId: BackendNodeId=None, objectId: "Runtime.RemoteObjectId"=None):
         # A descriptor for the highlight appearance.
         self.highlightConfig = highlightConfig
         # Identifier of the node to highlight.
@@ -419,17 +853,31 @@ class highlightNode(ChromeCommand):
         # JavaScript object id of the node to be highlighted.
         self.objectId = objectId
 
+    def to_wire(self):
+        wire = {"highlightConfig": encode(self.highlightConfig)}
+        if self.nodeId is not None:
+            wire["nodeId"] = self.nodeId
+        if self.backendNodeId is not None:
+            wire["backendNodeId"] = self.backendNodeId
+        if self.objectId is not None:
+            wire["objectId"] = self.objectId
+        return wire
+
 
 
 class hideHighlight(ChromeCommand):
     """Hides DOM node highlight."""
+    _fields = ()
+    __slots__ = _fields
 
     def __init__(self): pass
 
 class highlightFrame(ChromeCommand):
     """Highlights owner element of the frame with given id."""
+    _fields = ('frameId', 'contentColor', 'contentOutlineColor')
+    __slots__ = _fields
 
-    def __init__(self, frameId: "Page.FrameId", contentColor: "RGBA"=None, contentOutlineColor: "RGBA"=None):
+    def __init__(self, frameId: "Page.FrameId", contentColor: RGBA=None, contentOutlineColor: RGBA=None):
         # Identifier of the frame to highlight.
         self.frameId = frameId
         # The content box highlight fill color (default: transparent).
@@ -437,59 +885,137 @@ class highlightFrame(ChromeCommand):
         # The content box highlight outline color (default: transparent).
         self.contentOutlineColor = contentOutlineColor
 
+    def to_wire(self):
+        wire = {"frameId": self.frameId}
+        if self.contentColor is not None:
+            wire["contentColor"] = encode(self.contentColor)
+        if self.contentOutlineColor is not None:
+            wire["contentOutlineColor"] = encode(self.contentOutlineColor)
+        return wire
+
 
 
+class pushNodeByPathToFrontendResult(ChromeResult):
+    __slots__ = ()
+    _fields = ('nodeId',)
+    # Id of the node for given path.
+    nodeId: NodeId
+
 class pushNodeByPathToFrontend(ChromeCommand):
     """Requests that the node is sent to the caller given its path. // FIXME, use XPath"""
+    _fields = ('path',)
+    __slots__ = _fields
+    _result = pushNodeByPathToFrontendResult
 
     def __init__(self, path: str):
         # Path to node in the proprietary format.
         self.path = path
 
+    def to_wire(self):
+        wire = {"path": self.path}
+        return wire
+
 
 
+class pushNodesByBackendIdsToFrontendResult(ChromeResult):
+    __slots__ = ()
+    _fields = ('nodeIds',)
+    # The array of ids of pushed nodes that correspond to the backend ids specified in backendNodeIds.
+    nodeIds: List
+
 class pushNodesByBackendIdsToFrontend(ChromeCommand):
     """Requests that a batch of nodes is sent to the caller given their backend node ids."""
+    _fields = ('backendNodeIds',)
+    __slots__ = _fields
+    _result = pushNodesByBackendIdsToFrontendResult
 
     def __init__(self, backendNodeIds: List):
         # The array of backend node ids.
         self.backendNodeIds = backendNodeIds
 
+    def to_wire(self):
+        wire = {"backendNodeIds": self.backendNodeIds}
+        return wire
+
 
 
 class setInspectedNode(ChromeCommand):
     """Enables console to refer to the node with given id via $x (see Command Line API for more details $x functions)."""
+    _fields = ('nodeId',)
+    __slots__ = _fields
 
-    def __init__(self, nodeId: "NodeId"):
+    def __init__(self, nodeId: NodeId):
         # DOM node id to be accessible by means of $x command line API.
         self.nodeId = nodeId
 
+    def to_wire(self):
+        wire = {"nodeId": self.nodeId}
+        return wire
+
 
 
+class resolveNodeResult(ChromeResult):
+    __slots__ = ()
+    _fields = ('object',)
+    # JavaScript object wrapper for given node.
+    object: "Runtime.RemoteObject"
+    _types = {'object': 'Runtime.RemoteObject'}
+
 class resolveNode(ChromeCommand):
     """Resolves JavaScript node object for given node id."""
+    _fields = ('nodeId', 'objectGroup')
+    __slots__ = _fields
+    _result = resolveNodeResult
 
-    def __init__(self, nodeId: "NodeId", objectGroup: str=None):
+    def __init__(self, nodeId: NodeId, objectGroup: str=None):
         # Id of the node to resolve.
         self.nodeId = nodeId
         # Symbolic group name that can be used to release multiple objects.
         self.objectGroup = objectGroup
 
+    def to_wire(self):
+        wire = {"nodeId": self.nodeId}
+        if self.objectGroup is not None:
+            wire["objectGroup"] = self.objectGroup
+        return wire
+
+
 
+class getAttributesResult(ChromeResult):
+    __slots__ = ()
+    _fields = ('attributes',)
+    # An interleaved array of node attribute names and values.
+    attributes: List
 
 class getAttributes(ChromeCommand):
     """Returns attributes for the specified node."""
+    _fields = ('nodeId',)
+    __slots__ = _fields
+    _result = getAttributesResult
 
-    def __init__(self, nodeId: "NodeId"):
+    def __init__(self, nodeId: NodeId):
         # Id of the node to retrieve attibutes for.
         self.nodeId = nodeId
 
+    def to_wire(self):
+        wire = {"nodeId": self.nodeId}
+        return wire
 
 
+
+class copyToResult(ChromeResult):
+    __slots__ = ()
+    _fields = ('nodeId',)
+    # Id of the node clone.
+    nodeId: NodeId
+
 class copyTo(ChromeCommand):
     """Creates a deep copy of the specified node and places it into the target container before the given anchor."""
+    _fields = ('nodeId', 'targetNodeId', 'insertBeforeNodeId')
+    __slots__ = _fields
+    _result = copyToResult
 
-    def __init__(self, nodeId: "NodeId", targetNodeId: "NodeId", insertBeforeNodeId: "NodeId"=None):
+    def __init__(self, nodeId: NodeId, targetNodeId: NodeId, insertBeforeNodeId: NodeId=None):
         # Id of the node to copy.
         self.nodeId = nodeId
         # Id of the element to drop the copy into.
@@ -497,12 +1023,27 @@ class copyTo(ChromeCommand):
         # Drop the copy before this node (if absent, the copy becomes the last child of <code>targetNodeId</code>).
         self.insertBeforeNodeId = insertBeforeNodeId
 
+    def to_wire(self):
+        wire = {"nodeId": self.nodeId, "targetNodeId": self.targetNodeId}
+        if self.insertBeforeNodeId is not None:
+            wire["insertBeforeNodeId"] = self.insertBeforeNodeId
+        return wire
+
 
 
+class moveToResult(ChromeResult):
+    __slots__ = ()
+    _fields = ('nodeId',)
+    # New id of the moved node.
+    nodeId: NodeId
+
 class moveTo(ChromeCommand):
     """Moves node into the new container, places it before the given anchor."""
+    _fields = ('nodeId', 'targetNodeId', 'insertBeforeNodeId')
+    __slots__ = _fields
+    _result = moveToResult
 
-    def __init__(self, nodeId: "NodeId", targetNodeId: "NodeId", insertBeforeNodeId: "NodeId"=None):
+    def __init__(self, nodeId: NodeId, targetNodeId: NodeId, insertBeforeNodeId: NodeId=None):
         # Id of the node to move.
         self.nodeId = nodeId
         # Id of the element to drop the moved node into.
@@ -510,54 +1051,101 @@ class moveTo(ChromeCommand):
         # Drop node before this one (if absent, the moved node becomes the last child of <code>targetNodeId</code>).
         self.insertBeforeNodeId = insertBeforeNodeId
 
+    def to_wire(self):
+        wire = {"nodeId": self.nodeId, "targetNodeId": self.targetNodeId}
+        if self.insertBeforeNodeId is not None:
+            wire["insertBeforeNodeId"] = self.insertBeforeNodeId
+        return wire
+
 
 
 class undo(ChromeCommand):
     """Undoes the last performed action."""
+    _fields = ()
+    __slots__ = _fields
 
     def __init__(self): pass
 
 class redo(ChromeCommand):
     """Re-does the last undone action."""
+    _fields = ()
+    __slots__ = _fields
 
     def __init__(self): pass
 
 class markUndoableState(ChromeCommand):
     """Marks last undoable state."""
+    _fields = ()
+    __slots__ = _fields
 
     def __init__(self): pass
 
 class focus(ChromeCommand):
     """Focuses the given element."""
+    _fields = ('nodeId',)
+    __slots__ = _fields
 
-    def __init__(self, nodeId: "NodeId"):
+    def __init__(self, nodeId: NodeId):
         # Id of the node to focus.
         self.nodeId = nodeId
 
+    def to_wire(self):
+        wire = {"nodeId": self.nodeId}
+        return wire
+
 
 
 class setFileInputFiles(ChromeCommand):
     """Sets files for the given file input element."""
+    _fields = ('nodeId', 'files')
+    __slots__ = _fields
 
-    def __init__(self, nodeId: "NodeId", files: List):
+    def __init__(self, nodeId: NodeId, files: List):
         # Id of the file input node to set files for.
         self.nodeId = nodeId
         # Array of file paths to set.
         self.files = files
 
+    def to_wire(self):
+        wire = {"nodeId": self.nodeId, "files": self.files}
+        return wire
+
+
 
+class getBoxModelResult(ChromeResult):
+    __slots__ = ()
+    _fields = ('model',)
+    # Box model for the node.
+    model: BoxModel
+    _types = {'model': BoxModel}
 
 class getBoxModel(ChromeCommand):
     """Returns boxes for the currently selected nodes."""
+    _fields = ('nodeId',)
+    __slots__ = _fields
+    _result = getBoxModelResult
 
-    def __init__(self, nodeId: "NodeId"):
+    def __init__(self, nodeId: NodeId):
         # Id of the node to get box model for.
         self.nodeId = nodeId
 
+    def to_wire(self):
+        wire = {"nodeId": self.nodeId}
+        return wire
+
+
 
+class getNodeForLocationResult(ChromeResult):
+    __slots__ = ()
+    _fields = ('nodeId',)
+    # Id of the node at given coordinates.
+    nodeId: NodeId
 
 class getNodeForLocation(ChromeCommand):
     """Returns node id at given location."""
+    _fields = ('x', 'y')
+    __slots__ = _fields
+    _result = getNodeForLocationResult
 
     def __init__(self, x: int, y: int):
         # X coordinate.
@@ -565,23 +1153,194 @@ class getNodeForLocation(ChromeCommand):
         # Y coordinate.
         self.y = y
 
+    def to_wire(self):
+        wire = {"x": self.x, "y": self.y}
+        return wire
 
 
+
+class getRelayoutBoundaryResult(ChromeResult):
+    __slots__ = ()
+    _fields = ('nodeId',)
+    # Relayout boundary node id for the given node.
+    nodeId: NodeId
+
 class getRelayoutBoundary(ChromeCommand):
     """Returns the id of the nearest ancestor that is a relayout boundary."""
+    _fields = ('nodeId',)
+    __slots__ = _fields
+    _result = getRelayoutBoundaryResult
 
-    def __init__(self, nodeId: "NodeId"):
+    def __init__(self, nodeId: NodeId):
         # Id of the node.
         self.nodeId = nodeId
 
+    def to_wire(self):
+        wire = {"nodeId": self.nodeId}
+        return wire
+
 
 
+class getHighlightObjectForTestResult(ChromeResult):
+    __slots__ = ()
+    _fields = ('highlight',)
+    # Highlight data for the node.
+    highlight: dict
+
 class getHighlightObjectForTest(ChromeCommand):
     """For testing."""
+    _fields = ('nodeId',)
+    __slots__ = _fields
+    _result = getHighlightObjectForTestResult
 
-    def __init__(self, nodeId: "NodeId"):
+    def __init__(self, nodeId: NodeId):
         # Id of the node to get highlight object for.
         self.nodeId = nodeId
 
-
+    def to_wire(self):
+        wire = {"nodeId": self.nodeId}
+        return wire
+
+
+
+class documentUpdated(ChromeEvent):
+    """Fired when <code>Document</code> has been totally updated. Node ids are no longer valid."""
+    __slots__ = ()
+    _fields = ()
+
+class inspectNodeRequested(ChromeEvent):
+    """Fired when the node should be inspected. This happens after call to <code>setInspectMode</code>."""
+    __slots__ = ()
+    _fields = ('backendNodeId',)
+    # Id of the node to inspect.
+    backendNodeId: BackendNodeId
+
+class setChildNodes(ChromeEvent):
+    """Fired when backend wants to provide client with the missing DOM structure. This happens upon most of the calls requesting node ids."""
+    __slots__ = ()
+    _fields = ('parentId', 'nodes')
+    # Parent node id to populate with children.
+    parentId: NodeId
+    # Child nodes array.
+    nodes: List
+    _types = {'nodes': [Node]}
+
+class attributeModified(ChromeEvent):
+    """Fired when <code>Element</code>'s attribute is modified."""
+    __slots__ = ()
+    _fields = ('nodeId', 'name', 'value')
+    # Id of the node that has changed.
+    nodeId: NodeId
+    # Attribute name.
+    name: str
+    # Attribute value.
+    value: str
+
+class attributeRemoved(ChromeEvent):
+    """Fired when <code>Element</code>'s attribute is removed."""
+    __slots__ = ()
+    _fields = ('nodeId', 'name')
+    # Id of the node that has changed.
+    nodeId: NodeId
+    # A ttribute name.
+    name: str
+
+class inlineStyleInvalidated(ChromeEvent):
+    """Fired when <code>Element</code>'s inline style is modified via a CSS property modification."""
+    __slots__ = ()
+    _fields = ('nodeIds',)
+    # Ids of the nodes for which the inline styles have been invalidated.
+    nodeIds: List
+
+class characterDataModified(ChromeEvent):
+    """Mirrors <code>DOMCharacterDataModified</code> event."""
+    __slots__ = ()
+    _fields = ('nodeId', 'characterData')
+    # Id of the node that has changed.
+    nodeId: NodeId
+    # New text value.
+    characterData: str
+
+class childNodeCountUpdated(ChromeEvent):
+    """Fired when <code>Container</code>'s child node count has changed."""
+    __slots__ = ()
+    _fields = ('nodeId', 'childNodeCount')
+    # Id of the node that has changed.
+    nodeId: NodeId
+    # New node count.
+    childNodeCount: int
+
+class childNodeInserted(ChromeEvent):
+    """Mirrors <code>DOMNodeInserted</code> event."""
+    __slots__ = ()
+    _fields = ('parentNodeId', 'previousNodeId', 'node')
+    # Id of the node that has changed.
+    parentNodeId: NodeId
+    # If of the previous siblint.
+    previousNodeId: NodeId
+    # Inserted node data.
+    node: Node
+    _types = {'node': Node}
+
+class childNodeRemoved(ChromeEvent):
+    """Mirrors <code>DOMNodeRemoved</code> event."""
+    __slots__ = ()
+    _fields = ('parentNodeId', 'nodeId')
+    # Parent id.
+    parentNodeId: NodeId
+    # Id of the node that has been removed.
+    nodeId: NodeId
+
+class shadowRootPushed(ChromeEvent):
+    """Called when shadow root is pushed into the element."""
+    __slots__ = ()
+    _fields = ('hostId', 'root')
+    # Host element id.
+    hostId: NodeId
+    # Shadow root.
+    root: Node
+    _types = {'root': Node}
+
+class shadowRootPopped(ChromeEvent):
+    """Called when shadow root is popped from the element."""
+    __slots__ = ()
+    _fields = ('hostId', 'rootId')
+    # Host element id.
+    hostId: NodeId
+    # Shadow root id.
+    rootId: NodeId
+
+class pseudoElementAdded(ChromeEvent):
+    """Called when a pseudo element is added to an element."""
+    __slots__ = ()
+    _fields = ('parentId', 'pseudoElement')
+    # Pseudo element's parent element id.
+    parentId: NodeId
+    # The added pseudo element.
+    pseudoElement: Node
+    _types = {'pseudoElement': Node}
+
+class pseudoElementRemoved(ChromeEvent):
+    """Called when a pseudo element is removed from an element."""
+    __slots__ = ()
+    _fields = ('parentId', 'pseudoElementId')
+    # Pseudo element's parent element id.
+    parentId: NodeId
+    # The removed pseudo element id.
+    pseudoElementId: NodeId
+
+class distributedNodesUpdated(ChromeEvent):
+    """Called when distrubution is changed."""
+    __slots__ = ()
+    _fields = ('insertionPointId', 'distributedNodes')
+    # Insertion point where distrubuted nodes were updated.
+    insertionPointId: NodeId
+    # Distributed nodes for given insertion point.
+    distributedNodes: List
+    _types = {'distributedNodes': [BackendNode]}
+
+class nodeHighlightRequested(ChromeEvent):
+    __slots__ = ()
+    _fields = ('nodeId',)
+    nodeId: NodeId
 
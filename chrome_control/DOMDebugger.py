@@ -1,15 +1,22 @@
+# schema hash: cf8656818dfb18904d00474e5d73613ca172988e
 from enum import Enum
-from typing import Any, List
+from typing import TYPE_CHECKING, Any, List
 
-from .base import ChromeCommand
+from .base import ChromeCommand, ChromeEvent, ChromeResult, ChromeType, encode, resolve
 
-from . import Runtime
+if TYPE_CHECKING:
+    from . import Runtime
 
 DOMBreakpointType = Enum("DOMBreakpointType", "subtree-modified attribute-modified node-removed")
 DOMBreakpointType.__doc__ = """DOM breakpoint type."""
 
-class EventListener:
+class EventListener(ChromeType):
     """Object event listener."""
+    _fields = ('type', 'useCapture', 'passive', 'once', 'scriptId', 'lineNumber', 'columnNumber', 'handler', 'originalHandler', 'removeFunction')
+    __slots__ = _fields
+    _types = {'handler': 'Runtime.RemoteObject', 'originalHandler': 'Runtime.RemoteObject', 'removeFunction': 'Runtime.RemoteObject'}
+    _refs = ('Runtime.RemoteObject',)
+
     def __init__(self, type: str, useCapture: bool, passive: bool, once: bool, scriptId: "Runtime.ScriptId", lineNumber: int, columnNumber: int, handler: "Runtime.RemoteObject"=None, originalHandler: "Runtime.RemoteObject"=None, removeFunction: "Runtime.RemoteObject"=None):
         # <code>EventListener</code>'s type.
         self.type = type
@@ -32,30 +39,72 @@ class EventListener:
         # Event listener remove function.
         self.removeFunction = removeFunction
 
+    def to_wire(self):
+        wire = {"type": self.type, "useCapture": self.useCapture, "passive": self.passive, "once": self.once, "scriptId": self.scriptId, "lineNumber": self.lineNumber, "columnNumber": self.columnNumber}
+        if self.handler is not None:
+            wire["handler"] = encode(self.handler)
+        if self.originalHandler is not None:
+            wire["originalHandler"] = encode(self.originalHandler)
+        if self.removeFunction is not None:
+            wire["removeFunction"] = encode(self.removeFunction)
+        return wire
+
+    @classmethod
+    def from_wire(cls, wire: dict):
+        refs = cls._refs
+        if refs[0].__class__ is str:
+            refs = cls._refs = tuple(map(resolve, refs))
+        obj = cls.__new__(cls)
+        obj.type = wire["type"]
+        obj.useCapture = wire["useCapture"]
+        obj.passive = wire["passive"]
+        obj.once = wire["once"]
+        obj.scriptId = wire["scriptId"]
+        obj.lineNumber = wire["lineNumber"]
+        obj.columnNumber = wire["columnNumber"]
+        obj.handler = refs[0].from_wire(wire["handler"]) if "handler" in wire else None
+        obj.originalHandler = refs[0].from_wire(wire["originalHandler"]) if "originalHandler" in wire else None
+        obj.removeFunction = refs[0].from_wire(wire["removeFunction"]) if "removeFunction" in wire else None
+        return obj
+
 class setDOMBreakpoint(ChromeCommand):
     """Sets breakpoint on particular operation with DOM."""
+    _fields = ('nodeId', 'type')
+    __slots__ = _fields
 
-    def __init__(self, nodeId: "DOM.NodeId", type: "DOMBreakpointType"):
+    def __init__(self, nodeId: "DOM.NodeId", type: DOMBreakpointType):
         # Identifier of the node to set breakpoint on.
         self.nodeId = nodeId
         # Type of the operation to stop upon.
         self.type = type
 
+    def to_wire(self):
+        wire = {"nodeId": self.nodeId, "type": encode(self.type)}
+        return wire
+
 
 
 class removeDOMBreakpoint(ChromeCommand):
     """Removes DOM breakpoint that was set using <code>setDOMBreakpoint</code>."""
+    _fields = ('nodeId', 'type')
+    __slots__ = _fields
 
-    def __init__(self, nodeId: "DOM.NodeId", type: "DOMBreakpointType"):
+    def __init__(self, nodeId: "DOM.NodeId", type: DOMBreakpointType):
         # Identifier of the node to remove breakpoint from.
         self.nodeId = nodeId
         # Type of the breakpoint to remove.
         self.type = type
 
+    def to_wire(self):
+        wire = {"nodeId": self.nodeId, "type": encode(self.type)}
+        return wire
+
 
 
 class setEventListenerBreakpoint(ChromeCommand):
     """Sets breakpoint on particular DOM event."""
+    _fields = ('eventName', 'targetName')
+    __slots__ = _fields
 
     def __init__(self, eventName: str, targetName: str=None):
         # DOM Event name to stop on (any DOM event will do).
@@ -63,10 +112,18 @@ class setEventListenerBreakpoint(ChromeCommand):
         # EventTarget interface name to stop on. If equal to <code>"*"</code> or not provided, will stop on any EventTarget.
         self.targetName = targetName
 
+    def to_wire(self):
+        wire = {"eventName": self.eventName}
+        if self.targetName is not None:
+            wire["targetName"] = self.targetName
+        return wire
+
 
 
 class removeEventListenerBreakpoint(ChromeCommand):
     """Removes breakpoint on particular DOM event."""
+    _fields = ('eventName', 'targetName')
+    __slots__ = _fields
 
     def __init__(self, eventName: str, targetName: str=None):
         # Event name.
@@ -74,50 +131,94 @@ class removeEventListenerBreakpoint(ChromeCommand):
         # EventTarget interface name.
         self.targetName = targetName
 
+    def to_wire(self):
+        wire = {"eventName": self.eventName}
+        if self.targetName is not None:
+            wire["targetName"] = self.targetName
+        return wire
+
 
 
 class setInstrumentationBreakpoint(ChromeCommand):
     """Sets breakpoint on particular native event."""
+    _fields = ('eventName',)
+    __slots__ = _fields
 
     def __init__(self, eventName: str):
         # Instrumentation name to stop on.
         self.eventName = eventName
 
+    def to_wire(self):
+        wire = {"eventName": self.eventName}
+        return wire
+
 
 
 class removeInstrumentationBreakpoint(ChromeCommand):
     """Removes breakpoint on particular native event."""
+    _fields = ('eventName',)
+    __slots__ = _fields
 
     def __init__(self, eventName: str):
         # Instrumentation name to stop on.
         self.eventName = eventName
 
+    def to_wire(self):
+        wire = {"eventName": self.eventName}
+        return wire
+
 
 
 class setXHRBreakpoint(ChromeCommand):
     """Sets breakpoint on XMLHttpRequest."""
+    _fields = ('url',)
+    __slots__ = _fields
 
     def __init__(self, url: str):
         # Resource URL substring. All XHRs having this substring in the URL will get stopped upon.
         self.url = url
 
+    def to_wire(self):
+        wire = {"url": self.url}
+        return wire
+
 
 
 class removeXHRBreakpoint(ChromeCommand):
     """Removes breakpoint from XMLHttpRequest."""
+    _fields = ('url',)
+    __slots__ = _fields
 
     def __init__(self, url: str):
         # Resource URL substring.
         self.url = url
 
+    def to_wire(self):
+        wire = {"url": self.url}
+        return wire
 
 
+
+class getEventListenersResult(ChromeResult):
+    __slots__ = ()
+    _fields = ('listeners',)
+    # Array of relevant listeners.
+    listeners: List
+    _types = {'listeners': [EventListener]}
+
 class getEventListeners(ChromeCommand):
     """Returns event listeners of the given object."""
+    _fields = ('objectId',)
+    __slots__ = _fields
+    _result = getEventListenersResult
 
     def __init__(self, objectId: "Runtime.RemoteObjectId"):
         # Identifier of the object to return listeners for.
         self.objectId = objectId
 
+    def to_wire(self):
+        wire = {"objectId": self.objectId}
+        return wire
+
 
 
@@ -1,47 +1,123 @@
+# schema hash: 3d095729e005517f01d97bd944710066a520f2d9
 from enum import Enum
-from typing import Any, List
+from typing import TYPE_CHECKING, Any, List
 
-from .base import ChromeCommand
+from .base import ChromeCommand, ChromeEvent, ChromeResult, ChromeType, encode, resolve
 
 
-class StorageId:
+class StorageId(ChromeType):
     """DOM Storage identifier."""
+    _fields = ('securityOrigin', 'isLocalStorage')
+    __slots__ = _fields
+
     def __init__(self, securityOrigin: str, isLocalStorage: bool):
         # Security origin for the storage.
         self.securityOrigin = securityOrigin
         # Whether the storage is local storage (not session storage).
         self.isLocalStorage = isLocalStorage
 
+    def to_wire(self):
+        wire = {"securityOrigin": self.securityOrigin, "isLocalStorage": self.isLocalStorage}
+        return wire
+
+    @classmethod
+    def from_wire(cls, wire: dict):
+        obj = cls.__new__(cls)
+        obj.securityOrigin = wire["securityOrigin"]
+        obj.isLocalStorage = wire["isLocalStorage"]
+        return obj
+
 # DOM Storage item.
 Item = List[str]
 class enable(ChromeCommand):
     """Enables storage tracking, storage events will now be delivered to the client."""
+    _fields = ()
+    __slots__ = _fields
 
     def __init__(self): pass
 
 class disable(ChromeCommand):
     """Disables storage tracking, prevents storage events from being sent to the client."""
+    _fields = ()
+    __slots__ = _fields
 
     def __init__(self): pass
 
+class getDOMStorageItemsResult(ChromeResult):
+    __slots__ = ()
+    _fields = ('entries',)
+    entries: List
+
 class getDOMStorageItems(ChromeCommand):
-    def __init__(self, storageId: "StorageId"):
+    _fields = ('storageId',)
+    __slots__ = _fields
+    _result = getDOMStorageItemsResult
+
+    def __init__(self, storageId: StorageId):
         self.storageId = storageId
 
+    def to_wire(self):
+        wire = {"storageId": encode(self.storageId)}
+        return wire
+
 
 
 class setDOMStorageItem(ChromeCommand):
-    def __init__(self, storageId: "StorageId", key: str, value: str):
+    _fields = ('storageId', 'key', 'value')
+    __slots__ = _fields
+
+    def __init__(self, storageId: StorageId, key: str, value: str):
         self.storageId = storageId
         self.key = key
         self.value = value
 
+    def to_wire(self):
+        wire = {"storageId": encode(self.storageId), "key": self.key, "value": self.value}
+        return wire
+
 
 
 class removeDOMStorageItem(ChromeCommand):
-    def __init__(self, storageId: "StorageId", key: str):
+    _fields = ('storageId', 'key')
+    __slots__ = _fields
+
+    def __init__(self, storageId: StorageId, key: str):
         self.storageId = storageId
         self.key = key
 
-
+    def to_wire(self):
+        wire = {"storageId": encode(self.storageId), "key": self.key}
+        return wire
+
+
+
+class domStorageItemsCleared(ChromeEvent):
+    __slots__ = ()
+    _fields = ('storageId',)
+    storageId: StorageId
+    _types = {'storageId': StorageId}
+
+class domStorageItemRemoved(ChromeEvent):
+    __slots__ = ()
+    _fields = ('storageId', 'key')
+    storageId: StorageId
+    key: str
+    _types = {'storageId': StorageId}
+
+class domStorageItemAdded(ChromeEvent):
+    __slots__ = ()
+    _fields = ('storageId', 'key', 'newValue')
+    storageId: StorageId
+    key: str
+    newValue: str
+    _types = {'storageId': StorageId}
+
+class domStorageItemUpdated(ChromeEvent):
+    __slots__ = ()
+    _fields = ('storageId', 'key', 'oldValue', 'newValue')
+    storageId: StorageId
+    key: str
+    oldValue: str
+    newValue: str
+    _types = {'storageId': StorageId}
 
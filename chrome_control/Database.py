@@ -1,15 +1,19 @@
+# schema hash: 942bef1d391c5ac2761b33608752d6c1d1ffab94
 from enum import Enum
-from typing import Any, List
+from typing import TYPE_CHECKING, Any, List
 
-from .base import ChromeCommand
+from .base import ChromeCommand, ChromeEvent, ChromeResult, ChromeType, encode, resolve
 
 
 # Unique identifier of Database object.
 DatabaseId = str
 
-class Database:
+class Database(ChromeType):
     """Database object."""
-    def __init__(self, id: "DatabaseId", domain: str, name: str, version: str):
+    _fields = ('id', 'domain', 'name', 'version')
+    __slots__ = _fields
+
+    def __init__(self, id: DatabaseId, domain: str, name: str, version: str):
         # Database ID.
         self.id = id
         # Database domain.
@@ -19,34 +23,100 @@ class Database:
         # Database version.
         self.version = version
 
-class Error:
+    def to_wire(self):
+        wire = {"id": self.id, "domain": self.domain, "name": self.name, "version": self.version}
+        return wire
+
+    @classmethod
+    def from_wire(cls, wire: dict):
+        obj = cls.__new__(cls)
+        obj.id = wire["id"]
+        obj.domain = wire["domain"]
+        obj.name = wire["name"]
+        obj.version = wire["version"]
+        return obj
+
+class Error(ChromeType):
     """Database error."""
+    _fields = ('message', 'code')
+    __slots__ = _fields
+
     def __init__(self, message: str, code: int):
         # Error message.
         self.message = message
         # Error code.
         self.code = code
 
+    def to_wire(self):
+        wire = {"message": self.message, "code": self.code}
+        return wire
+
+    @classmethod
+    def from_wire(cls, wire: dict):
+        obj = cls.__new__(cls)
+        obj.message = wire["message"]
+        obj.code = wire["code"]
+        return obj
+
 class enable(ChromeCommand):
     """Enables database tracking, database events will now be delivered to the client."""
+    _fields = ()
+    __slots__ = _fields
 
     def __init__(self): pass
 
 class disable(ChromeCommand):
     """Disables database tracking, prevents database events from being sent to the client."""
+    _fields = ()
+    __slots__ = _fields
 
     def __init__(self): pass
 
+class getDatabaseTableNamesResult(ChromeResult):
+    __slots__ = ()
+    _fields = ('tableNames',)
+    tableNames: List
+
 class getDatabaseTableNames(ChromeCommand):
-    def __init__(self, databaseId: "DatabaseId"):
+    _fields = ('databaseId',)
+    __slots__ = _fields
+    _result = getDatabaseTableNamesResult
+
+    def __init__(self, databaseId: DatabaseId):
         self.databaseId = databaseId
 
+    def to_wire(self):
+        wire = {"databaseId": self.databaseId}
+        return wire
+
+
 
+class executeSQLResult(ChromeResult):
+    __slots__ = ()
+    _fields = ('columnNames', 'values', 'sqlError')
+    columnNames: List
+    values: List
+    sqlError: Error
+    _types = {'sqlError': Error}
 
 class executeSQL(ChromeCommand):
-    def __init__(self, databaseId: "DatabaseId", query: str):
+    _fields = ('databaseId', 'query')
+    __slots__ = _fields
+    _result = executeSQLResult
+
+    def __init__(self, databaseId: DatabaseId, query: str):
         self.databaseId = databaseId
         self.query = query
 
+    def to_wire(self):
+        wire = {"databaseId": self.databaseId, "query": self.query}
+        return wire
+
+
 
+class addDatabase(ChromeEvent):
+    __slots__ = ()
+    _fields = ('database',)
+    database: Database
+    _types = {'database': Database}
 
@@ -1,9 +1,11 @@
+# schema hash: 5341e3723fbe3fbbaf5e0818bcc948d5f774d331
 from enum import Enum
-from typing import Any, List
+from typing import TYPE_CHECKING, Any, List
 
-from .base import ChromeCommand
+from .base import ChromeCommand, ChromeEvent, ChromeResult, ChromeType, encode, resolve
 
-from . import Runtime
+if TYPE_CHECKING:
+    from . import Runtime
 
 # Breakpoint identifier.
 BreakpointId = str
@@ -11,8 +13,11 @@ BreakpointId = str
 # Call frame identifier.
 CallFrameId = str
 
-class Location:
+class Location(ChromeType):
     """Location in the source code."""
+    _fields = ('scriptId', 'lineNumber', 'columnNumber')
+    __slots__ = _fields
+
     def __init__(self, scriptId: "Runtime.ScriptId", lineNumber: int, columnNumber: int=None):
         # Script identifier as reported in the <code>Debugger.scriptParsed</code>.
         self.scriptId = scriptId
@@ -21,15 +26,89 @@ class Location:
         # Column number in the script (0-based).
         self.columnNumber = columnNumber
 
-class ScriptPosition:
+    def to_wire(self):
+        wire = {"scriptId": self.scriptId, "lineNumber": self.lineNumber}
+        if self.columnNumber is not None:
+            wire["columnNumber"] = self.columnNumber
+        return wire
+
+    @classmethod
+    def from_wire(cls, wire: dict):
+        obj = cls.__new__(cls)
+        obj.scriptId = wire["scriptId"]
+        obj.lineNumber = wire["lineNumber"]
+        obj.columnNumber = wire.get("columnNumber")
+        return obj
+
+class ScriptPosition(ChromeType):
     """Location in the source code."""
+    _fields = ('lineNumber', 'columnNumber')
+    __slots__ = _fields
+
     def __init__(self, lineNumber: int, columnNumber: int):
         self.lineNumber = lineNumber
         self.columnNumber = columnNumber
 
-class CallFrame:
+    def to_wire(self):
+        wire = {"lineNumber": self.lineNumber, "columnNumber": self.columnNumber}
+        return wire
+
+    @classmethod
+    def from_wire(cls, wire: dict):
+        obj = cls.__new__(cls)
+        obj.lineNumber = wire["lineNumber"]
+        obj.columnNumber = wire["columnNumber"]
+        return obj
+
+class Scope(ChromeType):
+    """Scope description."""
+    _fields = ('type', 'object', 'name', 'startLocation', 'endLocation')
+    __slots__ = _fields
+    _types = {'object': 'Runtime.RemoteObject', 'startLocation': Location, 'endLocation': Location}
+    _refs = ('Runtime.RemoteObject',)
+
+    def __init__(self, type: str, object: "Runtime.RemoteObject", name: str=None, startLocation: Location=None, endLocation: Location=None):
+        # Scope type.
+        self.type = type
+        # Object representing the scope. For <code>global</code> and <code>with</code> scopes it represents the actual object; for the rest of the scopes, it is artificial transient object enumerating scope variables as its properties.
+        self.object = object
+        self.name = name
+        # Location in the source code where scope starts
+        self.startLocation = startLocation
+        # Location in the source code where scope ends
+        self.endLocation = endLocation
+
+    def to_wire(self):
+        wire = {"type": self.type, "object": encode(self.object)}
+        if self.name is not None:
+            wire["name"] = self.name
+        if self.startLocation is not None:
+            wire["startLocation"] = encode(self.startLocation)
+        if self.endLocation is not None:
+            wire["endLocation"] = encode(self.endLocation)
+        return wire
+
+    @classmethod
+    def from_wire(cls, wire: dict):
+        refs = cls._refs
+        if refs[0].__class__ is str:
+            refs = cls._refs = tuple(map(resolve, refs))
+        obj = cls.__new__(cls)
+        obj.type = wire["type"]
+        obj.object = refs[0].from_wire(wire["object"])
+        obj.name = wire.get("name")
+        obj.startLocation = Location.from_wire(wire["startLocation"]) if "startLocation" in wire else None
+        obj.endLocation = Location.from_wire(wire["endLocation"]) if "endLocation" in wire else None
+        return obj
+
+class CallFrame(ChromeType):
     """JavaScript call frame. Array of call frames form the call stack."""
-    def __init__(self, callFrameId: "CallFrameId", functionName: str, location: "Location", scopeChain: List, this: "Runtime.RemoteObject", functionLocation: "Location"=None, returnValue: "Runtime.RemoteObject"=None):
+    _fields = ('callFrameId', 'functionName', 'location', 'scopeChain', 'this', 'functionLocation', 'returnValue')
+    __slots__ = _fields
+    _types = {'location': Location, 'scopeChain': [Scope], 'this': 'Runtime.RemoteObject', 'functionLocation': Location, 'returnValue': 'Runtime.RemoteObject'}
+    _refs = ('Runtime.RemoteObject',)
+
+    def __init__(self, callFrameId: CallFrameId, functionName: str, location: Location, scopeChain: List, this: "Runtime.RemoteObject", functionLocation: Location=None, returnValue: "Runtime.RemoteObject"=None):
         # Call frame identifier. This identifier is only valid while the virtual machine is paused.
         self.callFrameId = callFrameId
         # Name of the JavaScript function called on this call frame.
@@ -45,57 +124,109 @@ class CallFrame:
         # The value being returned, if the function is at return point.
         self.returnValue = returnValue
 
-class Scope:
-    """Scope description."""
-    def __init__(self, type: str, object: "Runtime.RemoteObject", name: str=None, startLocation: "Location"=None, endLocation: "Location"=None):
-        # Scope type.
-        self.type = type
-        # Object representing the scope. For <code>global</code> and <code>with</code> scopes it represents the actual object; for the rest of the scopes, it is artificial transient object enumerating scope variables as its properties.
-        self.object = object
-        self.name = name
-        # Location in the source code where scope starts
-        self.startLocation = startLocation
-        # Location in the source code where scope ends
-        self.endLocation = endLocation
-
-class SearchMatch:
+    def to_wire(self):
+        wire = {"callFrameId": self.callFrameId, "functionName": self.functionName, "location": encode(self.location), "scopeChain": encode(self.scopeChain), "this": encode(self.this)}
+        if self.functionLocation is not None:
+            wire["functionLocation"] = encode(self.functionLocation)
+        if self.returnValue is not None:
+            wire["returnValue"] = encode(self.returnValue)
+        return wire
+
+    @classmethod
+    def from_wire(cls, wire: dict):
+        refs = cls._refs
+        if refs[0].__class__ is str:
+            refs = cls._refs = tuple(map(resolve, refs))
+        obj = cls.__new__(cls)
+        obj.callFrameId = wire["callFrameId"]
+        obj.functionName = wire["functionName"]
+        obj.location = Location.from_wire(wire["location"])
+        obj.scopeChain = [Scope.from_wire(x0) for x0 in wire["scopeChain"]]
+        obj.this = refs[0].from_wire(wire["this"])
+        obj.functionLocation = Location.from_wire(wire["functionLocation"]) if "functionLocation" in wire else None
+        obj.returnValue = refs[0].from_wire(wire["returnValue"]) if "returnValue" in wire else None
+        return obj
+
+class SearchMatch(ChromeType):
     """Search match for resource."""
+    _fields = ('lineNumber', 'lineContent')
+    __slots__ = _fields
+
     def __init__(self, lineNumber: float, lineContent: str):
         # Line number in resource content.
         self.lineNumber = lineNumber
         # Line with match content.
         self.lineContent = lineContent
 
+    def to_wire(self):
+        wire = {"lineNumber": self.lineNumber, "lineContent": self.lineContent}
+        return wire
+
+    @classmethod
+    def from_wire(cls, wire: dict):
+        obj = cls.__new__(cls)
+        obj.lineNumber = wire["lineNumber"]
+        obj.lineContent = wire["lineContent"]
+        return obj
+
 class enable(ChromeCommand):
     """Enables debugger for the given page. Clients should not assume that the debugging has been enabled until the result for this command is received."""
+    _fields = ()
+    __slots__ = _fields
 
     def __init__(self): pass
 
 class disable(ChromeCommand):
     """Disables debugger for given page."""
+    _fields = ()
+    __slots__ = _fields
 
     def __init__(self): pass
 
 class setBreakpointsActive(ChromeCommand):
     """Activates / deactivates all breakpoints on the page."""
+    _fields = ('active',)
+    __slots__ = _fields
 
     def __init__(self, active: bool):
         # New value for breakpoints active state.
         self.active = active
 
+    def to_wire(self):
+        wire = {"active": self.active}
+        return wire
+
 
 
 class setSkipAllPauses(ChromeCommand):
     """Makes page not interrupt on any pauses (breakpoint, exception, dom exception etc)."""
+    _fields = ('skip',)
+    __slots__ = _fields
 
     def __init__(self, skip: bool):
         # New value for skip pauses state.
         self.skip = skip
 
+    def to_wire(self):
+        wire = {"skip": self.skip}
+        return wire
+
+
 
+class setBreakpointByUrlResult(ChromeResult):
+    __slots__ = ()
+    _fields = ('breakpointId', 'locations')
+    # Id of the created breakpoint for further reference.
+    breakpointId: BreakpointId
+    # List of the locations this breakpoint resolved into upon addition.
+    locations: List
+    _types = {'locations': [Location]}
 
 class setBreakpointByUrl(ChromeCommand):
     """Sets JavaScript breakpoint at given location specified either by URL or URL regex. Once this command is issued, all existing parsed scripts will have breakpoints resolved and returned in <code>locations</code> property. Further matching script parsing will result in subsequent <code>breakpointResolved</code> events issued. This logical breakpoint will survive page reloads."""
+    _fields = ('lineNumber', 'url', 'urlRegex', 'columnNumber', 'condition')
+    __slots__ = _fields
+    _result = setBreakpointByUrlResult
 
     def __init__(self, lineNumber: int, url: str=None, urlRegex: str=None, columnNumber: int=None, condition: str=None):
         # Line number to set breakpoint at.
@@ -109,74 +240,152 @@ class setBreakpointByUrl(ChromeCommand):
         # Expression to use as a breakpoint condition. When specified, debugger will only stop on the breakpoint if this expression evaluates to true.
         self.condition = condition
 
-
+    def to_wire(self):
+        wire = {"lineNumber": self.lineNumber}
+        if self.url is not None:
+            wire["url"] = self.url
+        if self.urlRegex is not None:
+            wire["urlRegex"] = self.urlRegex
+        if self.columnNumber is not None:
+            wire["columnNumber"] = self.columnNumber
+        if self.condition is not None:
+            wire["condition"] = self.condition
+        return wire
+
+
+
+class setBreakpointResult(ChromeResult):
+    __slots__ = ()
+    _fields = ('breakpointId', 'actualLocation')
+    # Id of the created breakpoint for further reference.
+    breakpointId: BreakpointId
+    # Location this breakpoint resolved into.
+    actualLocation: Location
+    _types = {'actualLocation': Location}
 
 class setBreakpoint(ChromeCommand):
     """Sets JavaScript breakpoint at a given location."""
+    _fields = ('location', 'condition')
+    __slots__ = _fields
+    _result = setBreakpointResult
 
-    def __init__(self, location: "Location", condition: str=None):
+    def __init__(self, location: Location, condition: str=None):
         # Location to set breakpoint in.
         self.location = location
         # Expression to use as a breakpoint condition. When specified, debugger will only stop on the breakpoint if this expression evaluates to true.
         self.condition = condition
 
+    def to_wire(self):
+        wire = {"location": encode(self.location)}
+        if self.condition is not None:
+            wire["condition"] = self.condition
+        return wire
+
 
 
 class removeBreakpoint(ChromeCommand):
     """Removes JavaScript breakpoint."""
+    _fields = ('breakpointId',)
+    __slots__ = _fields
 
-    def __init__(self, breakpointId: "BreakpointId"):
+    def __init__(self, breakpointId: BreakpointId):
         self.breakpointId = breakpointId
 
+    def to_wire(self):
+        wire = {"breakpointId": self.breakpointId}
+        return wire
+
+
 
+class getPossibleBreakpointsResult(ChromeResult):
+    __slots__ = ()
+    _fields = ('locations',)
+    # List of the possible breakpoint locations.
+    locations: List
+    _types = {'locations': [Location]}
 
 class getPossibleBreakpoints(ChromeCommand):
     """Returns possible locations for breakpoint. scriptId in start and end range locations should be the same."""
+    _fields = ('start', 'end')
+    __slots__ = _fields
+    _result = getPossibleBreakpointsResult
 
-    def __init__(self, start: "Location", end: "Location"=None):
+    def __init__(self, start: Location, end: Location=None):
         # Start of range to search possible breakpoint locations in.
         self.start = start
         # End of range to search possible breakpoint locations in (excluding). When not specifed, end of scripts is used as end of range.
         self.end = end
 
+    def to_wire(self):
+        wire = {"start": encode(self.start)}
+        if self.end is not None:
+            wire["end"] = encode(self.end)
+        return wire
+
 
 
 class continueToLocation(ChromeCommand):
     """Continues execution until specific location is reached."""
+    _fields = ('location',)
+    __slots__ = _fields
 
-    def __init__(self, location: "Location"):
+    def __init__(self, location: Location):
         # Location to continue to.
         self.location = location
 
+    def to_wire(self):
+        wire = {"location": encode(self.location)}
+        return wire
+
 
 
 class stepOver(ChromeCommand):
     """Steps over the statement."""
+    _fields = ()
+    __slots__ = _fields
 
     def __init__(self): pass
 
 class stepInto(ChromeCommand):
     """Steps into the function call."""
+    _fields = ()
+    __slots__ = _fields
 
     def __init__(self): pass
 
 class stepOut(ChromeCommand):
     """Steps out of the function call."""
+    _fields = ()
+    __slots__ = _fields
 
     def __init__(self): pass
 
 class pause(ChromeCommand):
     """Stops on the next JavaScript statement."""
+    _fields = ()
+    __slots__ = _fields
 
     def __init__(self): pass
 
 class resume(ChromeCommand):
     """Resumes JavaScript execution."""
+    _fields = ()
+    __slots__ = _fields
 
     def __init__(self): pass
 
+class searchInContentResult(ChromeResult):
+    __slots__ = ()
+    _fields = ('result',)
+    # List of search matches.
+    result: List
+    _types = {'result': [SearchMatch]}
+
 class searchInContent(ChromeCommand):
     """Searches for given string in script content."""
+    _fields = ('scriptId', 'query', 'caseSensitive', 'isRegex')
+    __slots__ = _fields
+    _result = searchInContentResult
 
     def __init__(self, scriptId: "Runtime.ScriptId", query: str, caseSensitive: bool=None, isRegex: bool=None):
         # Id of the script to search in.
@@ -188,10 +397,34 @@ class searchInContent(ChromeCommand):
         # If true, treats string parameter as regex.
         self.isRegex = isRegex
 
-
+    def to_wire(self):
+        wire = {"scriptId": self.scriptId, "query": self.query}
+        if self.caseSensitive is not None:
+            wire["caseSensitive"] = self.caseSensitive
+        if self.isRegex is not None:
+            wire["isRegex"] = self.isRegex
+        return wire
+
+
+
+class setScriptSourceResult(ChromeResult):
+    __slots__ = ()
+    _fields = ('callFrames', 'stackChanged', 'asyncStackTrace', 'exceptionDetails')
+    # New stack trace in case editing has happened while VM was stopped.
+    callFrames: List
+    # Whether current call stack  was modified after applying the changes.
+    stackChanged: bool
+    # Async stack trace, if any.
+    asyncStackTrace: "Runtime.StackTrace"
+    # Exception details if any.
+    exceptionDetails: "Runtime.ExceptionDetails"
+    _types = {'callFrames': [CallFrame], 'asyncStackTrace': 'Runtime.StackTrace', 'exceptionDetails': 'Runtime.ExceptionDetails'}
 
 class setScriptSource(ChromeCommand):
     """Edits JavaScript source live."""
+    _fields = ('scriptId', 'scriptSource', 'dryRun')
+    __slots__ = _fields
+    _result = setScriptSourceResult
 
     def __init__(self, scriptId: "Runtime.ScriptId", scriptSource: str, dryRun: bool=None):
         # Id of the script to edit.
@@ -201,39 +434,92 @@ class setScriptSource(ChromeCommand):
         #  If true the change will not actually be applied. Dry run may be used to get result description without actually modifying the code.
         self.dryRun = dryRun
 
+    def to_wire(self):
+        wire = {"scriptId": self.scriptId, "scriptSource": self.scriptSource}
+        if self.dryRun is not None:
+            wire["dryRun"] = self.dryRun
+        return wire
+
 
 
+class restartFrameResult(ChromeResult):
+    __slots__ = ()
+    _fields = ('callFrames', 'asyncStackTrace')
+    # New stack trace.
+    callFrames: List
+    # Async stack trace, if any.
+    asyncStackTrace: "Runtime.StackTrace"
+    _types = {'callFrames': [CallFrame], 'asyncStackTrace': 'Runtime.StackTrace'}
+
 class restartFrame(ChromeCommand):
     """Restarts particular call frame from the beginning."""
+    _fields = ('callFrameId',)
+    __slots__ = _fields
+    _result = restartFrameResult
 
-    def __init__(self, callFrameId: "CallFrameId"):
+    def __init__(self, callFrameId: CallFrameId):
         # Call frame identifier to evaluate on.
         self.callFrameId = callFrameId
 
+    def to_wire(self):
+        wire = {"callFrameId": self.callFrameId}
+        return wire
+
 
 
+class getScriptSourceResult(ChromeResult):
+    __slots__ = ()
+    _fields = ('scriptSource',)
+    # Script source.
+    scriptSource: str
+
 class getScriptSource(ChromeCommand):
     """Returns source for the script with given id."""
+    _fields = ('scriptId',)
+    __slots__ = _fields
+    _result = getScriptSourceResult
 
     def __init__(self, scriptId: "Runtime.ScriptId"):
         # Id of the script to get source for.
         self.scriptId = scriptId
 
+    def to_wire(self):
+        wire = {"scriptId": self.scriptId}
+        return wire
+
 
 
 class setPauseOnExceptions(ChromeCommand):
     """Defines pause on exceptions state. Can be set to stop on all exceptions, uncaught exceptions or no exceptions. Initial pause on exceptions state is <code>none</code>."""
+    _fields = ('state',)
+    __slots__ = _fields
 
     def __init__(self, state: str):
         # Pause on exceptions mode.
         self.state = state
 
+    def to_wire(self):
+        wire = {"state": self.state}
+        return wire
+
 
 
+class evaluateOnCallFrameResult(ChromeResult):
+    __slots__ = ()
+    _fields = ('result', 'exceptionDetails')
+    # Object wrapper for the evaluation result.
+    result: "Runtime.RemoteObject"
+    # Exception details.
+    exceptionDetails: "Runtime.ExceptionDetails"
+    _types = {'result': 'Runtime.RemoteObject', 'exceptionDetails': 'Runtime.ExceptionDetails'}
+
 class evaluateOnCallFrame(ChromeCommand):
     """Evaluates expression on a given call frame."""
+    _fields = ('callFrameId', 'expression', 'objectGroup', 'includeCommandLineAPI', 'silent', 'returnByValue', 'generatePreview')
+    __slots__ = _fields
+    _result = evaluateOnCallFrameResult
 
-    def __init__(self, callFrameId: "CallFrameId", expression: str, objectGroup: str=None, includeCommandLineAPI: bool=None, silent: bool=None, returnByValue: bool=None, generatePreview: bool=None):
+    def __init__(self, callFrameId: CallFrameId, expression: str, objectGroup: str=None, includeCommandLineAPI: bool=None, silent: bool=None, returnByValue: bool=None, generatePreview: bool=None):
         # Call frame identifier to evaluate on.
         self.callFrameId = callFrameId
         # Expression to evaluate.
@@ -249,12 +535,28 @@ class evaluateOnCallFrame(ChromeCommand):
         # Whether preview should be generated for the result.
         self.generatePreview = generatePreview
 
+    def to_wire(self):
+        wire = {"callFrameId": self.callFrameId, "expression": self.expression}
+        if self.objectGroup is not None:
+            wire["objectGroup"] = self.objectGroup
+        if self.includeCommandLineAPI is not None:
+            wire["includeCommandLineAPI"] = self.includeCommandLineAPI
+        if self.silent is not None:
+            wire["silent"] = self.silent
+        if self.returnByValue is not None:
+            wire["returnByValue"] = self.returnByValue
+        if self.generatePreview is not None:
+            wire["generatePreview"] = self.generatePreview
+        return wire
+
 
 
 class setVariableValue(ChromeCommand):
     """Changes value of variable in a callframe. Object-based scopes are not supported and must be mutated manually."""
+    _fields = ('scopeNumber', 'variableName', 'newValue', 'callFrameId')
+    __slots__ = _fields
 
-    def __init__(self, scopeNumber: int, variableName: str, newValue: "Runtime.CallArgument", callFrameId: "CallFrameId"):
+    def __init__(self, scopeNumber: int, variableName: str, newValue: "Runtime.CallArgument", callFrameId: CallFrameId):
         # 0-based number of scope as was listed in scope chain. Only 'local', 'closure' and 'catch' scope types are allowed. Other scopes could be manipulated manually.
         self.scopeNumber = scopeNumber
         # Variable name.
@@ -264,33 +566,142 @@ class setVariableValue(ChromeCommand):
         # Id of callframe that holds variable.
         self.callFrameId = callFrameId
 
+    def to_wire(self):
+        wire = {"scopeNumber": self.scopeNumber, "variableName": self.variableName, "newValue": encode(self.newValue), "callFrameId": self.callFrameId}
+        return wire
+
 
 
 class setAsyncCallStackDepth(ChromeCommand):
     """Enables or disables async call stacks tracking."""
+    _fields = ('maxDepth',)
+    __slots__ = _fields
 
     def __init__(self, maxDepth: int):
         # Maximum depth of async call stacks. Setting to <code>0</code> will effectively disable collecting async call stacks (default).
         self.maxDepth = maxDepth
 
+    def to_wire(self):
+        wire = {"maxDepth": self.maxDepth}
+        return wire
+
 
 
 class setBlackboxPatterns(ChromeCommand):
     """Replace previous blackbox patterns with passed ones. Forces backend to skip stepping/pausing in scripts with url matching one of the patterns. VM will try to leave blackboxed script by performing 'step in' several times, finally resorting to 'step out' if unsuccessful."""
+    _fields = ('patterns',)
+    __slots__ = _fields
 
     def __init__(self, patterns: List):
         # Array of regexps that will be used to check script url for blackbox state.
         self.patterns = patterns
 
+    def to_wire(self):
+        wire = {"patterns": self.patterns}
+        return wire
+
 
 
 class setBlackboxedRanges(ChromeCommand):
     """Makes backend skip steps in the script in blackboxed ranges. VM will try leave blacklisted scripts by performing 'step in' several times, finally resorting to 'step out' if unsuccessful. Positions array contains positions where blackbox state is changed. First interval isn't blackboxed. Array should be sorted."""
+    _fields = ('scriptId', 'positions')
+    __slots__ = _fields
 
     def __init__(self, scriptId: "Runtime.ScriptId", positions: List):
         # Id of the script.
         self.scriptId = scriptId
         self.positions = positions
 
-
+    def to_wire(self):
+        wire = {"scriptId": self.scriptId, "positions": encode(self.positions)}
+        return wire
+
+
+
+class scriptParsed(ChromeEvent):
+    """Fired when virtual machine parses script. This event is also fired for all known and uncollected scripts upon enabling debugger."""
+    __slots__ = ()
+    _fields = ('scriptId', 'url', 'startLine', 'startColumn', 'endLine', 'endColumn', 'executionContextId', 'hash', 'executionContextAuxData', 'isLiveEdit', 'sourceMapURL', 'hasSourceURL')
+    # Identifier of the script parsed.
+    scriptId: "Runtime.ScriptId"
+    # URL or name of the script parsed (if any).
+    url: str
+    # Line offset of the script within the resource with given URL (for script tags).
+    startLine: int
+    # Column offset of the script within the resource with given URL.
+    startColumn: int
+    # Last line of the script.
+    endLine: int
+    # Length of the last line of the script.
+    endColumn: int
+    # Specifies script creation context.
+    executionContextId: "Runtime.ExecutionContextId"
+    # Content hash of the script.
+    hash: str
+    # Embedder-specific auxiliary data.
+    executionContextAuxData: dict
+    # True, if this script is generated as a result of the live edit operation.
+    isLiveEdit: bool
+    # URL of source map associated with script (if any).
+    sourceMapURL: str
+    # True, if this script has sourceURL.
+    hasSourceURL: bool
+
+class scriptFailedToParse(ChromeEvent):
+    """Fired when virtual machine fails to parse the script."""
+    __slots__ = ()
+    _fields = ('scriptId', 'url', 'startLine', 'startColumn', 'endLine', 'endColumn', 'executionContextId', 'hash', 'executionContextAuxData', 'sourceMapURL', 'hasSourceURL')
+    # Identifier of the script parsed.
+    scriptId: "Runtime.ScriptId"
+    # URL or name of the script parsed (if any).
+    url: str
+    # Line offset of the script within the resource with given URL (for script tags).
+    startLine: int
+    # Column offset of the script within the resource with given URL.
+    startColumn: int
+    # Last line of the script.
+    endLine: int
+    # Length of the last line of the script.
+    endColumn: int
+    # Specifies script creation context.
+    executionContextId: "Runtime.ExecutionContextId"
+    # Content hash of the script.
+    hash: str
+    # Embedder-specific auxiliary data.
+    executionContextAuxData: dict
+    # URL of source map associated with script (if any).
+    sourceMapURL: str
+    # True, if this script has sourceURL.
+    hasSourceURL: bool
+
+class breakpointResolved(ChromeEvent):
+    """Fired when breakpoint is resolved to an actual script and location."""
+    __slots__ = ()
+    _fields = ('breakpointId', 'location')
+    # Breakpoint unique identifier.
+    breakpointId: BreakpointId
+    # Actual breakpoint location.
+    location: Location
+    _types = {'location': Location}
+
+class paused(ChromeEvent):
+    """Fired when the virtual machine stopped on breakpoint or exception or any other stop criteria."""
+    __slots__ = ()
+    _fields = ('callFrames', 'reason', 'data', 'hitBreakpoints', 'asyncStackTrace')
+    # Call stack the virtual machine stopped on.
+    callFrames: List
+    # Pause reason.
+    reason: str
+    # Object containing break-specific auxiliary properties.
+    data: dict
+    # Hit breakpoints IDs
+    hitBreakpoints: List
+    # Async stack trace, if any.
+    asyncStackTrace: "Runtime.StackTrace"
+    _types = {'callFrames': [CallFrame], 'asyncStackTrace': 'Runtime.StackTrace'}
+
+class resumed(ChromeEvent):
+    """Fired when the virtual machine resumed execution."""
+    __slots__ = ()
+    _fields = ()
 
@@ -1,11 +1,14 @@
+# schema hash: 69e528374be68f513b269a899d88336c18e46cc4
 from enum import Enum
-from typing import Any, List
+from typing import TYPE_CHECKING, Any, List
 
-from .base import ChromeCommand
+from .base import ChromeCommand, ChromeEvent, ChromeResult, ChromeType, encode, resolve
 
 
 class setDeviceOrientationOverride(ChromeCommand):
     """Overrides the Device Orientation."""
+    _fields = ('alpha', 'beta', 'gamma')
+    __slots__ = _fields
 
     def __init__(self, alpha: float, beta: float, gamma: float):
         # Mock alpha
@@ -15,10 +18,16 @@ class setDeviceOrientationOverride(ChromeCommand):
         # Mock gamma
         self.gamma = gamma
 
+    def to_wire(self):
+        wire = {"alpha": self.alpha, "beta": self.beta, "gamma": self.gamma}
+        return wire
+
 
 
 class clearDeviceOrientationOverride(ChromeCommand):
     """Clears the overridden Device Orientation."""
+    _fields = ()
+    __slots__ = _fields
 
     def __init__(self): pass
 
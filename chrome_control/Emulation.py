@@ -1,24 +1,41 @@
+# schema hash: 10f51446efc624d8b45aeab4a0a8052145539423
 from enum import Enum
-from typing import Any, List
+from typing import TYPE_CHECKING, Any, List
 
-from .base import ChromeCommand
+from .base import ChromeCommand, ChromeEvent, ChromeResult, ChromeType, encode, resolve
 
 
-class ScreenOrientation:
+class ScreenOrientation(ChromeType):
     """Screen orientation."""
+    _fields = ('type', 'angle')
+    __slots__ = _fields
+
     def __init__(self, type: str, angle: int):
         # Orientation type.
         self.type = type
         # Orientation angle.
         self.angle = angle
 
+    def to_wire(self):
+        wire = {"type": self.type, "angle": self.angle}
+        return wire
+
+    @classmethod
+    def from_wire(cls, wire: dict):
+        obj = cls.__new__(cls)
+        obj.type = wire["type"]
+        obj.angle = wire["angle"]
+        return obj
+
 VirtualTimePolicy = Enum("VirtualTimePolicy", "advance pause pauseIfNetworkFetchesPending")
 VirtualTimePolicy.__doc__ = """advance: If the scheduler runs out of immediate work, the virtual time base may fast forward to allow the next delayed task (if any) to run; pause: The virtual time base may not advance; pauseIfNetworkFetchesPending: The virtual time base may not advance if there are any pending resource fetches."""
 
 class setDeviceMetricsOverride(ChromeCommand):
     """Overrides the values of device screen dimensions (window.screen.width, window.screen.height, window.innerWidth, window.innerHeight, and "device-width"/"device-height"-related CSS media query results)."""
+    _fields = ('width', 'height', 'deviceScaleFactor', 'mobile', 'fitWindow', 'scale', 'offsetX', 'offsetY', 'screenWidth', 'screenHeight', 'positionX', 'positionY', 'screenOrientation')
+    __slots__ = _fields
 
-    def __init__(self, width: int, height: int, deviceScaleFactor: float, mobile: bool, fitWindow: bool, scale: float=None, offsetX: float=None, offsetY: float=None, screenWidth: int=None, screenHeight: int=None, positionX: int=None, positionY: int=None, screenOrientation: "ScreenOrientation"=None):
+    def __init__(self, width: int, height: int, deviceScaleFactor: float, mobile: bool, fitWindow: bool, scale: float=None, offsetX: float=None, offsetY: float=None, screenWidth: int=None, screenHeight: int=None, positionX: int=None, positionY: int=None, screenOrientation: ScreenOrientation=None):
         # Overriding width value in pixels (minimum 0, maximum 10000000). 0 disables the override.
         self.width = width
         # Overriding height value in pixels (minimum 0, maximum 10000000). 0 disables the override.
@@ -46,15 +63,39 @@ class setDeviceMetricsOverride(ChromeCommand):
         # Screen orientation override.
         self.screenOrientation = screenOrientation
 
+    def to_wire(self):
+        wire = {"width": self.width, "height": self.height, "deviceScaleFactor": self.deviceScaleFactor, "mobile": self.mobile, "fitWindow": self.fitWindow}
+        if self.scale is not None:
+            wire["scale"] = self.scale
+        if self.offsetX is not None:
+            wire["offsetX"] = self.offsetX
+        if self.offsetY is not None:
+            wire["offsetY"] = self.offsetY
+        if self.screenWidth is not None:
+            wire["screenWidth"] = self.screenWidth
+        if self.screenHeight is not None:
+            wire["screenHeight"] = self.screenHeight
+        if self.positionX is not None:
+            wire["positionX"] = self.positionX
+        if self.positionY is not None:
+            wire["positionY"] = self.positionY
+        if self.screenOrientation is not None:
+            wire["screenOrientation"] = encode(self.screenOrientation)
+        return wire
+
 
 
 class clearDeviceMetricsOverride(ChromeCommand):
     """Clears the overriden device metrics."""
+    _fields = ()
+    __slots__ = _fields
 
     def __init__(self): pass
 
 class forceViewport(ChromeCommand):
     """Overrides the visible area of the page. The change is hidden from the page, i.e. the observable scroll position and page scale does not change. In effect, the command moves the specified area of the page into the top-left corner of the frame."""
+    _fields = ('x', 'y', 'scale')
+    __slots__ = _fields
 
     def __init__(self, x: float, y: float, scale: float):
         # X coordinate of top-left corner of the area (CSS pixels).
@@ -64,29 +105,45 @@ class forceViewport(ChromeCommand):
         # Scale to apply to the area (relative to a page scale of 1.0).
         self.scale = scale
 
+    def to_wire(self):
+        wire = {"x": self.x, "y": self.y, "scale": self.scale}
+        return wire
+
 
 
 class resetViewport(ChromeCommand):
     """Resets the visible area of the page to the original viewport, undoing any effects of the <code>forceViewport</code> command."""
+    _fields = ()
+    __slots__ = _fields
 
     def __init__(self): pass
 
 class resetPageScaleFactor(ChromeCommand):
     """Requests that page scale factor is reset to initial values."""
+    _fields = ()
+    __slots__ = _fields
 
     def __init__(self): pass
 
 class setPageScaleFactor(ChromeCommand):
     """Sets a specified page scale factor."""
+    _fields = ('pageScaleFactor',)
+    __slots__ = _fields
 
     def __init__(self, pageScaleFactor: float):
         # Page scale factor.
         self.pageScaleFactor = pageScaleFactor
 
+    def to_wire(self):
+        wire = {"pageScaleFactor": self.pageScaleFactor}
+        return wire
+
 
 
 class setVisibleSize(ChromeCommand):
     """Resizes the frame/viewport of the page. Note that this does not affect the frame's container (e.g. browser window). Can be used to produce screenshots of the specified size. Not supported on Android."""
+    _fields = ('width', 'height')
+    __slots__ = _fields
 
     def __init__(self, width: int, height: int):
         # Frame width (DIP).
@@ -94,19 +151,31 @@ class setVisibleSize(ChromeCommand):
         # Frame height (DIP).
         self.height = height
 
+    def to_wire(self):
+        wire = {"width": self.width, "height": self.height}
+        return wire
+
 
 
 class setScriptExecutionDisabled(ChromeCommand):
     """Switches script execution in the page."""
+    _fields = ('value',)
+    __slots__ = _fields
 
     def __init__(self, value: bool):
         # Whether script execution should be disabled in the page.
         self.value = value
 
+    def to_wire(self):
+        wire = {"value": self.value}
+        return wire
+
 
 
 class setGeolocationOverride(ChromeCommand):
     """Overrides the Geolocation Position or Error. Omitting any of the parameters emulates position unavailable."""
+    _fields = ('latitude', 'longitude', 'accuracy')
+    __slots__ = _fields
 
     def __init__(self, latitude: float=None, longitude: float=None, accuracy: float=None):
         # Mock latitude
@@ -116,15 +185,29 @@ class setGeolocationOverride(ChromeCommand):
         # Mock accuracy
         self.accuracy = accuracy
 
+    def to_wire(self):
+        wire = {}
+        if self.latitude is not None:
+            wire["latitude"] = self.latitude
+        if self.longitude is not None:
+            wire["longitude"] = self.longitude
+        if self.accuracy is not None:
+            wire["accuracy"] = self.accuracy
+        return wire
+
 
 
 class clearGeolocationOverride(ChromeCommand):
     """Clears the overriden Geolocation Position and Error."""
+    _fields = ()
+    __slots__ = _fields
 
     def __init__(self): pass
 
 class setTouchEmulationEnabled(ChromeCommand):
     """Toggles mouse event-based touch event emulation."""
+    _fields = ('enabled', 'configuration')
+    __slots__ = _fields
 
     def __init__(self, enabled: bool, configuration: str=None):
         # Whether the touch event emulation should be enabled.
@@ -132,38 +215,78 @@ class setTouchEmulationEnabled(ChromeCommand):
         # Touch/gesture events configuration. Default: current platform.
         self.configuration = configuration
 
+    def to_wire(self):
+        wire = {"enabled": self.enabled}
+        if self.configuration is not None:
+            wire["configuration"] = self.configuration
+        return wire
+
 
 
 class setEmulatedMedia(ChromeCommand):
     """Emulates the given media for CSS media queries."""
+    _fields = ('media',)
+    __slots__ = _fields
 
     def __init__(self, media: str):
         # Media type to emulate. Empty string disables the override.
         self.media = media
 
+    def to_wire(self):
+        wire = {"media": self.media}
+        return wire
+
 
 
 class setCPUThrottlingRate(ChromeCommand):
     """Enables CPU throttling to emulate slow CPUs."""
+    _fields = ('rate',)
+    __slots__ = _fields
 
     def __init__(self, rate: float):
         # Throttling rate as a slowdown factor (1 is no throttle, 2 is 2x slowdown, etc).
         self.rate = rate
 
+    def to_wire(self):
+        wire = {"rate": self.rate}
+        return wire
+
 
 
+class canEmulateResult(ChromeResult):
+    __slots__ = ()
+    _fields = ('result',)
+    # True if emulation is supported.
+    result: bool
+
 class canEmulate(ChromeCommand):
     """Tells whether emulation is supported."""
+    _fields = ()
+    __slots__ = _fields
+    _result = canEmulateResult
 
     def __init__(self): pass
 
 class setVirtualTimePolicy(ChromeCommand):
     """Turns on virtual time for all frames (replacing real-time with a synthetic time source) and sets the current virtual time policy.  Note this supersedes any previous time budget."""
+    _fields = ('policy', 'budget')
+    __slots__ = _fields
 
-    def __init__(self, policy: "VirtualTimePolicy", budget: int=None):
+    def __init__(self, policy: VirtualTimePolicy, budget: int=None):
         self.policy = policy
         # If set, after this many virtual milliseconds have elapsed virtual time will be paused and a virtualTimeBudgetExpired event is sent.
         self.budget = budget
 
+    def to_wire(self):
+        wire = {"policy": encode(self.policy)}
+        if self.budget is not None:
+            wire["budget"] = self.budget
+        return wire
+
+
 
+class virtualTimeBudgetExpired(ChromeEvent):
+    """Notification sent after the virual time budget for the current VirtualTimePolicy has run out."""
+    __slots__ = ()
+    _fields = ()
 
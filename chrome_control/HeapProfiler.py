@@ -1,15 +1,22 @@
+# schema hash: af3ae15622a1e70dfdcc73e3b917316dee4f6928
 from enum import Enum
-from typing import Any, List
+from typing import TYPE_CHECKING, Any, List
 
-from .base import ChromeCommand
+from .base import ChromeCommand, ChromeEvent, ChromeResult, ChromeType, encode, resolve
 
-from . import Runtime
+if TYPE_CHECKING:
+    from . import Runtime
 
 # Heap snapshot object id.
 HeapSnapshotObjectId = str
 
-class SamplingHeapProfileNode:
+class SamplingHeapProfileNode(ChromeType):
     """Sampling Heap Profile node. Holds callsite information, allocation statistics and child nodes."""
+    _fields = ('callFrame', 'selfSize', 'children')
+    __slots__ = _fields
+    _types = {'callFrame': 'Runtime.CallFrame', 'children': ['HeapProfiler.SamplingHeapProfileNode']}
+    _refs = ('Runtime.CallFrame',)
+
     def __init__(self, callFrame: "Runtime.CallFrame", selfSize: float, children: List):
         # Function location.
         self.callFrame = callFrame
@@ -18,71 +25,223 @@ class SamplingHeapProfileNode:
         # Child nodes.
         self.children = children
 
-class SamplingHeapProfile:
+    def to_wire(self):
+        wire = {"callFrame": encode(self.callFrame), "selfSize": self.selfSize, "children": encode(self.children)}
+        return wire
+
+    @classmethod
+    def from_wire(cls, wire: dict):
+        refs = cls._refs
+        if refs[0].__class__ is str:
+            refs = cls._refs = tuple(map(resolve, refs))
+        obj = cls.__new__(cls)
+        obj.callFrame = refs[0].from_wire(wire["callFrame"])
+        obj.selfSize = wire["selfSize"]
+        obj.children = [SamplingHeapProfileNode.from_wire(x0) for x0 in wire["children"]]
+        return obj
+
+class SamplingHeapProfile(ChromeType):
     """Profile."""
-    def __init__(self, head: "SamplingHeapProfileNode"):
+    _fields = ('head',)
+    __slots__ = _fields
+    _types = {'head': SamplingHeapProfileNode}
+
+    def __init__(self, head: SamplingHeapProfileNode):
         self.head = head
 
+    def to_wire(self):
+        wire = {"head": encode(self.head)}
+        return wire
+
+    @classmethod
+    def from_wire(cls, wire: dict):
+        obj = cls.__new__(cls)
+        obj.head = SamplingHeapProfileNode.from_wire(wire["head"])
+        return obj
+
 class enable(ChromeCommand):
+    _fields = ()
+    __slots__ = _fields
+
     def __init__(self): pass
 
 class disable(ChromeCommand):
+    _fields = ()
+    __slots__ = _fields
+
     def __init__(self): pass
 
 class startTrackingHeapObjects(ChromeCommand):
+    _fields = ('trackAllocations',)
+    __slots__ = _fields
+
     def __init__(self, trackAllocations: bool=None):
         self.trackAllocations = trackAllocations
 
+    def to_wire(self):
+        wire = {}
+        if self.trackAllocations is not None:
+            wire["trackAllocations"] = self.trackAllocations
+        return wire
+
 
 
 class stopTrackingHeapObjects(ChromeCommand):
+    _fields = ('reportProgress',)
+    __slots__ = _fields
+
     def __init__(self, reportProgress: bool=None):
         # If true 'reportHeapSnapshotProgress' events will be generated while snapshot is being taken when the tracking is stopped.
         self.reportProgress = reportProgress
 
+    def to_wire(self):
+        wire = {}
+        if self.reportProgress is not None:
+            wire["reportProgress"] = self.reportProgress
+        return wire
+
 
 
 class takeHeapSnapshot(ChromeCommand):
+    _fields = ('reportProgress',)
+    __slots__ = _fields
+
     def __init__(self, reportProgress: bool=None):
         # If true 'reportHeapSnapshotProgress' events will be generated while snapshot is being taken.
         self.reportProgress = reportProgress
 
+    def to_wire(self):
+        wire = {}
+        if self.reportProgress is not None:
+            wire["reportProgress"] = self.reportProgress
+        return wire
+
 
 
 class collectGarbage(ChromeCommand):
+    _fields = ()
+    __slots__ = _fields
+
     def __init__(self): pass
 
+class getObjectByHeapObjectIdResult(ChromeResult):
+    __slots__ = ()
+    _fields = ('result',)
+    # Evaluation result.
+    result: "Runtime.RemoteObject"
+    _types = {'result': 'Runtime.RemoteObject'}
+
 class getObjectByHeapObjectId(ChromeCommand):
-    def __init__(self, objectId: "HeapSnapshotObjectId", objectGroup: str=None):
+    _fields = ('objectId', 'objectGroup')
+    __slots__ = _fields
+    _result = getObjectByHeapObjectIdResult
+
+    def __init__(self, objectId: HeapSnapshotObjectId, objectGroup: str=None):
         self.objectId = objectId
         # Symbolic group name that can be used to release multiple objects.
         self.objectGroup = objectGroup
 
+    def to_wire(self):
+        wire = {"objectId": self.objectId}
+        if self.objectGroup is not None:
+            wire["objectGroup"] = self.objectGroup
+        return wire
+
 
 
 class addInspectedHeapObject(ChromeCommand):
     """Enables console to refer to the node with given id via $x (see Command Line API for more details $x functions)."""
+    _fields = ('heapObjectId',)
+    __slots__ = _fields
 
-    def __init__(self, heapObjectId: "HeapSnapshotObjectId"):
+    def __init__(self, heapObjectId: HeapSnapshotObjectId):
         # Heap snapshot object id to be accessible by means of $x command line API.
         self.heapObjectId = heapObjectId
 
+    def to_wire(self):
+        wire = {"heapObjectId": self.heapObjectId}
+        return wire
 
 
+
+class getHeapObjectIdResult(ChromeResult):
+    __slots__ = ()
+    _fields = ('heapSnapshotObjectId',)
+    # Id of the heap snapshot object corresponding to the passed remote object id.
+    heapSnapshotObjectId: HeapSnapshotObjectId
+
 class getHeapObjectId(ChromeCommand):
+    _fields = ('objectId',)
+    __slots__ = _fields
+    _result = getHeapObjectIdResult
+
     def __init__(self, objectId: "Runtime.RemoteObjectId"):
         # Identifier of the object to get heap object id for.
         self.objectId = objectId
 
+    def to_wire(self):
+        wire = {"objectId": self.objectId}
+        return wire
+
 
 
 class startSampling(ChromeCommand):
+    _fields = ('samplingInterval',)
+    __slots__ = _fields
+
     def __init__(self, samplingInterval: float=None):
         # Average sample interval in bytes. Poisson distribution is used for the intervals. The default value is 32768 bytes.
         self.samplingInterval = samplingInterval
 
+    def to_wire(self):
+        wire = {}
+        if self.samplingInterval is not None:
+            wire["samplingInterval"] = self.samplingInterval
+        return wire
+
 
 
+class stopSamplingResult(ChromeResult):
+    __slots__ = ()
+    _fields = ('profile',)
+    # Recorded sampling heap profile.
+    profile: SamplingHeapProfile
+    _types = {'profile': SamplingHeapProfile}
+
 class stopSampling(ChromeCommand):
+    _fields = ()
+    __slots__ = _fields
+    _result = stopSamplingResult
+
     def __init__(self): pass
 
+class addHeapSnapshotChunk(ChromeEvent):
+    __slots__ = ()
+    _fields = ('chunk',)
+    chunk: str
+
+class resetProfiles(ChromeEvent):
+    __slots__ = ()
+    _fields = ()
+
+class reportHeapSnapshotProgress(ChromeEvent):
+    __slots__ = ()
+    _fields = ('done', 'total', 'finished')
+    done: int
+    total: int
+    finished: bool
+
+class lastSeenObjectId(ChromeEvent):
+    """If heap objects tracking has been started then backend regulary sends a current value for last seen object id and corresponding timestamp. If the were changes in the heap since last event then one or more heapStatsUpdate events will be sent before a new lastSeenObjectId event."""
+    __slots__ = ()
+    _fields = ('lastSeenObjectId', 'timestamp')
+    lastSeenObjectId: int
+    timestamp: float
+
+class heapStatsUpdate(ChromeEvent):
+    """If heap objects tracking has been started then backend may send update for one or more fragments"""
+    __slots__ = ()
+    _fields = ('statsUpdate',)
+    # An array of triplets. Each triplet describes a fragment. The first integer is the fragment index, the second integer is a total count of objects for the fragment, the third integer is a total size of the objects for the fragment.
+    statsUpdate: List
+
@@ -1,15 +1,27 @@
+# schema hash: 364813be54a677eb20d07607bff8bc5a43fb1393
 from enum import Enum
-from typing import Any, List
+from typing import TYPE_CHECKING, Any, List
 
-from .base import ChromeCommand
+from .base import ChromeCommand, ChromeEvent, ChromeResult, ChromeType, encode, resolve
 
 
 StreamHandle = str
 
+class readResult(ChromeResult):
+    __slots__ = ()
+    _fields = ('data', 'eof')
+    # Data that were read.
+    data: str
+    # Set if the end-of-file condition occured while reading.
+    eof: bool
+
 class read(ChromeCommand):
     """Read a chunk of the stream"""
+    _fields = ('handle', 'offset', 'size')
+    __slots__ = _fields
+    _result = readResult
 
-    def __init__(self, handle: "StreamHandle", offset: int=None, size: int=None):
+    def __init__(self, handle: StreamHandle, offset: int=None, size: int=None):
         # Handle of the stream to read.
         self.handle = handle
         # Seek to the specified offset before reading (if not specificed, proceed with offset following the last read).
@@ -17,14 +29,28 @@ class read(ChromeCommand):
         # Maximum number of bytes to read (left upon the agent discretion if not specified).
         self.size = size
 
+    def to_wire(self):
+        wire = {"handle": self.handle}
+        if self.offset is not None:
+            wire["offset"] = self.offset
+        if self.size is not None:
+            wire["size"] = self.size
+        return wire
+
 
 
 class close(ChromeCommand):
     """Close the stream, discard any temporary backing storage."""
+    _fields = ('handle',)
+    __slots__ = _fields
 
-    def __init__(self, handle: "StreamHandle"):
+    def __init__(self, handle: StreamHandle):
         # Handle of the stream to close.
         self.handle = handle
 
+    def to_wire(self):
+        wire = {"handle": self.handle}
+        return wire
+
 
 
@@ -1,23 +1,77 @@
+# schema hash: 4f2d19b23cf0c0616adb0d2c93c7ae306edf0e46
 from enum import Enum
-from typing import Any, List
+from typing import TYPE_CHECKING, Any, List
 
-from .base import ChromeCommand
+from .base import ChromeCommand, ChromeEvent, ChromeResult, ChromeType, encode, resolve
 
-from . import Runtime
+if TYPE_CHECKING:
+    from . import Runtime
 
-class DatabaseWithObjectStores:
-    """Database with an array of object stores."""
-    def __init__(self, name: str, version: int, objectStores: List):
-        # Database name.
+class KeyPath(ChromeType):
+    """Key path."""
+    _fields = ('type', 'string', 'array')
+    __slots__ = _fields
+
+    def __init__(self, type: str, string: str=None, array: List=None):
+        # Key path type.
+        self.type = type
+        # String value.
+        self.string = string
+        # Array value.
+        self.array = array
+
+    def to_wire(self):
+        wire = {"type": self.type}
+        if self.string is not None:
+            wire["string"] = self.string
+        if self.array is not None:
+            wire["array"] = self.array
+        return wire
+
+    @classmethod
+    def from_wire(cls, wire: dict):
+        obj = cls.__new__(cls)
+        obj.type = wire["type"]
+        obj.string = wire.get("string")
+        obj.array = wire.get("array")
+        return obj
+
+class ObjectStoreIndex(ChromeType):
+    """Object store index."""
+    _fields = ('name', 'keyPath', 'unique', 'multiEntry')
+    __slots__ = _fields
+    _types = {'keyPath': KeyPath}
+
+    def __init__(self, name: str, keyPath: KeyPath, unique: bool, multiEntry: bool):
+        # Index name.
         self.name = name
-        # Database version.
-        self.version = version
-        # Object stores in this database.
-        self.objectStores = objectStores
+        # Index key path.
+        self.keyPath = keyPath
+        # If true, index is unique.
+        self.unique = unique
+        # If true, index allows multiple entries for a key.
+        self.multiEntry = multiEntry
+
+    def to_wire(self):
+        wire = {"name": self.name, "keyPath": encode(self.keyPath), "unique": self.unique, "multiEntry": self.multiEntry}
+        return wire
 
-class ObjectStore:
+    @classmethod
+    def from_wire(cls, wire: dict):
+        obj = cls.__new__(cls)
+        obj.name = wire["name"]
+        obj.keyPath = KeyPath.from_wire(wire["keyPath"])
+        obj.unique = wire["unique"]
+        obj.multiEntry = wire["multiEntry"]
+        return obj
+
+class ObjectStore(ChromeType):
     """Object store."""
-    def __init__(self, name: str, keyPath: "KeyPath", autoIncrement: bool, indexes: List):
+    _fields = ('name', 'keyPath', 'autoIncrement', 'indexes')
+    __slots__ = _fields
+    _types = {'keyPath': KeyPath, 'indexes': [ObjectStoreIndex]}
+
+    def __init__(self, name: str, keyPath: KeyPath, autoIncrement: bool, indexes: List):
         # Object store name.
         self.name = name
         # Object store key path.
@@ -27,20 +81,51 @@ class ObjectStore:
         # Indexes in this object store.
         self.indexes = indexes
 
-class ObjectStoreIndex:
-    """Object store index."""
-    def __init__(self, name: str, keyPath: "KeyPath", unique: bool, multiEntry: bool):
-        # Index name.
+    def to_wire(self):
+        wire = {"name": self.name, "keyPath": encode(self.keyPath), "autoIncrement": self.autoIncrement, "indexes": encode(self.indexes)}
+        return wire
+
+    @classmethod
+    def from_wire(cls, wire: dict):
+        obj = cls.__new__(cls)
+        obj.name = wire["name"]
+        obj.keyPath = KeyPath.from_wire(wire["keyPath"])
+        obj.autoIncrement = wire["autoIncrement"]
+        obj.indexes = [ObjectStoreIndex.from_wire(x0) for x0 in wire["indexes"]]
+        return obj
+
+class DatabaseWithObjectStores(ChromeType):
+    """Database with an array of object stores."""
+    _fields = ('name', 'version', 'objectStores')
+    __slots__ = _fields
+    _types = {'objectStores': [ObjectStore]}
+
+    def __init__(self, name: str, version: int, objectStores: List):
+        # Database name.
         self.name = name
-        # Index key path.
-        self.keyPath = keyPath
-        # If true, index is unique.
-        self.unique = unique
-        # If true, index allows multiple entries for a key.
-        self.multiEntry = multiEntry
+        # Database version.
+        self.version = version
+        # Object stores in this database.
+        self.objectStores = objectStores
+
+    def to_wire(self):
+        wire = {"name": self.name, "version": self.version, "objectStores": encode(self.objectStores)}
+        return wire
+
+    @classmethod
+    def from_wire(cls, wire: dict):
+        obj = cls.__new__(cls)
+        obj.name = wire["name"]
+        obj.version = wire["version"]
+        obj.objectStores = [ObjectStore.from_wire(x0) for x0 in wire["objectStores"]]
+        return obj
 
-class Key:
+class Key(ChromeType):
     """Key."""
+    _fields = ('type', 'number', 'string', 'date', 'array')
+    __slots__ = _fields
+    _types = {'array': ['IndexedDB.Key']}
+
     def __init__(self, type: str, number: float=None, string: str=None, date: float=None, array: List=None):
         # Key type.
         self.type = type
@@ -53,9 +138,35 @@ class Key:
         # Array value.
         self.array = array
 
-class KeyRange:
+    def to_wire(self):
+        wire = {"type": self.type}
+        if self.number is not None:
+            wire["number"] = self.number
+        if self.string is not None:
+            wire["string"] = self.string
+        if self.date is not None:
+            wire["date"] = self.date
+        if self.array is not None:
+            wire["array"] = encode(self.array)
+        return wire
+
+    @classmethod
+    def from_wire(cls, wire: dict):
+        obj = cls.__new__(cls)
+        obj.type = wire["type"]
+        obj.number = wire.get("number")
+        obj.string = wire.get("string")
+        obj.date = wire.get("date")
+        obj.array = [Key.from_wire(x0) for x0 in wire["array"]] if "array" in wire else None
+        return obj
+
+class KeyRange(ChromeType):
     """Key range."""
-    def __init__(self, lowerOpen: bool, upperOpen: bool, lower: "Key"=None, upper: "Key"=None):
+    _fields = ('lowerOpen', 'upperOpen', 'lower', 'upper')
+    __slots__ = _fields
+    _types = {'lower': Key, 'upper': Key}
+
+    def __init__(self, lowerOpen: bool, upperOpen: bool, lower: Key=None, upper: Key=None):
         # If true lower bound is open.
         self.lowerOpen = lowerOpen
         # If true upper bound is open.
@@ -65,8 +176,30 @@ class KeyRange:
         # Upper bound.
         self.upper = upper
 
-class DataEntry:
+    def to_wire(self):
+        wire = {"lowerOpen": self.lowerOpen, "upperOpen": self.upperOpen}
+        if self.lower is not None:
+            wire["lower"] = encode(self.lower)
+        if self.upper is not None:
+            wire["upper"] = encode(self.upper)
+        return wire
+
+    @classmethod
+    def from_wire(cls, wire: dict):
+        obj = cls.__new__(cls)
+        obj.lowerOpen = wire["lowerOpen"]
+        obj.upperOpen = wire["upperOpen"]
+        obj.lower = Key.from_wire(wire["lower"]) if "lower" in wire else None
+        obj.upper = Key.from_wire(wire["upper"]) if "upper" in wire else None
+        return obj
+
+class DataEntry(ChromeType):
     """Data entry."""
+    _fields = ('key', 'primaryKey', 'value')
+    __slots__ = _fields
+    _types = {'key': 'Runtime.RemoteObject', 'primaryKey': 'Runtime.RemoteObject', 'value': 'Runtime.RemoteObject'}
+    _refs = ('Runtime.RemoteObject',)
+
     def __init__(self, key: "Runtime.RemoteObject", primaryKey: "Runtime.RemoteObject", value: "Runtime.RemoteObject"):
         # Key object.
         self.key = key
@@ -75,37 +208,69 @@ class DataEntry:
         # Value object.
         self.value = value
 
-class KeyPath:
-    """Key path."""
-    def __init__(self, type: str, string: str=None, array: List=None):
-        # Key path type.
-        self.type = type
-        # String value.
-        self.string = string
-        # Array value.
-        self.array = array
+    def to_wire(self):
+        wire = {"key": encode(self.key), "primaryKey": encode(self.primaryKey), "value": encode(self.value)}
+        return wire
+
+    @classmethod
+    def from_wire(cls, wire: dict):
+        refs = cls._refs
+        if refs[0].__class__ is str:
+            refs = cls._refs = tuple(map(resolve, refs))
+        obj = cls.__new__(cls)
+        obj.key = refs[0].from_wire(wire["key"])
+        obj.primaryKey = refs[0].from_wire(wire["primaryKey"])
+        obj.value = refs[0].from_wire(wire["value"])
+        return obj
 
 class enable(ChromeCommand):
     """Enables events from backend."""
+    _fields = ()
+    __slots__ = _fields
 
     def __init__(self): pass
 
 class disable(ChromeCommand):
     """Disables events from backend."""
+    _fields = ()
+    __slots__ = _fields
 
     def __init__(self): pass
 
+class requestDatabaseNamesResult(ChromeResult):
+    __slots__ = ()
+    _fields = ('databaseNames',)
+    # Database names for origin.
+    databaseNames: List
+
 class requestDatabaseNames(ChromeCommand):
     """Requests database names for given security origin."""
+    _fields = ('securityOrigin',)
+    __slots__ = _fields
+    _result = requestDatabaseNamesResult
 
     def __init__(self, securityOrigin: str):
         # Security origin.
         self.securityOrigin = securityOrigin
 
+    def to_wire(self):
+        wire = {"securityOrigin": self.securityOrigin}
+        return wire
+
 
 
+class requestDatabaseResult(ChromeResult):
+    __slots__ = ()
+    _fields = ('databaseWithObjectStores',)
+    # Database with an array of object stores.
+    databaseWithObjectStores: DatabaseWithObjectStores
+    _types = {'databaseWithObjectStores': DatabaseWithObjectStores}
+
 class requestDatabase(ChromeCommand):
     """Requests database with given name in given frame."""
+    _fields = ('securityOrigin', 'databaseName')
+    __slots__ = _fields
+    _result = requestDatabaseResult
 
     def __init__(self, securityOrigin: str, databaseName: str):
         # Security origin.
@@ -113,12 +278,28 @@ class requestDatabase(ChromeCommand):
         # Database name.
         self.databaseName = databaseName
 
+    def to_wire(self):
+        wire = {"securityOrigin": self.securityOrigin, "databaseName": self.databaseName}
+        return wire
+
 
 
+class requestDataResult(ChromeResult):
+    __slots__ = ()
+    _fields = ('objectStoreDataEntries', 'hasMore')
+    # Array of object store data entries.
+    objectStoreDataEntries: List
+    # If true, there are more entries to fetch in the given range.
+    hasMore: bool
+    _types = {'objectStoreDataEntries': [DataEntry]}
+
 class requestData(ChromeCommand):
     """Requests data from object store or index."""
+    _fields = ('securityOrigin', 'databaseName', 'objectStoreName', 'indexName', 'skipCount', 'pageSize', 'keyRange')
+    __slots__ = _fields
+    _result = requestDataResult
 
-    def __init__(self, securityOrigin: str, databaseName: str, objectStoreName: str, indexName: str, skipCount: int, pageSize: int, keyRange: "KeyRange"=None):
+    def __init__(self, securityOrigin: str, databaseName: str, objectStoreName: str, indexName: str, skipCount: int, pageSize: int, keyRange: KeyRange=None):
         # Security origin.
         self.securityOrigin = securityOrigin
         # Database name.
@@ -134,10 +315,23 @@ class requestData(ChromeCommand):
         # Key range.
         self.keyRange = keyRange
 
+    def to_wire(self):
+        wire = {"securityOrigin": self.securityOrigin, "databaseName": self.databaseName, "objectStoreName": self.objectStoreName, "indexName": self.indexName, "skipCount": self.skipCount, "pageSize": self.pageSize}
+        if self.keyRange is not None:
+            wire["keyRange"] = encode(self.keyRange)
+        return wire
+
 
 
+class clearObjectStoreResult(ChromeResult):
+    __slots__ = ()
+    _fields = ()
+
 class clearObjectStore(ChromeCommand):
     """Clears all entries from an object store."""
+    _fields = ('securityOrigin', 'databaseName', 'objectStoreName')
+    __slots__ = _fields
+    _result = clearObjectStoreResult
 
     def __init__(self, securityOrigin: str, databaseName: str, objectStoreName: str):
         # Security origin.
@@ -147,5 +341,9 @@ class clearObjectStore(ChromeCommand):
         # Object store name.
         self.objectStoreName = objectStoreName
 
+    def to_wire(self):
+        wire = {"securityOrigin": self.securityOrigin, "databaseName": self.databaseName, "objectStoreName": self.objectStoreName}
+        return wire
+
 
 
@@ -1,10 +1,14 @@
+# schema hash: 3d1ea118181b500a24399303a99e503d9dd3b2a5
 from enum import Enum
-from typing import Any, List
+from typing import TYPE_CHECKING, Any, List
 
-from .base import ChromeCommand
+from .base import ChromeCommand, ChromeEvent, ChromeResult, ChromeType, encode, resolve
 
 
-class TouchPoint:
+class TouchPoint(ChromeType):
+    _fields = ('state', 'x', 'y', 'radiusX', 'radiusY', 'rotationAngle', 'force', 'id')
+    __slots__ = _fields
+
     def __init__(self, state: str, x: int, y: int, radiusX: int=None, radiusY: int=None, rotationAngle: float=None, force: float=None, id: float=None):
         # State of the touch point.
         self.state = state
@@ -23,11 +27,40 @@ class TouchPoint:
         # Identifier used to track touch sources between events, must be unique within an event.
         self.id = id
 
+    def to_wire(self):
+        wire = {"state": self.state, "x": self.x, "y": self.y}
+        if self.radiusX is not None:
+            wire["radiusX"] = self.radiusX
+        if self.radiusY is not None:
+            wire["radiusY"] = self.radiusY
+        if self.rotationAngle is not None:
+            wire["rotationAngle"] = self.rotationAngle
+        if self.force is not None:
+            wire["force"] = self.force
+        if self.id is not None:
+            wire["id"] = self.id
+        return wire
+
+    @classmethod
+    def from_wire(cls, wire: dict):
+        obj = cls.__new__(cls)
+        obj.state = wire["state"]
+        obj.x = wire["x"]
+        obj.y = wire["y"]
+        obj.radiusX = wire.get("radiusX")
+        obj.radiusY = wire.get("radiusY")
+        obj.rotationAngle = wire.get("rotationAngle")
+        obj.force = wire.get("force")
+        obj.id = wire.get("id")
+        return obj
+
 GestureSourceType = Enum("GestureSourceType", "default touch mouse")
 GestureSourceType.__doc__ = """"""
 
 class dispatchKeyEvent(ChromeCommand):
     """Dispatches a key event to the page."""
+    _fields = ('type', 'modifiers', 'timestamp', 'text', 'unmodifiedText', 'keyIdentifier', 'code', 'key', 'windowsVirtualKeyCode', 'nativeVirtualKeyCode', 'autoRepeat', 'isKeypad', 'isSystemKey')
+    __slots__ = _fields
 
     def __init__(self, type: str, modifiers: int=None, timestamp: float=None, text: str=None, unmodifiedText: str=None, keyIdentifier: str=None, code: str=None, key: str=None, windowsVirtualKeyCode: int=None, nativeVirtualKeyCode: int=None, autoRepeat: bool=None, isKeypad: bool=None, isSystemKey: bool=None):
         # Type of the key event.
@@ -57,10 +90,40 @@ class dispatchKeyEvent(ChromeCommand):
         # Whether the event was a system key event (default: false).
         self.isSystemKey = isSystemKey
 
+    def to_wire(self):
+        wire = {"type": self.type}
+        if self.modifiers is not None:
+            wire["modifiers"] = self.modifiers
+        if self.timestamp is not None:
+            wire["timestamp"] = self.timestamp
+        if self.text is not None:
+            wire["text"] = self.text
+        if self.unmodifiedText is not None:
+            wire["unmodifiedText"] = self.unmodifiedText
+        if self.keyIdentifier is not None:
+            wire["keyIdentifier"] = self.keyIdentifier
+        if self.code is not None:
+            wire["code"] = self.code
+        if self.key is not None:
+            wire["key"] = self.key
+        if self.windowsVirtualKeyCode is not None:
+            wire["windowsVirtualKeyCode"] = self.windowsVirtualKeyCode
+        if self.nativeVirtualKeyCode is not None:
+            wire["nativeVirtualKeyCode"] = self.nativeVirtualKeyCode
+        if self.autoRepeat is not None:
+            wire["autoRepeat"] = self.autoRepeat
+        if self.isKeypad is not None:
+            wire["isKeypad"] = self.isKeypad
+        if self.isSystemKey is not None:
+            wire["isSystemKey"] = self.isSystemKey
+        return wire
+
 
 
 class dispatchMouseEvent(ChromeCommand):
     """Dispatches a mouse event to the page."""
+    _fields = ('type', 'x', 'y', 'modifiers', 'timestamp', 'button', 'clickCount')
+    __slots__ = _fields
 
     def __init__(self, type: str, x: int, y: int, modifiers: int=None, timestamp: float=None, button: str=None, clickCount: int=None):
         # Type of the mouse event.
@@ -78,10 +141,24 @@ class dispatchMouseEvent(ChromeCommand):
         # Number of times the mouse button was clicked (default: 0).
         self.clickCount = clickCount
 
+    def to_wire(self):
+        wire = {"type": self.type, "x": self.x, "y": self.y}
+        if self.modifiers is not None:
+            wire["modifiers"] = self.modifiers
+        if self.timestamp is not None:
+            wire["timestamp"] = self.timestamp
+        if self.button is not None:
+            wire["button"] = self.button
+        if self.clickCount is not None:
+            wire["clickCount"] = self.clickCount
+        return wire
+
 
 
 class dispatchTouchEvent(ChromeCommand):
     """Dispatches a touch event to the page."""
+    _fields = ('type', 'touchPoints', 'modifiers', 'timestamp')
+    __slots__ = _fields
 
     def __init__(self, type: str, touchPoints: List, modifiers: int=None, timestamp: float=None):
         # Type of the touch event.
@@ -93,10 +170,20 @@ class dispatchTouchEvent(ChromeCommand):
         # Time at which the event occurred. Measured in UTC time in seconds since January 1, 1970 (default: current time).
         self.timestamp = timestamp
 
+    def to_wire(self):
+        wire = {"type": self.type, "touchPoints": encode(self.touchPoints)}
+        if self.modifiers is not None:
+            wire["modifiers"] = self.modifiers
+        if self.timestamp is not None:
+            wire["timestamp"] = self.timestamp
+        return wire
+
 
 
 class emulateTouchFromMouseEvent(ChromeCommand):
     """Emulates touch event from the mouse event parameters."""
+    _fields = ('type', 'x', 'y', 'timestamp', 'button', 'deltaX', 'deltaY', 'modifiers', 'clickCount')
+    __slots__ = _fields
 
     def __init__(self, type: str, x: int, y: int, timestamp: float, button: str, deltaX: float=None, deltaY: float=None, modifiers: int=None, clickCount: int=None):
         # Type of the mouse event.
@@ -118,12 +205,26 @@ class emulateTouchFromMouseEvent(ChromeCommand):
         # Number of times the mouse button was clicked (default: 0).
         self.clickCount = clickCount
 
+    def to_wire(self):
+        wire = {"type": self.type, "x": self.x, "y": self.y, "timestamp": self.timestamp, "button": self.button}
+        if self.deltaX is not None:
+            wire["deltaX"] = self.deltaX
+        if self.deltaY is not None:
+            wire["deltaY"] = self.deltaY
+        if self.modifiers is not None:
+            wire["modifiers"] = self.modifiers
+        if self.clickCount is not None:
+            wire["clickCount"] = self.clickCount
+        return wire
+
 
 
 class synthesizePinchGesture(ChromeCommand):
     """Synthesizes a pinch gesture over a time period by issuing appropriate touch events."""
+    _fields = ('x', 'y', 'scaleFactor', 'relativeSpeed', 'gestureSourceType')
+    __slots__ = _fields
 
-    def __init__(self, x: int, y: int, scaleFactor: float, relativeSpeed: int=None, gestureSourceType: "GestureSourceType"=None):
+    def __init__(self, x: int, y: int, scaleFactor: float, relativeSpeed: int=None, gestureSourceType: GestureSourceType=None):
         # X coordinate of the start of the gesture in CSS pixels.
         self.x = x
         # Y coordinate of the start of the gesture in CSS pixels.
@@ -135,12 +236,22 @@ class synthesizePinchGesture(ChromeCommand):
         # Which type of input events to be generated (default: 'default', which queries the platform for the preferred input type).
         self.gestureSourceType = gestureSourceType
 
+    def to_wire(self):
+        wire = {"x": self.x, "y": self.y, "scaleFactor": self.scaleFactor}
+        if self.relativeSpeed is not None:
+            wire["relativeSpeed"] = self.relativeSpeed
+        if self.gestureSourceType is not None:
+            wire["gestureSourceType"] = encode(self.gestureSourceType)
+        return wire
+
 
 
 class synthesizeScrollGesture(ChromeCommand):
     """Synthesizes a scroll gesture over a time period by issuing appropriate touch events."""
+    _fields = ('x', 'y', 'xDistance', 'yDistance', 'xOverscroll', 'yOverscroll', 'preventFling', 'speed', 'gestureSourceType', 'repeatCount', 'repeatDelayMs', 'interactionMarkerName')
+    __slots__ = _fields
 
-    def __init__(self, x: int, y: int, xDistance: int=None, yDistance: int=None, xOverscroll: int=None, yOverscroll: int=None, preventFling: bool=None, speed: int=None, gestureSourceType: "GestureSourceType"=None, repeatCount: int=None, repeatDelayMs: int=None, interactionMarkerName: str=None):
+    def __init__(self, x: int, y: int, xDistance: int=None, yDistance: int=None, xOverscroll: int=None, yOverscroll: int=None, preventFling: bool=None, speed: int=None, gestureSourceType: GestureSourceType=None, repeatCount: int=None, repeatDelayMs: int=None, interactionMarkerName: str=None):
         # X coordinate of the start of the gesture in CSS pixels.
         self.x = x
         # Y coordinate of the start of the gesture in CSS pixels.
@@ -166,12 +277,38 @@ class synthesizeScrollGesture(ChromeCommand):
         # The name of the interaction markers to generate, if not empty (default: "").
         self.interactionMarkerName = interactionMarkerName
 
+    def to_wire(self):
+        wire = {"x": self.x, "y": self.y}
+        if self.xDistance is not None:
+            wire["xDistance"] = self.xDistance
+        if self.yDistance is not None:
+            wire["yDistance"] = self.yDistance
+        if self.xOverscroll is not None:
+            wire["xOverscroll"] = self.xOverscroll
+        if self.yOverscroll is not None:
+            wire["yOverscroll"] = self.yOverscroll
+        if self.preventFling is not None:
+            wire["preventFling"] = self.preventFling
+        if self.speed is not None:
+            wire["speed"] = self.speed
+        if self.gestureSourceType is not None:
+            wire["gestureSourceType"] = encode(self.gestureSourceType)
+        if self.repeatCount is not None:
+            wire["repeatCount"] = self.repeatCount
+        if self.repeatDelayMs is not None:
+            wire["repeatDelayMs"] = self.repeatDelayMs
+        if self.interactionMarkerName is not None:
+            wire["interactionMarkerName"] = self.interactionMarkerName
+        return wire
+
 
 
 class synthesizeTapGesture(ChromeCommand):
     """Synthesizes a tap gesture over a time period by issuing appropriate touch events."""
+    _fields = ('x', 'y', 'duration', 'tapCount', 'gestureSourceType')
+    __slots__ = _fields
 
-    def __init__(self, x: int, y: int, duration: int=None, tapCount: int=None, gestureSourceType: "GestureSourceType"=None):
+    def __init__(self, x: int, y: int, duration: int=None, tapCount: int=None, gestureSourceType: GestureSourceType=None):
         # X coordinate of the start of the gesture in CSS pixels.
         self.x = x
         # Y coordinate of the start of the gesture in CSS pixels.
@@ -183,5 +320,15 @@ class synthesizeTapGesture(ChromeCommand):
         # Which type of input events to be generated (default: 'default', which queries the platform for the preferred input type).
         self.gestureSourceType = gestureSourceType
 
+    def to_wire(self):
+        wire = {"x": self.x, "y": self.y}
+        if self.duration is not None:
+            wire["duration"] = self.duration
+        if self.tapCount is not None:
+            wire["tapCount"] = self.tapCount
+        if self.gestureSourceType is not None:
+            wire["gestureSourceType"] = encode(self.gestureSourceType)
+        return wire
+
 
 
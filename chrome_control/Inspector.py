@@ -1,16 +1,33 @@
+# schema hash: 031ff9a44050a8926c4a22587edb6e199d90563e
 from enum import Enum
-from typing import Any, List
+from typing import TYPE_CHECKING, Any, List
 
-from .base import ChromeCommand
+from .base import ChromeCommand, ChromeEvent, ChromeResult, ChromeType, encode, resolve
 
 
 class enable(ChromeCommand):
     """Enables inspector domain notifications."""
+    _fields = ()
+    __slots__ = _fields
 
     def __init__(self): pass
 
 class disable(ChromeCommand):
     """Disables inspector domain notifications."""
+    _fields = ()
+    __slots__ = _fields
 
     def __init__(self): pass
 
+class detached(ChromeEvent):
+    """Fired when remote debugging connection is about to be terminated. Contains detach reason."""
+    __slots__ = ()
+    _fields = ('reason',)
+    # The reason why connection has been terminated.
+    reason: str
+
+class targetCrashed(ChromeEvent):
+    """Fired when debugging target has crashed"""
+    __slots__ = ()
+    _fields = ()
+
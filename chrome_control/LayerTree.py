@@ -1,9 +1,11 @@
+# schema hash: b9537cc4f0d7c5d3b5a0a6ad81bf5f17c5ec6efc
 from enum import Enum
-from typing import Any, List
+from typing import TYPE_CHECKING, Any, List
 
-from .base import ChromeCommand
+from .base import ChromeCommand, ChromeEvent, ChromeResult, ChromeType, encode, resolve
 
-from . import DOM
+if TYPE_CHECKING:
+    from . import DOM
 
 # Unique Layer identifier.
 LayerId = str
@@ -11,16 +13,38 @@ LayerId = str
 # Unique snapshot identifier.
 SnapshotId = str
 
-class ScrollRect:
+class ScrollRect(ChromeType):
     """Rectangle where scrolling happens on the main thread."""
+    _fields = ('rect', 'type')
+    __slots__ = _fields
+    _types = {'rect': 'DOM.Rect'}
+    _refs = ('DOM.Rect',)
+
     def __init__(self, rect: "DOM.Rect", type: str):
         # Rectangle itself.
         self.rect = rect
         # Reason for rectangle to force scrolling on the main thread
         self.type = type
 
-class PictureTile:
+    def to_wire(self):
+        wire = {"rect": encode(self.rect), "type": self.type}
+        return wire
+
+    @classmethod
+    def from_wire(cls, wire: dict):
+        refs = cls._refs
+        if refs[0].__class__ is str:
+            refs = cls._refs = tuple(map(resolve, refs))
+        obj = cls.__new__(cls)
+        obj.rect = refs[0].from_wire(wire["rect"])
+        obj.type = wire["type"]
+        return obj
+
+class PictureTile(ChromeType):
     """Serialized fragment of layer picture along with its offset within the layer."""
+    _fields = ('x', 'y', 'picture')
+    __slots__ = _fields
+
     def __init__(self, x: float, y: float, picture: str):
         # Offset from owning layer left boundary
         self.x = x
@@ -29,9 +53,25 @@ class PictureTile:
         # Base64-encoded snapshot data.
         self.picture = picture
 
-class Layer:
+    def to_wire(self):
+        wire = {"x": self.x, "y": self.y, "picture": self.picture}
+        return wire
+
+    @classmethod
+    def from_wire(cls, wire: dict):
+        obj = cls.__new__(cls)
+        obj.x = wire["x"]
+        obj.y = wire["y"]
+        obj.picture = wire["picture"]
+        return obj
+
+class Layer(ChromeType):
     """Information about a compositing layer."""
-    def __init__(self, layerId: "LayerId", offsetX: float, offsetY: float, width: float, height: float, paintCount: int, drawsContent: bool, parentLayerId: "LayerId"=None, backendNodeId: "DOM.BackendNodeId"=None, transform: List=None, anchorX: float=None, anchorY: float=None, anchorZ: float=None, invisible: bool=None, scrollRects: List=None):
+    _fields = ('layerId', 'offsetX', 'offsetY', 'width', 'height', 'paintCount', 'drawsContent', 'parentLayerId', 'backendNodeId', 'transform', 'anchorX', 'anchorY', 'anchorZ', 'invisible', 'scrollRects')
+    __slots__ = _fields
+    _types = {'scrollRects': [ScrollRect]}
+
+    def __init__(self, layerId: LayerId, offsetX: float, offsetY: float, width: float, height: float, paintCount: int, drawsContent: bool, parentLayerId: LayerId=None, backendNodeId: "DOM.BackendNodeId"=None, transform: List=None, anchorX: float=None, anchorY: float=None, anchorZ: float=None, invisible: bool=None, scrollRects: List=None):
         # The unique id for this layer.
         self.layerId = layerId
         # Offset from parent layer, X coordinate.
@@ -63,56 +103,155 @@ class Layer:
         # Rectangles scrolling on main thread only.
         self.scrollRects = scrollRects
 
+    def to_wire(self):
+        wire = {"layerId": self.layerId, "offsetX": self.offsetX, "offsetY": self.offsetY, "width": self.width, "height": self.height, "paintCount": self.paintCount, "drawsContent": self.drawsContent}
+        if self.parentLayerId is not None:
+            wire["parentLayerId"] = self.parentLayerId
+        if self.backendNodeId is not None:
+            wire["backendNodeId"] = self.backendNodeId
+        if self.transform is not None:
+            wire["transform"] = self.transform
+        if self.anchorX is not None:
+            wire["anchorX"] = self.anchorX
+        if self.anchorY is not None:
+            wire["anchorY"] = self.anchorY
+        if self.anchorZ is not None:
+            wire["anchorZ"] = self.anchorZ
+        if self.invisible is not None:
+            wire["invisible"] = self.invisible
+        if self.scrollRects is not None:
+            wire["scrollRects"] = encode(self.scrollRects)
+        return wire
+
+    @classmethod
+    def from_wire(cls, wire: dict):
+        obj = cls.__new__(cls)
+        obj.layerId = wire["layerId"]
+        obj.offsetX = wire["offsetX"]
+        obj.offsetY = wire["offsetY"]
+        obj.width = wire["width"]
+        obj.height = wire["height"]
+        obj.paintCount = wire["paintCount"]
+        obj.drawsContent = wire["drawsContent"]
+        obj.parentLayerId = wire.get("parentLayerId")
+        obj.backendNodeId = wire.get("backendNodeId")
+        obj.transform = wire.get("transform")
+        obj.anchorX = wire.get("anchorX")
+        obj.anchorY = wire.get("anchorY")
+        obj.anchorZ = wire.get("anchorZ")
+        obj.invisible = wire.get("invisible")
+        obj.scrollRects = [ScrollRect.from_wire(x0) for x0 in wire["scrollRects"]] if "scrollRects" in wire else None
+        return obj
+
 # Array of timings, one per paint step.
 # items: A time in seconds since the end of previous step (for the first step, time since painting started)PaintProfile = List[float]
 class enable(ChromeCommand):
     """Enables compositing tree inspection."""
+    _fields = ()
+    __slots__ = _fields
 
     def __init__(self): pass
 
 class disable(ChromeCommand):
     """Disables compositing tree inspection."""
+    _fields = ()
+    __slots__ = _fields
 
     def __init__(self): pass
 
+class compositingReasonsResult(ChromeResult):
+    __slots__ = ()
+    _fields = ('compositingReasons',)
+    # A list of strings specifying reasons for the given layer to become composited.
+    compositingReasons: List
+
 class compositingReasons(ChromeCommand):
     """Provides the reasons why the given layer was composited."""
+    _fields = ('layerId',)
+    __slots__ = _fields
+    _result = compositingReasonsResult
 
-    def __init__(self, layerId: "LayerId"):
+    def __init__(self, layerId: LayerId):
         # The id of the layer for which we want to get the reasons it was composited.
         self.layerId = layerId
 
+    def to_wire(self):
+        wire = {"layerId": self.layerId}
+        return wire
+
+
 
+class makeSnapshotResult(ChromeResult):
+    __slots__ = ()
+    _fields = ('snapshotId',)
+    # The id of the layer snapshot.
+    snapshotId: SnapshotId
 
 class makeSnapshot(ChromeCommand):
     """Returns the layer snapshot identifier."""
+    _fields = ('layerId',)
+    __slots__ = _fields
+    _result = makeSnapshotResult
 
-    def __init__(self, layerId: "LayerId"):
+    def __init__(self, layerId: LayerId):
         # The id of the layer.
         self.layerId = layerId
 
+    def to_wire(self):
+        wire = {"layerId": self.layerId}
+        return wire
+
+
 
+class loadSnapshotResult(ChromeResult):
+    __slots__ = ()
+    _fields = ('snapshotId',)
+    # The id of the snapshot.
+    snapshotId: SnapshotId
 
 class loadSnapshot(ChromeCommand):
     """Returns the snapshot identifier."""
+    _fields = ('tiles',)
+    __slots__ = _fields
+    _result = loadSnapshotResult
 
     def __init__(self, tiles: List):
         # An array of tiles composing the snapshot.
         self.tiles = tiles
 
+    def to_wire(self):
+        wire = {"tiles": encode(self.tiles)}
+        return wire
+
 
 
 class releaseSnapshot(ChromeCommand):
     """Releases layer snapshot captured by the back-end."""
+    _fields = ('snapshotId',)
+    __slots__ = _fields
 
-    def __init__(self, snapshotId: "SnapshotId"):
+    def __init__(self, snapshotId: SnapshotId):
         # The id of the layer snapshot.
         self.snapshotId = snapshotId
 
+    def to_wire(self):
+        wire = {"snapshotId": self.snapshotId}
+        return wire
+
+
 
+class profileSnapshotResult(ChromeResult):
+    __slots__ = ()
+    _fields = ('timings',)
+    # The array of paint profiles, one per run.
+    timings: List
 
 class profileSnapshot(ChromeCommand):
-    def __init__(self, snapshotId: "SnapshotId", minRepeatCount: int=None, minDuration: float=None, clipRect: "DOM.Rect"=None):
+    _fields = ('snapshotId', 'minRepeatCount', 'minDuration', 'clipRect')
+    __slots__ = _fields
+    _result = profileSnapshotResult
+
+    def __init__(self, snapshotId: SnapshotId, minRepeatCount: int=None, minDuration: float=None, clipRect: "DOM.Rect"=None):
         # The id of the layer snapshot.
         self.snapshotId = snapshotId
         # The maximum number of times to replay the snapshot (1, if not specified).
@@ -122,12 +261,31 @@ class profileSnapshot(ChromeCommand):
         # The clip rectangle to apply when replaying the snapshot.
         self.clipRect = clipRect
 
+    def to_wire(self):
+        wire = {"snapshotId": self.snapshotId}
+        if self.minRepeatCount is not None:
+            wire["minRepeatCount"] = self.minRepeatCount
+        if self.minDuration is not None:
+            wire["minDuration"] = self.minDuration
+        if self.clipRect is not None:
+            wire["clipRect"] = encode(self.clipRect)
+        return wire
+
+
 
+class replaySnapshotResult(ChromeResult):
+    __slots__ = ()
+    _fields = ('dataURL',)
+    # A data: URL for resulting image.
+    dataURL: str
 
 class replaySnapshot(ChromeCommand):
     """Replays the layer snapshot and returns the resulting bitmap."""
+    _fields = ('snapshotId', 'fromStep', 'toStep', 'scale')
+    __slots__ = _fields
+    _result = replaySnapshotResult
 
-    def __init__(self, snapshotId: "SnapshotId", fromStep: int=None, toStep: int=None, scale: float=None):
+    def __init__(self, snapshotId: SnapshotId, fromStep: int=None, toStep: int=None, scale: float=None):
         # The id of the layer snapshot.
         self.snapshotId = snapshotId
         # The first step to replay from (replay from the very start if not specified).
@@ -137,14 +295,53 @@ class replaySnapshot(ChromeCommand):
         # The scale to apply while replaying (defaults to 1).
         self.scale = scale
 
+    def to_wire(self):
+        wire = {"snapshotId": self.snapshotId}
+        if self.fromStep is not None:
+            wire["fromStep"] = self.fromStep
+        if self.toStep is not None:
+            wire["toStep"] = self.toStep
+        if self.scale is not None:
+            wire["scale"] = self.scale
+        return wire
 
 
+
+class snapshotCommandLogResult(ChromeResult):
+    __slots__ = ()
+    _fields = ('commandLog',)
+    # The array of canvas function calls.
+    commandLog: List
+
 class snapshotCommandLog(ChromeCommand):
     """Replays the layer snapshot and returns canvas log."""
+    _fields = ('snapshotId',)
+    __slots__ = _fields
+    _result = snapshotCommandLogResult
 
-    def __init__(self, snapshotId: "SnapshotId"):
+    def __init__(self, snapshotId: SnapshotId):
         # The id of the layer snapshot.
         self.snapshotId = snapshotId
 
+    def to_wire(self):
+        wire = {"snapshotId": self.snapshotId}
+        return wire
+
+
+
+class layerTreeDidChange(ChromeEvent):
+    __slots__ = ()
+    _fields = ('layers',)
+    # Layer tree, absent if not in the comspositing mode.
+    layers: List
+    _types = {'layers': [Layer]}
 
+class layerPainted(ChromeEvent):
+    __slots__ = ()
+    _fields = ('layerId', 'clip')
+    # The id of the painted layer.
+    layerId: LayerId
+    # Clip rectangle.
+    clip: "DOM.Rect"
+    _types = {'clip': 'DOM.Rect'}
 
@@ -1,13 +1,20 @@
+# schema hash: 3b08395a4c45e99a28c164e8a8a505bb691b47e6
 from enum import Enum
-from typing import Any, List
+from typing import TYPE_CHECKING, Any, List
 
-from .base import ChromeCommand
+from .base import ChromeCommand, ChromeEvent, ChromeResult, ChromeType, encode, resolve
 
-from . import Runtime
-from . import Network
+if TYPE_CHECKING:
+    from . import Network
+    from . import Runtime
 
-class LogEntry:
+class LogEntry(ChromeType):
     """Log entry."""
+    _fields = ('source', 'level', 'text', 'timestamp', 'url', 'lineNumber', 'stackTrace', 'networkRequestId', 'workerId')
+    __slots__ = _fields
+    _types = {'stackTrace': 'Runtime.StackTrace'}
+    _refs = ('Runtime.StackTrace',)
+
     def __init__(self, source: str, level: str, text: str, timestamp: "Runtime.Timestamp", url: str=None, lineNumber: int=None, stackTrace: "Runtime.StackTrace"=None, networkRequestId: "Network.RequestId"=None, workerId: str=None):
         # Log entry source.
         self.source = source
@@ -28,40 +35,107 @@ class LogEntry:
         # Identifier of the worker associated with this entry.
         self.workerId = workerId
 
-class ViolationSetting:
+    def to_wire(self):
+        wire = {"source": self.source, "level": self.level, "text": self.text, "timestamp": self.timestamp}
+        if self.url is not None:
+            wire["url"] = self.url
+        if self.lineNumber is not None:
+            wire["lineNumber"] = self.lineNumber
+        if self.stackTrace is not None:
+            wire["stackTrace"] = encode(self.stackTrace)
+        if self.networkRequestId is not None:
+            wire["networkRequestId"] = self.networkRequestId
+        if self.workerId is not None:
+            wire["workerId"] = self.workerId
+        return wire
+
+    @classmethod
+    def from_wire(cls, wire: dict):
+        refs = cls._refs
+        if refs[0].__class__ is str:
+            refs = cls._refs = tuple(map(resolve, refs))
+        obj = cls.__new__(cls)
+        obj.source = wire["source"]
+        obj.level = wire["level"]
+        obj.text = wire["text"]
+        obj.timestamp = wire["timestamp"]
+        obj.url = wire.get("url")
+        obj.lineNumber = wire.get("lineNumber")
+        obj.stackTrace = refs[0].from_wire(wire["stackTrace"]) if "stackTrace" in wire else None
+        obj.networkRequestId = wire.get("networkRequestId")
+        obj.workerId = wire.get("workerId")
+        return obj
+
+class ViolationSetting(ChromeType):
     """Violation configuration setting."""
+    _fields = ('name', 'threshold')
+    __slots__ = _fields
+
     def __init__(self, name: str, threshold: float):
         # Violation type.
         self.name = name
         # Time threshold to trigger upon.
         self.threshold = threshold
 
+    def to_wire(self):
+        wire = {"name": self.name, "threshold": self.threshold}
+        return wire
+
+    @classmethod
+    def from_wire(cls, wire: dict):
+        obj = cls.__new__(cls)
+        obj.name = wire["name"]
+        obj.threshold = wire["threshold"]
+        return obj
+
 class enable(ChromeCommand):
     """Enables log domain, sends the entries collected so far to the client by means of the <code>entryAdded</code> notification."""
+    _fields = ()
+    __slots__ = _fields
 
     def __init__(self): pass
 
 class disable(ChromeCommand):
     """Disables log domain, prevents further log entries from being reported to the client."""
+    _fields = ()
+    __slots__ = _fields
 
     def __init__(self): pass
 
 class clear(ChromeCommand):
     """Clears the log."""
+    _fields = ()
+    __slots__ = _fields
 
     def __init__(self): pass
 
 class startViolationsReport(ChromeCommand):
     """start violation reporting."""
+    _fields = ('config',)
+    __slots__ = _fields
 
     def __init__(self, config: List):
         # Configuration for violations.
         self.config = config
 
+    def to_wire(self):
+        wire = {"config": encode(self.config)}
+        return wire
+
 
 
 class stopViolationsReport(ChromeCommand):
     """Stop violation reporting."""
+    _fields = ()
+    __slots__ = _fields
 
     def __init__(self): pass
 
+class entryAdded(ChromeEvent):
+    """Issued when new message was logged."""
+    __slots__ = ()
+    _fields = ('entry',)
+    # The entry.
+    entry: LogEntry
+    _types = {'entry': LogEntry}
+
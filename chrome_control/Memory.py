@@ -1,30 +1,54 @@
+# schema hash: 0158a821bf21fbebf0e9a0ab66f29288c986f75d
 from enum import Enum
-from typing import Any, List
+from typing import TYPE_CHECKING, Any, List
 
-from .base import ChromeCommand
+from .base import ChromeCommand, ChromeEvent, ChromeResult, ChromeType, encode, resolve
 
 
 PressureLevel = Enum("PressureLevel", "moderate critical")
 PressureLevel.__doc__ = """Memory pressure level."""
 
+class getDOMCountersResult(ChromeResult):
+    __slots__ = ()
+    _fields = ('documents', 'nodes', 'jsEventListeners')
+    documents: int
+    nodes: int
+    jsEventListeners: int
+
 class getDOMCounters(ChromeCommand):
+    _fields = ()
+    __slots__ = _fields
+    _result = getDOMCountersResult
+
     def __init__(self): pass
 
 class setPressureNotificationsSuppressed(ChromeCommand):
     """Enable/disable suppressing memory pressure notifications in all processes."""
+    _fields = ('suppressed',)
+    __slots__ = _fields
 
     def __init__(self, suppressed: bool):
         # If true, memory pressure notifications will be suppressed.
         self.suppressed = suppressed
 
+    def to_wire(self):
+        wire = {"suppressed": self.suppressed}
+        return wire
+
 
 
 class simulatePressureNotification(ChromeCommand):
     """Simulate a memory pressure notification in all processes."""
+    _fields = ('level',)
+    __slots__ = _fields
 
-    def __init__(self, level: "PressureLevel"):
+    def __init__(self, level: PressureLevel):
         # Memory pressure level of the notification.
         self.level = level
 
+    def to_wire(self):
+        wire = {"level": encode(self.level)}
+        return wire
+
 
 
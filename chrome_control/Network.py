@@ -1,11 +1,13 @@
+# schema hash: 79ea86466b126fc49a2eaafd7e498165f0ab84f0
 from enum import Enum
-from typing import Any, List
+from typing import TYPE_CHECKING, Any, List
 
-from .base import ChromeCommand
+from .base import ChromeCommand, ChromeEvent, ChromeResult, ChromeType, encode, resolve
 
-from . import Page
-from . import Runtime
-from . import Security
+if TYPE_CHECKING:
+    from . import Page
+    from . import Runtime
+    from . import Security
 
 # Unique loader identifier.
 LoaderId = str
@@ -24,8 +26,11 @@ ConnectionType.__doc__ = """Loading priority of a resource request."""
 CookieSameSite = Enum("CookieSameSite", "Strict Lax")
 CookieSameSite.__doc__ = """Represents the cookie's 'SameSite' status: https://tools.ietf.org/html/draft-west-first-party-cookies"""
 
-class ResourceTiming:
+class ResourceTiming(ChromeType):
     """Timing information for the request."""
+    _fields = ('requestTime', 'proxyStart', 'proxyEnd', 'dnsStart', 'dnsEnd', 'connectStart', 'connectEnd', 'sslStart', 'sslEnd', 'workerStart', 'workerReady', 'sendStart', 'sendEnd', 'pushStart', 'pushEnd', 'receiveHeadersEnd')
+    __slots__ = _fields
+
     def __init__(self, requestTime: float, proxyStart: float, proxyEnd: float, dnsStart: float, dnsEnd: float, connectStart: float, connectEnd: float, sslStart: float, sslEnd: float, workerStart: float, workerReady: float, sendStart: float, sendEnd: float, pushStart: float, pushEnd: float, receiveHeadersEnd: float):
         # Timing's requestTime is a baseline in seconds, while the other numbers are ticks in milliseconds relatively to this requestTime.
         self.requestTime = requestTime
@@ -60,12 +65,41 @@ class ResourceTiming:
         # Finished receiving response headers.
         self.receiveHeadersEnd = receiveHeadersEnd
 
+    def to_wire(self):
+        wire = {"requestTime": self.requestTime, "proxyStart": self.proxyStart, "proxyEnd": self.proxyEnd, "dnsStart": self.dnsStart, "dnsEnd": self.dnsEnd, "connectStart": self.connectStart, "connectEnd": self.connectEnd, "sslStart": self.sslStart, "sslEnd": self.sslEnd, "workerStart": self.workerStart, "workerReady": self.workerReady, "sendStart": self.sendStart, "sendEnd": self.sendEnd, "pushStart": self.pushStart, "pushEnd": self.pushEnd, "receiveHeadersEnd": self.receiveHeadersEnd}
+        return wire
+
+    @classmethod
+    def from_wire(cls, wire: dict):
+        obj = cls.__new__(cls)
+        obj.requestTime = wire["requestTime"]
+        obj.proxyStart = wire["proxyStart"]
+        obj.proxyEnd = wire["proxyEnd"]
+        obj.dnsStart = wire["dnsStart"]
+        obj.dnsEnd = wire["dnsEnd"]
+        obj.connectStart = wire["connectStart"]
+        obj.connectEnd = wire["connectEnd"]
+        obj.sslStart = wire["sslStart"]
+        obj.sslEnd = wire["sslEnd"]
+        obj.workerStart = wire["workerStart"]
+        obj.workerReady = wire["workerReady"]
+        obj.sendStart = wire["sendStart"]
+        obj.sendEnd = wire["sendEnd"]
+        obj.pushStart = wire["pushStart"]
+        obj.pushEnd = wire["pushEnd"]
+        obj.receiveHeadersEnd = wire["receiveHeadersEnd"]
+        return obj
+
 ResourcePriority = Enum("ResourcePriority", "VeryLow Low Medium High VeryHigh")
 ResourcePriority.__doc__ = """Loading priority of a resource request."""
 
-class Request:
+class Request(ChromeType):
     """HTTP request data."""
-    def __init__(self, url: str, method: str, headers: "Headers", initialPriority: "ResourcePriority", referrerPolicy: str, postData: str=None, mixedContentType: str=None):
+    _fields = ('url', 'method', 'headers', 'initialPriority', 'referrerPolicy', 'postData', 'mixedContentType')
+    __slots__ = _fields
+    _types = {'initialPriority': ResourcePriority}
+
+    def __init__(self, url: str, method: str, headers: Headers, initialPriority: ResourcePriority, referrerPolicy: str, postData: str=None, mixedContentType: str=None):
         # Request URL.
         self.url = url
         # HTTP request method.
@@ -81,9 +115,32 @@ class Request:
         # The mixed content status of the request, as defined in http://www.w3.org/TR/mixed-content/
         self.mixedContentType = mixedContentType
 
-class SignedCertificateTimestamp:
+    def to_wire(self):
+        wire = {"url": self.url, "method": self.method, "headers": self.headers, "initialPriority": encode(self.initialPriority), "referrerPolicy": self.referrerPolicy}
+        if self.postData is not None:
+            wire["postData"] = self.postData
+        if self.mixedContentType is not None:
+            wire["mixedContentType"] = self.mixedContentType
+        return wire
+
+    @classmethod
+    def from_wire(cls, wire: dict):
+        obj = cls.__new__(cls)
+        obj.url = wire["url"]
+        obj.method = wire["method"]
+        obj.headers = wire["headers"]
+        obj.initialPriority = ResourcePriority.__members__.get(wire["initialPriority"], wire["initialPriority"])
+        obj.referrerPolicy = wire["referrerPolicy"]
+        obj.postData = wire.get("postData")
+        obj.mixedContentType = wire.get("mixedContentType")
+        return obj
+
+class SignedCertificateTimestamp(ChromeType):
     """Details of a signed certificate timestamp (SCT)."""
-    def __init__(self, status: str, origin: str, logDescription: str, logId: str, timestamp: "Timestamp", hashAlgorithm: str, signatureAlgorithm: str, signatureData: str):
+    _fields = ('status', 'origin', 'logDescription', 'logId', 'timestamp', 'hashAlgorithm', 'signatureAlgorithm', 'signatureData')
+    __slots__ = _fields
+
+    def __init__(self, status: str, origin: str, logDescription: str, logId: str, timestamp: Timestamp, hashAlgorithm: str, signatureAlgorithm: str, signatureData: str):
         # Validation status.
         self.status = status
         # Origin.
@@ -101,9 +158,30 @@ class SignedCertificateTimestamp:
         # Signature data.
         self.signatureData = signatureData
 
-class SecurityDetails:
+    def to_wire(self):
+        wire = {"status": self.status, "origin": self.origin, "logDescription": self.logDescription, "logId": self.logId, "timestamp": self.timestamp, "hashAlgorithm": self.hashAlgorithm, "signatureAlgorithm": self.signatureAlgorithm, "signatureData": self.signatureData}
+        return wire
+
+    @classmethod
+    def from_wire(cls, wire: dict):
+        obj = cls.__new__(cls)
+        obj.status = wire["status"]
+        obj.origin = wire["origin"]
+        obj.logDescription = wire["logDescription"]
+        obj.logId = wire["logId"]
+        obj.timestamp = wire["timestamp"]
+        obj.hashAlgorithm = wire["hashAlgorithm"]
+        obj.signatureAlgorithm = wire["signatureAlgorithm"]
+        obj.signatureData = wire["signatureData"]
+        return obj
+
+class SecurityDetails(ChromeType):
     """Security details about a request."""
-    def __init__(self, protocol: str, keyExchange: str, cipher: str, certificateId: "Security.CertificateId", subjectName: str, sanList: List, issuer: str, validFrom: "Timestamp", validTo: "Timestamp", signedCertificateTimestampList: List, keyExchangeGroup: str=None, mac: str=None):
+    _fields = ('protocol', 'keyExchange', 'cipher', 'certificateId', 'subjectName', 'sanList', 'issuer', 'validFrom', 'validTo', 'signedCertificateTimestampList', 'keyExchangeGroup', 'mac')
+    __slots__ = _fields
+    _types = {'signedCertificateTimestampList': [SignedCertificateTimestamp]}
+
+    def __init__(self, protocol: str, keyExchange: str, cipher: str, certificateId: "Security.CertificateId", subjectName: str, sanList: List, issuer: str, validFrom: Timestamp, validTo: Timestamp, signedCertificateTimestampList: List, keyExchangeGroup: str=None, mac: str=None):
         # Protocol name (e.g. "TLS 1.2" or "QUIC").
         self.protocol = protocol
         # Key Exchange used by the connection, or the empty string if not applicable.
@@ -129,12 +207,42 @@ class SecurityDetails:
         # TLS MAC. Note that AEAD ciphers do not have separate MACs.
         self.mac = mac
 
+    def to_wire(self):
+        wire = {"protocol": self.protocol, "keyExchange": self.keyExchange, "cipher": self.cipher, "certificateId": self.certificateId, "subjectName": self.subjectName, "sanList": self.sanList, "issuer": self.issuer, "validFrom": self.validFrom, "validTo": self.validTo, "signedCertificateTimestampList": encode(self.signedCertificateTimestampList)}
+        if self.keyExchangeGroup is not None:
+            wire["keyExchangeGroup"] = self.keyExchangeGroup
+        if self.mac is not None:
+            wire["mac"] = self.mac
+        return wire
+
+    @classmethod
+    def from_wire(cls, wire: dict):
+        obj = cls.__new__(cls)
+        obj.protocol = wire["protocol"]
+        obj.keyExchange = wire["keyExchange"]
+        obj.cipher = wire["cipher"]
+        obj.certificateId = wire["certificateId"]
+        obj.subjectName = wire["subjectName"]
+        obj.sanList = wire["sanList"]
+        obj.issuer = wire["issuer"]
+        obj.validFrom = wire["validFrom"]
+        obj.validTo = wire["validTo"]
+        obj.signedCertificateTimestampList = [SignedCertificateTimestamp.from_wire(x0) for x0 in wire["signedCertificateTimestampList"]]
+        obj.keyExchangeGroup = wire.get("keyExchangeGroup")
+        obj.mac = wire.get("mac")
+        return obj
+
 BlockedReason = Enum("BlockedReason", "csp mixed-content origin inspector subresource-filter other")
 BlockedReason.__doc__ = """The reason why request was blocked."""
 
-class Response:
+class Response(ChromeType):
     """HTTP response data."""
-    def __init__(self, url: str, status: float, statusText: str, headers: "Headers", mimeType: str, connectionReused: bool, connectionId: float, encodedDataLength: float, securityState: "Security.SecurityState", headersText: str=None, requestHeaders: "Headers"=None, requestHeadersText: str=None, remoteIPAddress: str=None, remotePort: int=None, fromDiskCache: bool=None, fromServiceWorker: bool=None, timing: "ResourceTiming"=None, protocol: str=None, securityDetails: "SecurityDetails"=None):
+    _fields = ('url', 'status', 'statusText', 'headers', 'mimeType', 'connectionReused', 'connectionId', 'encodedDataLength', 'securityState', 'headersText', 'requestHeaders', 'requestHeadersText', 'remoteIPAddress', 'remotePort', 'fromDiskCache', 'fromServiceWorker', 'timing', 'protocol', 'securityDetails')
+    __slots__ = _fields
+    _types = {'securityState': 'Security.SecurityState', 'timing': ResourceTiming, 'securityDetails': SecurityDetails}
+    _refs = ('Security.SecurityState',)
+
+    def __init__(self, url: str, status: float, statusText: str, headers: Headers, mimeType: str, connectionReused: bool, connectionId: float, encodedDataLength: float, securityState: "Security.SecurityState", headersText: str=None, requestHeaders: Headers=None, requestHeadersText: str=None, remoteIPAddress: str=None, remotePort: int=None, fromDiskCache: bool=None, fromServiceWorker: bool=None, timing: ResourceTiming=None, protocol: str=None, securityDetails: SecurityDetails=None):
         # Response URL. This URL can be different from CachedResource.url in case of redirect.
         self.url = url
         # HTTP response status code.
@@ -174,15 +282,82 @@ class Response:
         # Security details for the request.
         self.securityDetails = securityDetails
 
-class WebSocketRequest:
+    def to_wire(self):
+        wire = {"url": self.url, "status": self.status, "statusText": self.statusText, "headers": self.headers, "mimeType": self.mimeType, "connectionReused": self.connectionReused, "connectionId": self.connectionId, "encodedDataLength": self.encodedDataLength, "securityState": encode(self.securityState)}
+        if self.headersText is not None:
+            wire["headersText"] = self.headersText
+        if self.requestHeaders is not None:
+            wire["requestHeaders"] = self.requestHeaders
+        if self.requestHeadersText is not None:
+            wire["requestHeadersText"] = self.requestHeadersText
+        if self.remoteIPAddress is not None:
+            wire["remoteIPAddress"] = self.remoteIPAddress
+        if self.remotePort is not None:
+            wire["remotePort"] = self.remotePort
+        if self.fromDiskCache is not None:
+            wire["fromDiskCache"] = self.fromDiskCache
+        if self.fromServiceWorker is not None:
+            wire["fromServiceWorker"] = self.fromServiceWorker
+        if self.timing is not None:
+            wire["timing"] = encode(self.timing)
+        if self.protocol is not None:
+            wire["protocol"] = self.protocol
+        if self.securityDetails is not None:
+            wire["securityDetails"] = encode(self.securityDetails)
+        return wire
+
+    @classmethod
+    def from_wire(cls, wire: dict):
+        refs = cls._refs
+        if refs[0].__class__ is str:
+            refs = cls._refs = tuple(map(resolve, refs))
+        obj = cls.__new__(cls)
+        obj.url = wire["url"]
+        obj.status = wire["status"]
+        obj.statusText = wire["statusText"]
+        obj.headers = wire["headers"]
+        obj.mimeType = wire["mimeType"]
+        obj.connectionReused = wire["connectionReused"]
+        obj.connectionId = wire["connectionId"]
+        obj.encodedDataLength = wire["encodedDataLength"]
+        obj.securityState = refs[0].__members__.get(wire["securityState"], wire["securityState"])
+        obj.headersText = wire.get("headersText")
+        obj.requestHeaders = wire.get("requestHeaders")
+        obj.requestHeadersText = wire.get("requestHeadersText")
+        obj.remoteIPAddress = wire.get("remoteIPAddress")
+        obj.remotePort = wire.get("remotePort")
+        obj.fromDiskCache = wire.get("fromDiskCache")
+        obj.fromServiceWorker = wire.get("fromServiceWorker")
+        obj.timing = ResourceTiming.from_wire(wire["timing"]) if "timing" in wire else None
+        obj.protocol = wire.get("protocol")
+        obj.securityDetails = SecurityDetails.from_wire(wire["securityDetails"]) if "securityDetails" in wire else None
+        return obj
+
+class WebSocketRequest(ChromeType):
     """WebSocket request data."""
-    def __init__(self, headers: "Headers"):
+    _fields = ('headers',)
+    __slots__ = _fields
+
+    def __init__(self, headers: Headers):
         # HTTP request headers.
         self.headers = headers
 
-class WebSocketResponse:
+    def to_wire(self):
+        wire = {"headers": self.headers}
+        return wire
+
+    @classmethod
+    def from_wire(cls, wire: dict):
+        obj = cls.__new__(cls)
+        obj.headers = wire["headers"]
+        return obj
+
+class WebSocketResponse(ChromeType):
     """WebSocket response data."""
-    def __init__(self, status: float, statusText: str, headers: "Headers", headersText: str=None, requestHeaders: "Headers"=None, requestHeadersText: str=None):
+    _fields = ('status', 'statusText', 'headers', 'headersText', 'requestHeaders', 'requestHeadersText')
+    __slots__ = _fields
+
+    def __init__(self, status: float, statusText: str, headers: Headers, headersText: str=None, requestHeaders: Headers=None, requestHeadersText: str=None):
         # HTTP response status code.
         self.status = status
         # HTTP response status text.
@@ -196,8 +371,32 @@ class WebSocketResponse:
         # HTTP request headers text.
         self.requestHeadersText = requestHeadersText
 
-class WebSocketFrame:
+    def to_wire(self):
+        wire = {"status": self.status, "statusText": self.statusText, "headers": self.headers}
+        if self.headersText is not None:
+            wire["headersText"] = self.headersText
+        if self.requestHeaders is not None:
+            wire["requestHeaders"] = self.requestHeaders
+        if self.requestHeadersText is not None:
+            wire["requestHeadersText"] = self.requestHeadersText
+        return wire
+
+    @classmethod
+    def from_wire(cls, wire: dict):
+        obj = cls.__new__(cls)
+        obj.status = wire["status"]
+        obj.statusText = wire["statusText"]
+        obj.headers = wire["headers"]
+        obj.headersText = wire.get("headersText")
+        obj.requestHeaders = wire.get("requestHeaders")
+        obj.requestHeadersText = wire.get("requestHeadersText")
+        return obj
+
+class WebSocketFrame(ChromeType):
     """WebSocket frame data."""
+    _fields = ('opcode', 'mask', 'payloadData')
+    __slots__ = _fields
+
     def __init__(self, opcode: float, mask: bool, payloadData: str):
         # WebSocket frame opcode.
         self.opcode = opcode
@@ -206,9 +405,26 @@ class WebSocketFrame:
         # WebSocke frame payload data.
         self.payloadData = payloadData
 
-class CachedResource:
+    def to_wire(self):
+        wire = {"opcode": self.opcode, "mask": self.mask, "payloadData": self.payloadData}
+        return wire
+
+    @classmethod
+    def from_wire(cls, wire: dict):
+        obj = cls.__new__(cls)
+        obj.opcode = wire["opcode"]
+        obj.mask = wire["mask"]
+        obj.payloadData = wire["payloadData"]
+        return obj
+
+class CachedResource(ChromeType):
     """Information about the cached resource."""
-    def __init__(self, url: str, type: "Page.ResourceType", bodySize: float, response: "Response"=None):
+    _fields = ('url', 'type', 'bodySize', 'response')
+    __slots__ = _fields
+    _types = {'type': 'Page.ResourceType', 'response': Response}
+    _refs = ('Page.ResourceType',)
+
+    def __init__(self, url: str, type: "Page.ResourceType", bodySize: float, response: Response=None):
         # Resource URL. This is the url of the original network request.
         self.url = url
         # Type of this resource.
@@ -218,8 +434,31 @@ class CachedResource:
         # Cached response data.
         self.response = response
 
-class Initiator:
+    def to_wire(self):
+        wire = {"url": self.url, "type": encode(self.type), "bodySize": self.bodySize}
+        if self.response is not None:
+            wire["response"] = encode(self.response)
+        return wire
+
+    @classmethod
+    def from_wire(cls, wire: dict):
+        refs = cls._refs
+        if refs[0].__class__ is str:
+            refs = cls._refs = tuple(map(resolve, refs))
+        obj = cls.__new__(cls)
+        obj.url = wire["url"]
+        obj.type = refs[0].__members__.get(wire["type"], wire["type"])
+        obj.bodySize = wire["bodySize"]
+        obj.response = Response.from_wire(wire["response"]) if "response" in wire else None
+        return obj
+
+class Initiator(ChromeType):
     """Information about the request initiator."""
+    _fields = ('type', 'stack', 'url', 'lineNumber')
+    __slots__ = _fields
+    _types = {'stack': 'Runtime.StackTrace'}
+    _refs = ('Runtime.StackTrace',)
+
     def __init__(self, type: str, stack: "Runtime.StackTrace"=None, url: str=None, lineNumber: float=None):
         # Type of this initiator.
         self.type = type
@@ -230,9 +469,35 @@ class Initiator:
         # Initiator line number, set for Parser type only (0-based).
         self.lineNumber = lineNumber
 
-class Cookie:
+    def to_wire(self):
+        wire = {"type": self.type}
+        if self.stack is not None:
+            wire["stack"] = encode(self.stack)
+        if self.url is not None:
+            wire["url"] = self.url
+        if self.lineNumber is not None:
+            wire["lineNumber"] = self.lineNumber
+        return wire
+
+    @classmethod
+    def from_wire(cls, wire: dict):
+        refs = cls._refs
+        if refs[0].__class__ is str:
+            refs = cls._refs = tuple(map(resolve, refs))
+        obj = cls.__new__(cls)
+        obj.type = wire["type"]
+        obj.stack = refs[0].from_wire(wire["stack"]) if "stack" in wire else None
+        obj.url = wire.get("url")
+        obj.lineNumber = wire.get("lineNumber")
+        return obj
+
+class Cookie(ChromeType):
     """Cookie object"""
-    def __init__(self, name: str, value: str, domain: str, path: str, expires: float, size: int, httpOnly: bool, secure: bool, session: bool, sameSite: "CookieSameSite"=None):
+    _fields = ('name', 'value', 'domain', 'path', 'expires', 'size', 'httpOnly', 'secure', 'session', 'sameSite')
+    __slots__ = _fields
+    _types = {'sameSite': CookieSameSite}
+
+    def __init__(self, name: str, value: str, domain: str, path: str, expires: float, size: int, httpOnly: bool, secure: bool, session: bool, sameSite: CookieSameSite=None):
         # Cookie name.
         self.name = name
         # Cookie value.
@@ -254,8 +519,31 @@ class Cookie:
         # Cookie SameSite type.
         self.sameSite = sameSite
 
+    def to_wire(self):
+        wire = {"name": self.name, "value": self.value, "domain": self.domain, "path": self.path, "expires": self.expires, "size": self.size, "httpOnly": self.httpOnly, "secure": self.secure, "session": self.session}
+        if self.sameSite is not None:
+            wire["sameSite"] = encode(self.sameSite)
+        return wire
+
+    @classmethod
+    def from_wire(cls, wire: dict):
+        obj = cls.__new__(cls)
+        obj.name = wire["name"]
+        obj.value = wire["value"]
+        obj.domain = wire["domain"]
+        obj.path = wire["path"]
+        obj.expires = wire["expires"]
+        obj.size = wire["size"]
+        obj.httpOnly = wire["httpOnly"]
+        obj.secure = wire["secure"]
+        obj.session = wire["session"]
+        obj.sameSite = CookieSameSite.__members__.get(wire["sameSite"], wire["sameSite"]) if "sameSite" in wire else None
+        return obj
+
 class enable(ChromeCommand):
     """Enables network tracking, network events will now be delivered to the client."""
+    _fields = ('maxTotalBufferSize', 'maxResourceBufferSize')
+    __slots__ = _fields
 
     def __init__(self, maxTotalBufferSize: int=None, maxResourceBufferSize: int=None):
         # Buffer size in bytes to use when preserving network payloads (XHRs, etc).
@@ -263,108 +551,213 @@ class enable(ChromeCommand):
         # Per-resource buffer size in bytes to use when preserving network payloads (XHRs, etc).
         self.maxResourceBufferSize = maxResourceBufferSize
 
+    def to_wire(self):
+        wire = {}
+        if self.maxTotalBufferSize is not None:
+            wire["maxTotalBufferSize"] = self.maxTotalBufferSize
+        if self.maxResourceBufferSize is not None:
+            wire["maxResourceBufferSize"] = self.maxResourceBufferSize
+        return wire
+
 
 
 class disable(ChromeCommand):
     """Disables network tracking, prevents network events from being sent to the client."""
+    _fields = ()
+    __slots__ = _fields
 
     def __init__(self): pass
 
 class setUserAgentOverride(ChromeCommand):
     """Allows overriding user agent with the given string."""
+    _fields = ('userAgent',)
+    __slots__ = _fields
 
     def __init__(self, userAgent: str):
         # User agent to use.
         self.userAgent = userAgent
 
+    def to_wire(self):
+        wire = {"userAgent": self.userAgent}
+        return wire
+
 
 
 class setExtraHTTPHeaders(ChromeCommand):
     """Specifies whether to always send extra HTTP headers with the requests from this page."""
+    _fields = ('headers',)
+    __slots__ = _fields
 
-    def __init__(self, headers: "Headers"):
+    def __init__(self, headers: Headers):
         # Map with extra HTTP headers.
         self.headers = headers
 
+    def to_wire(self):
+        wire = {"headers": self.headers}
+        return wire
 
 
+
+class getResponseBodyResult(ChromeResult):
+    __slots__ = ()
+    _fields = ('body', 'base64Encoded')
+    # Response body.
+    body: str
+    # True, if content was sent as base64.
+    base64Encoded: bool
+
 class getResponseBody(ChromeCommand):
     """Returns content served for the given request."""
+    _fields = ('requestId',)
+    __slots__ = _fields
+    _result = getResponseBodyResult
 
-    def __init__(self, requestId: "RequestId"):
+    def __init__(self, requestId: RequestId):
         # Identifier of the network request to get content for.
         self.requestId = requestId
 
+    def to_wire(self):
+        wire = {"requestId": self.requestId}
+        return wire
+
 
 
 class addBlockedURL(ChromeCommand):
     """Blocks specific URL from loading."""
+    _fields = ('url',)
+    __slots__ = _fields
 
     def __init__(self, url: str):
         # URL to block.
         self.url = url
 
+    def to_wire(self):
+        wire = {"url": self.url}
+        return wire
+
 
 
 class removeBlockedURL(ChromeCommand):
     """Cancels blocking of a specific URL from loading."""
+    _fields = ('url',)
+    __slots__ = _fields
 
     def __init__(self, url: str):
         # URL to stop blocking.
         self.url = url
 
+    def to_wire(self):
+        wire = {"url": self.url}
+        return wire
+
 
 
 class replayXHR(ChromeCommand):
     """This method sends a new XMLHttpRequest which is identical to the original one. The following parameters should be identical: method, url, async, request body, extra headers, withCredentials attribute, user, password."""
+    _fields = ('requestId',)
+    __slots__ = _fields
 
-    def __init__(self, requestId: "RequestId"):
+    def __init__(self, requestId: RequestId):
         # Identifier of XHR to replay.
         self.requestId = requestId
 
+    def to_wire(self):
+        wire = {"requestId": self.requestId}
+        return wire
+
 
 
 class setMonitoringXHREnabled(ChromeCommand):
     """Toggles monitoring of XMLHttpRequest. If <code>true</code>, console will receive messages upon each XHR issued."""
+    _fields = ('enabled',)
+    __slots__ = _fields
 
     def __init__(self, enabled: bool):
         # Monitoring enabled state.
         self.enabled = enabled
 
+    def to_wire(self):
+        wire = {"enabled": self.enabled}
+        return wire
+
+
 
+class canClearBrowserCacheResult(ChromeResult):
+    __slots__ = ()
+    _fields = ('result',)
+    # True if browser cache can be cleared.
+    result: bool
 
 class canClearBrowserCache(ChromeCommand):
     """Tells whether clearing browser cache is supported."""
+    _fields = ()
+    __slots__ = _fields
+    _result = canClearBrowserCacheResult
 
     def __init__(self): pass
 
 class clearBrowserCache(ChromeCommand):
     """Clears browser cache."""
+    _fields = ()
+    __slots__ = _fields
 
     def __init__(self): pass
 
+class canClearBrowserCookiesResult(ChromeResult):
+    __slots__ = ()
+    _fields = ('result',)
+    # True if browser cookies can be cleared.
+    result: bool
+
 class canClearBrowserCookies(ChromeCommand):
     """Tells whether clearing browser cookies is supported."""
+    _fields = ()
+    __slots__ = _fields
+    _result = canClearBrowserCookiesResult
 
     def __init__(self): pass
 
 class clearBrowserCookies(ChromeCommand):
     """Clears browser cookies."""
+    _fields = ()
+    __slots__ = _fields
 
     def __init__(self): pass
 
+class getCookiesResult(ChromeResult):
+    __slots__ = ()
+    _fields = ('cookies',)
+    # Array of cookie objects.
+    cookies: List
+    _types = {'cookies': [Cookie]}
+
 class getCookies(ChromeCommand):
     """Returns all browser cookies for the current URL. Depending on the backend support, will return detailed cookie information in the <code>cookies</code> field."""
+    _fields = ()
+    __slots__ = _fields
+    _result = getCookiesResult
 
     def __init__(self): pass
 
+class getAllCookiesResult(ChromeResult):
+    __slots__ = ()
+    _fields = ('cookies',)
+    # Array of cookie objects.
+    cookies: List
+    _types = {'cookies': [Cookie]}
+
 class getAllCookies(ChromeCommand):
     """Returns all browser cookies. Depending on the backend support, will return detailed cookie information in the <code>cookies</code> field."""
+    _fields = ()
+    __slots__ = _fields
+    _result = getAllCookiesResult
 
     def __init__(self): pass
 
 class deleteCookie(ChromeCommand):
     """Deletes browser cookie with given name, domain and path."""
+    _fields = ('cookieName', 'url')
+    __slots__ = _fields
 
     def __init__(self, cookieName: str, url: str):
         # Name of the cookie to remove.
@@ -372,12 +765,25 @@ class deleteCookie(ChromeCommand):
         # URL to match cooke domain and path.
         self.url = url
 
+    def to_wire(self):
+        wire = {"cookieName": self.cookieName, "url": self.url}
+        return wire
+
+
 
+class setCookieResult(ChromeResult):
+    __slots__ = ()
+    _fields = ('success',)
+    # True if successfully set cookie.
+    success: bool
 
 class setCookie(ChromeCommand):
     """Sets a cookie with the given cookie data; may overwrite equivalent cookies if they exist."""
+    _fields = ('url', 'name', 'value', 'domain', 'path', 'secure', 'httpOnly', 'sameSite', 'expirationDate')
+    __slots__ = _fields
+    _result = setCookieResult
 
-    def __init__(self, url: str, name: str, value: str, domain: str=None, path: str=None, secure: bool=None, httpOnly: bool=None, sameSite: "CookieSameSite"=None, expirationDate: "Timestamp"=None):
+    def __init__(self, url: str, name: str, value: str, domain: str=None, path: str=None, secure: bool=None, httpOnly: bool=None, sameSite: CookieSameSite=None, expirationDate: Timestamp=None):
         # The request-URI to associate with the setting of the cookie. This value can affect the default domain and path values of the created cookie.
         self.url = url
         # The name of the cookie.
@@ -397,17 +803,44 @@ class setCookie(ChromeCommand):
         # If omitted, the cookie becomes a session cookie.
         self.expirationDate = expirationDate
 
-
+    def to_wire(self):
+        wire = {"url": self.url, "name": self.name, "value": self.value}
+        if self.domain is not None:
+            wire["domain"] = self.domain
+        if self.path is not None:
+            wire["path"] = self.path
+        if self.secure is not None:
+            wire["secure"] = self.secure
+        if self.httpOnly is not None:
+            wire["httpOnly"] = self.httpOnly
+        if self.sameSite is not None:
+            wire["sameSite"] = encode(self.sameSite)
+        if self.expirationDate is not None:
+            wire["expirationDate"] = self.expirationDate
+        return wire
+
+
+
+class canEmulateNetworkConditionsResult(ChromeResult):
+    __slots__ = ()
+    _fields = ('result',)
+    # True if emulation of network conditions is supported.
+    result: bool
 
 class canEmulateNetworkConditions(ChromeCommand):
     """Tells whether emulation of network conditions is supported."""
+    _fields = ()
+    __slots__ = _fields
+    _result = canEmulateNetworkConditionsResult
 
     def __init__(self): pass
 
 class emulateNetworkConditions(ChromeCommand):
     """Activates emulation of network conditions."""
+    _fields = ('offline', 'latency', 'downloadThroughput', 'uploadThroughput', 'connectionType')
+    __slots__ = _fields
 
-    def __init__(self, offline: bool, latency: float, downloadThroughput: float, uploadThroughput: float, connectionType: "ConnectionType"=None):
+    def __init__(self, offline: bool, latency: float, downloadThroughput: float, uploadThroughput: float, connectionType: ConnectionType=None):
         # True to emulate internet disconnection.
         self.offline = offline
         # Additional latency (ms).
@@ -419,28 +852,48 @@ class emulateNetworkConditions(ChromeCommand):
         # Connection type if known.
         self.connectionType = connectionType
 
+    def to_wire(self):
+        wire = {"offline": self.offline, "latency": self.latency, "downloadThroughput": self.downloadThroughput, "uploadThroughput": self.uploadThroughput}
+        if self.connectionType is not None:
+            wire["connectionType"] = encode(self.connectionType)
+        return wire
+
 
 
 class setCacheDisabled(ChromeCommand):
     """Toggles ignoring cache for each request. If <code>true</code>, cache will not be used."""
+    _fields = ('cacheDisabled',)
+    __slots__ = _fields
 
     def __init__(self, cacheDisabled: bool):
         # Cache disabled state.
         self.cacheDisabled = cacheDisabled
 
+    def to_wire(self):
+        wire = {"cacheDisabled": self.cacheDisabled}
+        return wire
+
 
 
 class setBypassServiceWorker(ChromeCommand):
     """Toggles ignoring of service worker for each request."""
+    _fields = ('bypass',)
+    __slots__ = _fields
 
     def __init__(self, bypass: bool):
         # Bypass service worker and load from network.
         self.bypass = bypass
 
+    def to_wire(self):
+        wire = {"bypass": self.bypass}
+        return wire
+
 
 
 class setDataSizeLimitsForTest(ChromeCommand):
     """For testing."""
+    _fields = ('maxTotalSize', 'maxResourceSize')
+    __slots__ = _fields
 
     def __init__(self, maxTotalSize: int, maxResourceSize: int):
         # Maximum total buffer size.
@@ -448,14 +901,232 @@ class setDataSizeLimitsForTest(ChromeCommand):
         # Maximum per-resource size.
         self.maxResourceSize = maxResourceSize
 
+    def to_wire(self):
+        wire = {"maxTotalSize": self.maxTotalSize, "maxResourceSize": self.maxResourceSize}
+        return wire
+
 
 
+class getCertificateResult(ChromeResult):
+    __slots__ = ()
+    _fields = ('tableNames',)
+    tableNames: List
+
 class getCertificate(ChromeCommand):
     """Returns the DER-encoded certificate."""
+    _fields = ('origin',)
+    __slots__ = _fields
+    _result = getCertificateResult
 
     def __init__(self, origin: str):
         # Origin to get certificate for.
         self.origin = origin
 
-
+    def to_wire(self):
+        wire = {"origin": self.origin}
+        return wire
+
+
+
+class resourceChangedPriority(ChromeEvent):
+    """Fired when resource loading priority is changed"""
+    __slots__ = ()
+    _fields = ('requestId', 'newPriority', 'timestamp')
+    # Request identifier.
+    requestId: RequestId
+    # New priority
+    newPriority: ResourcePriority
+    # Timestamp.
+    timestamp: Timestamp
+    _types = {'newPriority': ResourcePriority}
+
+class requestWillBeSent(ChromeEvent):
+    """Fired when page is about to send HTTP request."""
+    __slots__ = ()
+    _fields = ('requestId', 'frameId', 'loaderId', 'documentURL', 'request', 'timestamp', 'wallTime', 'initiator', 'redirectResponse', 'type')
+    # Request identifier.
+    requestId: RequestId
+    # Frame identifier.
+    frameId: "Page.FrameId"
+    # Loader identifier.
+    loaderId: LoaderId
+    # URL of the document this request is loaded for.
+    documentURL: str
+    # Request data.
+    request: Request
+    # Timestamp.
+    timestamp: Timestamp
+    # UTC Timestamp.
+    wallTime: Timestamp
+    # Request initiator.
+    initiator: Initiator
+    # Redirect response data.
+    redirectResponse: Response
+    # Type of this resource.
+    type: "Page.ResourceType"
+    _types = {'request': Request, 'initiator': Initiator, 'redirectResponse': Response, 'type': 'Page.ResourceType'}
+
+class requestServedFromCache(ChromeEvent):
+    """Fired if request ended up loading from cache."""
+    __slots__ = ()
+    _fields = ('requestId',)
+    # Request identifier.
+    requestId: RequestId
+
+class responseReceived(ChromeEvent):
+    """Fired when HTTP response is available."""
+    __slots__ = ()
+    _fields = ('requestId', 'frameId', 'loaderId', 'timestamp', 'type', 'response')
+    # Request identifier.
+    requestId: RequestId
+    # Frame identifier.
+    frameId: "Page.FrameId"
+    # Loader identifier.
+    loaderId: LoaderId
+    # Timestamp.
+    timestamp: Timestamp
+    # Resource type.
+    type: "Page.ResourceType"
+    # Response data.
+    response: Response
+    _types = {'type': 'Page.ResourceType', 'response': Response}
+
+class dataReceived(ChromeEvent):
+    """Fired when data chunk was received over the network."""
+    __slots__ = ()
+    _fields = ('requestId', 'timestamp', 'dataLength', 'encodedDataLength')
+    # Request identifier.
+    requestId: RequestId
+    # Timestamp.
+    timestamp: Timestamp
+    # Data chunk length.
+    dataLength: int
+    # Actual bytes received (might be less than dataLength for compressed encodings).
+    encodedDataLength: int
+
+class loadingFinished(ChromeEvent):
+    """Fired when HTTP request has finished loading."""
+    __slots__ = ()
+    _fields = ('requestId', 'timestamp', 'encodedDataLength')
+    # Request identifier.
+    requestId: RequestId
+    # Timestamp.
+    timestamp: Timestamp
+    # Total number of bytes received for this request.
+    encodedDataLength: float
+
+class loadingFailed(ChromeEvent):
+    """Fired when HTTP request has failed to load."""
+    __slots__ = ()
+    _fields = ('requestId', 'timestamp', 'type', 'errorText', 'canceled', 'blockedReason')
+    # Request identifier.
+    requestId: RequestId
+    # Timestamp.
+    timestamp: Timestamp
+    # Resource type.
+    type: "Page.ResourceType"
+    # User friendly error message.
+    errorText: str
+    # True if loading was canceled.
+    canceled: bool
+    # The reason why loading was blocked, if any.
+    blockedReason: BlockedReason
+    _types = {'type': 'Page.ResourceType', 'blockedReason': BlockedReason}
+
+class webSocketWillSendHandshakeRequest(ChromeEvent):
+    """Fired when WebSocket is about to initiate handshake."""
+    __slots__ = ()
+    _fields = ('requestId', 'timestamp', 'wallTime', 'request')
+    # Request identifier.
+    requestId: RequestId
+    # Timestamp.
+    timestamp: Timestamp
+    # UTC Timestamp.
+    wallTime: Timestamp
+    # WebSocket request data.
+    request: WebSocketRequest
+    _types = {'request': WebSocketRequest}
+
+class webSocketHandshakeResponseReceived(ChromeEvent):
+    """Fired when WebSocket handshake response becomes available."""
+    __slots__ = ()
+    _fields = ('requestId', 'timestamp', 'response')
+    # Request identifier.
+    requestId: RequestId
+    # Timestamp.
+    timestamp: Timestamp
+    # WebSocket response data.
+    response: WebSocketResponse
+    _types = {'response': WebSocketResponse}
+
+class webSocketCreated(ChromeEvent):
+    """Fired upon WebSocket creation."""
+    __slots__ = ()
+    _fields = ('requestId', 'url', 'initiator')
+    # Request identifier.
+    requestId: RequestId
+    # WebSocket request URL.
+    url: str
+    # Request initiator.
+    initiator: Initiator
+    _types = {'initiator': Initiator}
+
+class webSocketClosed(ChromeEvent):
+    """Fired when WebSocket is closed."""
+    __slots__ = ()
+    _fields = ('requestId', 'timestamp')
+    # Request identifier.
+    requestId: RequestId
+    # Timestamp.
+    timestamp: Timestamp
+
+class webSocketFrameReceived(ChromeEvent):
+    """Fired when WebSocket frame is received."""
+    __slots__ = ()
+    _fields = ('requestId', 'timestamp', 'response')
+    # Request identifier.
+    requestId: RequestId
+    # Timestamp.
+    timestamp: Timestamp
+    # WebSocket response data.
+    response: WebSocketFrame
+    _types = {'response': WebSocketFrame}
+
+class webSocketFrameError(ChromeEvent):
+    """Fired when WebSocket frame error occurs."""
+    __slots__ = ()
+    _fields = ('requestId', 'timestamp', 'errorMessage')
+    # Request identifier.
+    requestId: RequestId
+    # Timestamp.
+    timestamp: Timestamp
+    # WebSocket frame error message.
+    errorMessage: str
+
+class webSocketFrameSent(ChromeEvent):
+    """Fired when WebSocket frame is sent."""
+    __slots__ = ()
+    _fields = ('requestId', 'timestamp', 'response')
+    # Request identifier.
+    requestId: RequestId
+    # Timestamp.
+    timestamp: Timestamp
+    # WebSocket response data.
+    response: WebSocketFrame
+    _types = {'response': WebSocketFrame}
+
+class eventSourceMessageReceived(ChromeEvent):
+    """Fired when EventSource message is received."""
+    __slots__ = ()
+    _fields = ('requestId', 'timestamp', 'eventName', 'eventId', 'data')
+    # Request identifier.
+    requestId: RequestId
+    # Timestamp.
+    timestamp: Timestamp
+    # Message type.
+    eventName: str
+    # Message identifier.
+    eventId: str
+    # Message content.
+    data: str
 
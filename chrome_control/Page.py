@@ -1,9 +1,12 @@
+# schema hash: 63a25e437323f3ccdaad9f82a93319ea40ac9872
 from enum import Enum
-from typing import Any, List
+from typing import TYPE_CHECKING, Any, List
 
-from .base import ChromeCommand
+from .base import ChromeCommand, ChromeEvent, ChromeResult, ChromeType, encode, resolve
 
-from . import Network
+if TYPE_CHECKING:
+    from . import DOM
+    from . import Network
 
 ResourceType = Enum("ResourceType", "Document Stylesheet Image Media Font Script TextTrack XHR Fetch EventSource WebSocket Manifest Other")
 ResourceType.__doc__ = """Resource type as it was perceived by the rendering engine."""
@@ -11,8 +14,11 @@ ResourceType.__doc__ = """Resource type as it was perceived by the rendering eng
 # Unique frame identifier.
 FrameId = str
 
-class Frame:
+class Frame(ChromeType):
     """Information about the Frame on the page."""
+    _fields = ('id', 'loaderId', 'url', 'securityOrigin', 'mimeType', 'parentId', 'name')
+    __slots__ = _fields
+
     def __init__(self, id: str, loaderId: "Network.LoaderId", url: str, securityOrigin: str, mimeType: str, parentId: str=None, name: str=None):
         # Frame unique identifier.
         self.id = id
@@ -29,9 +35,33 @@ class Frame:
         # Frame's name as specified in the tag.
         self.name = name
 
-class FrameResource:
+    def to_wire(self):
+        wire = {"id": self.id, "loaderId": self.loaderId, "url": self.url, "securityOrigin": self.securityOrigin, "mimeType": self.mimeType}
+        if self.parentId is not None:
+            wire["parentId"] = self.parentId
+        if self.name is not None:
+            wire["name"] = self.name
+        return wire
+
+    @classmethod
+    def from_wire(cls, wire: dict):
+        obj = cls.__new__(cls)
+        obj.id = wire["id"]
+        obj.loaderId = wire["loaderId"]
+        obj.url = wire["url"]
+        obj.securityOrigin = wire["securityOrigin"]
+        obj.mimeType = wire["mimeType"]
+        obj.parentId = wire.get("parentId")
+        obj.name = wire.get("name")
+        return obj
+
+class FrameResource(ChromeType):
     """Information about the Resource on the page."""
-    def __init__(self, url: str, type: "ResourceType", mimeType: str, lastModified: "Network.Timestamp"=None, contentSize: float=None, failed: bool=None, canceled: bool=None):
+    _fields = ('url', 'type', 'mimeType', 'lastModified', 'contentSize', 'failed', 'canceled')
+    __slots__ = _fields
+    _types = {'type': ResourceType}
+
+    def __init__(self, url: str, type: ResourceType, mimeType: str, lastModified: "Network.Timestamp"=None, contentSize: float=None, failed: bool=None, canceled: bool=None):
         # Resource URL.
         self.url = url
         # Type of this resource.
@@ -47,9 +77,37 @@ class FrameResource:
         # True if the resource was canceled during loading.
         self.canceled = canceled
 
-class FrameResourceTree:
+    def to_wire(self):
+        wire = {"url": self.url, "type": encode(self.type), "mimeType": self.mimeType}
+        if self.lastModified is not None:
+            wire["lastModified"] = self.lastModified
+        if self.contentSize is not None:
+            wire["contentSize"] = self.contentSize
+        if self.failed is not None:
+            wire["failed"] = self.failed
+        if self.canceled is not None:
+            wire["canceled"] = self.canceled
+        return wire
+
+    @classmethod
+    def from_wire(cls, wire: dict):
+        obj = cls.__new__(cls)
+        obj.url = wire["url"]
+        obj.type = ResourceType.__members__.get(wire["type"], wire["type"])
+        obj.mimeType = wire["mimeType"]
+        obj.lastModified = wire.get("lastModified")
+        obj.contentSize = wire.get("contentSize")
+        obj.failed = wire.get("failed")
+        obj.canceled = wire.get("canceled")
+        return obj
+
+class FrameResourceTree(ChromeType):
     """Information about the Frame hierarchy along with their cached resources."""
-    def __init__(self, frame: "Frame", resources: List, childFrames: List=None):
+    _fields = ('frame', 'resources', 'childFrames')
+    __slots__ = _fields
+    _types = {'frame': Frame, 'resources': [FrameResource], 'childFrames': ['Page.FrameResourceTree']}
+
+    def __init__(self, frame: Frame, resources: List, childFrames: List=None):
         # Frame information for this tree item.
         self.frame = frame
         # Information about frame resources.
@@ -57,11 +115,28 @@ class FrameResourceTree:
         # Child frames.
         self.childFrames = childFrames
 
+    def to_wire(self):
+        wire = {"frame": encode(self.frame), "resources": encode(self.resources)}
+        if self.childFrames is not None:
+            wire["childFrames"] = encode(self.childFrames)
+        return wire
+
+    @classmethod
+    def from_wire(cls, wire: dict):
+        obj = cls.__new__(cls)
+        obj.frame = Frame.from_wire(wire["frame"])
+        obj.resources = [FrameResource.from_wire(x0) for x0 in wire["resources"]]
+        obj.childFrames = [FrameResourceTree.from_wire(x0) for x0 in wire["childFrames"]] if "childFrames" in wire else None
+        return obj
+
 # Unique script identifier.
 ScriptIdentifier = str
 
-class NavigationEntry:
+class NavigationEntry(ChromeType):
     """Navigation history entry."""
+    _fields = ('id', 'url', 'title')
+    __slots__ = _fields
+
     def __init__(self, id: int, url: str, title: str):
         # Unique id of the navigation history entry.
         self.id = id
@@ -70,8 +145,23 @@ class NavigationEntry:
         # Title of the navigation history entry.
         self.title = title
 
-class ScreencastFrameMetadata:
+    def to_wire(self):
+        wire = {"id": self.id, "url": self.url, "title": self.title}
+        return wire
+
+    @classmethod
+    def from_wire(cls, wire: dict):
+        obj = cls.__new__(cls)
+        obj.id = wire["id"]
+        obj.url = wire["url"]
+        obj.title = wire["title"]
+        return obj
+
+class ScreencastFrameMetadata(ChromeType):
     """Screencast frame metadata."""
+    _fields = ('offsetTop', 'pageScaleFactor', 'deviceWidth', 'deviceHeight', 'scrollOffsetX', 'scrollOffsetY', 'timestamp')
+    __slots__ = _fields
+
     def __init__(self, offsetTop: float, pageScaleFactor: float, deviceWidth: float, deviceHeight: float, scrollOffsetX: float, scrollOffsetY: float, timestamp: float=None):
         # Top offset in DIP.
         self.offsetTop = offsetTop
@@ -88,11 +178,32 @@ class ScreencastFrameMetadata:
         # Frame swap timestamp.
         self.timestamp = timestamp
 
+    def to_wire(self):
+        wire = {"offsetTop": self.offsetTop, "pageScaleFactor": self.pageScaleFactor, "deviceWidth": self.deviceWidth, "deviceHeight": self.deviceHeight, "scrollOffsetX": self.scrollOffsetX, "scrollOffsetY": self.scrollOffsetY}
+        if self.timestamp is not None:
+            wire["timestamp"] = self.timestamp
+        return wire
+
+    @classmethod
+    def from_wire(cls, wire: dict):
+        obj = cls.__new__(cls)
+        obj.offsetTop = wire["offsetTop"]
+        obj.pageScaleFactor = wire["pageScaleFactor"]
+        obj.deviceWidth = wire["deviceWidth"]
+        obj.deviceHeight = wire["deviceHeight"]
+        obj.scrollOffsetX = wire["scrollOffsetX"]
+        obj.scrollOffsetY = wire["scrollOffsetY"]
+        obj.timestamp = wire.get("timestamp")
+        return obj
+
 DialogType = Enum("DialogType", "alert confirm prompt beforeunload")
 DialogType.__doc__ = """Javascript dialog type."""
 
-class AppManifestError:
+class AppManifestError(ChromeType):
     """Error while paring app manifest."""
+    _fields = ('message', 'critical', 'line', 'column')
+    __slots__ = _fields
+
     def __init__(self, message: str, critical: int, line: int, column: int):
         # Error message.
         self.message = message
@@ -103,11 +214,27 @@ class AppManifestError:
         # Error column.
         self.column = column
 
+    def to_wire(self):
+        wire = {"message": self.message, "critical": self.critical, "line": self.line, "column": self.column}
+        return wire
+
+    @classmethod
+    def from_wire(cls, wire: dict):
+        obj = cls.__new__(cls)
+        obj.message = wire["message"]
+        obj.critical = wire["critical"]
+        obj.line = wire["line"]
+        obj.column = wire["column"]
+        return obj
+
 NavigationResponse = Enum("NavigationResponse", "Proceed Cancel CancelAndIgnore")
 NavigationResponse.__doc__ = """Proceed: allow the navigation; Cancel: cancel the navigation; CancelAndIgnore: cancels the navigation and makes the requester of the navigation acts like the request was never made."""
 
-class LayoutViewport:
+class LayoutViewport(ChromeType):
     """Layout viewport position and dimensions."""
+    _fields = ('pageX', 'pageY', 'clientWidth', 'clientHeight')
+    __slots__ = _fields
+
     def __init__(self, pageX: int, pageY: int, clientWidth: int, clientHeight: int):
         # Horizontal offset relative to the document (CSS pixels).
         self.pageX = pageX
@@ -118,8 +245,24 @@ class LayoutViewport:
         # Height (CSS pixels), excludes scrollbar if present.
         self.clientHeight = clientHeight
 
-class VisualViewport:
+    def to_wire(self):
+        wire = {"pageX": self.pageX, "pageY": self.pageY, "clientWidth": self.clientWidth, "clientHeight": self.clientHeight}
+        return wire
+
+    @classmethod
+    def from_wire(cls, wire: dict):
+        obj = cls.__new__(cls)
+        obj.pageX = wire["pageX"]
+        obj.pageY = wire["pageY"]
+        obj.clientWidth = wire["clientWidth"]
+        obj.clientHeight = wire["clientHeight"]
+        return obj
+
+class VisualViewport(ChromeType):
     """Visual viewport position, dimensions, and scale."""
+    _fields = ('offsetX', 'offsetY', 'pageX', 'pageY', 'clientWidth', 'clientHeight', 'scale')
+    __slots__ = _fields
+
     def __init__(self, offsetX: float, offsetY: float, pageX: float, pageY: float, clientWidth: float, clientHeight: float, scale: float):
         # Horizontal offset relative to the layout viewport (CSS pixels).
         self.offsetX = offsetX
@@ -136,39 +279,88 @@ class VisualViewport:
         # Scale relative to the ideal viewport (size at width=device-width).
         self.scale = scale
 
+    def to_wire(self):
+        wire = {"offsetX": self.offsetX, "offsetY": self.offsetY, "pageX": self.pageX, "pageY": self.pageY, "clientWidth": self.clientWidth, "clientHeight": self.clientHeight, "scale": self.scale}
+        return wire
+
+    @classmethod
+    def from_wire(cls, wire: dict):
+        obj = cls.__new__(cls)
+        obj.offsetX = wire["offsetX"]
+        obj.offsetY = wire["offsetY"]
+        obj.pageX = wire["pageX"]
+        obj.pageY = wire["pageY"]
+        obj.clientWidth = wire["clientWidth"]
+        obj.clientHeight = wire["clientHeight"]
+        obj.scale = wire["scale"]
+        return obj
+
 class enable(ChromeCommand):
     """Enables page domain notifications."""
+    _fields = ()
+    __slots__ = _fields
 
     def __init__(self): pass
 
 class disable(ChromeCommand):
     """Disables page domain notifications."""
+    _fields = ()
+    __slots__ = _fields
 
     def __init__(self): pass
 
+class addScriptToEvaluateOnLoadResult(ChromeResult):
+    __slots__ = ()
+    _fields = ('identifier',)
+    # Identifier of the added script.
+    identifier: ScriptIdentifier
+
 class addScriptToEvaluateOnLoad(ChromeCommand):
+    _fields = ('scriptSource',)
+    __slots__ = _fields
+    _result = addScriptToEvaluateOnLoadResult
+
     def __init__(self, scriptSource: str):
         self.scriptSource = scriptSource
 
+    def to_wire(self):
+        wire = {"scriptSource": self.scriptSource}
+        return wire
+
 
 
 class removeScriptToEvaluateOnLoad(ChromeCommand):
-    def __init__(self, identifier: "ScriptIdentifier"):
+    _fields = ('identifier',)
+    __slots__ = _fields
+
+    def __init__(self, identifier: ScriptIdentifier):
         self.identifier = identifier
 
+    def to_wire(self):
+        wire = {"identifier": self.identifier}
+        return wire
+
 
 
 class setAutoAttachToCreatedPages(ChromeCommand):
     """Controls whether browser will open a new inspector window for connected pages."""
+    _fields = ('autoAttach',)
+    __slots__ = _fields
 
     def __init__(self, autoAttach: bool):
         # If true, browser will open a new inspector window for every page created from this one.
         self.autoAttach = autoAttach
 
+    def to_wire(self):
+        wire = {"autoAttach": self.autoAttach}
+        return wire
+
 
 
 class reload(ChromeCommand):
     """Reloads given page optionally ignoring the cache."""
+    _fields = ('ignoreCache', 'scriptToEvaluateOnLoad')
+    __slots__ = _fields
 
     def __init__(self, ignoreCache: bool=None, scriptToEvaluateOnLoad: str=None):
         # If true, browser cache is ignored (as if the user pressed Shift+refresh).
@@ -176,43 +368,96 @@ class reload(ChromeCommand):
         # If set, the script will be injected into all frames of the inspected page after reload.
         self.scriptToEvaluateOnLoad = scriptToEvaluateOnLoad
 
+    def to_wire(self):
+        wire = {}
+        if self.ignoreCache is not None:
+            wire["ignoreCache"] = self.ignoreCache
+        if self.scriptToEvaluateOnLoad is not None:
+            wire["scriptToEvaluateOnLoad"] = self.scriptToEvaluateOnLoad
+        return wire
 
 
+
+class navigateResult(ChromeResult):
+    __slots__ = ()
+    _fields = ('frameId',)
+    # Frame id that will be navigated.
+    frameId: FrameId
+
 class navigate(ChromeCommand):
     """Navigates current page to the given URL."""
+    _fields = ('url',)
+    __slots__ = _fields
+    _result = navigateResult
 
     def __init__(self, url: str):
         # URL to navigate the page to.
         self.url = url
 
+    def to_wire(self):
+        wire = {"url": self.url}
+        return wire
+
 
 
 class stopLoading(ChromeCommand):
     """Force the page stop all navigations and pending resource fetches."""
+    _fields = ()
+    __slots__ = _fields
 
     def __init__(self): pass
 
+class getNavigationHistoryResult(ChromeResult):
+    __slots__ = ()
+    _fields = ('currentIndex', 'entries')
+    # Index of the current navigation history entry.
+    currentIndex: int
+    # Array of navigation history entries.
+    entries: List
+    _types = {'entries': [NavigationEntry]}
+
 class getNavigationHistory(ChromeCommand):
     """Returns navigation history for the current page."""
+    _fields = ()
+    __slots__ = _fields
+    _result = getNavigationHistoryResult
 
     def __init__(self): pass
 
 class navigateToHistoryEntry(ChromeCommand):
     """Navigates current page to the given history entry."""
+    _fields = ('entryId',)
+    __slots__ = _fields
 
     def __init__(self, entryId: int):
         # Unique id of the entry to navigate to.
         self.entryId = entryId
 
+    def to_wire(self):
+        wire = {"entryId": self.entryId}
+        return wire
+
 
 
+class getCookiesResult(ChromeResult):
+    __slots__ = ()
+    _fields = ('cookies',)
+    # Array of cookie objects.
+    cookies: List
+    _types = {'cookies': ['Network.Cookie']}
+
 class getCookies(ChromeCommand):
     """Returns all browser cookies. Depending on the backend support, will return detailed cookie information in the <code>cookies</code> field."""
+    _fields = ()
+    __slots__ = _fields
+    _result = getCookiesResult
 
     def __init__(self): pass
 
 class deleteCookie(ChromeCommand):
     """Deletes browser cookie with given name, domain and path."""
+    _fields = ('cookieName', 'url')
+    __slots__ = _fields
 
     def __init__(self, cookieName: str, url: str):
         # Name of the cookie to remove.
@@ -220,28 +465,67 @@ class deleteCookie(ChromeCommand):
         # URL to match cooke domain and path.
         self.url = url
 
+    def to_wire(self):
+        wire = {"cookieName": self.cookieName, "url": self.url}
+        return wire
+
 
 
+class getResourceTreeResult(ChromeResult):
+    __slots__ = ()
+    _fields = ('frameTree',)
+    # Present frame / resource tree structure.
+    frameTree: FrameResourceTree
+    _types = {'frameTree': FrameResourceTree}
+
 class getResourceTree(ChromeCommand):
     """Returns present frame / resource tree structure."""
+    _fields = ()
+    __slots__ = _fields
+    _result = getResourceTreeResult
 
     def __init__(self): pass
 
+class getResourceContentResult(ChromeResult):
+    __slots__ = ()
+    _fields = ('content', 'base64Encoded')
+    # Resource content.
+    content: str
+    # True, if content was served as base64.
+    base64Encoded: bool
+
 class getResourceContent(ChromeCommand):
     """Returns content of the given resource."""
+    _fields = ('frameId', 'url')
+    __slots__ = _fields
+    _result = getResourceContentResult
 
-    def __init__(self, frameId: "FrameId", url: str):
+    def __init__(self, frameId: FrameId, url: str):
         # Frame id to get resource for.
         self.frameId = frameId
         # URL of the resource to get content for.
         self.url = url
 
+    def to_wire(self):
+        wire = {"frameId": self.frameId, "url": self.url}
+        return wire
+
 
 
+class searchInResourceResult(ChromeResult):
+    __slots__ = ()
+    _fields = ('result',)
+    # List of search matches.
+    result: List
+    _types = {'result': ['Debugger.SearchMatch']}
+
 class searchInResource(ChromeCommand):
     """Searches for given string in resource content."""
+    _fields = ('frameId', 'url', 'query', 'caseSensitive', 'isRegex')
+    __slots__ = _fields
+    _result = searchInResourceResult
 
-    def __init__(self, frameId: "FrameId", url: str, query: str, caseSensitive: bool=None, isRegex: bool=None):
+    def __init__(self, frameId: FrameId, url: str, query: str, caseSensitive: bool=None, isRegex: bool=None):
         # Frame id for resource to search in.
         self.frameId = frameId
         # URL of the resource to search in.
@@ -253,21 +537,37 @@ class searchInResource(ChromeCommand):
         # If true, treats string parameter as regex.
         self.isRegex = isRegex
 
+    def to_wire(self):
+        wire = {"frameId": self.frameId, "url": self.url, "query": self.query}
+        if self.caseSensitive is not None:
+            wire["caseSensitive"] = self.caseSensitive
+        if self.isRegex is not None:
+            wire["isRegex"] = self.isRegex
+        return wire
+
 
 
 class setDocumentContent(ChromeCommand):
     """Sets given markup as the document's HTML."""
+    _fields = ('frameId', 'html')
+    __slots__ = _fields
 
-    def __init__(self, frameId: "FrameId", html: str):
+    def __init__(self, frameId: FrameId, html: str):
         # Frame id to set HTML for.
         self.frameId = frameId
         # HTML content to set.
         self.html = html
 
+    def to_wire(self):
+        wire = {"frameId": self.frameId, "html": self.html}
+        return wire
+
 
 
 class setDeviceMetricsOverride(ChromeCommand):
     """Overrides the values of device screen dimensions (window.screen.width, window.screen.height, window.innerWidth, window.innerHeight, and "device-width"/"device-height"-related CSS media query results)."""
+    _fields = ('width', 'height', 'deviceScaleFactor', 'mobile', 'fitWindow', 'scale', 'offsetX', 'offsetY', 'screenWidth', 'screenHeight', 'positionX', 'positionY', 'screenOrientation')
+    __slots__ = _fields
 
     def __init__(self, width: int, height: int, deviceScaleFactor: float, mobile: bool, fitWindow: bool, scale: float=None, offsetX: float=None, offsetY: float=None, screenWidth: int=None, screenHeight: int=None, positionX: int=None, positionY: int=None, screenOrientation: "Emulation.ScreenOrientation"=None):
         # Overriding width value in pixels (minimum 0, maximum 10000000). 0 disables the override.
@@ -297,15 +597,39 @@ class setDeviceMetricsOverride(ChromeCommand):
         # Screen orientation override.
         self.screenOrientation = screenOrientation
 
+    def to_wire(self):
+        wire = {"width": self.width, "height": self.height, "deviceScaleFactor": self.deviceScaleFactor, "mobile": self.mobile, "fitWindow": self.fitWindow}
+        if self.scale is not None:
+            wire["scale"] = self.scale
+        if self.offsetX is not None:
+            wire["offsetX"] = self.offsetX
+        if self.offsetY is not None:
+            wire["offsetY"] = self.offsetY
+        if self.screenWidth is not None:
+            wire["screenWidth"] = self.screenWidth
+        if self.screenHeight is not None:
+            wire["screenHeight"] = self.screenHeight
+        if self.positionX is not None:
+            wire["positionX"] = self.positionX
+        if self.positionY is not None:
+            wire["positionY"] = self.positionY
+        if self.screenOrientation is not None:
+            wire["screenOrientation"] = encode(self.screenOrientation)
+        return wire
+
 
 
 class clearDeviceMetricsOverride(ChromeCommand):
     """Clears the overriden device metrics."""
+    _fields = ()
+    __slots__ = _fields
 
     def __init__(self): pass
 
 class setGeolocationOverride(ChromeCommand):
     """Overrides the Geolocation Position or Error. Omitting any of the parameters emulates position unavailable."""
+    _fields = ('latitude', 'longitude', 'accuracy')
+    __slots__ = _fields
 
     def __init__(self, latitude: float=None, longitude: float=None, accuracy: float=None):
         # Mock latitude
@@ -315,15 +639,29 @@ class setGeolocationOverride(ChromeCommand):
         # Mock accuracy
         self.accuracy = accuracy
 
+    def to_wire(self):
+        wire = {}
+        if self.latitude is not None:
+            wire["latitude"] = self.latitude
+        if self.longitude is not None:
+            wire["longitude"] = self.longitude
+        if self.accuracy is not None:
+            wire["accuracy"] = self.accuracy
+        return wire
+
 
 
 class clearGeolocationOverride(ChromeCommand):
     """Clears the overriden Geolocation Position and Error."""
+    _fields = ()
+    __slots__ = _fields
 
     def __init__(self): pass
 
 class setDeviceOrientationOverride(ChromeCommand):
     """Overrides the Device Orientation."""
+    _fields = ('alpha', 'beta', 'gamma')
+    __slots__ = _fields
 
     def __init__(self, alpha: float, beta: float, gamma: float):
         # Mock alpha
@@ -333,15 +671,23 @@ class setDeviceOrientationOverride(ChromeCommand):
         # Mock gamma
         self.gamma = gamma
 
+    def to_wire(self):
+        wire = {"alpha": self.alpha, "beta": self.beta, "gamma": self.gamma}
+        return wire
+
 
 
 class clearDeviceOrientationOverride(ChromeCommand):
     """Clears the overridden Device Orientation."""
+    _fields = ()
+    __slots__ = _fields
 
     def __init__(self): pass
 
 class setTouchEmulationEnabled(ChromeCommand):
     """Toggles mouse event-based touch event emulation."""
+    _fields = ('enabled', 'configuration')
+    __slots__ = _fields
 
     def __init__(self, enabled: bool, configuration: str=None):
         # Whether the touch event emulation should be enabled.
@@ -349,15 +695,32 @@ class setTouchEmulationEnabled(ChromeCommand):
         # Touch/gesture events configuration. Default: current platform.
         self.configuration = configuration
 
+    def to_wire(self):
+        wire = {"enabled": self.enabled}
+        if self.configuration is not None:
+            wire["configuration"] = self.configuration
+        return wire
+
 
 
+class captureScreenshotResult(ChromeResult):
+    __slots__ = ()
+    _fields = ('data',)
+    # Base64-encoded image data (PNG).
+    data: str
+
 class captureScreenshot(ChromeCommand):
     """Capture page screenshot."""
+    _fields = ()
+    __slots__ = _fields
+    _result = captureScreenshotResult
 
     def __init__(self): pass
 
 class startScreencast(ChromeCommand):
     """Starts sending each frame using the <code>screencastFrame</code> event."""
+    _fields = ('format', 'quality', 'maxWidth', 'maxHeight', 'everyNthFrame')
+    __slots__ = _fields
 
     def __init__(self, format: str=None, quality: int=None, maxWidth: int=None, maxHeight: int=None, everyNthFrame: int=None):
         # Image compression format.
@@ -371,24 +734,48 @@ class startScreencast(ChromeCommand):
         # Send every n-th frame.
         self.everyNthFrame = everyNthFrame
 
+    def to_wire(self):
+        wire = {}
+        if self.format is not None:
+            wire["format"] = self.format
+        if self.quality is not None:
+            wire["quality"] = self.quality
+        if self.maxWidth is not None:
+            wire["maxWidth"] = self.maxWidth
+        if self.maxHeight is not None:
+            wire["maxHeight"] = self.maxHeight
+        if self.everyNthFrame is not None:
+            wire["everyNthFrame"] = self.everyNthFrame
+        return wire
+
 
 
 class stopScreencast(ChromeCommand):
     """Stops sending each frame in the <code>screencastFrame</code>."""
+    _fields = ()
+    __slots__ = _fields
 
     def __init__(self): pass
 
 class screencastFrameAck(ChromeCommand):
     """Acknowledges that a screencast frame has been received by the frontend."""
+    _fields = ('sessionId',)
+    __slots__ = _fields
 
     def __init__(self, sessionId: int):
         # Frame number.
         self.sessionId = sessionId
 
+    def to_wire(self):
+        wire = {"sessionId": self.sessionId}
+        return wire
+
 
 
 class handleJavaScriptDialog(ChromeCommand):
     """Accepts or dismisses a JavaScript initiated dialog (alert, confirm, prompt, or onbeforeunload)."""
+    _fields = ('accept', 'promptText')
+    __slots__ = _fields
 
     def __init__(self, accept: bool, promptText: str=None):
         # Whether to accept or dismiss the dialog.
@@ -396,19 +783,33 @@ class handleJavaScriptDialog(ChromeCommand):
         # The text to enter into the dialog prompt before accepting. Used only if this is a prompt dialog.
         self.promptText = promptText
 
+    def to_wire(self):
+        wire = {"accept": self.accept}
+        if self.promptText is not None:
+            wire["promptText"] = self.promptText
+        return wire
+
 
 
 class setColorPickerEnabled(ChromeCommand):
     """Shows / hides color picker"""
+    _fields = ('enabled',)
+    __slots__ = _fields
 
     def __init__(self, enabled: bool):
         # Shows / hides color picker
         self.enabled = enabled
 
+    def to_wire(self):
+        wire = {"enabled": self.enabled}
+        return wire
+
 
 
 class configureOverlay(ChromeCommand):
     """Configures overlay."""
+    _fields = ('suspended', 'message')
+    __slots__ = _fields
 
     def __init__(self, suspended: bool=None, message: str=None):
         # Whether overlay should be suspended and not consume any resources.
@@ -416,33 +817,216 @@ class configureOverlay(ChromeCommand):
         # Overlay message to display.
         self.message = message
 
+    def to_wire(self):
+        wire = {}
+        if self.suspended is not None:
+            wire["suspended"] = self.suspended
+        if self.message is not None:
+            wire["message"] = self.message
+        return wire
+
+
 
+class getAppManifestResult(ChromeResult):
+    __slots__ = ()
+    _fields = ('url', 'errors', 'data')
+    # Manifest location.
+    url: str
+    errors: List
+    # Manifest content.
+    data: str
+    _types = {'errors': [AppManifestError]}
 
 class getAppManifest(ChromeCommand):
+    _fields = ()
+    __slots__ = _fields
+    _result = getAppManifestResult
+
     def __init__(self): pass
 
 class requestAppBanner(ChromeCommand):
+    _fields = ()
+    __slots__ = _fields
+
     def __init__(self): pass
 
 class setControlNavigations(ChromeCommand):
     """Toggles navigation throttling which allows programatic control over navigation and redirect response."""
+    _fields = ('enabled',)
+    __slots__ = _fields
 
     def __init__(self, enabled: bool):
         self.enabled = enabled
 
+    def to_wire(self):
+        wire = {"enabled": self.enabled}
+        return wire
+
 
 
 class processNavigation(ChromeCommand):
     """Should be sent in response to a navigationRequested or a redirectRequested event, telling the browser how to handle the navigation."""
+    _fields = ('response', 'navigationId')
+    __slots__ = _fields
 
-    def __init__(self, response: "NavigationResponse", navigationId: int):
+    def __init__(self, response: NavigationResponse, navigationId: int):
         self.response = response
         self.navigationId = navigationId
 
+    def to_wire(self):
+        wire = {"response": encode(self.response), "navigationId": self.navigationId}
+        return wire
 
 
+
+class getLayoutMetricsResult(ChromeResult):
+    __slots__ = ()
+    _fields = ('layoutViewport', 'visualViewport')
+    # Metrics relating to the layout viewport.
+    layoutViewport: LayoutViewport
+    # Metrics relating to the visual viewport.
+    visualViewport: VisualViewport
+    _types = {'layoutViewport': LayoutViewport, 'visualViewport': VisualViewport}
+
 class getLayoutMetrics(ChromeCommand):
     """Returns metrics relating to the layouting of the page, such as viewport bounds/scale."""
+    _fields = ()
+    __slots__ = _fields
+    _result = getLayoutMetricsResult
 
     def __init__(self): pass
 
+class domContentEventFired(ChromeEvent):
+    __slots__ = ()
+    _fields = ('timestamp',)
+    timestamp: float
+
+class loadEventFired(ChromeEvent):
+    __slots__ = ()
+    _fields = ('timestamp',)
+    timestamp: float
+
+class frameAttached(ChromeEvent):
+    """Fired when frame has been attached to its parent."""
+    __slots__ = ()
+    _fields = ('frameId', 'parentFrameId')
+    # Id of the frame that has been attached.
+    frameId: FrameId
+    # Parent frame identifier.
+    parentFrameId: FrameId
+
+class frameNavigated(ChromeEvent):
+    """Fired once navigation of the frame has completed. Frame is now associated with the new loader."""
+    __slots__ = ()
+    _fields = ('frame',)
+    # Frame object.
+    frame: Frame
+    _types = {'frame': Frame}
+
+class frameDetached(ChromeEvent):
+    """Fired when frame has been detached from its parent."""
+    __slots__ = ()
+    _fields = ('frameId',)
+    # Id of the frame that has been detached.
+    frameId: FrameId
+
+class frameStartedLoading(ChromeEvent):
+    """Fired when frame has started loading."""
+    __slots__ = ()
+    _fields = ('frameId',)
+    # Id of the frame that has started loading.
+    frameId: FrameId
+
+class frameStoppedLoading(ChromeEvent):
+    """Fired when frame has stopped loading."""
+    __slots__ = ()
+    _fields = ('frameId',)
+    # Id of the frame that has stopped loading.
+    frameId: FrameId
+
+class frameScheduledNavigation(ChromeEvent):
+    """Fired when frame schedules a potential navigation."""
+    __slots__ = ()
+    _fields = ('frameId', 'delay')
+    # Id of the frame that has scheduled a navigation.
+    frameId: FrameId
+    # Delay (in seconds) until the navigation is scheduled to begin. The navigation is not guaranteed to start.
+    delay: float
+
+class frameClearedScheduledNavigation(ChromeEvent):
+    """Fired when frame no longer has a scheduled navigation."""
+    __slots__ = ()
+    _fields = ('frameId',)
+    # Id of the frame that has cleared its scheduled navigation.
+    frameId: FrameId
+
+class frameResized(ChromeEvent):
+    __slots__ = ()
+    _fields = ()
+
+class javascriptDialogOpening(ChromeEvent):
+    """Fired when a JavaScript initiated dialog (alert, confirm, prompt, or onbeforeunload) is about to open."""
+    __slots__ = ()
+    _fields = ('message', 'type')
+    # Message that will be displayed by the dialog.
+    message: str
+    # Dialog type.
+    type: DialogType
+    _types = {'type': DialogType}
+
+class javascriptDialogClosed(ChromeEvent):
+    """Fired when a JavaScript initiated dialog (alert, confirm, prompt, or onbeforeunload) has been closed."""
+    __slots__ = ()
+    _fields = ('result',)
+    # Whether dialog was confirmed.
+    result: bool
+
+class screencastFrame(ChromeEvent):
+    """Compressed image data requested by the <code>startScreencast</code>."""
+    __slots__ = ()
+    _fields = ('data', 'metadata', 'sessionId')
+    # Base64-encoded compressed image.
+    data: str
+    # Screencast frame metadata.
+    metadata: ScreencastFrameMetadata
+    # Frame number.
+    sessionId: int
+    _types = {'metadata': ScreencastFrameMetadata}
+
+class screencastVisibilityChanged(ChromeEvent):
+    """Fired when the page with currently enabled screencast was shown or hidden </code>."""
+    __slots__ = ()
+    _fields = ('visible',)
+    # True if the page is visible.
+    visible: bool
+
+class colorPicked(ChromeEvent):
+    """Fired when a color has been picked."""
+    __slots__ = ()
+    _fields = ('color',)
+    # RGBA of the picked color.
+    color: "DOM.RGBA"
+    _types = {'color': 'DOM.RGBA'}
+
+class interstitialShown(ChromeEvent):
+    """Fired when interstitial page was shown"""
+    __slots__ = ()
+    _fields = ()
+
+class interstitialHidden(ChromeEvent):
+    """Fired when interstitial page was hidden"""
+    __slots__ = ()
+    _fields = ()
+
+class navigationRequested(ChromeEvent):
+    """Fired when a navigation is started if navigation throttles are enabled.  The navigation will be deferred until processNavigation is called."""
+    __slots__ = ()
+    _fields = ('isInMainFrame', 'isRedirect', 'navigationId', 'url')
+    # Whether the navigation is taking place in the main frame or in a subframe.
+    isInMainFrame: bool
+    # Whether the navigation has encountered a server redirect or not.
+    isRedirect: bool
+    navigationId: int
+    # URL of requested navigation.
+    url: str
+
@@ -1,12 +1,42 @@
+# schema hash: 18255f8b8d9cca1f0d97d1b1c21f291cff5bc69a
 from enum import Enum
-from typing import Any, List
+from typing import TYPE_CHECKING, Any, List
 
-from .base import ChromeCommand
+from .base import ChromeCommand, ChromeEvent, ChromeResult, ChromeType, encode, resolve
 
-from . import Runtime
+if TYPE_CHECKING:
+    from . import Debugger
+    from . import Runtime
 
-class ProfileNode:
+class PositionTickInfo(ChromeType):
+    """Specifies a number of samples attributed to a certain source position."""
+    _fields = ('line', 'ticks')
+    __slots__ = _fields
+
+    def __init__(self, line: int, ticks: int):
+        # Source line number (1-based).
+        self.line = line
+        # Number of samples attributed to the source line.
+        self.ticks = ticks
+
+    def to_wire(self):
+        wire = {"line": self.line, "ticks": self.ticks}
+        return wire
+
+    @classmethod
+    def from_wire(cls, wire: dict):
+        obj = cls.__new__(cls)
+        obj.line = wire["line"]
+        obj.ticks = wire["ticks"]
+        return obj
+
+class ProfileNode(ChromeType):
     """Profile node. Holds callsite information, execution statistics and child nodes."""
+    _fields = ('id', 'callFrame', 'hitCount', 'children', 'deoptReason', 'positionTicks')
+    __slots__ = _fields
+    _types = {'callFrame': 'Runtime.CallFrame', 'positionTicks': [PositionTickInfo]}
+    _refs = ('Runtime.CallFrame',)
+
     def __init__(self, id: int, callFrame: "Runtime.CallFrame", hitCount: int=None, children: List=None, deoptReason: str=None, positionTicks: List=None):
         # Unique id of the node.
         self.id = id
@@ -21,8 +51,38 @@ class ProfileNode:
         # An array of source position ticks.
         self.positionTicks = positionTicks
 
-class Profile:
+    def to_wire(self):
+        wire = {"id": self.id, "callFrame": encode(self.callFrame)}
+        if self.hitCount is not None:
+            wire["hitCount"] = self.hitCount
+        if self.children is not None:
+            wire["children"] = self.children
+        if self.deoptReason is not None:
+            wire["deoptReason"] = self.deoptReason
+        if self.positionTicks is not None:
+            wire["positionTicks"] = encode(self.positionTicks)
+        return wire
+
+    @classmethod
+    def from_wire(cls, wire: dict):
+        refs = cls._refs
+        if refs[0].__class__ is str:
+            refs = cls._refs = tuple(map(resolve, refs))
+        obj = cls.__new__(cls)
+        obj.id = wire["id"]
+        obj.callFrame = refs[0].from_wire(wire["callFrame"])
+        obj.hitCount = wire.get("hitCount")
+        obj.children = wire.get("children")
+        obj.deoptReason = wire.get("deoptReason")
+        obj.positionTicks = [PositionTickInfo.from_wire(x0) for x0 in wire["positionTicks"]] if "positionTicks" in wire else None
+        return obj
+
+class Profile(ChromeType):
     """Profile."""
+    _fields = ('nodes', 'startTime', 'endTime', 'samples', 'timeDeltas')
+    __slots__ = _fields
+    _types = {'nodes': [ProfileNode]}
+
     def __init__(self, nodes: List, startTime: float, endTime: float, samples: List=None, timeDeltas: List=None):
         # The list of profile nodes. First item is the root node.
         self.nodes = nodes
@@ -35,32 +95,90 @@ class Profile:
         # Time intervals between adjacent samples in microseconds. The first delta is relative to the profile startTime.
         self.timeDeltas = timeDeltas
 
-class PositionTickInfo:
-    """Specifies a number of samples attributed to a certain source position."""
-    def __init__(self, line: int, ticks: int):
-        # Source line number (1-based).
-        self.line = line
-        # Number of samples attributed to the source line.
-        self.ticks = ticks
+    def to_wire(self):
+        wire = {"nodes": encode(self.nodes), "startTime": self.startTime, "endTime": self.endTime}
+        if self.samples is not None:
+            wire["samples"] = self.samples
+        if self.timeDeltas is not None:
+            wire["timeDeltas"] = self.timeDeltas
+        return wire
+
+    @classmethod
+    def from_wire(cls, wire: dict):
+        obj = cls.__new__(cls)
+        obj.nodes = [ProfileNode.from_wire(x0) for x0 in wire["nodes"]]
+        obj.startTime = wire["startTime"]
+        obj.endTime = wire["endTime"]
+        obj.samples = wire.get("samples")
+        obj.timeDeltas = wire.get("timeDeltas")
+        return obj
 
 class enable(ChromeCommand):
+    _fields = ()
+    __slots__ = _fields
+
     def __init__(self): pass
 
 class disable(ChromeCommand):
+    _fields = ()
+    __slots__ = _fields
+
     def __init__(self): pass
 
 class setSamplingInterval(ChromeCommand):
     """Changes CPU profiler sampling interval. Must be called before CPU profiles recording started."""
+    _fields = ('interval',)
+    __slots__ = _fields
 
     def __init__(self, interval: int):
         # New sampling interval in microseconds.
         self.interval = interval
 
+    def to_wire(self):
+        wire = {"interval": self.interval}
+        return wire
+
 
 
 class start(ChromeCommand):
+    _fields = ()
+    __slots__ = _fields
+
     def __init__(self): pass
 
+class stopResult(ChromeResult):
+    __slots__ = ()
+    _fields = ('profile',)
+    # Recorded profile.
+    profile: Profile
+    _types = {'profile': Profile}
+
 class stop(ChromeCommand):
+    _fields = ()
+    __slots__ = _fields
+    _result = stopResult
+
     def __init__(self): pass
 
+class consoleProfileStarted(ChromeEvent):
+    """Sent when new profile recodring is started using console.profile() call."""
+    __slots__ = ()
+    _fields = ('id', 'location', 'title')
+    id: str
+    # Location of console.profile().
+    location: "Debugger.Location"
+    # Profile title passed as an argument to console.profile().
+    title: str
+    _types = {'location': 'Debugger.Location'}
+
+class consoleProfileFinished(ChromeEvent):
+    __slots__ = ()
+    _fields = ('id', 'location', 'profile', 'title')
+    id: str
+    # Location of console.profileEnd().
+    location: "Debugger.Location"
+    profile: Profile
+    # Profile title passed as an argument to console.profile().
+    title: str
+    _types = {'location': 'Debugger.Location', 'profile': Profile}
+
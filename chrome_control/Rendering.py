@@ -1,51 +1,82 @@
+# schema hash: 8be7f70f92195729f0d2b98928ce3837e8aaadc9
 from enum import Enum
-from typing import Any, List
+from typing import TYPE_CHECKING, Any, List
 
-from .base import ChromeCommand
+from .base import ChromeCommand, ChromeEvent, ChromeResult, ChromeType, encode, resolve
 
 
 class setShowPaintRects(ChromeCommand):
     """Requests that backend shows paint rectangles"""
+    _fields = ('result',)
+    __slots__ = _fields
 
     def __init__(self, result: bool):
         # True for showing paint rectangles
         self.result = result
 
+    def to_wire(self):
+        wire = {"result": self.result}
+        return wire
+
 
 
 class setShowDebugBorders(ChromeCommand):
     """Requests that backend shows debug borders on layers"""
+    _fields = ('show',)
+    __slots__ = _fields
 
     def __init__(self, show: bool):
         # True for showing debug borders
         self.show = show
 
+    def to_wire(self):
+        wire = {"show": self.show}
+        return wire
+
 
 
 class setShowFPSCounter(ChromeCommand):
     """Requests that backend shows the FPS counter"""
+    _fields = ('show',)
+    __slots__ = _fields
 
     def __init__(self, show: bool):
         # True for showing the FPS counter
         self.show = show
 
+    def to_wire(self):
+        wire = {"show": self.show}
+        return wire
+
 
 
 class setShowScrollBottleneckRects(ChromeCommand):
     """Requests that backend shows scroll bottleneck rects"""
+    _fields = ('show',)
+    __slots__ = _fields
 
     def __init__(self, show: bool):
         # True for showing scroll bottleneck rects
         self.show = show
 
+    def to_wire(self):
+        wire = {"show": self.show}
+        return wire
+
 
 
 class setShowViewportSizeOnResize(ChromeCommand):
     """Paints viewport size upon main frame resize."""
+    _fields = ('show',)
+    __slots__ = _fields
 
     def __init__(self, show: bool):
         # Whether to paint size or not.
         self.show = show
 
+    def to_wire(self):
+        wire = {"show": self.show}
+        return wire
+
 
 
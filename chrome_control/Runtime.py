@@ -1,7 +1,8 @@
+# schema hash: f794c71110b3a23834c1e8febeab1e0fd63d5986
 from enum import Enum
-from typing import Any, List
+from typing import TYPE_CHECKING, Any, List
 
-from .base import ChromeCommand
+from .base import ChromeCommand, ChromeEvent, ChromeResult, ChromeType, encode, resolve
 
 
 # Unique script identifier.
@@ -13,37 +14,73 @@ RemoteObjectId = str
 UnserializableValue = Enum("UnserializableValue", "Infinity NaN -Infinity -0")
 UnserializableValue.__doc__ = """Primitive value which cannot be JSON-stringified."""
 
-class RemoteObject:
-    """Mirror object referencing original JavaScript object."""
-    def __init__(self, type: str, subtype: str=None, className: str=None, value: Any=None, unserializableValue: "UnserializableValue"=None, description: str=None, objectId: "RemoteObjectId"=None, preview: "ObjectPreview"=None, customPreview: "CustomPreview"=None):
-        # Object type.
+class PropertyPreview(ChromeType):
+    _fields = ('name', 'type', 'value', 'valuePreview', 'subtype')
+    __slots__ = _fields
+    _types = {'valuePreview': 'Runtime.ObjectPreview'}
+
+    def __init__(self, name: str, type: str, value: str=None, valuePreview: "ObjectPreview"=None, subtype: str=None):
+        # Property name.
+        self.name = name
+        # Object type. Accessor means that the property itself is an accessor property.
         self.type = type
+        # User-friendly property value string.
+        self.value = value
+        # Nested value preview.
+        self.valuePreview = valuePreview
         # Object subtype hint. Specified for <code>object</code> type values only.
         self.subtype = subtype
-        # Object class (constructor) name. Specified for <code>object</code> type values only.
-        self.className = className
-        # Remote object value in case of primitive values or JSON values (if it was requested).
+
+    def to_wire(self):
+        wire = {"name": self.name, "type": self.type}
+        if self.value is not None:
+            wire["value"] = self.value
+        if self.valuePreview is not None:
+            wire["valuePreview"] = encode(self.valuePreview)
+        if self.subtype is not None:
+            wire["subtype"] = self.subtype
+        return wire
+
+    @classmethod
+    def from_wire(cls, wire: dict):
+        obj = cls.__new__(cls)
+        obj.name = wire["name"]
+        obj.type = wire["type"]
+        obj.value = wire.get("value")
+        obj.valuePreview = ObjectPreview.from_wire(wire["valuePreview"]) if "valuePreview" in wire else None
+        obj.subtype = wire.get("subtype")
+        return obj
+
+class EntryPreview(ChromeType):
+    _fields = ('value', 'key')
+    __slots__ = _fields
+    _types = {'value': 'Runtime.ObjectPreview', 'key': 'Runtime.ObjectPreview'}
+
+    def __init__(self, value: "ObjectPreview", key: "ObjectPreview"=None):
+        # Preview of the value.
         self.value = value
-        # Primitive value which can not be JSON-stringified does not have <code>value</code>, but gets this property.
-        self.unserializableValue = unserializableValue
-        # String representation of the object.
-        self.description = description
-        # Unique object identifier (for non-primitive values).
-        self.objectId = objectId
-        # Preview containing abbreviated property values. Specified for <code>object</code> type values only.
-        self.preview = preview
-        self.customPreview = customPreview
+        # Preview of the key. Specified for map-like collection entries.
+        self.key = key
 
-class CustomPreview:
-    def __init__(self, header: str, hasBody: bool, formatterObjectId: "RemoteObjectId", bindRemoteObjectFunctionId: "RemoteObjectId", configObjectId: "RemoteObjectId"=None):
-        self.header = header
-        self.hasBody = hasBody
-        self.formatterObjectId = formatterObjectId
-        self.bindRemoteObjectFunctionId = bindRemoteObjectFunctionId
-        self.configObjectId = configObjectId
+    def to_wire(self):
+        wire = {"value": encode(self.value)}
+        if self.key is not None:
+            wire["key"] = encode(self.key)
+        return wire
 
-class ObjectPreview:
+    @classmethod
+    def from_wire(cls, wire: dict):
+        obj = cls.__new__(cls)
+        obj.value = ObjectPreview.from_wire(wire["value"])
+        obj.key = ObjectPreview.from_wire(wire["key"]) if "key" in wire else None
+        return obj
+
+class ObjectPreview(ChromeType):
     """Object containing abbreviated remote object value."""
+    _fields = ('type', 'overflow', 'properties', 'subtype', 'description', 'entries')
+    __slots__ = _fields
+    _types = {'properties': [PropertyPreview], 'entries': [EntryPreview]}
+
     def __init__(self, type: str, overflow: bool, properties: List, subtype: str=None, description: str=None, entries: List=None):
         # Object type.
         self.type = type
@@ -58,29 +95,120 @@ class ObjectPreview:
         # List of the entries. Specified for <code>map</code> and <code>set</code> subtype values only.
         self.entries = entries
 
-class PropertyPreview:
-    def __init__(self, name: str, type: str, value: str=None, valuePreview: "ObjectPreview"=None, subtype: str=None):
-        # Property name.
-        self.name = name
-        # Object type. Accessor means that the property itself is an accessor property.
+    def to_wire(self):
+        wire = {"type": self.type, "overflow": self.overflow, "properties": encode(self.properties)}
+        if self.subtype is not None:
+            wire["subtype"] = self.subtype
+        if self.description is not None:
+            wire["description"] = self.description
+        if self.entries is not None:
+            wire["entries"] = encode(self.entries)
+        return wire
+
+    @classmethod
+    def from_wire(cls, wire: dict):
+        obj = cls.__new__(cls)
+        obj.type = wire["type"]
+        obj.overflow = wire["overflow"]
+        obj.properties = [PropertyPreview.from_wire(x0) for x0 in wire["properties"]]
+        obj.subtype = wire.get("subtype")
+        obj.description = wire.get("description")
+        obj.entries = [EntryPreview.from_wire(x0) for x0 in wire["entries"]] if "entries" in wire else None
+        return obj
+
+class CustomPreview(ChromeType):
+    _fields = ('header', 'hasBody', 'formatterObjectId', 'bindRemoteObjectFunctionId', 'configObjectId')
+    __slots__ = _fields
+
+    def __init__(self, header: str, hasBody: bool, formatterObjectId: RemoteObjectId, bindRemoteObjectFunctionId: RemoteObjectId, configObjectId: RemoteObjectId=None):
+        self.header = header
+        self.hasBody = hasBody
+        self.formatterObjectId = formatterObjectId
+        self.bindRemoteObjectFunctionId = bindRemoteObjectFunctionId
+        self.configObjectId = configObjectId
+
+    def to_wire(self):
+        wire = {"header": self.header, "hasBody": self.hasBody, "formatterObjectId": self.formatterObjectId, "bindRemoteObjectFunctionId": self.bindRemoteObjectFunctionId}
+        if self.configObjectId is not None:
+            wire["configObjectId"] = self.configObjectId
+        return wire
+
+    @classmethod
+    def from_wire(cls, wire: dict):
+        obj = cls.__new__(cls)
+        obj.header = wire["header"]
+        obj.hasBody = wire["hasBody"]
+        obj.formatterObjectId = wire["formatterObjectId"]
+        obj.bindRemoteObjectFunctionId = wire["bindRemoteObjectFunctionId"]
+        obj.configObjectId = wire.get("configObjectId")
+        return obj
+
+class RemoteObject(ChromeType):
+    """Mirror object referencing original JavaScript object."""
+    _fields = ('type', 'subtype', 'className', 'value', 'unserializableValue', 'description', 'objectId', 'preview', 'customPreview')
+    __slots__ = _fields
+    _types = {'unserializableValue': UnserializableValue, 'preview': ObjectPreview, 'customPreview': CustomPreview}
+
+    def __init__(self, type: str, subtype: str=None, className: str=None, value: Any=None, unserializableValue: UnserializableValue=None, description: str=None, objectId: RemoteObjectId=None, preview: ObjectPreview=None, customPreview: CustomPreview=None):
+        # Object type.
         self.type = type
-        # User-friendly property value string.
-        self.value = value
-        # Nested value preview.
-        self.valuePreview = valuePreview
         # Object subtype hint. Specified for <code>object</code> type values only.
         self.subtype = subtype
-
-class EntryPreview:
-    def __init__(self, value: "ObjectPreview", key: "ObjectPreview"=None):
-        # Preview of the value.
+        # Object class (constructor) name. Specified for <code>object</code> type values only.
+        self.className = className
+        # Remote object value in case of primitive values or JSON values (if it was requested).
         self.value = value
-        # Preview of the key. Specified for map-like collection entries.
-        self.key = key
+        # Primitive value which can not be JSON-stringified does not have <code>value</code>, but gets this property.
+        self.unserializableValue = unserializableValue
+        # String representation of the object.
+        self.description = description
+        # Unique object identifier (for non-primitive values).
+        self.objectId = objectId
+        # Preview containing abbreviated property values. Specified for <code>object</code> type values only.
+        self.preview = preview
+        self.customPreview = customPreview
 
-class PropertyDescriptor:
+    def to_wire(self):
+        wire = {"type": self.type}
+        if self.subtype is not None:
+            wire["subtype"] = self.subtype
+        if self.className is not None:
+            wire["className"] = self.className
+        if self.value is not None:
+            wire["value"] = self.value
+        if self.unserializableValue is not None:
+            wire["unserializableValue"] = encode(self.unserializableValue)
+        if self.description is not None:
+            wire["description"] = self.description
+        if self.objectId is not None:
+            wire["objectId"] = self.objectId
+        if self.preview is not None:
+            wire["preview"] = encode(self.preview)
+        if self.customPreview is not None:
+            wire["customPreview"] = encode(self.customPreview)
+        return wire
+
+    @classmethod
+    def from_wire(cls, wire: dict):
+        obj = cls.__new__(cls)
+        obj.type = wire["type"]
+        obj.subtype = wire.get("subtype")
+        obj.className = wire.get("className")
+        obj.value = wire.get("value")
+        obj.unserializableValue = UnserializableValue.__members__.get(wire["unserializableValue"], wire["unserializableValue"]) if "unserializableValue" in wire else None
+        obj.description = wire.get("description")
+        obj.objectId = wire.get("objectId")
+        obj.preview = ObjectPreview.from_wire(wire["preview"]) if "preview" in wire else None
+        obj.customPreview = CustomPreview.from_wire(wire["customPreview"]) if "customPreview" in wire else None
+        return obj
+
+class PropertyDescriptor(ChromeType):
     """Object property descriptor."""
-    def __init__(self, name: str, configurable: bool, enumerable: bool, value: "RemoteObject"=None, writable: bool=None, get: "RemoteObject"=None, set: "RemoteObject"=None, wasThrown: bool=None, isOwn: bool=None, symbol: "RemoteObject"=None):
+    _fields = ('name', 'configurable', 'enumerable', 'value', 'writable', 'get', 'set', 'wasThrown', 'isOwn', 'symbol')
+    __slots__ = _fields
+    _types = {'value': RemoteObject, 'get': RemoteObject, 'set': RemoteObject, 'symbol': RemoteObject}
+
+    def __init__(self, name: str, configurable: bool, enumerable: bool, value: RemoteObject=None, writable: bool=None, get: RemoteObject=None, set: RemoteObject=None, wasThrown: bool=None, isOwn: bool=None, symbol: RemoteObject=None):
         # Property name or symbol description.
         self.name = name
         # True if the type of this property descriptor may be changed and if the property may be deleted from the corresponding object.
@@ -102,17 +230,71 @@ class PropertyDescriptor:
         # Property symbol object, if the property is of the <code>symbol</code> type.
         self.symbol = symbol
 
-class InternalPropertyDescriptor:
+    def to_wire(self):
+        wire = {"name": self.name, "configurable": self.configurable, "enumerable": self.enumerable}
+        if self.value is not None:
+            wire["value"] = encode(self.value)
+        if self.writable is not None:
+            wire["writable"] = self.writable
+        if self.get is not None:
+            wire["get"] = encode(self.get)
+        if self.set is not None:
+            wire["set"] = encode(self.set)
+        if self.wasThrown is not None:
+            wire["wasThrown"] = self.wasThrown
+        if self.isOwn is not None:
+            wire["isOwn"] = self.isOwn
+        if self.symbol is not None:
+            wire["symbol"] = encode(self.symbol)
+        return wire
+
+    @classmethod
+    def from_wire(cls, wire: dict):
+        obj = cls.__new__(cls)
+        obj.name = wire["name"]
+        obj.configurable = wire["configurable"]
+        obj.enumerable = wire["enumerable"]
+        obj.value = RemoteObject.from_wire(wire["value"]) if "value" in wire else None
+        obj.writable = wire.get("writable")
+        obj.get = RemoteObject.from_wire(wire["get"]) if "get" in wire else None
+        obj.set = RemoteObject.from_wire(wire["set"]) if "set" in wire else None
+        obj.wasThrown = wire.get("wasThrown")
+        obj.isOwn = wire.get("isOwn")
+        obj.symbol = RemoteObject.from_wire(wire["symbol"]) if "symbol" in wire else None
+        return obj
+
+class InternalPropertyDescriptor(ChromeType):
     """Object internal property descriptor. This property isn't normally visible in JavaScript code."""
-    def __init__(self, name: str, value: "RemoteObject"=None):
+    _fields = ('name', 'value')
+    __slots__ = _fields
+    _types = {'value': RemoteObject}
+
+    def __init__(self, name: str, value: RemoteObject=None):
         # Conventional property name.
         self.name = name
         # The value associated with the property.
         self.value = value
 
-class CallArgument:
+    def to_wire(self):
+        wire = {"name": self.name}
+        if self.value is not None:
+            wire["value"] = encode(self.value)
+        return wire
+
+    @classmethod
+    def from_wire(cls, wire: dict):
+        obj = cls.__new__(cls)
+        obj.name = wire["name"]
+        obj.value = RemoteObject.from_wire(wire["value"]) if "value" in wire else None
+        return obj
+
+class CallArgument(ChromeType):
     """Represents function call argument. Either remote object id <code>objectId</code>, primitive <code>value</code>, unserializable primitive value or neither of (for undefined) them should be specified."""
-    def __init__(self, value: Any=None, unserializableValue: "UnserializableValue"=None, objectId: "RemoteObjectId"=None):
+    _fields = ('value', 'unserializableValue', 'objectId')
+    __slots__ = _fields
+    _types = {'unserializableValue': UnserializableValue}
+
+    def __init__(self, value: Any=None, unserializableValue: UnserializableValue=None, objectId: RemoteObjectId=None):
         # Primitive value.
         self.value = value
         # Primitive value which can not be JSON-stringified.
@@ -120,12 +302,33 @@ class CallArgument:
         # Remote object handle.
         self.objectId = objectId
 
+    def to_wire(self):
+        wire = {}
+        if self.value is not None:
+            wire["value"] = self.value
+        if self.unserializableValue is not None:
+            wire["unserializableValue"] = encode(self.unserializableValue)
+        if self.objectId is not None:
+            wire["objectId"] = self.objectId
+        return wire
+
+    @classmethod
+    def from_wire(cls, wire: dict):
+        obj = cls.__new__(cls)
+        obj.value = wire.get("value")
+        obj.unserializableValue = UnserializableValue.__members__.get(wire["unserializableValue"], wire["unserializableValue"]) if "unserializableValue" in wire else None
+        obj.objectId = wire.get("objectId")
+        return obj
+
 # Id of an execution context.
 ExecutionContextId = int
 
-class ExecutionContextDescription:
+class ExecutionContextDescription(ChromeType):
     """Description of an isolated world."""
-    def __init__(self, id: "ExecutionContextId", origin: str, name: str, auxData: dict=None):
+    _fields = ('id', 'origin', 'name', 'auxData')
+    __slots__ = _fields
+
+    def __init__(self, id: ExecutionContextId, origin: str, name: str, auxData: dict=None):
         # Unique id of the execution context. It can be used to specify in which execution context script evaluation should be performed.
         self.id = id
         # Execution context origin.
@@ -135,9 +338,89 @@ class ExecutionContextDescription:
         # Embedder-specific auxiliary data.
         self.auxData = auxData
 
-class ExceptionDetails:
+    def to_wire(self):
+        wire = {"id": self.id, "origin": self.origin, "name": self.name}
+        if self.auxData is not None:
+            wire["auxData"] = self.auxData
+        return wire
+
+    @classmethod
+    def from_wire(cls, wire: dict):
+        obj = cls.__new__(cls)
+        obj.id = wire["id"]
+        obj.origin = wire["origin"]
+        obj.name = wire["name"]
+        obj.auxData = wire.get("auxData")
+        return obj
+
+class CallFrame(ChromeType):
+    """Stack entry for runtime errors and assertions."""
+    _fields = ('functionName', 'scriptId', 'url', 'lineNumber', 'columnNumber')
+    __slots__ = _fields
+
+    def __init__(self, functionName: str, scriptId: ScriptId, url: str, lineNumber: int, columnNumber: int):
+        # JavaScript function name.
+        self.functionName = functionName
+        # JavaScript script id.
+        self.scriptId = scriptId
+        # JavaScript script name or url.
+        self.url = url
+        # JavaScript script line number (0-based).
+        self.lineNumber = lineNumber
+        # JavaScript script column number (0-based).
+        self.columnNumber = columnNumber
+
+    def to_wire(self):
+        wire = {"functionName": self.functionName, "scriptId": self.scriptId, "url": self.url, "lineNumber": self.lineNumber, "columnNumber": self.columnNumber}
+        return wire
+
+    @classmethod
+    def from_wire(cls, wire: dict):
+        obj = cls.__new__(cls)
+        obj.functionName = wire["functionName"]
+        obj.scriptId = wire["scriptId"]
+        obj.url = wire["url"]
+        obj.lineNumber = wire["lineNumber"]
+        obj.columnNumber = wire["columnNumber"]
+        return obj
+
+class StackTrace(ChromeType):
+    """Call frames for assertions or error messages."""
+    _fields = ('callFrames', 'description', 'parent')
+    __slots__ = _fields
+    _types = {'callFrames': [CallFrame], 'parent': 'Runtime.StackTrace'}
+
+    def __init__(self, callFrames: List, description: str=None, parent: "StackTrace"=None):
+        # JavaScript function name.
+        self.callFrames = callFrames
+        # String label of this stack trace. For async traces this may be a name of the function that initiated the async call.
+        self.description = description
+        # Asynchronous JavaScript stack trace that preceded this stack, if available.
+        self.parent = parent
+
+    def to_wire(self):
+        wire = {"callFrames": encode(self.callFrames)}
+        if self.description is not None:
+            wire["description"] = self.description
+        if self.parent is not None:
+            wire["parent"] = encode(self.parent)
+        return wire
+
+    @classmethod
+    def from_wire(cls, wire: dict):
+        obj = cls.__new__(cls)
+        obj.callFrames = [CallFrame.from_wire(x0) for x0 in wire["callFrames"]]
+        obj.description = wire.get("description")
+        obj.parent = StackTrace.from_wire(wire["parent"]) if "parent" in wire else None
+        return obj
+
+class ExceptionDetails(ChromeType):
     """Detailed information about exception (or error) that was thrown during script compilation or execution."""
-    def __init__(self, exceptionId: int, text: str, lineNumber: int, columnNumber: int, scriptId: "ScriptId"=None, url: str=None, stackTrace: "StackTrace"=None, exception: "RemoteObject"=None, executionContextId: "ExecutionContextId"=None):
+    _fields = ('exceptionId', 'text', 'lineNumber', 'columnNumber', 'scriptId', 'url', 'stackTrace', 'exception', 'executionContextId')
+    __slots__ = _fields
+    _types = {'stackTrace': StackTrace, 'exception': RemoteObject}
+
+    def __init__(self, exceptionId: int, text: str, lineNumber: int, columnNumber: int, scriptId: ScriptId=None, url: str=None, stackTrace: StackTrace=None, exception: RemoteObject=None, executionContextId: ExecutionContextId=None):
         # Exception id.
         self.exceptionId = exceptionId
         # Exception text, which should be used together with exception object when available.
@@ -157,37 +440,53 @@ class ExceptionDetails:
         # Identifier of the context where exception happened.
         self.executionContextId = executionContextId
 
+    def to_wire(self):
+        wire = {"exceptionId": self.exceptionId, "text": self.text, "lineNumber": self.lineNumber, "columnNumber": self.columnNumber}
+        if self.scriptId is not None:
+            wire["scriptId"] = self.scriptId
+        if self.url is not None:
+            wire["url"] = self.url
+        if self.stackTrace is not None:
+            wire["stackTrace"] = encode(self.stackTrace)
+        if self.exception is not None:
+            wire["exception"] = encode(self.exception)
+        if self.executionContextId is not None:
+            wire["executionContextId"] = self.executionContextId
+        return wire
+
+    @classmethod
+    def from_wire(cls, wire: dict):
+        obj = cls.__new__(cls)
+        obj.exceptionId = wire["exceptionId"]
+        obj.text = wire["text"]
+        obj.lineNumber = wire["lineNumber"]
+        obj.columnNumber = wire["columnNumber"]
+        obj.scriptId = wire.get("scriptId")
+        obj.url = wire.get("url")
+        obj.stackTrace = StackTrace.from_wire(wire["stackTrace"]) if "stackTrace" in wire else None
+        obj.exception = RemoteObject.from_wire(wire["exception"]) if "exception" in wire else None
+        obj.executionContextId = wire.get("executionContextId")
+        return obj
+
 # Number of milliseconds since epoch.
 Timestamp = float
 
-class CallFrame:
-    """Stack entry for runtime errors and assertions."""
-    def __init__(self, functionName: str, scriptId: "ScriptId", url: str, lineNumber: int, columnNumber: int):
-        # JavaScript function name.
-        self.functionName = functionName
-        # JavaScript script id.
-        self.scriptId = scriptId
-        # JavaScript script name or url.
-        self.url = url
-        # JavaScript script line number (0-based).
-        self.lineNumber = lineNumber
-        # JavaScript script column number (0-based).
-        self.columnNumber = columnNumber
-
-class StackTrace:
-    """Call frames for assertions or error messages."""
-    def __init__(self, callFrames: List, description: str=None, parent: "StackTrace"=None):
-        # JavaScript function name.
-        self.callFrames = callFrames
-        # String label of this stack trace. For async traces this may be a name of the function that initiated the async call.
-        self.description = description
-        # Asynchronous JavaScript stack trace that preceded this stack, if available.
-        self.parent = parent
+class evaluateResult(ChromeResult):
+    __slots__ = ()
+    _fields = ('result', 'exceptionDetails')
+    # Evaluation result.
+    result: RemoteObject
+    # Exception details.
+    exceptionDetails: ExceptionDetails
+    _types = {'result': RemoteObject, 'exceptionDetails': ExceptionDetails}
 
 class evaluate(ChromeCommand):
     """Evaluates expression on global object."""
+    _fields = ('expression', 'objectGroup', 'includeCommandLineAPI', 'silent', 'contextId', 'returnByValue', 'generatePreview', 'userGesture', 'awaitPromise')
+    __slots__ = _fields
+    _result = evaluateResult
 
-    def __init__(self, expression: str, objectGroup: str=None, includeCommandLineAPI: bool=None, silent: bool=None, contextId: "ExecutionContextId"=None, returnByValue: bool=None, generatePreview: bool=None, userGesture: bool=None, awaitPromise: bool=None):
+    def __init__(self, expression: str, objectGroup: str=None, includeCommandLineAPI: bool=None, silent: bool=None, contextId: ExecutionContextId=None, returnByValue: bool=None, generatePreview: bool=None, userGesture: bool=None, awaitPromise: bool=None):
         # Expression to evaluate.
         self.expression = expression
         # Symbolic group name that can be used to release multiple objects.
@@ -207,12 +506,44 @@ class evaluate(ChromeCommand):
         # Whether execution should wait for promise to be resolved. If the result of evaluation is not a Promise, it's considered to be an error.
         self.awaitPromise = awaitPromise
 
-
+    def to_wire(self):
+        wire = {"expression": self.expression}
+        if self.objectGroup is not None:
+            wire["objectGroup"] = self.objectGroup
+        if self.includeCommandLineAPI is not None:
+            wire["includeCommandLineAPI"] = self.includeCommandLineAPI
+        if self.silent is not None:
+            wire["silent"] = self.silent
+        if self.contextId is not None:
+            wire["contextId"] = self.contextId
+        if self.returnByValue is not None:
+            wire["returnByValue"] = self.returnByValue
+        if self.generatePreview is not None:
+            wire["generatePreview"] = self.generatePreview
+        if self.userGesture is not None:
+            wire["userGesture"] = self.userGesture
+        if self.awaitPromise is not None:
+            wire["awaitPromise"] = self.awaitPromise
+        return wire
+
+
+
+class awaitPromiseResult(ChromeResult):
+    __slots__ = ()
+    _fields = ('result', 'exceptionDetails')
+    # Promise result. Will contain rejected value if promise was rejected.
+    result: RemoteObject
+    # Exception details if stack strace is available.
+    exceptionDetails: ExceptionDetails
+    _types = {'result': RemoteObject, 'exceptionDetails': ExceptionDetails}
 
 class awaitPromise(ChromeCommand):
     """Add handler to promise with given promise object id."""
+    _fields = ('promiseObjectId', 'returnByValue', 'generatePreview')
+    __slots__ = _fields
+    _result = awaitPromiseResult
 
-    def __init__(self, promiseObjectId: "RemoteObjectId", returnByValue: bool=None, generatePreview: bool=None):
+    def __init__(self, promiseObjectId: RemoteObjectId, returnByValue: bool=None, generatePreview: bool=None):
         # Identifier of the promise.
         self.promiseObjectId = promiseObjectId
         # Whether the result is expected to be a JSON object that should be sent by value.
@@ -220,12 +551,32 @@ class awaitPromise(ChromeCommand):
         # Whether preview should be generated for the result.
         self.generatePreview = generatePreview
 
+    def to_wire(self):
+        wire = {"promiseObjectId": self.promiseObjectId}
+        if self.returnByValue is not None:
+            wire["returnByValue"] = self.returnByValue
+        if self.generatePreview is not None:
+            wire["generatePreview"] = self.generatePreview
+        return wire
 
 
+
+class callFunctionOnResult(ChromeResult):
+    __slots__ = ()
+    _fields = ('result', 'exceptionDetails')
+    # Call result.
+    result: RemoteObject
+    # Exception details.
+    exceptionDetails: ExceptionDetails
+    _types = {'result': RemoteObject, 'exceptionDetails': ExceptionDetails}
+
 class callFunctionOn(ChromeCommand):
     """Calls function with given declaration on the given object. Object group of the result is inherited from the target object."""
+    _fields = ('objectId', 'functionDeclaration', 'arguments', 'silent', 'returnByValue', 'generatePreview', 'userGesture', 'awaitPromise')
+    __slots__ = _fields
+    _result = callFunctionOnResult
 
-    def __init__(self, objectId: "RemoteObjectId", functionDeclaration: str, arguments: List=None, silent: bool=None, returnByValue: bool=None, generatePreview: bool=None, userGesture: bool=None, awaitPromise: bool=None):
+    def __init__(self, objectId: RemoteObjectId, functionDeclaration: str, arguments: List=None, silent: bool=None, returnByValue: bool=None, generatePreview: bool=None, userGesture: bool=None, awaitPromise: bool=None):
         # Identifier of the object to call function on.
         self.objectId = objectId
         # Declaration of the function to call.
@@ -243,12 +594,42 @@ class callFunctionOn(ChromeCommand):
         # Whether execution should wait for promise to be resolved. If the result of evaluation is not a Promise, it's considered to be an error.
         self.awaitPromise = awaitPromise
 
-
+    def to_wire(self):
+        wire = {"objectId": self.objectId, "functionDeclaration": self.functionDeclaration}
+        if self.arguments is not None:
+            wire["arguments"] = encode(self.arguments)
+        if self.silent is not None:
+            wire["silent"] = self.silent
+        if self.returnByValue is not None:
+            wire["returnByValue"] = self.returnByValue
+        if self.generatePreview is not None:
+            wire["generatePreview"] = self.generatePreview
+        if self.userGesture is not None:
+            wire["userGesture"] = self.userGesture
+        if self.awaitPromise is not None:
+            wire["awaitPromise"] = self.awaitPromise
+        return wire
+
+
+
+class getPropertiesResult(ChromeResult):
+    __slots__ = ()
+    _fields = ('result', 'internalProperties', 'exceptionDetails')
+    # Object properties.
+    result: List
+    # Internal object properties (only of the element itself).
+    internalProperties: List
+    # Exception details.
+    exceptionDetails: ExceptionDetails
+    _types = {'result': [PropertyDescriptor], 'internalProperties': [InternalPropertyDescriptor], 'exceptionDetails': ExceptionDetails}
 
 class getProperties(ChromeCommand):
     """Returns properties of a given object. Object group of the result is inherited from the target object."""
+    _fields = ('objectId', 'ownProperties', 'accessorPropertiesOnly', 'generatePreview')
+    __slots__ = _fields
+    _result = getPropertiesResult
 
-    def __init__(self, objectId: "RemoteObjectId", ownProperties: bool=None, accessorPropertiesOnly: bool=None, generatePreview: bool=None):
+    def __init__(self, objectId: RemoteObjectId, ownProperties: bool=None, accessorPropertiesOnly: bool=None, generatePreview: bool=None):
         # Identifier of the object to return properties for.
         self.objectId = objectId
         # If true, returns properties belonging only to the element itself, not to its prototype chain.
@@ -258,56 +639,105 @@ class getProperties(ChromeCommand):
         # Whether preview should be generated for the results.
         self.generatePreview = generatePreview
 
+    def to_wire(self):
+        wire = {"objectId": self.objectId}
+        if self.ownProperties is not None:
+            wire["ownProperties"] = self.ownProperties
+        if self.accessorPropertiesOnly is not None:
+            wire["accessorPropertiesOnly"] = self.accessorPropertiesOnly
+        if self.generatePreview is not None:
+            wire["generatePreview"] = self.generatePreview
+        return wire
+
 
 
 class releaseObject(ChromeCommand):
     """Releases remote object with given id."""
+    _fields = ('objectId',)
+    __slots__ = _fields
 
-    def __init__(self, objectId: "RemoteObjectId"):
+    def __init__(self, objectId: RemoteObjectId):
         # Identifier of the object to release.
         self.objectId = objectId
 
+    def to_wire(self):
+        wire = {"objectId": self.objectId}
+        return wire
+
 
 
 class releaseObjectGroup(ChromeCommand):
     """Releases all remote objects that belong to a given group."""
+    _fields = ('objectGroup',)
+    __slots__ = _fields
 
     def __init__(self, objectGroup: str):
         # Symbolic object group name.
         self.objectGroup = objectGroup
 
+    def to_wire(self):
+        wire = {"objectGroup": self.objectGroup}
+        return wire
+
 
 
 class runIfWaitingForDebugger(ChromeCommand):
     """Tells inspected instance to run if it was waiting for debugger to attach."""
+    _fields = ()
+    __slots__ = _fields
 
     def __init__(self): pass
 
 class enable(ChromeCommand):
     """Enables reporting of execution contexts creation by means of <code>executionContextCreated</code> event. When the reporting gets enabled the event will be sent immediately for each existing execution context."""
+    _fields = ()
+    __slots__ = _fields
 
     def __init__(self): pass
 
 class disable(ChromeCommand):
     """Disables reporting of execution contexts creation."""
+    _fields = ()
+    __slots__ = _fields
 
     def __init__(self): pass
 
 class discardConsoleEntries(ChromeCommand):
     """Discards collected exceptions and console API calls."""
+    _fields = ()
+    __slots__ = _fields
 
     def __init__(self): pass
 
 class setCustomObjectFormatterEnabled(ChromeCommand):
+    _fields = ('enabled',)
+    __slots__ = _fields
+
     def __init__(self, enabled: bool):
         self.enabled = enabled
 
+    def to_wire(self):
+        wire = {"enabled": self.enabled}
+        return wire
+
 
 
+class compileScriptResult(ChromeResult):
+    __slots__ = ()
+    _fields = ('scriptId', 'exceptionDetails')
+    # Id of the script.
+    scriptId: ScriptId
+    # Exception details.
+    exceptionDetails: ExceptionDetails
+    _types = {'exceptionDetails': ExceptionDetails}
+
 class compileScript(ChromeCommand):
     """Compiles expression."""
+    _fields = ('expression', 'sourceURL', 'persistScript', 'executionContextId')
+    __slots__ = _fields
+    _result = compileScriptResult
 
-    def __init__(self, expression: str, sourceURL: str, persistScript: bool, executionContextId: "ExecutionContextId"=None):
+    def __init__(self, expression: str, sourceURL: str, persistScript: bool, executionContextId: ExecutionContextId=None):
         # Expression to compile.
         self.expression = expression
         # Source url to be set for the script.
@@ -317,12 +747,30 @@ class compileScript(ChromeCommand):
         # Specifies in which execution context to perform script run. If the parameter is omitted the evaluation will be performed in the context of the inspected page.
         self.executionContextId = executionContextId
 
+    def to_wire(self):
+        wire = {"expression": self.expression, "sourceURL": self.sourceURL, "persistScript": self.persistScript}
+        if self.executionContextId is not None:
+            wire["executionContextId"] = self.executionContextId
+        return wire
+
 
 
+class runScriptResult(ChromeResult):
+    __slots__ = ()
+    _fields = ('result', 'exceptionDetails')
+    # Run result.
+    result: RemoteObject
+    # Exception details.
+    exceptionDetails: ExceptionDetails
+    _types = {'result': RemoteObject, 'exceptionDetails': ExceptionDetails}
+
 class runScript(ChromeCommand):
     """Runs script with given id in a given context."""
+    _fields = ('scriptId', 'executionContextId', 'objectGroup', 'silent', 'includeCommandLineAPI', 'returnByValue', 'generatePreview', 'awaitPromise')
+    __slots__ = _fields
+    _result = runScriptResult
 
-    def __init__(self, scriptId: "ScriptId", executionContextId: "ExecutionContextId"=None, objectGroup: str=None, silent: bool=None, includeCommandLineAPI: bool=None, returnByValue: bool=None, generatePreview: bool=None, awaitPromise: bool=None):
+    def __init__(self, scriptId: ScriptId, executionContextId: ExecutionContextId=None, objectGroup: str=None, silent: bool=None, includeCommandLineAPI: bool=None, returnByValue: bool=None, generatePreview: bool=None, awaitPromise: bool=None):
         # Id of the script to run.
         self.scriptId = scriptId
         # Specifies in which execution context to perform script run. If the parameter is omitted the evaluation will be performed in the context of the inspected page.
@@ -340,5 +788,85 @@ class runScript(ChromeCommand):
         # Whether execution should wait for promise to be resolved. If the result of evaluation is not a Promise, it's considered to be an error.
         self.awaitPromise = awaitPromise
 
-
+    def to_wire(self):
+        wire = {"scriptId": self.scriptId}
+        if self.executionContextId is not None:
+            wire["executionContextId"] = self.executionContextId
+        if self.objectGroup is not None:
+            wire["objectGroup"] = self.objectGroup
+        if self.silent is not None:
+            wire["silent"] = self.silent
+        if self.includeCommandLineAPI is not None:
+            wire["includeCommandLineAPI"] = self.includeCommandLineAPI
+        if self.returnByValue is not None:
+            wire["returnByValue"] = self.returnByValue
+        if self.generatePreview is not None:
+            wire["generatePreview"] = self.generatePreview
+        if self.awaitPromise is not None:
+            wire["awaitPromise"] = self.awaitPromise
+        return wire
+
+
+
+class executionContextCreated(ChromeEvent):
+    """Issued when new execution context is created."""
+    __slots__ = ()
+    _fields = ('context',)
+    # A newly created execution contex.
+    context: ExecutionContextDescription
+    _types = {'context': ExecutionContextDescription}
+
+class executionContextDestroyed(ChromeEvent):
+    """Issued when execution context is destroyed."""
+    __slots__ = ()
+    _fields = ('executionContextId',)
+    # Id of the destroyed context
+    executionContextId: ExecutionContextId
+
+class executionContextsCleared(ChromeEvent):
+    """Issued when all executionContexts were cleared in browser"""
+    __slots__ = ()
+    _fields = ()
+
+class exceptionThrown(ChromeEvent):
+    """Issued when exception was thrown and unhandled."""
+    __slots__ = ()
+    _fields = ('timestamp', 'exceptionDetails')
+    # Timestamp of the exception.
+    timestamp: Timestamp
+    exceptionDetails: ExceptionDetails
+    _types = {'exceptionDetails': ExceptionDetails}
+
+class exceptionRevoked(ChromeEvent):
+    """Issued when unhandled exception was revoked."""
+    __slots__ = ()
+    _fields = ('reason', 'exceptionId')
+    # Reason describing why exception was revoked.
+    reason: str
+    # The id of revoked exception, as reported in <code>exceptionUnhandled</code>.
+    exceptionId: int
+
+class consoleAPICalled(ChromeEvent):
+    """Issued when console API was called."""
+    __slots__ = ()
+    _fields = ('type', 'args', 'executionContextId', 'timestamp', 'stackTrace')
+    # Type of the call.
+    type: str
+    # Call arguments.
+    args: List
+    # Identifier of the context where the call was made.
+    executionContextId: ExecutionContextId
+    # Call timestamp.
+    timestamp: Timestamp
+    # Stack trace captured when the call was made.
+    stackTrace: StackTrace
+    _types = {'args': [RemoteObject], 'stackTrace': StackTrace}
+
+class inspectRequested(ChromeEvent):
+    """Issued when object should be inspected (for example, as a result of inspect() command line API call)."""
+    __slots__ = ()
+    _fields = ('object', 'hints')
+    object: RemoteObject
+    hints: dict
+    _types = {'object': RemoteObject}
 
@@ -1,19 +1,44 @@
+# schema hash: ba1ff797a4452f72cf6759ee3ddf374aa53e33f5
 from enum import Enum
-from typing import Any, List
+from typing import TYPE_CHECKING, Any, List
 
-from .base import ChromeCommand
+from .base import ChromeCommand, ChromeEvent, ChromeResult, ChromeType, encode, resolve
 
 
-class Domain:
+class Domain(ChromeType):
     """Description of the protocol domain."""
+    _fields = ('name', 'version')
+    __slots__ = _fields
+
     def __init__(self, name: str, version: str):
         # Domain name.
         self.name = name
         # Domain version.
         self.version = version
 
+    def to_wire(self):
+        wire = {"name": self.name, "version": self.version}
+        return wire
+
+    @classmethod
+    def from_wire(cls, wire: dict):
+        obj = cls.__new__(cls)
+        obj.name = wire["name"]
+        obj.version = wire["version"]
+        return obj
+
+class getDomainsResult(ChromeResult):
+    __slots__ = ()
+    _fields = ('domains',)
+    # List of supported domains.
+    domains: List
+    _types = {'domains': [Domain]}
+
 class getDomains(ChromeCommand):
     """Returns supported domains."""
+    _fields = ()
+    __slots__ = _fields
+    _result = getDomainsResult
 
     def __init__(self): pass
 
@@ -1,7 +1,8 @@
+# schema hash: 15c6c36d825a3d7beabc73169945a93b8f138d4d
 from enum import Enum
-from typing import Any, List
+from typing import TYPE_CHECKING, Any, List
 
-from .base import ChromeCommand
+from .base import ChromeCommand, ChromeEvent, ChromeResult, ChromeType, encode, resolve
 
 
 # An internal certificate ID value.
@@ -10,9 +11,13 @@ CertificateId = int
 SecurityState = Enum("SecurityState", "unknown neutral insecure warning secure info")
 SecurityState.__doc__ = """The security level of a page or resource."""
 
-class SecurityStateExplanation:
+class SecurityStateExplanation(ChromeType):
     """An explanation of an factor contributing to the security state."""
-    def __init__(self, securityState: "SecurityState", summary: str, description: str, hasCertificate: bool):
+    _fields = ('securityState', 'summary', 'description', 'hasCertificate')
+    __slots__ = _fields
+    _types = {'securityState': SecurityState}
+
+    def __init__(self, securityState: SecurityState, summary: str, description: str, hasCertificate: bool):
         # Security state representing the severity of the factor being explained.
         self.securityState = securityState
         # Short phrase describing the type of factor.
@@ -22,9 +27,26 @@ class SecurityStateExplanation:
         # True if the page has a certificate.
         self.hasCertificate = hasCertificate
 
-class InsecureContentStatus:
+    def to_wire(self):
+        wire = {"securityState": encode(self.securityState), "summary": self.summary, "description": self.description, "hasCertificate": self.hasCertificate}
+        return wire
+
+    @classmethod
+    def from_wire(cls, wire: dict):
+        obj = cls.__new__(cls)
+        obj.securityState = SecurityState.__members__.get(wire["securityState"], wire["securityState"])
+        obj.summary = wire["summary"]
+        obj.description = wire["description"]
+        obj.hasCertificate = wire["hasCertificate"]
+        return obj
+
+class InsecureContentStatus(ChromeType):
     """Information about insecure content on the page."""
-    def __init__(self, ranMixedContent: bool, displayedMixedContent: bool, ranContentWithCertErrors: bool, displayedContentWithCertErrors: bool, ranInsecureContentStyle: "SecurityState", displayedInsecureContentStyle: "SecurityState"):
+    _fields = ('ranMixedContent', 'displayedMixedContent', 'ranContentWithCertErrors', 'displayedContentWithCertErrors', 'ranInsecureContentStyle', 'displayedInsecureContentStyle')
+    __slots__ = _fields
+    _types = {'ranInsecureContentStyle': SecurityState, 'displayedInsecureContentStyle': SecurityState}
+
+    def __init__(self, ranMixedContent: bool, displayedMixedContent: bool, ranContentWithCertErrors: bool, displayedContentWithCertErrors: bool, ranInsecureContentStyle: SecurityState, displayedInsecureContentStyle: SecurityState):
         # True if the page was loaded over HTTPS and ran mixed (HTTP) content such as scripts.
         self.ranMixedContent = ranMixedContent
         # True if the page was loaded over HTTPS and displayed mixed (HTTP) content such as images.
@@ -38,18 +60,55 @@ class InsecureContentStatus:
         # Security state representing a page that displayed insecure content.
         self.displayedInsecureContentStyle = displayedInsecureContentStyle
 
+    def to_wire(self):
+        wire = {"ranMixedContent": self.ranMixedContent, "displayedMixedContent": self.displayedMixedContent, "ranContentWithCertErrors": self.ranContentWithCertErrors, "displayedContentWithCertErrors": self.displayedContentWithCertErrors, "ranInsecureContentStyle": encode(self.ranInsecureContentStyle), "displayedInsecureContentStyle": encode(self.displayedInsecureContentStyle)}
+        return wire
+
+    @classmethod
+    def from_wire(cls, wire: dict):
+        obj = cls.__new__(cls)
+        obj.ranMixedContent = wire["ranMixedContent"]
+        obj.displayedMixedContent = wire["displayedMixedContent"]
+        obj.ranContentWithCertErrors = wire["ranContentWithCertErrors"]
+        obj.displayedContentWithCertErrors = wire["displayedContentWithCertErrors"]
+        obj.ranInsecureContentStyle = SecurityState.__members__.get(wire["ranInsecureContentStyle"], wire["ranInsecureContentStyle"])
+        obj.displayedInsecureContentStyle = SecurityState.__members__.get(wire["displayedInsecureContentStyle"], wire["displayedInsecureContentStyle"])
+        return obj
+
 class enable(ChromeCommand):
     """Enables tracking security state changes."""
+    _fields = ()
+    __slots__ = _fields
 
     def __init__(self): pass
 
 class disable(ChromeCommand):
     """Disables tracking security state changes."""
+    _fields = ()
+    __slots__ = _fields
 
     def __init__(self): pass
 
 class showCertificateViewer(ChromeCommand):
     """Displays native dialog with the certificate details."""
+    _fields = ()
+    __slots__ = _fields
 
     def __init__(self): pass
 
+class securityStateChanged(ChromeEvent):
+    """The security state of the page changed."""
+    __slots__ = ()
+    _fields = ('securityState', 'schemeIsCryptographic', 'explanations', 'insecureContentStatus', 'summary')
+    # Security state.
+    securityState: SecurityState
+    # True if the page was loaded over cryptographic transport such as HTTPS.
+    schemeIsCryptographic: bool
+    # List of explanations for the security state. If the overall security state is `insecure` or `warning`, at least one corresponding explanation should be included.
+    explanations: List
+    # Information about insecure content on the page.
+    insecureContentStatus: InsecureContentStatus
+    # Overrides user-visible description of the state.
+    summary: str
+    _types = {'securityState': SecurityState, 'explanations': [SecurityStateExplanation], 'insecureContentStatus': InsecureContentStatus}
+
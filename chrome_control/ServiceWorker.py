@@ -1,26 +1,47 @@
+# schema hash: 19a243c411f51af0a89aa57ea5dd937accd21d5a
 from enum import Enum
-from typing import Any, List
+from typing import TYPE_CHECKING, Any, List
 
-from .base import ChromeCommand
+from .base import ChromeCommand, ChromeEvent, ChromeResult, ChromeType, encode, resolve
 
-from . import Target
+if TYPE_CHECKING:
+    from . import Target
 
-class ServiceWorkerRegistration:
+class ServiceWorkerRegistration(ChromeType):
     """ServiceWorker registration."""
+    _fields = ('registrationId', 'scopeURL', 'isDeleted')
+    __slots__ = _fields
+
     def __init__(self, registrationId: str, scopeURL: str, isDeleted: bool):
         self.registrationId = registrationId
         self.scopeURL = scopeURL
         self.isDeleted = isDeleted
 
+    def to_wire(self):
+        wire = {"registrationId": self.registrationId, "scopeURL": self.scopeURL, "isDeleted": self.isDeleted}
+        return wire
+
+    @classmethod
+    def from_wire(cls, wire: dict):
+        obj = cls.__new__(cls)
+        obj.registrationId = wire["registrationId"]
+        obj.scopeURL = wire["scopeURL"]
+        obj.isDeleted = wire["isDeleted"]
+        return obj
+
 ServiceWorkerVersionRunningStatus = Enum("ServiceWorkerVersionRunningStatus", "stopped starting running stopping")
 ServiceWorkerVersionRunningStatus.__doc__ = """"""
 
 ServiceWorkerVersionStatus = Enum("ServiceWorkerVersionStatus", "new installing installed activating activated redundant")
 ServiceWorkerVersionStatus.__doc__ = """"""
 
-class ServiceWorkerVersion:
+class ServiceWorkerVersion(ChromeType):
     """ServiceWorker version."""
-    def __init__(self, versionId: str, registrationId: str, scriptURL: str, runningStatus: "ServiceWorkerVersionRunningStatus", status: "ServiceWorkerVersionStatus", scriptLastModified: float=None, scriptResponseTime: float=None, controlledClients: List=None, targetId: "Target.TargetID"=None):
+    _fields = ('versionId', 'registrationId', 'scriptURL', 'runningStatus', 'status', 'scriptLastModified', 'scriptResponseTime', 'controlledClients', 'targetId')
+    __slots__ = _fields
+    _types = {'runningStatus': ServiceWorkerVersionRunningStatus, 'status': ServiceWorkerVersionStatus}
+
+    def __init__(self, versionId: str, registrationId: str, scriptURL: str, runningStatus: ServiceWorkerVersionRunningStatus, status: ServiceWorkerVersionStatus, scriptLastModified: float=None, scriptResponseTime: float=None, controlledClients: List=None, targetId: "Target.TargetID"=None):
         self.versionId = versionId
         self.registrationId = registrationId
         self.scriptURL = scriptURL
@@ -33,8 +54,37 @@ class ServiceWorkerVersion:
         self.controlledClients = controlledClients
         self.targetId = targetId
 
-class ServiceWorkerErrorMessage:
+    def to_wire(self):
+        wire = {"versionId": self.versionId, "registrationId": self.registrationId, "scriptURL": self.scriptURL, "runningStatus": encode(self.runningStatus), "status": encode(self.status)}
+        if self.scriptLastModified is not None:
+            wire["scriptLastModified"] = self.scriptLastModified
+        if self.scriptResponseTime is not None:
+            wire["scriptResponseTime"] = self.scriptResponseTime
+        if self.controlledClients is not None:
+            wire["controlledClients"] = self.controlledClients
+        if self.targetId is not None:
+            wire["targetId"] = self.targetId
+        return wire
+
+    @classmethod
+    def from_wire(cls, wire: dict):
+        obj = cls.__new__(cls)
+        obj.versionId = wire["versionId"]
+        obj.registrationId = wire["registrationId"]
+        obj.scriptURL = wire["scriptURL"]
+        obj.runningStatus = ServiceWorkerVersionRunningStatus.__members__.get(wire["runningStatus"], wire["runningStatus"])
+        obj.status = ServiceWorkerVersionStatus.__members__.get(wire["status"], wire["status"])
+        obj.scriptLastModified = wire.get("scriptLastModified")
+        obj.scriptResponseTime = wire.get("scriptResponseTime")
+        obj.controlledClients = wire.get("controlledClients")
+        obj.targetId = wire.get("targetId")
+        return obj
+
+class ServiceWorkerErrorMessage(ChromeType):
     """ServiceWorker error message."""
+    _fields = ('errorMessage', 'registrationId', 'versionId', 'sourceURL', 'lineNumber', 'columnNumber')
+    __slots__ = _fields
+
     def __init__(self, errorMessage: str, registrationId: str, versionId: str, sourceURL: str, lineNumber: int, columnNumber: int):
         self.errorMessage = errorMessage
         self.registrationId = registrationId
@@ -43,68 +93,170 @@ class ServiceWorkerErrorMessage:
         self.lineNumber = lineNumber
         self.columnNumber = columnNumber
 
+    def to_wire(self):
+        wire = {"errorMessage": self.errorMessage, "registrationId": self.registrationId, "versionId": self.versionId, "sourceURL": self.sourceURL, "lineNumber": self.lineNumber, "columnNumber": self.columnNumber}
+        return wire
+
+    @classmethod
+    def from_wire(cls, wire: dict):
+        obj = cls.__new__(cls)
+        obj.errorMessage = wire["errorMessage"]
+        obj.registrationId = wire["registrationId"]
+        obj.versionId = wire["versionId"]
+        obj.sourceURL = wire["sourceURL"]
+        obj.lineNumber = wire["lineNumber"]
+        obj.columnNumber = wire["columnNumber"]
+        return obj
+
 class enable(ChromeCommand):
+    _fields = ()
+    __slots__ = _fields
+
     def __init__(self): pass
 
 class disable(ChromeCommand):
+    _fields = ()
+    __slots__ = _fields
+
     def __init__(self): pass
 
 class unregister(ChromeCommand):
+    _fields = ('scopeURL',)
+    __slots__ = _fields
+
     def __init__(self, scopeURL: str):
         self.scopeURL = scopeURL
 
+    def to_wire(self):
+        wire = {"scopeURL": self.scopeURL}
+        return wire
+
 
 
 class updateRegistration(ChromeCommand):
+    _fields = ('scopeURL',)
+    __slots__ = _fields
+
     def __init__(self, scopeURL: str):
         self.scopeURL = scopeURL
 
+    def to_wire(self):
+        wire = {"scopeURL": self.scopeURL}
+        return wire
+
 
 
 class startWorker(ChromeCommand):
+    _fields = ('scopeURL',)
+    __slots__ = _fields
+
     def __init__(self, scopeURL: str):
         self.scopeURL = scopeURL
 
+    def to_wire(self):
+        wire = {"scopeURL": self.scopeURL}
+        return wire
+
 
 
 class skipWaiting(ChromeCommand):
+    _fields = ('scopeURL',)
+    __slots__ = _fields
+
     def __init__(self, scopeURL: str):
         self.scopeURL = scopeURL
 
+    def to_wire(self):
+        wire = {"scopeURL": self.scopeURL}
+        return wire
+
 
 
 class stopWorker(ChromeCommand):
+    _fields = ('versionId',)
+    __slots__ = _fields
+
     def __init__(self, versionId: str):
         self.versionId = versionId
 
+    def to_wire(self):
+        wire = {"versionId": self.versionId}
+        return wire
+
 
 
 class inspectWorker(ChromeCommand):
+    _fields = ('versionId',)
+    __slots__ = _fields
+
     def __init__(self, versionId: str):
         self.versionId = versionId
 
+    def to_wire(self):
+        wire = {"versionId": self.versionId}
+        return wire
+
 
 
 class setForceUpdateOnPageLoad(ChromeCommand):
+    _fields = ('forceUpdateOnPageLoad',)
+    __slots__ = _fields
+
     def __init__(self, forceUpdateOnPageLoad: bool):
         self.forceUpdateOnPageLoad = forceUpdateOnPageLoad
 
+    def to_wire(self):
+        wire = {"forceUpdateOnPageLoad": self.forceUpdateOnPageLoad}
+        return wire
+
 
 
 class deliverPushMessage(ChromeCommand):
+    _fields = ('origin', 'registrationId', 'data')
+    __slots__ = _fields
+
     def __init__(self, origin: str, registrationId: str, data: str):
         self.origin = origin
         self.registrationId = registrationId
         self.data = data
 
+    def to_wire(self):
+        wire = {"origin": self.origin, "registrationId": self.registrationId, "data": self.data}
+        return wire
+
 
 
 class dispatchSyncEvent(ChromeCommand):
+    _fields = ('origin', 'registrationId', 'tag', 'lastChance')
+    __slots__ = _fields
+
     def __init__(self, origin: str, registrationId: str, tag: str, lastChance: bool):
         self.origin = origin
         self.registrationId = registrationId
         self.tag = tag
         self.lastChance = lastChance
 
+    def to_wire(self):
+        wire = {"origin": self.origin, "registrationId": self.registrationId, "tag": self.tag, "lastChance": self.lastChance}
+        return wire
+
+
+
+class workerRegistrationUpdated(ChromeEvent):
+    __slots__ = ()
+    _fields = ('registrations',)
+    registrations: List
+    _types = {'registrations': [ServiceWorkerRegistration]}
+
+class workerVersionUpdated(ChromeEvent):
+    __slots__ = ()
+    _fields = ('versions',)
+    versions: List
+    _types = {'versions': [ServiceWorkerVersion]}
 
+class workerErrorReported(ChromeEvent):
+    __slots__ = ()
+    _fields = ('errorMessage',)
+    errorMessage: ServiceWorkerErrorMessage
+    _types = {'errorMessage': ServiceWorkerErrorMessage}
 
@@ -1,7 +1,8 @@
+# schema hash: ba128d132054264d0081ccb9c523faa4d925aeda
 from enum import Enum
-from typing import Any, List
+from typing import TYPE_CHECKING, Any, List
 
-from .base import ChromeCommand
+from .base import ChromeCommand, ChromeEvent, ChromeResult, ChromeType, encode, resolve
 
 
 StorageType = Enum("StorageType", "appcache cookies file_systems indexeddb local_storage shader_cache websql service_workers cache_storage all")
@@ -9,6 +10,8 @@ StorageType.__doc__ = """Enum of possible storage types."""
 
 class clearDataForOrigin(ChromeCommand):
     """Clears storage for origin."""
+    _fields = ('origin', 'storageTypes')
+    __slots__ = _fields
 
     def __init__(self, origin: str, storageTypes: str):
         # Security origin.
@@ -16,5 +19,9 @@ class clearDataForOrigin(ChromeCommand):
         # Comma separated origin names.
         self.storageTypes = storageTypes
 
+    def to_wire(self):
+        wire = {"origin": self.origin, "storageTypes": self.storageTypes}
+        return wire
+
 
 
@@ -1,11 +1,15 @@
+# schema hash: 471bebf8446ebdfaff198ad64b72f3f05e8f8005
 from enum import Enum
-from typing import Any, List
+from typing import TYPE_CHECKING, Any, List
 
-from .base import ChromeCommand
+from .base import ChromeCommand, ChromeEvent, ChromeResult, ChromeType, encode, resolve
 
 
-class GPUDevice:
+class GPUDevice(ChromeType):
     """Describes a single graphics processor (GPU)."""
+    _fields = ('vendorId', 'deviceId', 'vendorString', 'deviceString')
+    __slots__ = _fields
+
     def __init__(self, vendorId: float, deviceId: float, vendorString: str, deviceString: str):
         # PCI ID of the GPU vendor, if available; 0 otherwise.
         self.vendorId = vendorId
@@ -16,8 +20,25 @@ class GPUDevice:
         # String description of the GPU device, if the PCI ID is not available.
         self.deviceString = deviceString
 
-class GPUInfo:
+    def to_wire(self):
+        wire = {"vendorId": self.vendorId, "deviceId": self.deviceId, "vendorString": self.vendorString, "deviceString": self.deviceString}
+        return wire
+
+    @classmethod
+    def from_wire(cls, wire: dict):
+        obj = cls.__new__(cls)
+        obj.vendorId = wire["vendorId"]
+        obj.deviceId = wire["deviceId"]
+        obj.vendorString = wire["vendorString"]
+        obj.deviceString = wire["deviceString"]
+        return obj
+
+class GPUInfo(ChromeType):
     """Provides information about the GPU(s) on the system."""
+    _fields = ('devices', 'driverBugWorkarounds', 'auxAttributes', 'featureStatus')
+    __slots__ = _fields
+    _types = {'devices': [GPUDevice]}
+
     def __init__(self, devices: List, driverBugWorkarounds: List, auxAttributes: dict=None, featureStatus: dict=None):
         # The graphics devices on the system. Element 0 is the primary GPU.
         self.devices = devices
@@ -28,8 +49,39 @@ class GPUInfo:
         # An optional dictionary of graphics features and their status.
         self.featureStatus = featureStatus
 
+    def to_wire(self):
+        wire = {"devices": encode(self.devices), "driverBugWorkarounds": self.driverBugWorkarounds}
+        if self.auxAttributes is not None:
+            wire["auxAttributes"] = self.auxAttributes
+        if self.featureStatus is not None:
+            wire["featureStatus"] = self.featureStatus
+        return wire
+
+    @classmethod
+    def from_wire(cls, wire: dict):
+        obj = cls.__new__(cls)
+        obj.devices = [GPUDevice.from_wire(x0) for x0 in wire["devices"]]
+        obj.driverBugWorkarounds = wire["driverBugWorkarounds"]
+        obj.auxAttributes = wire.get("auxAttributes")
+        obj.featureStatus = wire.get("featureStatus")
+        return obj
+
+class getInfoResult(ChromeResult):
+    __slots__ = ()
+    _fields = ('gpu', 'modelName', 'modelVersion')
+    # Information about the GPUs on the system.
+    gpu: GPUInfo
+    # A platform-dependent description of the model of the machine. On Mac OS, this is, for example, 'MacBookPro'. Will be the empty string if not supported.
+    modelName: str
+    # A platform-dependent description of the version of the machine. On Mac OS, this is, for example, '10.1'. Will be the empty string if not supported.
+    modelVersion: str
+    _types = {'gpu': GPUInfo}
+
 class getInfo(ChromeCommand):
     """Returns information about the system."""
+    _fields = ()
+    __slots__ = _fields
+    _result = getInfoResult
 
     def __init__(self): pass
 
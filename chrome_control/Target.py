@@ -1,36 +1,75 @@
+# schema hash: df1d8286cd9481713877a863672eff0985b1c0da
 from enum import Enum
-from typing import Any, List
+from typing import TYPE_CHECKING, Any, List
 
-from .base import ChromeCommand
+from .base import ChromeCommand, ChromeEvent, ChromeResult, ChromeType, encode, resolve
 
 
 TargetID = str
 
 BrowserContextID = str
 
-class TargetInfo:
-    def __init__(self, targetId: "TargetID", type: str, title: str, url: str):
+class TargetInfo(ChromeType):
+    _fields = ('targetId', 'type', 'title', 'url')
+    __slots__ = _fields
+
+    def __init__(self, targetId: TargetID, type: str, title: str, url: str):
         self.targetId = targetId
         self.type = type
         self.title = title
         self.url = url
 
-class RemoteLocation:
+    def to_wire(self):
+        wire = {"targetId": self.targetId, "type": self.type, "title": self.title, "url": self.url}
+        return wire
+
+    @classmethod
+    def from_wire(cls, wire: dict):
+        obj = cls.__new__(cls)
+        obj.targetId = wire["targetId"]
+        obj.type = wire["type"]
+        obj.title = wire["title"]
+        obj.url = wire["url"]
+        return obj
+
+class RemoteLocation(ChromeType):
+    _fields = ('host', 'port')
+    __slots__ = _fields
+
     def __init__(self, host: str, port: int):
         self.host = host
         self.port = port
 
+    def to_wire(self):
+        wire = {"host": self.host, "port": self.port}
+        return wire
+
+    @classmethod
+    def from_wire(cls, wire: dict):
+        obj = cls.__new__(cls)
+        obj.host = wire["host"]
+        obj.port = wire["port"]
+        return obj
+
 class setDiscoverTargets(ChromeCommand):
     """Controls whether to discover available targets and notify via <code>targetCreated/targetDestroyed</code> events."""
+    _fields = ('discover',)
+    __slots__ = _fields
 
     def __init__(self, discover: bool):
         # Whether to discover available targets.
         self.discover = discover
 
+    def to_wire(self):
+        wire = {"discover": self.discover}
+        return wire
+
 
 
 class setAutoAttach(ChromeCommand):
     """Controls whether to automatically attach to new targets which are considered to be related to this one. When turned on, attaches to all existing related targets as well. When turned off, automatically detaches from all currently attached targets."""
+    _fields = ('autoAttach', 'waitForDebuggerOnStart')
+    __slots__ = _fields
 
     def __init__(self, autoAttach: bool, waitForDebuggerOnStart: bool):
         # Whether to auto-attach to related targets.
@@ -38,90 +77,193 @@ class setAutoAttach(ChromeCommand):
         # Whether to pause new targets when attaching to them. Use <code>Runtime.runIfWaitingForDebugger</code> to run paused targets.
         self.waitForDebuggerOnStart = waitForDebuggerOnStart
 
+    def to_wire(self):
+        wire = {"autoAttach": self.autoAttach, "waitForDebuggerOnStart": self.waitForDebuggerOnStart}
+        return wire
+
 
 
 class setAttachToFrames(ChromeCommand):
+    _fields = ('value',)
+    __slots__ = _fields
+
     def __init__(self, value: bool):
         # Whether to attach to frames.
         self.value = value
 
+    def to_wire(self):
+        wire = {"value": self.value}
+        return wire
+
 
 
 class setRemoteLocations(ChromeCommand):
     """Enables target discovery for the specified locations, when <code>setDiscoverTargets</code> was set to <code>true</code>."""
+    _fields = ('locations',)
+    __slots__ = _fields
 
     def __init__(self, locations: List):
         # List of remote locations.
         self.locations = locations
 
+    def to_wire(self):
+        wire = {"locations": encode(self.locations)}
+        return wire
+
 
 
 class sendMessageToTarget(ChromeCommand):
     """Sends protocol message to the target with given id."""
+    _fields = ('targetId', 'message')
+    __slots__ = _fields
 
     def __init__(self, targetId: str, message: str):
         self.targetId = targetId
         self.message = message
 
+    def to_wire(self):
+        wire = {"targetId": self.targetId, "message": self.message}
+        return wire
 
 
+
+class getTargetInfoResult(ChromeResult):
+    __slots__ = ()
+    _fields = ('targetInfo',)
+    targetInfo: TargetInfo
+    _types = {'targetInfo': TargetInfo}
+
 class getTargetInfo(ChromeCommand):
     """Returns information about a target."""
+    _fields = ('targetId',)
+    __slots__ = _fields
+    _result = getTargetInfoResult
 
-    def __init__(self, targetId: "TargetID"):
+    def __init__(self, targetId: TargetID):
         self.targetId = targetId
 
+    def to_wire(self):
+        wire = {"targetId": self.targetId}
+        return wire
+
 
 
 class activateTarget(ChromeCommand):
     """Activates (focuses) the target."""
+    _fields = ('targetId',)
+    __slots__ = _fields
 
-    def __init__(self, targetId: "TargetID"):
+    def __init__(self, targetId: TargetID):
         self.targetId = targetId
 
+    def to_wire(self):
+        wire = {"targetId": self.targetId}
+        return wire
 
 
+
+class closeTargetResult(ChromeResult):
+    __slots__ = ()
+    _fields = ('success',)
+    success: bool
+
 class closeTarget(ChromeCommand):
     """Closes the target. If the target is a page that gets closed too."""
+    _fields = ('targetId',)
+    __slots__ = _fields
+    _result = closeTargetResult
 
-    def __init__(self, targetId: "TargetID"):
+    def __init__(self, targetId: TargetID):
         self.targetId = targetId
 
+    def to_wire(self):
+        wire = {"targetId": self.targetId}
+        return wire
+
+
 
+class attachToTargetResult(ChromeResult):
+    __slots__ = ()
+    _fields = ('success',)
+    # Whether attach succeeded.
+    success: bool
 
 class attachToTarget(ChromeCommand):
     """Attaches to the target with given id."""
+    _fields = ('targetId',)
+    __slots__ = _fields
+    _result = attachToTargetResult
 
-    def __init__(self, targetId: "TargetID"):
+    def __init__(self, targetId: TargetID):
         self.targetId = targetId
 
+    def to_wire(self):
+        wire = {"targetId": self.targetId}
+        return wire
+
 
 
 class detachFromTarget(ChromeCommand):
     """Detaches from the target with given id."""
+    _fields = ('targetId',)
+    __slots__ = _fields
 
-    def __init__(self, targetId: "TargetID"):
+    def __init__(self, targetId: TargetID):
         self.targetId = targetId
 
+    def to_wire(self):
+        wire = {"targetId": self.targetId}
+        return wire
+
+
 
+class createBrowserContextResult(ChromeResult):
+    __slots__ = ()
+    _fields = ('browserContextId',)
+    # The id of the context created.
+    browserContextId: BrowserContextID
 
 class createBrowserContext(ChromeCommand):
     """Creates a new empty BrowserContext. Similar to an incognito profile but you can have more than one."""
+    _fields = ()
+    __slots__ = _fields
+    _result = createBrowserContextResult
 
     def __init__(self): pass
 
+class disposeBrowserContextResult(ChromeResult):
+    __slots__ = ()
+    _fields = ('success',)
+    success: bool
+
 class disposeBrowserContext(ChromeCommand):
     """Deletes a BrowserContext, will fail of any open page uses it."""
+    _fields = ('browserContextId',)
+    __slots__ = _fields
+    _result = disposeBrowserContextResult
 
-    def __init__(self, browserContextId: "BrowserContextID"):
+    def __init__(self, browserContextId: BrowserContextID):
         self.browserContextId = browserContextId
 
+    def to_wire(self):
+        wire = {"browserContextId": self.browserContextId}
+        return wire
+
+
 
+class createTargetResult(ChromeResult):
+    __slots__ = ()
+    _fields = ('targetId',)
+    # The id of the page opened.
+    targetId: TargetID
 
 class createTarget(ChromeCommand):
     """Creates a new page."""
+    _fields = ('url', 'width', 'height', 'browserContextId')
+    __slots__ = _fields
+    _result = createTargetResult
 
-    def __init__(self, url: str, width: int=None, height: int=None, browserContextId: "BrowserContextID"=None):
+    def __init__(self, url: str, width: int=None, height: int=None, browserContextId: BrowserContextID=None):
         # The initial URL the page will be navigated to.
         self.url = url
         # Frame width in DIP (headless chrome only).
@@ -131,10 +273,64 @@ class createTarget(ChromeCommand):
         # The browser context to create the page in (headless chrome only).
         self.browserContextId = browserContextId
 
+    def to_wire(self):
+        wire = {"url": self.url}
+        if self.width is not None:
+            wire["width"] = self.width
+        if self.height is not None:
+            wire["height"] = self.height
+        if self.browserContextId is not None:
+            wire["browserContextId"] = self.browserContextId
+        return wire
 
 
+
+class getTargetsResult(ChromeResult):
+    __slots__ = ()
+    _fields = ('targetInfos',)
+    # The list of targets.
+    targetInfos: List
+    _types = {'targetInfos': [TargetInfo]}
+
 class getTargets(ChromeCommand):
     """Retrieves a list of available targets."""
+    _fields = ()
+    __slots__ = _fields
+    _result = getTargetsResult
 
     def __init__(self): pass
 
+class targetCreated(ChromeEvent):
+    """Issued when a possible inspection target is created."""
+    __slots__ = ()
+    _fields = ('targetInfo',)
+    targetInfo: TargetInfo
+    _types = {'targetInfo': TargetInfo}
+
+class targetDestroyed(ChromeEvent):
+    """Issued when a target is destroyed."""
+    __slots__ = ()
+    _fields = ('targetId',)
+    targetId: TargetID
+
+class attachedToTarget(ChromeEvent):
+    """Issued when attached to target because of auto-attach or <code>attachToTarget</code> command."""
+    __slots__ = ()
+    _fields = ('targetInfo', 'waitingForDebugger')
+    targetInfo: TargetInfo
+    waitingForDebugger: bool
+    _types = {'targetInfo': TargetInfo}
+
+class detachedFromTarget(ChromeEvent):
+    """Issued when detached from target for any reason (including <code>detachFromTarget</code> command)."""
+    __slots__ = ()
+    _fields = ('targetId',)
+    targetId: TargetID
+
+class receivedMessageFromTarget(ChromeEvent):
+    """Notifies about new protocol message from attached target."""
+    __slots__ = ()
+    _fields = ('targetId', 'message')
+    targetId: TargetID
+    message: str
+
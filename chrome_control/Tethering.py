@@ -1,24 +1,46 @@
+# schema hash: 96bb8e7e399ec1ac0d49992cde7d5bc7dc90dcce
 from enum import Enum
-from typing import Any, List
+from typing import TYPE_CHECKING, Any, List
 
-from .base import ChromeCommand
+from .base import ChromeCommand, ChromeEvent, ChromeResult, ChromeType, encode, resolve
 
 
 class bind(ChromeCommand):
     """Request browser port binding."""
+    _fields = ('port',)
+    __slots__ = _fields
 
     def __init__(self, port: int):
         # Port number to bind.
         self.port = port
 
+    def to_wire(self):
+        wire = {"port": self.port}
+        return wire
+
 
 
 class unbind(ChromeCommand):
     """Request browser port unbinding."""
+    _fields = ('port',)
+    __slots__ = _fields
 
     def __init__(self, port: int):
         # Port number to unbind.
         self.port = port
 
+    def to_wire(self):
+        wire = {"port": self.port}
+        return wire
+
+
 
+class accepted(ChromeEvent):
+    """Informs that port was successfully bound and got a specified connection id."""
+    __slots__ = ()
+    _fields = ('port', 'connectionId')
+    # Port number that was successfully bound.
+    port: int
+    # Connection id to be used.
+    connectionId: str
 
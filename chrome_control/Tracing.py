@@ -1,13 +1,19 @@
+# schema hash: 5fe4157d052766dc60dc85ed4500579e83510bb5
 from enum import Enum
-from typing import Any, List
+from typing import TYPE_CHECKING, Any, List
 
-from .base import ChromeCommand
+from .base import ChromeCommand, ChromeEvent, ChromeResult, ChromeType, encode, resolve
 
+if TYPE_CHECKING:
+    from . import IO
 
 class MemoryDumpConfig: pass
 
-class TraceConfig:
-    def __init__(self, recordMode: str=None, enableSampling: bool=None, enableSystrace: bool=None, enableArgumentFilter: bool=None, includedCategories: List=None, excludedCategories: List=None, syntheticDelays: List=None, memoryDumpConfig: "MemoryDumpConfig"=None):
+class TraceConfig(ChromeType):
+    _fields = ('recordMode', 'enableSampling', 'enableSystrace', 'enableArgumentFilter', 'includedCategories', 'excludedCategories', 'syntheticDelays', 'memoryDumpConfig')
+    __slots__ = _fields
+
+    def __init__(self, recordMode: str=None, enableSampling: bool=None, enableSystrace: bool=None, enableArgumentFilter: bool=None, includedCategories: List=None, excludedCategories: List=None, syntheticDelays: List=None, memoryDumpConfig: MemoryDumpConfig=None):
         # Controls how the trace buffer stores data.
         self.recordMode = recordMode
         # Turns on JavaScript stack sampling.
@@ -25,10 +31,45 @@ class TraceConfig:
         # Configuration for memory dump triggers. Used only when "memory-infra" category is enabled.
         self.memoryDumpConfig = memoryDumpConfig
 
+    def to_wire(self):
+        wire = {}
+        if self.recordMode is not None:
+            wire["recordMode"] = self.recordMode
+        if self.enableSampling is not None:
+            wire["enableSampling"] = self.enableSampling
+        if self.enableSystrace is not None:
+            wire["enableSystrace"] = self.enableSystrace
+        if self.enableArgumentFilter is not None:
+            wire["enableArgumentFilter"] = self.enableArgumentFilter
+        if self.includedCategories is not None:
+            wire["includedCategories"] = self.includedCategories
+        if self.excludedCategories is not None:
+            wire["excludedCategories"] = self.excludedCategories
+        if self.syntheticDelays is not None:
+            wire["syntheticDelays"] = self.syntheticDelays
+        if self.memoryDumpConfig is not None:
+            wire["memoryDumpConfig"] = self.memoryDumpConfig
+        return wire
+
+    @classmethod
+    def from_wire(cls, wire: dict):
+        obj = cls.__new__(cls)
+        obj.recordMode = wire.get("recordMode")
+        obj.enableSampling = wire.get("enableSampling")
+        obj.enableSystrace = wire.get("enableSystrace")
+        obj.enableArgumentFilter = wire.get("enableArgumentFilter")
+        obj.includedCategories = wire.get("includedCategories")
+        obj.excludedCategories = wire.get("excludedCategories")
+        obj.syntheticDelays = wire.get("syntheticDelays")
+        obj.memoryDumpConfig = wire.get("memoryDumpConfig")
+        return obj
+
 class start(ChromeCommand):
     """Start trace events collection."""
+    _fields = ('categories', 'options', 'bufferUsageReportingInterval', 'transferMode', 'traceConfig')
+    __slots__ = _fields
 
-    def __init__(self, categories: str=None, options: str=None, bufferUsageReportingInterval: float=None, transferMode: str=None, traceConfig: "TraceConfig"=None):
+    def __init__(self, categories: str=None, options: str=None, bufferUsageReportingInterval: float=None, transferMode: str=None, traceConfig: TraceConfig=None):
         # Category/tag filter
         self.categories = categories
         # Tracing options
@@ -40,29 +81,94 @@ class start(ChromeCommand):
         # 
         self.traceConfig = traceConfig
 
+    def to_wire(self):
+        wire = {}
+        if self.categories is not None:
+            wire["categories"] = self.categories
+        if self.options is not None:
+            wire["options"] = self.options
+        if self.bufferUsageReportingInterval is not None:
+            wire["bufferUsageReportingInterval"] = self.bufferUsageReportingInterval
+        if self.transferMode is not None:
+            wire["transferMode"] = self.transferMode
+        if self.traceConfig is not None:
+            wire["traceConfig"] = encode(self.traceConfig)
+        return wire
+
 
 
 class end(ChromeCommand):
     """Stop trace events collection."""
+    _fields = ()
+    __slots__ = _fields
 
     def __init__(self): pass
 
+class getCategoriesResult(ChromeResult):
+    __slots__ = ()
+    _fields = ('categories',)
+    # A list of supported tracing categories.
+    categories: List
+
 class getCategories(ChromeCommand):
     """Gets supported tracing categories."""
+    _fields = ()
+    __slots__ = _fields
+    _result = getCategoriesResult
 
     def __init__(self): pass
 
+class requestMemoryDumpResult(ChromeResult):
+    __slots__ = ()
+    _fields = ('dumpGuid', 'success')
+    # GUID of the resulting global memory dump.
+    dumpGuid: str
+    # True iff the global memory dump succeeded.
+    success: bool
+
 class requestMemoryDump(ChromeCommand):
     """Request a global memory dump."""
+    _fields = ()
+    __slots__ = _fields
+    _result = requestMemoryDumpResult
 
     def __init__(self): pass
 
 class recordClockSyncMarker(ChromeCommand):
     """Record a clock sync marker in the trace."""
+    _fields = ('syncId',)
+    __slots__ = _fields
 
     def __init__(self, syncId: str):
         # The ID of this clock sync marker
         self.syncId = syncId
 
-
+    def to_wire(self):
+        wire = {"syncId": self.syncId}
+        return wire
+
+
+
+class dataCollected(ChromeEvent):
+    """Contains an bucket of collected trace events. When tracing is stopped collected events will be send as a sequence of dataCollected events followed by tracingComplete event."""
+    __slots__ = ()
+    _fields = ('value',)
+    value: List
+
+class tracingComplete(ChromeEvent):
+    """Signals that tracing is stopped and there is no trace buffers pending flush, all data were delivered via dataCollected events."""
+    __slots__ = ()
+    _fields = ('stream',)
+    # A handle of the stream that holds resulting trace data.
+    stream: "IO.StreamHandle"
+
+class bufferUsage(ChromeEvent):
+    __slots__ = ()
+    _fields = ('percentFull', 'eventCount', 'value')
+    # A number in range [0..1] that indicates the used size of event buffer as a fraction of its total size.
+    percentFull: float
+    # An approximate number of events in the trace log.
+    eventCount: float
+    # A number in range [0..1] that indicates the used size of event buffer as a fraction of its total size.
+    value: float
 
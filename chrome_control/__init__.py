@@ -1,34 +1,71 @@
-from .chrome import Chrome
-from . import Accessibility
-from . import Animation
-from . import ApplicationCache
-from . import CSS
-from . import CacheStorage
-from . import Console
-from . import DOM
-from . import DOMDebugger
-from . import DOMStorage
-from . import Database
-from . import Debugger
-from . import DeviceOrientation
-from . import Emulation
-from . import HeapProfiler
-from . import IO
-from . import IndexedDB
-from . import Input
-from . import Inspector
-from . import LayerTree
-from . import Log
-from . import Memory
-from . import Network
-from . import Page
-from . import Profiler
-from . import Rendering
-from . import Runtime
-from . import Schema
-from . import Security
-from . import ServiceWorker
-from . import Storage
-from . import SystemInfo
-from . import Target
-from . import Tethering
+import importlib
+
+# Nothing is imported until it's first used, so a script that only needs Page
+# and Runtime doesn't pay for the other domains, or for requests and
+# websocket if it never opens a connection.
+
+_domains = {
+    "Accessibility",
+    "Animation",
+    "ApplicationCache",
+    "CSS",
+    "CacheStorage",
+    "Console",
+    "DOM",
+    "DOMDebugger",
+    "DOMStorage",
+    "Database",
+    "Debugger",
+    "DeviceOrientation",
+    "Emulation",
+    "HeapProfiler",
+    "IO",
+    "IndexedDB",
+    "Input",
+    "Inspector",
+    "LayerTree",
+    "Log",
+    "Memory",
+    "Network",
+    "Page",
+    "Profiler",
+    "Rendering",
+    "Runtime",
+    "Schema",
+    "Security",
+    "ServiceWorker",
+    "Storage",
+    "SystemInfo",
+    "Target",
+    "Tethering",
+    "Tracing",
+}
+
+# class (or function) -> the module it lives in
+_classes = {
+    "Chrome": ".chrome",
+    "AsyncChrome": ".async_chrome",
+    "Browser": ".browser",
+    "Session": ".browser",
+    "TabPool": ".pool",
+    "Screencast": ".screencast",
+    "IOStream": ".stream",
+    "TraceRecorder": ".trace",
+    "take_heap_snapshot": ".heap",
+    "HeapSnapshot": ".heap",
+}
+
+__all__ = sorted(_domains) + sorted(_classes)
+
+def __getattr__(name):
+    if name in _domains:
+        # importing a submodule sets it as an attribute of the package, so
+        # this only happens once per domain
+        return importlib.import_module(f'.{name}', __name__)
+    if name in _classes:
+        value = globals()[name] = getattr(importlib.import_module(_classes[name], __name__), name)
+        return value
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,142 @@
+import asyncio
+import itertools
+
+try:
+    import websockets
+except ImportError:
+    websockets = None
+
+from chrome_control.base import ChromeCommand, ChromeError, decode_result
+from chrome_control.chrome import enable_debug_logging, log_debug, method_name
+from chrome_control.codec import default_codec
+from chrome_control.deadline import Deadline
+from chrome_control.discovery import discovery
+
+class AsyncChrome:
+    """An asyncio client for a single tab.
+
+    `do` has the same contract as `Chrome.do`, but returns an awaitable, so
+    any number of commands (and any number of tabs) can be in flight on one
+    event loop:
+
+        async with AsyncChrome() as c:
+            await c.do(Page.navigate("http://adhocteam.us/our-team"))
+    """
+    def __init__(self, debug=False, codec=None, host: str="localhost", port: int=9222, timeout: float=None):
+        if debug:
+            enable_debug_logging()
+        self.codec = codec or default_codec()
+        # see Client
+        self.timeout = timeout
+        self.discovery = discovery(host, port)
+        self.ws = None
+        self.reader = None
+
+        # replies are matched to their command by id, since with many commands
+        # in flight they can come back in any order
+        self.ids = itertools.count(1)
+        self.pending = {}
+
+    async def connect(self):
+        if websockets is None:
+            raise ImportError("AsyncChrome requires the websockets package")
+
+        # discovery is a plain http request, run it off the event loop so that
+        # opening a tab doesn't stall every other tab
+        loop = asyncio.get_running_loop()
+        self.tab = await loop.run_in_executor(None, lambda: self.discovery.new_tab(timeout=self.timeout))
+
+        # screenshots and DOM dumps are routinely bigger than the default 1MB
+        # frame limit, so don't set one
+        self.ws = await websockets.connect(self.tab['webSocketDebuggerUrl'], max_size=None, open_timeout=self.timeout)
+        self.reader = asyncio.ensure_future(self._read())
+        return self
+
+    async def close(self):
+        if self.reader is not None:
+            self.reader.cancel()
+        if self.ws is not None:
+            await self.ws.close()
+
+    async def __aenter__(self):
+        return await self.connect()
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    async def _read(self):
+        try:
+            while True:
+                # see Connection._read
+                try:
+                    frame = await self.ws.recv(decode=False)
+                except websockets.ConnectionClosed:
+                    break
+
+                log_debug("rcvd", frame)
+                o = self.codec.loads(frame)
+
+                fut = self.pending.pop(o.get("id"), None)
+                if fut is not None and not fut.done():
+                    fut.set_result(o)
+        finally:
+            # nothing more is coming, don't leave anybody waiting forever
+            pending, self.pending = self.pending, {}
+            for fut in pending.values():
+                if not fut.done():
+                    fut.set_exception(ConnectionError("websocket closed"))
+
+    async def do(self, cmd: ChromeCommand, timeout=None):
+        """Send `cmd` and return its result, like Chrome.do. Raises
+        TimeoutError if `timeout` (seconds, or a Deadline; the client's default
+        if not given) passes first. Cancelling the awaiting task cancels the
+        command too."""
+        deadline = Deadline.of(self.timeout if timeout is None else timeout)
+        id_ = next(self.ids)
+        msg = {
+            "id": id_,
+            "method": method_name(cmd),
+            "params": cmd.to_wire()
+        }
+        data = self.codec.dumps(msg)
+        log_debug("sent", data)
+
+        fut = asyncio.get_running_loop().create_future()
+        self.pending[id_] = fut
+        try:
+            # orjson produces bytes, which would otherwise go as a binary frame
+            await self.ws.send(data, text=True)
+            reply = await asyncio.wait_for(fut, deadline and deadline.remaining())
+        except asyncio.TimeoutError:
+            raise TimeoutError(f"no reply to {msg['method']} within {deadline.timeout}s") from None
+        finally:
+            self.pending.pop(id_, None)
+        return decode_result(cmd, reply)
+
+    async def batch(self, cmds: list, return_exceptions: bool=False, timeout=None):
+        """Send all of `cmds` back to back and return their results in order,
+        like Chrome.batch: if any of them failed, the first ChromeError is
+        raised once all the replies are in, and with `return_exceptions`,
+        ChromeErrors take the place of their results instead. Anything else,
+        such as a TimeoutError, is raised straight away, and the commands
+        still in flight are cancelled."""
+        deadline = Deadline.of(self.timeout if timeout is None else timeout)
+        tasks = [asyncio.ensure_future(self.do(cmd, deadline)) for cmd in cmds]
+        results = []
+        try:
+            for task in tasks:
+                try:
+                    results.append(await task)
+                except ChromeError as e:
+                    results.append(e)
+        finally:
+            for task in tasks[len(results):]:
+                task.cancel()
+            # so that their errors aren't reported as never retrieved
+            await asyncio.gather(*tasks[len(results):], return_exceptions=True)
+
+        if not return_exceptions:
+            for result in results:
+                if isinstance(result, ChromeError):
+                    raise result
+        return results
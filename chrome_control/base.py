@@ -1 +1,219 @@
-class ChromeCommand: pass
+import importlib
+from enum import Enum, EnumMeta
+
+class ChromeError(Exception):
+    """Chrome answered a command with an error."""
+    def __init__(self, error: dict):
+        super().__init__(error.get("message"))
+        self.code = error.get("code")
+        self.data = error.get("data")
+
+class ChromeType:
+    """Base of the generated protocol types.
+
+    Instances are either built by hand through the generated `__init__`, or
+    decoded from a dict off the wire. `decode` does that lazily: each field is
+    only decoded the first time it's read. The generated `from_wire`
+    classmethod decodes the whole thing up front, which is quicker when most
+    of it is going to be read anyway."""
+    # the dict it was decoded from, if it was
+    __slots__ = ("_wire",)
+    # field names, in the order the constructor takes them. Generated
+    # subclasses use these as their __slots__.
+    _fields = ()
+    # field name -> decode spec, for the fields that aren't plain json values.
+    # See decode.
+    _types = {}
+    # the classes and enums of other domains that from_wire decodes with,
+    # as "Domain.Type" strings until its first call binds them
+    _refs = ()
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        # built by hand, and this isn't one of its fields
+        try:
+            wire = self._wire
+        except AttributeError:
+            raise AttributeError(name) from None
+
+        if name not in self._fields:
+            raise AttributeError(name)
+        value = wire.get(name)
+        spec = self._types.get(name)
+        if spec is not None and value is not None:
+            if unbound(spec):
+                spec = self._types[name] = bind(spec)
+            value = decode(spec, value)
+        setattr(self, name, value)
+        return value
+
+    def to_wire(self):
+        return {}
+
+class WireObject:
+    """A dict as it came off the wire, with the fields declared by a generated
+    subclass read from it on attribute access.
+
+    Only fields that hold generated types are decoded, on first access, so a
+    big payload costs nothing beyond the json parse until it's looked at."""
+    __slots__ = ("_wire", "_cache")
+    # the names of its fields, including the optional ones, which read as
+    # None when they're left out. See ChromeType._fields.
+    _fields = ()
+    _types = {}
+
+    def __init__(self, wire: dict):
+        self._wire = wire
+        self._cache = None
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+
+        cache = self._cache
+        if cache is not None and name in cache:
+            return cache[name]
+
+        try:
+            value = self._wire[name]
+        except KeyError:
+            # optional fields are simply left out
+            if name in self._fields:
+                return None
+            raise AttributeError(name) from None
+
+        spec = self._types.get(name)
+        if spec is not None:
+            if unbound(spec):
+                spec = self._types[name] = bind(spec)
+            value = decode(spec, value)
+            if cache is None:
+                cache = self._cache = {}
+            cache[name] = value
+        return value
+
+    def __getitem__(self, name):
+        return self._wire[name]
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({self._wire!r})'
+
+class ChromeResult(WireObject):
+    """What a command returned. Generated subclasses are named after their
+    command, e.g. `DOM.getDocumentResult`."""
+    __slots__ = ()
+
+class ChromeCommand:
+    __slots__ = ()
+    # the names of its params, see ChromeType._fields
+    _fields = ()
+    # the class its reply is decoded into
+    _result = ChromeResult
+
+    def to_wire(self):
+        """The command's params as a json-ready dict. Generated subclasses
+        build it straight from their fields, leaving out the ones that are
+        None."""
+        return {}
+
+# every generated event class, by the method name Chrome sends it with, e.g.
+# "Page.loadEventFired". Events from a versioned build (see gen.py) are
+# prefixed with its subpackage, e.g. "v1_3.Page.loadEventFired".
+events = {}
+
+class ChromeEvent(WireObject):
+    """An event sent by Chrome."""
+    __slots__ = ()
+
+    def __init_subclass__(cls):
+        super().__init_subclass__()
+        events[f'{cls.__module__.split(".", 1)[1]}.{cls.__name__}'] = cls
+
+    @property
+    def params(self):
+        return self._wire
+
+def decode_event(method: str, params: dict, build: str=""):
+    """Turn the params of a `method` event into an instance of its generated
+    class from `build`. Events that aren't in the protocol come back as a
+    ChromeEvent."""
+    if build:
+        method = f'{build}.{method}'
+    try:
+        return events[method](params)
+    except KeyError:
+        pass
+    # domains are imported lazily, so its module may not have been loaded yet
+    domain = method.rpartition(".")[0]
+    if domain and domain not in _imported:
+        _imported.add(domain)
+        try:
+            importlib.import_module(f'{__package__}.{domain}')
+        except ImportError:
+            pass
+    return events.get(method, ChromeEvent)(params)
+
+# domains decode_event has tried to import
+_imported = set()
+
+def decode_result(cmd: ChromeCommand, reply: dict):
+    """Turn Chrome's reply to `cmd` into an instance of its result class, or
+    raise a ChromeError if the command failed."""
+    if "error" in reply:
+        raise ChromeError(reply["error"])
+    return cmd._result(reply.get("result", {}))
+
+# "Domain.Type", or "build.Domain.Type" -> the generated class or enum
+_resolved = {}
+
+def resolve(spec: str):
+    try:
+        return _resolved[spec]
+    except KeyError:
+        pass
+    domain, name = spec.rsplit(".", 1)
+    module = importlib.import_module(f'{__package__}.{domain}')
+    cls = _resolved[spec] = getattr(module, name)
+    return cls
+
+def encode(value):
+    """The json-ready form of a field value that holds generated types or
+    enums. Plain json values are passed through, so dicts work too."""
+    if isinstance(value, ChromeType):
+        return value.to_wire()
+    if isinstance(value, Enum):
+        return value.name
+    if isinstance(value, list):
+        return [encode(v) for v in value]
+    return value
+
+def unbound(spec):
+    """Whether a decode spec still refers to its class by name."""
+    return spec.__class__ is str or (spec.__class__ is list and unbound(spec[0]))
+
+def bind(spec):
+    """A decode spec with the classes it refers to by name resolved."""
+    if isinstance(spec, list):
+        return [bind(spec[0])]
+    if isinstance(spec, str):
+        return resolve(spec)
+    return spec
+
+def decode(spec, value):
+    """Decode a json value according to a spec generated by gen.py: a
+    generated class or enum, [spec] for a list, or "Domain.Type" for a class
+    that wasn't defined yet when the spec was. The generated classes' fields
+    bind those the first time they're read, so it only costs a lookup
+    once."""
+    if isinstance(spec, list):
+        return [decode(spec[0], v) for v in value]
+
+    cls = resolve(spec) if spec.__class__ is str else spec
+    if isinstance(cls, EnumMeta):
+        # newer versions of Chrome may send values we've never heard of
+        return cls.__members__.get(value, value)
+
+    obj = cls.__new__(cls)
+    obj._wire = value
+    return obj
@@ -0,0 +1,136 @@
+from concurrent.futures import InvalidStateError
+
+from chrome_control import Target
+from chrome_control.base import ChromeCommand, ChromeError
+from chrome_control.chrome import Client, Connection, Pending, enable_debug_logging
+from chrome_control.discovery import discovery
+
+class Session(Client):
+    """A target driven through a Browser's websocket rather than one of its
+    own. It has the same interface as Chrome: do, send/recv, on, wait_for, expect."""
+    def __init__(self, browser: "Browser", target_id: str):
+        super().__init__(browser.codec, browser.timeout)
+        self.build = browser.build
+        self.browser = browser
+        self.target_id = target_id
+
+    def _wrap(self, data):
+        # the message travels as a string inside the browser's command
+        if isinstance(data, bytes):
+            data = data.decode()
+        return Target.sendMessageToTarget(self.target_id, data)
+
+    def _write(self, data):
+        self.browser._post(self._wrap(data))
+
+    def send(self, cmd: ChromeCommand):
+        # Chrome answers the browser's command that carries the message too,
+        # with an error if it couldn't be delivered (the target is gone, say),
+        # in which case no reply to the command itself is ever coming
+        id_ = next(self.ids)
+        pending = self.pending[id_] = Pending(cmd)
+        try:
+            wrapper = self.browser.send(self._wrap(self._message(id_, cmd)))
+        except Exception:
+            del self.pending[id_]
+            raise
+
+        def delivered(fut):
+            self.browser.pending.pop(wrapper, None)
+            if fut.cancelled():
+                return
+            exc = fut.exception()
+            if exc is None and "error" in fut.result():
+                exc = ChromeError(fut.result()["error"])
+            if exc is not None:
+                try:
+                    pending.set_exception(exc)
+                except InvalidStateError:
+                    pass
+
+        fut = self.browser.pending.get(wrapper)
+        # unless the browser's commands were all cancelled in the meantime
+        if fut is not None:
+            fut.add_done_callback(delivered)
+        return id_
+
+    def close(self):
+        """Close the target."""
+        self.browser.close_session(self)
+
+class Browser(Connection):
+    """A connection to the browser itself rather than to one of its tabs.
+
+    Any number of targets can be driven over its single websocket, each as a
+    Session, so hundreds of pages cost one connection instead of hundreds:
+
+        browser = Browser()
+        page = browser.new_page()
+        page.do(Page.navigate("http://bananas.com"))
+    """
+    def __init__(self, debug=False, codec=None, host: str="localhost", port: int=9222, timeout: float=None):
+        if debug:
+            enable_debug_logging()
+        super().__init__(codec, timeout)
+
+        # target id -> Session
+        self.sessions = {}
+
+        self.discovery = discovery(host, port)
+        self.build = self.discovery.build(timeout)
+        self._connect(self.discovery.version(timeout)["webSocketDebuggerUrl"])
+
+    def _receive(self, o: dict):
+        method = o.get("method")
+        if method == "Target.receivedMessageFromTarget":
+            # route it to its session without decoding the event; only the
+            # message inside is of interest
+            params = o["params"]
+            session = self.sessions.get(params["targetId"])
+            if session is not None:
+                session._receive(self.codec.loads(params["message"]))
+            return
+
+        if method in ("Target.detachedFromTarget", "Target.targetDestroyed"):
+            session = self.sessions.pop(o["params"]["targetId"], None)
+            if session is not None:
+                session._fail_pending(ConnectionError(f"detached from target {session.target_id}"))
+                session._signal_disconnect()
+
+        super()._receive(o)
+
+    def _fail_pending(self, exc: Exception):
+        super()._fail_pending(exc)
+        for session in list(self.sessions.values()):
+            session._fail_pending(exc)
+
+    def _signal_disconnect(self):
+        super()._signal_disconnect()
+        for session in list(self.sessions.values()):
+            session._signal_disconnect()
+
+    def attach(self, target_id: str):
+        """Start a Session with an existing target."""
+        # register it first, its first messages can arrive before the reply
+        session = self.sessions[target_id] = Session(self, target_id)
+        try:
+            if not self.do(Target.attachToTarget(target_id)).success:
+                raise ConnectionError(f"couldn't attach to target {target_id}")
+        except Exception:
+            self.sessions.pop(target_id, None)
+            raise
+        return session
+
+    def new_page(self, url: str="about:blank", **kwargs):
+        """Open a new page and start a Session with it. Any keyword arguments
+        are passed on to Target.createTarget."""
+        target_id = self.do(Target.createTarget(url, **kwargs)).targetId
+        return self.attach(target_id)
+
+    def close_session(self, session: Session):
+        # its replies stop being routed to it here, so whoever's still
+        # waiting on one would wait forever
+        self.sessions.pop(session.target_id, None)
+        session._fail_pending(ConnectionError(f"session with target {session.target_id} closed"))
+        session._signal_disconnect()
+        self.do(Target.closeTarget(session.target_id))
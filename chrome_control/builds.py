@@ -0,0 +1,7 @@
+# generated by gen.py, don't edit it by hand.
+
+# protocol version -> the subpackage of chrome_control generated from it, ""
+# being chrome_control itself. See Discovery.build.
+builds = {
+    '1.2': '',
+}
@@ -1,63 +1,575 @@
-import json
-import requests
+import importlib
+import itertools
+import logging
+import queue
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import Future, InvalidStateError
+from concurrent.futures import TimeoutError as FutureTimeoutError
+
 import websocket
-from chrome_control.base import ChromeCommand
-
-class ObjectEncoder(json.JSONEncoder):
-    def default(self, obj):
-        if isinstance(obj, (str, int, float, list, bool, dict)):
-            return json.JSONEncoder.default(self, obj)
-        attrs = [x for x in dir(obj) if not x.startswith('_')]
-        return {key: getattr(obj, key) for key in attrs if getattr(obj, key) is not None}
-
-class Chrome:
-    def __init__(self, debug=1):
-        self.debug = debug
-
-        # is this documented anywhere? I had to find this from reading node code
-        # https://github.com/cyrus-and/chrome-remote-interface/blob/2a85a87574053f4ef48d17ac1ac03b7513310336/lib/devtools.js#L65
-        #
-        # there appears to be an endpoint that's equivalent to /json/new, at:
-        # https://chromedevtools.github.io/debugger-protocol-viewer/tot/Target/#method-createTarget
-        #
-        # update, no this is not documented anywhere:
-        # https://github.com/GoogleChrome/devtools-docs/issues/67#issuecomment-37675331
-        self.tab = requests.get("http://localhost:9222/json/new").json()
-        tabs = requests.get("http://localhost:9222/json").json()
-
-        # we need to find the index of our new tab in the tablist, which the API
-        # calls the "id", but also doesn't come back in the /new obj. Search the tablist
-        # for our tab.
-        for i, t in enumerate(tabs):
-            if t["id"] == self.tab["id"]:
-                self.idx = i
-                break
-        else: 1/0
-
-        #  * Maybe a tab is the proper unit for the client to deal with? Something like:
-        #  with Tab(url) as tab:
-        #    tab.do(Page.navigate("http://bananas.com"))
-        #    tab.do(Runtime.evaluate("console.log(window.location);", returnByValue=true))
-        self.ws = websocket.create_connection(self.tab['webSocketDebuggerUrl'])
-
-    def do(self, cmd: ChromeCommand):
-        # Reverse engineer the command name that was passed in from the object's
-        # meta information. Converts class like `chrome_control.Page.navigate`
-        # to `'Page.navigate'`.
-        method = f'{cmd.__module__.split(".")[-1]}.{cmd.__class__.__name__}'
 
+from chrome_control.base import ChromeCommand, ChromeError, decode_event, decode_result
+from chrome_control.codec import default_codec
+from chrome_control.deadline import Deadline
+from chrome_control.discovery import discovery
+
+# Every message sent and received is logged at DEBUG level. Formatting only
+# happens if a handler is going to emit the record, and long messages (like
+# screenshots) are cut down to LOG_LIMIT characters.
+log = logging.getLogger("chrome_control")
+LOG_LIMIT = 1000
+
+class Truncated:
+    """A message for the log, formatted when the record is emitted."""
+    __slots__ = ("data",)
+
+    def __init__(self, data):
+        self.data = data
+
+    def __str__(self):
+        data = self.data[:LOG_LIMIT]
+        if isinstance(data, bytes):
+            # we may have cut a character in half
+            data = data.decode("utf-8", "replace")
+        if len(self.data) > LOG_LIMIT:
+            data += f'... ({len(self.data)} total)'
+        return data
+
+def log_debug(direction, data):
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug("%s: %s", direction, Truncated(data))
+
+def enable_debug_logging():
+    """Print the message log to stderr, which is what `debug=True` does."""
+    log.setLevel(logging.DEBUG)
+    if not log.handlers:
+        log.addHandler(logging.StreamHandler())
+
+def method_name(cmd: ChromeCommand):
+    # Reverse engineer the command name that was passed in from the object's
+    # meta information. Converts class like `chrome_control.Page.navigate`
+    # to `'Page.navigate'`.
+    return f'{cmd.__module__.split(".")[-1]}.{cmd.__class__.__name__}'
+
+class Pending(Future):
+    """A command that's waiting for its reply."""
+    def __init__(self, cmd: ChromeCommand):
+        super().__init__()
+        self.cmd = cmd
+
+class Batch:
+    """Commands queued up to be sent together when the with block ends. See
+    Client.batch."""
+    def __init__(self, client: "Client", return_exceptions: bool=False, timeout=None):
+        self.client = client
+        self.return_exceptions = return_exceptions
+        self.timeout = timeout
+        self.commands = []
+        self.results = None
+
+    def add(self, cmd: ChromeCommand):
+        """Queue `cmd`, and return the index its result will have."""
+        self.commands.append(cmd)
+        return len(self.commands) - 1
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.results = self.client.batch(self.commands, self.return_exceptions, self.timeout)
+
+class Waiter:
+    """Events of one method, collected from the moment it's created until the
+    with block ends. See Client.expect."""
+    def __init__(self, client: "Client", method: str, predicate=None, timeout=None):
+        self.client = client
+        self.method = method
+        self.predicate = predicate
+        self.timeout = timeout
+        self.events = queue.Queue()
+        self.event = None
+        client.on(method, self.events.put)
+
+    def get(self, timeout=None):
+        """The first matching event, waiting for it if it hasn't arrived yet.
+        Raises TimeoutError if `timeout` (seconds, or a Deadline; the one the
+        Waiter was made with if not given) passes first."""
+        if self.event is not None:
+            return self.event
+        deadline = Deadline.of(self.timeout if timeout is None else timeout)
+        while True:
+            try:
+                event = self.events.get(timeout=deadline and deadline.remaining())
+            except queue.Empty:
+                raise TimeoutError(f"no {self.method} event within {deadline.timeout}s") from None
+            if self.predicate is None or self.predicate(event):
+                self.event = event
+                return event
+
+    def close(self):
+        self.client.off(self.method, self.events.put)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            if exc_type is None:
+                self.get()
+        finally:
+            self.close()
+
+class Client:
+    """Sends commands and matches up their replies, and hands events to
+    whoever subscribed to them. Subclasses say how a message gets to Chrome
+    (`_write`), and feed whatever comes back to `_receive`.
+
+    `timeout` is how long, in seconds, to wait for a reply when a call
+    doesn't give a timeout of its own. The default is to wait forever."""
+    # the build of the generated modules events are decoded with, see
+    # Discovery.build
+    build = ""
+
+    def __init__(self, codec=None, timeout: float=None):
+        self.codec = codec or default_codec()
+        self.timeout = timeout
+
+        # every command gets its own id, and the reply carries it back. Commands
+        # that have been sent but not collected yet are kept in `pending`, as a
+        # future that's resolved when the reply arrives.
+        self.ids = itertools.count(1)
+        self.pending = {}
+
+        # event method name -> callbacks subscribed to it
+        self.subscribers = defaultdict(list)
+
+        # set once the connection is gone for good, see on_disconnect
+        self.disconnected = threading.Event()
+        self.disconnect_callbacks = []
+
+    def _write(self, data):
+        raise NotImplementedError
+
+    def domain(self, name: str):
+        """The module for domain `name` from the build that matches this
+        Chrome, e.g. `chrome.domain("Page").navigate(...)`."""
+        package = f'chrome_control.{self.build}' if self.build else "chrome_control"
+        return importlib.import_module(f'{package}.{name}')
+
+    def _receive(self, o: dict):
+        if "id" in o:
+            # replies to commands that nobody is waiting for are of no use to
+            # anyone
+            fut = self.pending.get(o["id"])
+            if fut is not None:
+                try:
+                    fut.set_result(o)
+                except InvalidStateError:
+                    # it was cancelled in the meantime
+                    pass
+        else:
+            self._dispatch(o["method"], o.get("params", {}))
+
+    def _fail_pending(self, exc: Exception):
+        # nothing more is coming, don't leave anybody waiting forever
+        for fut in list(self.pending.values()):
+            try:
+                fut.set_exception(exc)
+            except InvalidStateError:
+                pass
+
+    def _signal_disconnect(self):
+        self.disconnected.set()
+        for callback in list(self.disconnect_callbacks):
+            try:
+                callback()
+            except Exception:
+                log.exception("disconnect callback failed")
+
+    def _dispatch(self, method, params):
+        callbacks = self.subscribers.get(method)
+        if not callbacks:
+            return
+
+        event = decode_event(method, params, self.build)
+        for callback in list(callbacks):
+            try:
+                callback(event)
+            except Exception:
+                # a broken callback mustn't take the reader thread down with it
+                log.exception("%s callback failed", method)
+
+    def on(self, method: str, callback):
+        """Call `callback(event)` for every `method` event, e.g.
+        `chrome.on("Network.requestWillBeSent", print)`. The event is an
+        instance of the class generated for it, `Network.requestWillBeSent`.
+
+        Callbacks run on the reader thread, so they should be quick; no replies
+        or other events are delivered while one is running."""
+        self.subscribers[method].append(callback)
+        return callback
+
+    def off(self, method: str, callback):
+        self.subscribers[method].remove(callback)
+
+    def on_disconnect(self, callback):
+        """Call `callback()` once the connection is gone for good: it was
+        closed, or it dropped and (for a resilient Chrome) isn't coming back.
+        `disconnected` is set by then. It runs on the reader thread, like
+        event callbacks."""
+        self.disconnect_callbacks.append(callback)
+        return callback
+
+    def off_disconnect(self, callback):
+        self.disconnect_callbacks.remove(callback)
+
+    def wait_for(self, method: str, predicate=None, timeout=None):
+        """Block until a `method` event for which `predicate(event)` is true
+        arrives, and return it. Only events that arrive after the call
+        are considered, so one caused by a command sent before it may be
+        missed; use `expect` for those. Raises TimeoutError if `timeout`
+        (seconds, or a Deadline) passes first."""
+        waiter = Waiter(self, method, predicate)
+        try:
+            return waiter.get(timeout)
+        finally:
+            waiter.close()
+
+    def expect(self, method: str, predicate=None, timeout=None):
+        """Start listening for a `method` event for which `predicate(event)`
+        is true, and wait for it when the with block ends:
+
+            with chrome.expect("Page.loadEventFired", timeout=30) as load:
+                chrome.do(Page.navigate(url))
+            print(load.event.timestamp)
+
+        The event can't be missed however quickly it follows the commands sent
+        in the block. Raises TimeoutError if `timeout` (seconds, or a
+        Deadline) passes first."""
+        return Waiter(self, method, predicate, timeout)
+
+    def _message(self, id_: int, cmd: ChromeCommand):
         msg = {
-            "id": self.idx,
-            "method": method,
-            "params": cmd
+            "id": id_,
+            "method": method_name(cmd),
+            "params": cmd.to_wire()
         }
-        if self.debug:
-            print("sent: ", json.dumps(msg, cls=ObjectEncoder))
+        data = self.codec.dumps(msg)
+        log_debug("sent", data)
+        return data
+
+    def send(self, cmd: ChromeCommand):
+        """Send a command without waiting for its reply, and return its id.
+
+        Any number of commands can be sent before collecting their replies
+        with `recv`, so independent commands cost one round trip in total
+        instead of one each."""
+        id_ = next(self.ids)
+        data = self._message(id_, cmd)
+
+        self.pending[id_] = Pending(cmd)
+        try:
+            self._write(data)
+        except Exception:
+            del self.pending[id_]
+            raise
+        return id_
+
+    def _post(self, cmd: ChromeCommand):
+        # send a command whose reply nobody is going to wait for
+        self._write(self._message(next(self.ids), cmd))
+
+    def recv(self, id_: int, timeout=None):
+        """Wait for the reply to the command with id `id_` and return its
+        result, decoded into the command's result class. Raises ChromeError if
+        the command failed.
+
+        Raises TimeoutError if `timeout` (seconds, or a Deadline; the client's
+        default if not given) passes first; the command is then cancelled, and
+        its reply ignored if it ever arrives."""
+        deadline = Deadline.of(self.timeout if timeout is None else timeout)
+        pending = self.pending[id_]
+        try:
+            reply = pending.result(deadline and deadline.remaining())
+        except FutureTimeoutError:
+            raise TimeoutError(f"no reply to {method_name(pending.cmd)} within {deadline.timeout}s") from None
+        finally:
+            self.pending.pop(id_, None)
+        return decode_result(pending.cmd, reply)
+
+    def cancel(self, id_: int=None):
+        """Stop waiting for the reply to the command with id `id_`, or to every
+        command if no id is given. Whoever is waiting on it in `recv` gets a
+        CancelledError. Chrome has no way to abort a command, so this only
+        frees up the caller; the reply is ignored when it arrives."""
+        ids = list(self.pending) if id_ is None else [id_]
+        for id_ in ids:
+            pending = self.pending.pop(id_, None)
+            if pending is not None:
+                pending.cancel()
+
+    def do(self, cmd: ChromeCommand, timeout=None):
+        return self.recv(self.send(cmd), timeout)
+
+    def batch(self, cmds: list=None, return_exceptions: bool=False, timeout=None):
+        """Send all of `cmds` back to back, then wait for all of their replies,
+        and return their results in order: one round trip for the lot.
+
+        If any of them failed, the first ChromeError is raised once all the
+        replies are in; with `return_exceptions`, errors take the place of
+        their results instead.
+
+        `timeout` bounds the whole batch, rather than each command in it.
+
+        Without `cmds`, returns a Batch to queue them up in a with block:
+
+            with chrome.batch() as b:
+                b.add(Network.enable())
+                b.add(Page.enable())
+            network, page = b.results
+        """
+        if cmds is None:
+            return Batch(self, return_exceptions, timeout)
+
+        deadline = Deadline.of(self.timeout if timeout is None else timeout)
+        ids = []
+        try:
+            for cmd in cmds:
+                ids.append(self.send(cmd))
+        except BaseException:
+            # the ones that did go out aren't going to be collected
+            for id_ in ids:
+                self.cancel(id_)
+            raise
+        results = []
+        try:
+            for id_ in ids:
+                try:
+                    results.append(self.recv(id_, deadline))
+                except ChromeError as e:
+                    results.append(e)
+        finally:
+            # if we timed out, don't leave the rest pending forever
+            for id_ in ids[len(results):]:
+                self.cancel(id_)
+
+        if not return_exceptions:
+            for result in results:
+                if isinstance(result, ChromeError):
+                    raise result
+        return results
+
+class Connection(Client):
+    """A Client with a websocket of its own, which is what Chrome and Browser
+    have in common. What arrives on the websocket is read on a thread of its
+    own, the reader, which replies are delivered and callbacks run on."""
+    def __init__(self, codec=None, timeout: float=None):
+        super().__init__(codec, timeout)
+        self.closing = False
+        self.ws = None
+        self.reader = None
+
+    def _connect(self, url: str):
+        # the timeout bounds the handshake, but the reader waits for as long
+        # as it takes
+        self.ws = websocket.create_connection(url, timeout=self.timeout)
+        self.ws.settimeout(None)
+        self.reader = threading.Thread(target=self._read, args=(self.ws,), name="chrome-reader", daemon=True)
+        self.reader.start()
+
+    def close(self):
+        self.closing = True
+        self.ws.close()
+        self.reader.join()
+
+    def _write(self, data):
+        self.ws.send(data)
+
+    def _read(self, ws):
+        try:
+            while True:
+                # take the frame as bytes, so that it goes straight to the
+                # json parser without being decoded into a str first
+                opcode, frame = ws.recv_data()
+                if opcode == websocket.ABNF.OPCODE_CLOSE:
+                    break
+
+                log_debug("rcvd", frame)
+                self._receive(self.codec.loads(frame))
+        except (websocket.WebSocketException, OSError):
+            pass
+        finally:
+            self._disconnected(ws)
+
+    def _disconnected(self, ws):
+        # on the reader thread, once `ws` has closed. A connection that has
+        # been replaced since has nothing left to fail.
+        if ws is self.ws:
+            self._fail_pending(ConnectionError("websocket closed"))
+            self._signal_disconnect()
+
+class Chrome(Connection):
+    """A client for a single tab. A new tab is opened, unless the id of an
+    existing one is given as `target_id`.
+
+    With `resilient`, the client survives the tab crashing or the websocket
+    dropping: it reconnects (to a new tab if the old one is gone), re-sends
+    the `enable` commands and Page.addScriptToEvaluateOnLoad registrations
+    that were in effect, and carries on. Only the commands that were in
+    flight at the time fail, with a ConnectionError; commands sent while it
+    reconnects wait for it to finish."""
+    def __init__(self, debug=False, codec=None, host: str="localhost", port: int=9222, target_id: str=None, timeout: float=None, resilient: bool=False):
+        if debug:
+            enable_debug_logging()
+        super().__init__(codec, timeout)
+
+        self.discovery = discovery(host, port)
+        self.build = self.discovery.build(timeout)
+        if target_id is None:
+            self.tab = self.discovery.new_tab(timeout=timeout)
+        else:
+            self.tab = self.discovery.target(target_id, timeout)
+
+        self.resilient = resilient
+        self.crashed = False
+        self.connected = threading.Event()
+        # only one thread reconnects at a time: the one whose reader noticed
+        # first. `lost` is set if the connection it's restoring drops too.
+        self.reconnect_lock = threading.Lock()
+        self.reconnecting = False
+        self.lost = False
+
+        # commands that set up state in the tab, to be re-sent after
+        # reconnecting (and undone by TabPool between jobs): method (or
+        # script identifier) -> command. They're kept track of whether or not
+        # the client is resilient.
+        self.restore = {}
+        # script identifier we handed out -> the identifier Chrome knows the
+        # script by since it was last re-registered
+        self.script_ids = {}
+
+        # to reuse tabs rather than opening a new one every time, see TabPool
+        self._connect(self.tab['webSocketDebuggerUrl'])
+        self.connected.set()
+
+        if resilient:
+            # a crashed tab keeps its websocket open, so watch for it
+            self.on("Inspector.targetCrashed", self._crashed)
+            self.do(self.domain("Inspector").enable())
+
+    def _write(self, data):
+        if self.resilient and not self.connected.wait(self.timeout):
+            raise ConnectionError(f"not reconnected within {self.timeout}s")
+        super()._write(data)
+
+    def _disconnected(self, ws):
+        with self.reconnect_lock:
+            current = ws is self.ws
+            if current and self.reconnecting:
+                self.lost = True
+            reconnect = current and self.resilient and not self.closing and not self.reconnecting
+            # unless another thread is still trying to reconnect
+            gone = current and not reconnect and not self.reconnecting
+            if reconnect:
+                self.reconnecting = True
+        if current:
+            if self.resilient:
+                self.connected.clear()
+            self._fail_pending(ConnectionError("websocket closed"))
+        if reconnect:
+            if not self._reconnect():
+                self._signal_disconnect()
+        elif gone:
+            self._signal_disconnect()
+
+    def _crashed(self, event):
+        log.warning("tab %s crashed", self.tab["id"])
+        self.crashed = True
+        # the reader thread notices and reconnects
+        self.ws.close()
+
+    def _reconnect(self):
+        delay = 0.1
+        while not self.closing:
+            try:
+                self.discovery.invalidate()
+                if self.crashed or self.tab["id"] not in self.discovery.targets(self.timeout):
+                    old, self.tab = self.tab, self.discovery.new_tab(timeout=self.timeout)
+                    self.crashed = False
+                    try:
+                        self.discovery.close_tab(old["id"], self.timeout)
+                    except Exception:
+                        pass
+
+                with self.reconnect_lock:
+                    self.lost = False
+                self._connect(self.tab["webSocketDebuggerUrl"])
+                self._restore()
+                with self.reconnect_lock:
+                    if self.lost:
+                        raise ConnectionError("websocket closed while restoring")
+                    self.connected.set()
+                    self.reconnecting = False
+            except Exception:
+                log.warning("reconnecting to tab %s failed, retrying in %ss", self.tab["id"], delay, exc_info=True)
+                # don't leave the failed connection and its reader behind
+                try:
+                    self.ws.close()
+                except Exception:
+                    pass
+                time.sleep(delay)
+                delay = min(delay * 2, 5)
+            else:
+                log.info("reconnected to tab %s", self.tab["id"])
+                return True
+        with self.reconnect_lock:
+            self.reconnecting = False
+        return False
+
+    def _restore(self):
+        # the client isn't connected as far as everybody else is concerned yet,
+        # so write directly to the websocket
+        ids = []
+        for key, cmd in list(self.restore.items()):
+            id_ = next(self.ids)
+            self.pending[id_] = Pending(cmd)
+            self.ws.send(self._message(id_, cmd))
+            ids.append((key, id_))
 
-        self.ws.send(json.dumps(msg, cls=ObjectEncoder))
+        for key, id_ in ids:
+            try:
+                result = Client.recv(self, id_)
+            except ChromeError as e:
+                # it won't work any better next time, so give up on it rather
+                # than on the connection
+                log.warning("restoring %s failed, dropping it: %s", method_name(self.restore[key]), e)
+                self.restore.pop(key, None)
+                self.script_ids.pop(key, None)
+                continue
+            if key in self.script_ids:
+                self.script_ids[key] = result.identifier
 
-        o = json.loads(self.ws.recv())
-        if self.debug:
-            print("rcvd: ", o)
+    def send(self, cmd: ChromeCommand):
+        method = method_name(cmd)
+        domain, name = method.split(".")
+        # enables are recorded by recv, once they've worked
+        if name == "disable":
+            self.restore.pop(f'{domain}.enable', None)
+        elif method == "Page.removeScriptToEvaluateOnLoad" and cmd.identifier in self.script_ids:
+            self.restore.pop(cmd.identifier, None)
+            cmd = type(cmd)(self.script_ids.pop(cmd.identifier))
+        return super().send(cmd)
 
-        return o
+    def recv(self, id_: int, timeout=None):
+        cmd = self.pending[id_].cmd
+        result = super().recv(id_, timeout)
+        method = method_name(cmd)
+        if method.endswith(".enable"):
+            self.restore[method] = cmd
+        elif method == "Page.addScriptToEvaluateOnLoad":
+            self.restore[result.identifier] = cmd
+            self.script_ids[result.identifier] = result.identifier
+        return result
@@ -0,0 +1,34 @@
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# A codec is anything with `dumps(obj)`, returning the str or utf-8 bytes of
+# a json message, and `loads(data)`, which has to accept the utf-8 bytes of a
+# frame as it came off the socket. Pass one to Chrome or AsyncChrome to use a
+# json library of your choice.
+
+class JSONCodec:
+    """The standard library's json."""
+    def dumps(self, obj):
+        return json.dumps(obj)
+
+    def loads(self, data):
+        return json.loads(data)
+
+class OrjsonCodec:
+    """orjson, which parses and produces utf-8 bytes directly and is several
+    times faster than json on big messages."""
+    def dumps(self, obj):
+        return orjson.dumps(obj)
+
+    def loads(self, data):
+        return orjson.loads(data)
+
+def default_codec():
+    """The fastest codec that's installed."""
+    if orjson is not None:
+        return OrjsonCodec()
+    return JSONCodec()
@@ -0,0 +1,36 @@
+import time
+
+class Deadline:
+    """A point in time that some work has to be finished by.
+
+    Anything that takes a `timeout` also takes a Deadline, so a helper that
+    issues several commands can hand the same one to each of them, and the
+    whole operation, rather than each step, is bounded:
+
+        deadline = Deadline(10)
+        with chrome.expect("Page.loadEventFired", timeout=deadline):
+            chrome.do(Page.navigate(url), timeout=deadline)
+    """
+    __slots__ = ("timeout", "expires")
+
+    def __init__(self, timeout: float):
+        self.timeout = timeout
+        self.expires = time.monotonic() + timeout
+
+    @classmethod
+    def of(cls, timeout):
+        """A Deadline for `timeout`, which is either a number of seconds from
+        now, a Deadline, or None for no deadline at all."""
+        if timeout is None or isinstance(timeout, Deadline):
+            return timeout
+        return cls(timeout)
+
+    def remaining(self):
+        """Seconds left, never less than zero."""
+        return max(0.0, self.expires - time.monotonic())
+
+    def expired(self):
+        return time.monotonic() >= self.expires
+
+    def __repr__(self):
+        return f'Deadline({self.timeout}, {self.remaining():.3f}s left)'
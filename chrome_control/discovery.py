@@ -0,0 +1,133 @@
+import threading
+
+import requests
+
+from chrome_control.deadline import Deadline
+
+class Discovery:
+    """Chrome's http endpoints (/json, /json/new, /json/version, ...), talked
+    to over a keep-alive connection per thread, since a requests.Session
+    can't be shared between threads.
+
+    The target list is cached, and kept up to date with the tabs opened and
+    closed through it, so looking a target up by id doesn't cost a request.
+    Use `discovery(host, port)` to get the instance shared by every client of
+    that Chrome.
+
+    Every request takes a `timeout`, in seconds or as a Deadline, which
+    bounds both connecting and waiting for the response. The default is to
+    wait forever."""
+    def __init__(self, host: str="localhost", port: int=9222):
+        self.url = f'http://{host}:{port}'
+        self.local = threading.local()
+        self.lock = threading.Lock()
+
+        # target id -> target, or None when it has to be fetched again
+        self._targets = None
+        self._version = None
+        self._build = None
+
+    def _get(self, path: str, timeout=None):
+        http = getattr(self.local, "http", None)
+        if http is None:
+            http = self.local.http = requests.Session()
+        deadline = Deadline.of(timeout)
+        try:
+            resp = http.get(self.url + path, timeout=deadline and deadline.remaining())
+        except requests.Timeout:
+            raise TimeoutError(f"no response from {self.url}{path} within {deadline.timeout}s") from None
+        resp.raise_for_status()
+        return resp
+
+    def version(self, timeout=None):
+        """The browser's version info, including the browser-level
+        webSocketDebuggerUrl. It can't change, so it's only fetched once."""
+        if self._version is None:
+            self._version = self._get("/json/version", timeout).json()
+        return self._version
+
+    def build(self, timeout=None):
+        """The build of the generated modules (see gen.py) that matches the
+        protocol version this Chrome speaks: the name of its subpackage of
+        chrome_control, or "" for chrome_control itself. It's only worked out
+        once, so connecting doesn't cost any probing."""
+        if self._build is None:
+            from chrome_control.builds import builds
+            self._build = pick_build(builds, self.version(timeout).get("Protocol-Version", ""))
+        return self._build
+
+    def targets(self, timeout=None):
+        """Every target, by id."""
+        with self.lock:
+            targets = self._targets
+        if targets is None:
+            targets = {t["id"]: t for t in self._get("/json", timeout).json()}
+            with self.lock:
+                self._targets = targets
+        return targets
+
+    def target(self, target_id: str, timeout=None):
+        """The target with id `target_id`. Targets opened by something else
+        since the list was fetched are found by fetching it again."""
+        deadline = Deadline.of(timeout)
+        target = self.targets(deadline).get(target_id)
+        if target is None:
+            self.invalidate()
+            target = self.targets(deadline)[target_id]
+        return target
+
+    def invalidate(self):
+        """Forget the cached target list."""
+        with self.lock:
+            self._targets = None
+
+    def new_tab(self, url: str=None, timeout=None):
+        # is this documented anywhere? I had to find this from reading node code
+        # https://github.com/cyrus-and/chrome-remote-interface/blob/2a85a87574053f4ef48d17ac1ac03b7513310336/lib/devtools.js#L65
+        #
+        # there appears to be an endpoint that's equivalent to /json/new, at:
+        # https://chromedevtools.github.io/debugger-protocol-viewer/tot/Target/#method-createTarget
+        #
+        # update, no this is not documented anywhere:
+        # https://github.com/GoogleChrome/devtools-docs/issues/67#issuecomment-37675331
+        tab = self._get("/json/new" + (f'?{url}' if url else ""), timeout).json()
+        with self.lock:
+            if self._targets is not None:
+                self._targets[tab["id"]] = tab
+        return tab
+
+    def close_tab(self, target_id: str, timeout=None):
+        self._get(f'/json/close/{target_id}', timeout)
+        with self.lock:
+            if self._targets is not None:
+                self._targets.pop(target_id, None)
+
+def pick_build(builds: dict, version: str):
+    """The build for protocol `version` out of `builds`, which maps protocol
+    versions to builds. Without an exact match, it's the newest build for an
+    older version, which is missing what's new but doesn't send anything the
+    browser won't understand, and failing that the default one."""
+    if version in builds:
+        return builds[version]
+
+    def key(v):
+        return tuple(int(n) for n in v.split("."))
+
+    try:
+        wanted = key(version)
+    except ValueError:
+        return ""
+    older = [v for v in builds if key(v) < wanted]
+    return builds[max(older, key=key)] if older else ""
+
+# (host, port) -> the Discovery shared by every client of that Chrome
+_shared = {}
+_shared_lock = threading.Lock()
+
+def discovery(host: str="localhost", port: int=9222):
+    with _shared_lock:
+        try:
+            return _shared[host, port]
+        except KeyError:
+            d = _shared[host, port] = Discovery(host, port)
+            return d
@@ -0,0 +1,401 @@
+import json
+import mmap
+import time
+from array import array
+from typing import TYPE_CHECKING
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from chrome_control import HeapProfiler
+
+if TYPE_CHECKING:
+    # not imported otherwise, so analysing a snapshot offline doesn't need
+    # websocket-client or requests
+    from chrome_control.chrome import Client
+
+def take_heap_snapshot(client: "Client", path: str=None, progress=None, timeout=None):
+    """Take a heap snapshot of the page and write it to `path`, by default
+    Heap-<date>T<time>.heapsnapshot in the current directory like DevTools
+    names them, and return the path. The file loads in DevTools' Memory
+    panel.
+
+    Chrome sends the snapshot as a flood of small HeapProfiler.addHeapSnapshotChunk
+    events before it replies; each is written out as it arrives, so even a
+    snapshot of a huge heap is never held in memory. `progress(done, total)`
+    is called as Chrome reports its progress, on the reader thread."""
+    if path is None:
+        path = time.strftime("Heap-%Y%m%dT%H%M%S.heapsnapshot")
+
+    def chunk(event):
+        f.write(event.chunk)
+
+    def report(event):
+        progress(event.done, event.total)
+
+    # the snapshot is utf-8 json, written as is
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        client.on("HeapProfiler.addHeapSnapshotChunk", chunk)
+        if progress is not None:
+            client.on("HeapProfiler.reportHeapSnapshotProgress", report)
+        try:
+            client.do(HeapProfiler.takeHeapSnapshot(reportProgress=progress is not None), timeout)
+        finally:
+            client.off("HeapProfiler.addHeapSnapshotChunk", chunk)
+            if progress is not None:
+                client.off("HeapProfiler.reportHeapSnapshotProgress", report)
+    return path
+
+class Aggregate:
+    """The instances of one constructor in a HeapSnapshot: how many there
+    are, their own sizes, and the size retained by them."""
+    __slots__ = ("count", "self_size", "retained_size")
+
+    def __init__(self, count: int=0, self_size: int=0, retained_size: int=0):
+        self.count = count
+        self.self_size = self_size
+        self.retained_size = retained_size
+
+    def __repr__(self):
+        return f'Aggregate(count={self.count}, self_size={self.self_size}, retained_size={self.retained_size})'
+
+class HeapSnapshot:
+    """A .heapsnapshot file, as written by take_heap_snapshot, read for
+    analysis without DevTools:
+
+        before, after = HeapSnapshot("before.heapsnapshot"), HeapSnapshot("after.heapsnapshot")
+        for name, delta in sorted(after.diff(before).items(), key=lambda kv: -kv[1].retained_size)[:20]:
+            print(name, delta)
+
+    The file is memory-mapped, and its flat `nodes` and `edges` arrays are
+    parsed a piece at a time straight into typed arrays of uint32: numpy
+    arrays if numpy is installed, which also parses them several times
+    faster, else the standard library's array. Only the metadata and
+    `strings` go through the json parser.
+
+    Nodes are referred to by their ordinal, 0 being the root. Dominators and
+    retained sizes are worked out the first time they're asked for, with
+    weak edges ignored, like DevTools does."""
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+            self.meta, pos = _value(m, b'"snapshot"', 0)
+            self.nodes, pos = _ints(m, b'"nodes"', pos)
+            self.edges, pos = _ints(m, b'"edges"', pos)
+            self.strings, _ = _value(m, b'"strings"', pos)
+
+        meta = self.meta["meta"]
+        self.node_fields = meta["node_fields"]
+        self.edge_fields = meta["edge_fields"]
+        self.node_types = meta["node_types"][self.node_fields.index("type")]
+        self.edge_types = meta["edge_types"][self.edge_fields.index("type")]
+        self.node_count = len(self.nodes) // len(self.node_fields)
+
+        # reachable nodes in depth first post order, see dominators()
+        self._order = None
+        self._dominators = None
+        self._retained = None
+        self._constructors = None
+
+    def node_field(self, name: str):
+        """Field `name` of every node, e.g. "self_size", as a typed array."""
+        return self.nodes[self.node_fields.index(name)::len(self.node_fields)]
+
+    def edge_field(self, name: str):
+        """Field `name` of every edge, as a typed array. Edges are in the
+        order of the nodes they're from."""
+        return self.edges[self.edge_fields.index(name)::len(self.edge_fields)]
+
+    def class_name(self, node: int, types=None, names=None):
+        """What DevTools groups the node under: its constructor's name for
+        objects, else its type in brackets, e.g. "(string)"."""
+        type_ = self.node_types[(self.node_field("type") if types is None else types)[node]]
+        if type_ in ("object", "native"):
+            return self.strings[(self.node_field("name") if names is None else names)[node]]
+        return f'({type_})'
+
+    def _graph(self):
+        # the graph in compressed sparse row form: the edges of node i are
+        # first[i] up to first[i + 1], and targets holds the node each edge
+        # points to, or -1 for weak edges
+        nf = len(self.node_fields)
+        weak = self.edge_types.index("weak") if "weak" in self.edge_types else -1
+        counts, types, to_nodes = self.node_field("edge_count"), self.edge_field("type"), self.edge_field("to_node")
+        if numpy is not None:
+            first = _typed("i", numpy.concatenate((numpy.zeros(1, numpy.int64), numpy.cumsum(counts, dtype=numpy.int64))))
+            targets = _typed("i", numpy.where(types == weak, -1, to_nodes // nf))
+            return first, targets
+
+        first = array("i", [0]) * (len(counts) + 1)
+        total = 0
+        for i, count in enumerate(counts):
+            total += count
+            first[i + 1] = total
+        targets = array("i", (-1 if t == weak else to // nf for t, to in zip(types, to_nodes)))
+        return first, targets
+
+    def dominators(self):
+        """The immediate dominator of each node, by ordinal: the node every
+        path from the root to it goes through last. It's the root for the
+        root itself, and -1 for nodes that can only be reached through weak
+        edges, or not at all.
+
+        Uses the iterative algorithm of Cooper, Harvey and Kennedy, which is
+        simple and, on graphs shaped like heaps, about as fast as
+        Lengauer-Tarjan."""
+        if self._dominators is not None:
+            return self._dominators
+
+        first, targets = self._graph()
+        n = self.node_count
+
+        # number the nodes reachable from the root in depth first post order
+        order = array("i")
+        seen = bytearray(n)
+        cursor = array("i", first)
+        stack = array("i", [0])
+        seen[0] = 1
+        while stack:
+            node = stack[-1]
+            e, end = cursor[node], first[node + 1]
+            while e < end and (targets[e] < 0 or seen[targets[e]]):
+                e += 1
+            if e < end:
+                cursor[node] = e + 1
+                seen[targets[e]] = 1
+                stack.append(targets[e])
+            else:
+                stack.pop()
+                order.append(node)
+        del cursor, stack
+        count = len(order)
+        number = array("i", [-1]) * n
+        for i, node in enumerate(order):
+            number[node] = i
+
+        # the predecessors of each node, by post order number, in the same
+        # form as the graph
+        pred_first = array("i", [0]) * (count + 1)
+        for node in order:
+            for e in range(first[node], first[node + 1]):
+                if targets[e] >= 0:
+                    pred_first[number[targets[e]] + 1] += 1
+        for i in range(count):
+            pred_first[i + 1] += pred_first[i]
+        fill = pred_first[:-1]
+        preds = array("i", [0]) * pred_first[count]
+        for node in order:
+            b = number[node]
+            for e in range(first[node], first[node + 1]):
+                if targets[e] >= 0:
+                    p = number[targets[e]]
+                    preds[fill[p]] = b
+                    fill[p] += 1
+        del first, targets, fill
+
+        # in post order numbers, a dominator always has a higher number than
+        # the nodes it dominates, and the root has the highest
+        root = count - 1
+        doms = array("i", [-1]) * count
+        doms[root] = root
+        changed = True
+        while changed:
+            changed = False
+            for b in range(root - 1, -1, -1):
+                new = -1
+                for i in range(pred_first[b], pred_first[b + 1]):
+                    p = preds[i]
+                    if doms[p] < 0:
+                        continue
+                    if new < 0:
+                        new = p
+                        continue
+                    while p != new:
+                        while p < new:
+                            p = doms[p]
+                        while new < p:
+                            new = doms[new]
+                if doms[b] != new:
+                    doms[b] = new
+                    changed = True
+
+        dominators = array("i", [-1]) * n
+        for i, node in enumerate(order):
+            dominators[node] = order[doms[i]]
+        self._order = order
+        self._dominators = dominators
+        return dominators
+
+    def retained_sizes(self):
+        """The retained size of each node, by ordinal: its own size plus that
+        of every node it dominates, i.e. what would be freed if it were."""
+        if self._retained is not None:
+            return self._retained
+
+        dominators = self.dominators()
+        retained = _typed("q", self.node_field("self_size"))
+        # children come before their dominators in post order
+        for node in self._order[:-1]:
+            retained[dominators[node]] += retained[node]
+        for node in range(self.node_count):
+            if dominators[node] < 0:
+                retained[node] = 0
+        self._retained = retained
+        return retained
+
+    def constructors(self):
+        """Class name (see class_name) -> Aggregate of the nodes reachable
+        from the root. Like DevTools, an instance that's retained by another
+        instance of the same class only counts towards the class's retained
+        size once, through the outer one."""
+        if self._constructors is not None:
+            return self._constructors
+
+        dominators = self.dominators()
+        retained = self.retained_sizes()
+        # they're read one node at a time, which is slow for numpy arrays
+        types, names = _typed("I", self.node_field("type")), _typed("I", self.node_field("name"))
+        sizes = _typed("I", self.node_field("self_size"))
+        order = self._order
+
+        # number the classes, and give each node the number of its class.
+        # Nodes are told apart by name, or for other types by type, which is
+        # negated so they don't clash.
+        keys = {}
+        numbers = {}
+        aggregates = []
+        classes = array("i", [-1]) * self.node_count
+        objects = {i for i, t in enumerate(self.node_types) if t in ("object", "native")}
+        for node in order:
+            t = types[node]
+            key = names[node] if t in objects else ~t
+            cls = keys.get(key)
+            if cls is None:
+                name = self.class_name(node, types, names)
+                cls = numbers.get(name)
+                if cls is None:
+                    cls = numbers[name] = len(aggregates)
+                    aggregates.append((name, Aggregate()))
+                keys[key] = cls
+            classes[node] = cls
+
+        # the dominator tree, in the same form as the graph
+        first = array("i", [0]) * (self.node_count + 1)
+        for node in order[:-1]:
+            first[dominators[node] + 1] += 1
+        for i in range(self.node_count):
+            first[i + 1] += first[i]
+        fill = first[:-1]
+        children = array("i", [0]) * first[-1]
+        for node in order[:-1]:
+            d = dominators[node]
+            children[fill[d]] = node
+            fill[d] += 1
+        del fill
+
+        # walk it, keeping count of the classes on the path from the root.
+        # Leaving a node is pushed as ~node.
+        active = array("i", [0]) * len(aggregates)
+        stack = array("i", [0])
+        while stack:
+            node = stack.pop()
+            if node < 0:
+                active[classes[~node]] -= 1
+                continue
+            cls = classes[node]
+            agg = aggregates[cls][1]
+            agg.count += 1
+            agg.self_size += sizes[node]
+            if not active[cls]:
+                agg.retained_size += retained[node]
+            active[cls] += 1
+            stack.append(~node)
+            stack.extend(children[first[node]:first[node + 1]])
+
+        self._constructors = dict(aggregates)
+        return self._constructors
+
+    def diff(self, base: "HeapSnapshot"):
+        """Class name -> Aggregate of how this snapshot differs from `base`,
+        for the classes that do."""
+        mine, theirs = self.constructors(), base.constructors()
+        deltas = {}
+        for name in mine.keys() | theirs.keys():
+            a, b = mine.get(name, Aggregate()), theirs.get(name, Aggregate())
+            delta = Aggregate(a.count - b.count, a.self_size - b.self_size, a.retained_size - b.retained_size)
+            if delta.count or delta.self_size or delta.retained_size:
+                deltas[name] = delta
+        return deltas
+
+def _typed(typecode: str, values):
+    """`values`, a numpy array or any iterable of ints, as an array of
+    `typecode`."""
+    if numpy is not None and isinstance(values, numpy.ndarray):
+        return array(typecode, values.astype(typecode).tobytes())
+    if isinstance(values, array) and values.typecode == typecode:
+        return values
+    return array(typecode, values)
+
+# how much of a flat array is parsed at a time
+CHUNK_SIZE = 1 << 22
+
+def _value(m: mmap.mmap, key: bytes, pos: int):
+    """Decode the json value of `key`, found at or after `pos`, and return it
+    along with where it ends."""
+    start = m.find(key, pos)
+    if start < 0:
+        raise ValueError(f"no {key.decode()} in heap snapshot")
+    start = m.find(b":", start) + 1
+    decoder = json.JSONDecoder()
+    # the value's size isn't known up front, so try ever bigger windows
+    size = 1 << 16
+    while True:
+        end = min(len(m), start + size)
+        # the window may cut a character in half, in which case the value is
+        # cut short and fails to parse anyway
+        text = m[start:end].decode("utf-8", "ignore")
+        value_text = text.lstrip()
+        try:
+            value, n = decoder.raw_decode(value_text)
+        except json.JSONDecodeError:
+            if end == len(m):
+                raise
+            size *= 4
+            continue
+        n += len(text) - len(value_text)
+        return value, start + len(text[:n].encode())
+
+def _ints(m: mmap.mmap, key: bytes, pos: int):
+    """Parse the flat array of integers of `key`, found at or after `pos`,
+    into a typed array, and return it along with where it ends."""
+    start = m.find(key, pos)
+    if start < 0:
+        raise ValueError(f"no {key.decode()} in heap snapshot")
+    start = m.find(b"[", start) + 1
+    end = m.find(b"]", start)
+
+    parts = []
+    while start < end:
+        stop = min(end, start + CHUNK_SIZE)
+        if stop < end:
+            # don't cut a number in half
+            comma = m.rfind(b",", start, stop)
+            if comma < 0:
+                comma = m.find(b",", stop, end)
+            stop = comma + 1 if comma >= 0 else end
+        chunk = m[start:stop].rstrip(b", \n")
+        if chunk:
+            if numpy is not None:
+                parts.append(numpy.fromstring(chunk.decode("ascii"), dtype=numpy.uint32, sep=","))
+            else:
+                parts.append(array("I", map(int, chunk.split(b","))))
+        start = stop
+
+    if numpy is not None:
+        return (numpy.concatenate(parts) if parts else numpy.zeros(0, numpy.uint32)), end + 1
+    ints = array("I")
+    for part in parts:
+        ints.extend(part)
+    return ints, end + 1
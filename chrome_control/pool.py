@@ -0,0 +1,155 @@
+import queue
+import threading
+from contextlib import contextmanager
+
+from chrome_control import Emulation, Page, Runtime, Storage
+from chrome_control.base import ChromeError
+from chrome_control.chrome import Chrome, log
+from chrome_control.deadline import Deadline
+
+# undoes every Emulation override
+RESET_EMULATION = [
+    Emulation.clearDeviceMetricsOverride(),
+    Emulation.resetViewport(),
+    Emulation.resetPageScaleFactor(),
+    Emulation.clearGeolocationOverride(),
+    Emulation.setScriptExecutionDisabled(False),
+    Emulation.setTouchEmulationEnabled(False),
+    Emulation.setEmulatedMedia(""),
+    Emulation.setCPUThrottlingRate(1),
+]
+
+class TabPool:
+    """A set of tabs that are opened once and handed out over and over.
+
+    Opening a tab costs a few http round trips, a renderer process and a
+    websocket handshake; checking one out of the pool costs nothing:
+
+        pool = TabPool(8)
+        with pool.tab("http://bananas.com") as tab:
+            tab.do(Runtime.evaluate("console.log(window.location);", returnByValue=True))
+
+    When a tab is returned, whatever the job left behind is cleaned up: its
+    event callbacks and Page.addScriptToEvaluateOnLoad scripts are dropped,
+    Emulation overrides are cleared, so are the storage and cookies of every
+    origin it navigated to, and it's navigated to about:blank. A resilient
+    tab forgets the job's enables and scripts, so they aren't re-sent into
+    the next job's tab after a reconnect. A tab that can't be reset is closed
+    and replaced with a fresh one.
+
+    Cleaning up is given `reset_timeout` seconds, so a page that's hung
+    can't block `checkin`.
+
+    Any other keyword arguments are passed on to `Chrome`."""
+    def __init__(self, size: int, reset_timeout: float=10, **chrome_args):
+        self.chrome_args = chrome_args
+        self.reset_timeout = reset_timeout
+        # checked out tab -> its (subscribers, restore, script_ids) when it
+        # was checked out
+        self.saved = {}
+        # checked out tab -> the origins its frames have navigated to
+        self.origins = {}
+        self.idle = queue.Queue()
+        self.tabs = []
+        self.lock = threading.Lock()
+        for _ in range(size):
+            self.idle.put(self._open())
+
+    def _open(self):
+        chrome = Chrome(**self.chrome_args)
+        # for Page.frameNavigated, see checkout
+        chrome.do(Page.enable())
+        with self.lock:
+            self.tabs.append(chrome)
+        return chrome
+
+    def _close(self, chrome):
+        with self.lock:
+            self.tabs.remove(chrome)
+        try:
+            chrome.close()
+        finally:
+            chrome.discovery.close_tab(chrome.tab["id"], chrome.timeout)
+
+    def _reset(self, chrome):
+        # drop the callbacks the job added, but not the client's own, such as
+        # the crash handler of a resilient one
+        subscribers, restore, script_ids = self.saved.pop(chrome)
+        origins = self.origins.pop(chrome)
+        chrome.subscribers.clear()
+        chrome.subscribers.update(subscribers)
+
+        deadline = Deadline(self.reset_timeout)
+        # in case the job turned Page events off
+        origins.add(chrome.do(Runtime.evaluate("location.origin", returnByValue=True), deadline).result.value)
+
+        # send them all in one round trip
+        cmds = [Page.removeScriptToEvaluateOnLoad(identifier) for identifier in list(chrome.script_ids) if identifier not in script_ids]
+        # about:blank and friends have an opaque origin, and nothing to clear
+        cmds.extend(Storage.clearDataForOrigin(origin, "all") for origin in origins if origin and origin not in ("null", "://"))
+        cmds.extend([Page.enable(), Page.navigate("about:blank")])
+        results = chrome.batch(cmds + RESET_EMULATION, return_exceptions=True, timeout=deadline)
+        # older Chromes don't know all of the Emulation commands, and that's
+        # fine, but the rest have to work
+        for result in results[:len(cmds)]:
+            if isinstance(result, ChromeError):
+                raise result
+
+        # what the job enabled and registered isn't to be restored after a
+        # reconnect; scripts that were there before may have been re-registered
+        # since, under a new identifier
+        chrome.restore.clear()
+        chrome.restore.update(restore)
+        chrome.script_ids = {k: v for k, v in chrome.script_ids.items() if k in script_ids}
+
+    def checkout(self, timeout=None):
+        """Take a tab out of the pool, waiting up to `timeout` (seconds, or a
+        Deadline) for one to be returned if they're all in use. Hand it back
+        with `checkin`."""
+        deadline = Deadline.of(timeout)
+        try:
+            chrome = self.idle.get(timeout=deadline and deadline.remaining())
+        except queue.Empty:
+            raise TimeoutError(f"no tab was free within {deadline.timeout}s") from None
+        self.saved[chrome] = ({method: list(callbacks) for method, callbacks in chrome.subscribers.items()}, dict(chrome.restore), dict(chrome.script_ids))
+        origins = self.origins[chrome] = set()
+        # dropped along with the job's callbacks
+        chrome.on("Page.frameNavigated", lambda event: origins.add(event.frame.securityOrigin))
+        return chrome
+
+    def checkin(self, chrome: Chrome):
+        try:
+            self._reset(chrome)
+        except Exception:
+            log.warning("couldn't reset tab %s, replacing it", chrome.tab["id"], exc_info=True)
+            try:
+                self._close(chrome)
+            except Exception:
+                pass
+            chrome = self._open()
+        self.idle.put(chrome)
+
+    @contextmanager
+    def tab(self, url: str=None, timeout=None):
+        """Check out a tab for the duration of a with block, navigated to
+        `url` if one is given. `timeout` covers both the wait for a free tab
+        and the navigation."""
+        deadline = Deadline.of(timeout)
+        chrome = self.checkout(deadline)
+        try:
+            if url is not None:
+                chrome.do(Page.navigate(url), timeout=deadline)
+            yield chrome
+        finally:
+            self.checkin(chrome)
+
+    def close(self):
+        """Close every tab, including the ones that are checked out."""
+        for chrome in list(self.tabs):
+            self._close(chrome)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
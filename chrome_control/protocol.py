@@ -0,0 +1,605 @@
+# generated by gen.py, don't edit it by hand.
+#
+# A type is a json type ("string", "integer", "number", "boolean", "object" or
+# "any"), a qualified "Domain.Type", or [type] for a list. Params and returns
+# are tuples of (name, type, optional).
+
+# a hash of the protocol file and gen.py this was built from
+source = 'd92366396b2bef57bfa0f7a7fe4e1680177d9117'
+
+version = ('1', '2')
+
+# "Domain.Type" -> its underlying type, or a tuple of its values for enums
+types = {
+    'Memory.PressureLevel': ('moderate', 'critical'),
+    'Page.ResourceType': ('Document', 'Stylesheet', 'Image', 'Media', 'Font', 'Script', 'TextTrack', 'XHR', 'Fetch', 'EventSource', 'WebSocket', 'Manifest', 'Other'),
+    'Page.FrameId': 'string',
+    'Page.Frame': 'object',
+    'Page.FrameResource': 'object',
+    'Page.FrameResourceTree': 'object',
+    'Page.ScriptIdentifier': 'string',
+    'Page.NavigationEntry': 'object',
+    'Page.ScreencastFrameMetadata': 'object',
+    'Page.DialogType': ('alert', 'confirm', 'prompt', 'beforeunload'),
+    'Page.AppManifestError': 'object',
+    'Page.NavigationResponse': ('Proceed', 'Cancel', 'CancelAndIgnore'),
+    'Page.LayoutViewport': 'object',
+    'Page.VisualViewport': 'object',
+    'Emulation.ScreenOrientation': 'object',
+    'Emulation.VirtualTimePolicy': ('advance', 'pause', 'pauseIfNetworkFetchesPending'),
+    'Security.CertificateId': 'integer',
+    'Security.SecurityState': ('unknown', 'neutral', 'insecure', 'warning', 'secure', 'info'),
+    'Security.SecurityStateExplanation': 'object',
+    'Security.InsecureContentStatus': 'object',
+    'Network.LoaderId': 'string',
+    'Network.RequestId': 'string',
+    'Network.Timestamp': 'number',
+    'Network.Headers': 'object',
+    'Network.ConnectionType': ('none', 'cellular2g', 'cellular3g', 'cellular4g', 'bluetooth', 'ethernet', 'wifi', 'wimax', 'other'),
+    'Network.CookieSameSite': ('Strict', 'Lax'),
+    'Network.ResourceTiming': 'object',
+    'Network.ResourcePriority': ('VeryLow', 'Low', 'Medium', 'High', 'VeryHigh'),
+    'Network.Request': 'object',
+    'Network.SignedCertificateTimestamp': 'object',
+    'Network.SecurityDetails': 'object',
+    'Network.BlockedReason': ('csp', 'mixed-content', 'origin', 'inspector', 'subresource-filter', 'other'),
+    'Network.Response': 'object',
+    'Network.WebSocketRequest': 'object',
+    'Network.WebSocketResponse': 'object',
+    'Network.WebSocketFrame': 'object',
+    'Network.CachedResource': 'object',
+    'Network.Initiator': 'object',
+    'Network.Cookie': 'object',
+    'Database.DatabaseId': 'string',
+    'Database.Database': 'object',
+    'Database.Error': 'object',
+    'IndexedDB.DatabaseWithObjectStores': 'object',
+    'IndexedDB.ObjectStore': 'object',
+    'IndexedDB.ObjectStoreIndex': 'object',
+    'IndexedDB.Key': 'object',
+    'IndexedDB.KeyRange': 'object',
+    'IndexedDB.DataEntry': 'object',
+    'IndexedDB.KeyPath': 'object',
+    'CacheStorage.CacheId': 'string',
+    'CacheStorage.DataEntry': 'object',
+    'CacheStorage.Cache': 'object',
+    'DOMStorage.StorageId': 'object',
+    'DOMStorage.Item': ['string'],
+    'ApplicationCache.ApplicationCacheResource': 'object',
+    'ApplicationCache.ApplicationCache': 'object',
+    'ApplicationCache.FrameWithManifest': 'object',
+    'DOM.NodeId': 'integer',
+    'DOM.BackendNodeId': 'integer',
+    'DOM.BackendNode': 'object',
+    'DOM.PseudoType': ('first-line', 'first-letter', 'before', 'after', 'backdrop', 'selection', 'first-line-inherited', 'scrollbar', 'scrollbar-thumb', 'scrollbar-button', 'scrollbar-track', 'scrollbar-track-piece', 'scrollbar-corner', 'resizer', 'input-list-button'),
+    'DOM.ShadowRootType': ('user-agent', 'open', 'closed'),
+    'DOM.Node': 'object',
+    'DOM.RGBA': 'object',
+    'DOM.Quad': ['number'],
+    'DOM.BoxModel': 'object',
+    'DOM.ShapeOutsideInfo': 'object',
+    'DOM.Rect': 'object',
+    'DOM.HighlightConfig': 'object',
+    'DOM.InspectMode': ('searchForNode', 'searchForUAShadowDOM', 'none'),
+    'CSS.StyleSheetId': 'string',
+    'CSS.StyleSheetOrigin': ('injected', 'user-agent', 'inspector', 'regular'),
+    'CSS.PseudoElementMatches': 'object',
+    'CSS.InheritedStyleEntry': 'object',
+    'CSS.RuleMatch': 'object',
+    'CSS.Value': 'object',
+    'CSS.SelectorList': 'object',
+    'CSS.CSSStyleSheetHeader': 'object',
+    'CSS.CSSRule': 'object',
+    'CSS.RuleUsage': 'object',
+    'CSS.SourceRange': 'object',
+    'CSS.ShorthandEntry': 'object',
+    'CSS.CSSComputedStyleProperty': 'object',
+    'CSS.CSSStyle': 'object',
+    'CSS.CSSProperty': 'object',
+    'CSS.CSSMedia': 'object',
+    'CSS.MediaQuery': 'object',
+    'CSS.MediaQueryExpression': 'object',
+    'CSS.PlatformFontUsage': 'object',
+    'CSS.CSSKeyframesRule': 'object',
+    'CSS.CSSKeyframeRule': 'object',
+    'CSS.StyleDeclarationEdit': 'object',
+    'CSS.InlineTextBox': 'object',
+    'CSS.LayoutTreeNode': 'object',
+    'CSS.ComputedStyle': 'object',
+    'IO.StreamHandle': 'string',
+    'DOMDebugger.DOMBreakpointType': ('subtree-modified', 'attribute-modified', 'node-removed'),
+    'DOMDebugger.EventListener': 'object',
+    'Target.TargetID': 'string',
+    'Target.BrowserContextID': 'string',
+    'Target.TargetInfo': 'object',
+    'Target.RemoteLocation': 'object',
+    'ServiceWorker.ServiceWorkerRegistration': 'object',
+    'ServiceWorker.ServiceWorkerVersionRunningStatus': ('stopped', 'starting', 'running', 'stopping'),
+    'ServiceWorker.ServiceWorkerVersionStatus': ('new', 'installing', 'installed', 'activating', 'activated', 'redundant'),
+    'ServiceWorker.ServiceWorkerVersion': 'object',
+    'ServiceWorker.ServiceWorkerErrorMessage': 'object',
+    'Input.TouchPoint': 'object',
+    'Input.GestureSourceType': ('default', 'touch', 'mouse'),
+    'LayerTree.LayerId': 'string',
+    'LayerTree.SnapshotId': 'string',
+    'LayerTree.ScrollRect': 'object',
+    'LayerTree.PictureTile': 'object',
+    'LayerTree.Layer': 'object',
+    'LayerTree.PaintProfile': ['number'],
+    'Tracing.MemoryDumpConfig': 'object',
+    'Tracing.TraceConfig': 'object',
+    'Animation.Animation': 'object',
+    'Animation.AnimationEffect': 'object',
+    'Animation.KeyframesRule': 'object',
+    'Animation.KeyframeStyle': 'object',
+    'Accessibility.AXNodeId': 'string',
+    'Accessibility.AXValueType': ('boolean', 'tristate', 'booleanOrUndefined', 'idref', 'idrefList', 'integer', 'node', 'nodeList', 'number', 'string', 'computedString', 'token', 'tokenList', 'domRelation', 'role', 'internalRole', 'valueUndefined'),
+    'Accessibility.AXValueSourceType': ('attribute', 'implicit', 'style', 'contents', 'placeholder', 'relatedElement'),
+    'Accessibility.AXValueNativeSourceType': ('figcaption', 'label', 'labelfor', 'labelwrapped', 'legend', 'tablecaption', 'title', 'other'),
+    'Accessibility.AXValueSource': 'object',
+    'Accessibility.AXRelatedNode': 'object',
+    'Accessibility.AXProperty': 'object',
+    'Accessibility.AXValue': 'object',
+    'Accessibility.AXGlobalStates': ('disabled', 'hidden', 'hiddenRoot', 'invalid'),
+    'Accessibility.AXLiveRegionAttributes': ('live', 'atomic', 'relevant', 'busy', 'root'),
+    'Accessibility.AXWidgetAttributes': ('autocomplete', 'haspopup', 'level', 'multiselectable', 'orientation', 'multiline', 'readonly', 'required', 'valuemin', 'valuemax', 'valuetext'),
+    'Accessibility.AXWidgetStates': ('checked', 'expanded', 'pressed', 'selected'),
+    'Accessibility.AXRelationshipAttributes': ('activedescendant', 'flowto', 'controls', 'describedby', 'labelledby', 'owns'),
+    'Accessibility.AXNode': 'object',
+    'Storage.StorageType': ('appcache', 'cookies', 'file_systems', 'indexeddb', 'local_storage', 'shader_cache', 'websql', 'service_workers', 'cache_storage', 'all'),
+    'Log.LogEntry': 'object',
+    'Log.ViolationSetting': 'object',
+    'SystemInfo.GPUDevice': 'object',
+    'SystemInfo.GPUInfo': 'object',
+    'Schema.Domain': 'object',
+    'Runtime.ScriptId': 'string',
+    'Runtime.RemoteObjectId': 'string',
+    'Runtime.UnserializableValue': ('Infinity', 'NaN', '-Infinity', '-0'),
+    'Runtime.RemoteObject': 'object',
+    'Runtime.CustomPreview': 'object',
+    'Runtime.ObjectPreview': 'object',
+    'Runtime.PropertyPreview': 'object',
+    'Runtime.EntryPreview': 'object',
+    'Runtime.PropertyDescriptor': 'object',
+    'Runtime.InternalPropertyDescriptor': 'object',
+    'Runtime.CallArgument': 'object',
+    'Runtime.ExecutionContextId': 'integer',
+    'Runtime.ExecutionContextDescription': 'object',
+    'Runtime.ExceptionDetails': 'object',
+    'Runtime.Timestamp': 'number',
+    'Runtime.CallFrame': 'object',
+    'Runtime.StackTrace': 'object',
+    'Debugger.BreakpointId': 'string',
+    'Debugger.CallFrameId': 'string',
+    'Debugger.Location': 'object',
+    'Debugger.ScriptPosition': 'object',
+    'Debugger.CallFrame': 'object',
+    'Debugger.Scope': 'object',
+    'Debugger.SearchMatch': 'object',
+    'Console.ConsoleMessage': 'object',
+    'Profiler.ProfileNode': 'object',
+    'Profiler.Profile': 'object',
+    'Profiler.PositionTickInfo': 'object',
+    'HeapProfiler.HeapSnapshotObjectId': 'string',
+    'HeapProfiler.SamplingHeapProfileNode': 'object',
+    'HeapProfiler.SamplingHeapProfile': 'object',
+}
+
+# "Domain.command" -> (params, returns)
+commands = {
+    'Inspector.enable': ((), ()),
+    'Inspector.disable': ((), ()),
+    'Memory.getDOMCounters': ((), (('documents', 'integer', False), ('nodes', 'integer', False), ('jsEventListeners', 'integer', False))),
+    'Memory.setPressureNotificationsSuppressed': ((('suppressed', 'boolean', False),), ()),
+    'Memory.simulatePressureNotification': ((('level', 'Memory.PressureLevel', False),), ()),
+    'Page.enable': ((), ()),
+    'Page.disable': ((), ()),
+    'Page.addScriptToEvaluateOnLoad': ((('scriptSource', 'string', False),), (('identifier', 'Page.ScriptIdentifier', False),)),
+    'Page.removeScriptToEvaluateOnLoad': ((('identifier', 'Page.ScriptIdentifier', False),), ()),
+    'Page.setAutoAttachToCreatedPages': ((('autoAttach', 'boolean', False),), ()),
+    'Page.reload': ((('ignoreCache', 'boolean', True), ('scriptToEvaluateOnLoad', 'string', True)), ()),
+    'Page.navigate': ((('url', 'string', False),), (('frameId', 'Page.FrameId', False),)),
+    'Page.stopLoading': ((), ()),
+    'Page.getNavigationHistory': ((), (('currentIndex', 'integer', False), ('entries', ['Page.NavigationEntry'], False))),
+    'Page.navigateToHistoryEntry': ((('entryId', 'integer', False),), ()),
+    'Page.getCookies': ((), (('cookies', ['Network.Cookie'], False),)),
+    'Page.deleteCookie': ((('cookieName', 'string', False), ('url', 'string', False)), ()),
+    'Page.getResourceTree': ((), (('frameTree', 'Page.FrameResourceTree', False),)),
+    'Page.getResourceContent': ((('frameId', 'Page.FrameId', False), ('url', 'string', False)), (('content', 'string', False), ('base64Encoded', 'boolean', False))),
+    'Page.searchInResource': ((('frameId', 'Page.FrameId', False), ('url', 'string', False), ('query', 'string', False), ('caseSensitive', 'boolean', True), ('isRegex', 'boolean', True)), (('result', ['Debugger.SearchMatch'], False),)),
+    'Page.setDocumentContent': ((('frameId', 'Page.FrameId', False), ('html', 'string', False)), ()),
+    'Page.setDeviceMetricsOverride': ((('width', 'integer', False), ('height', 'integer', False), ('deviceScaleFactor', 'number', False), ('mobile', 'boolean', False), ('fitWindow', 'boolean', False), ('scale', 'number', True), ('offsetX', 'number', True), ('offsetY', 'number', True), ('screenWidth', 'integer', True), ('screenHeight', 'integer', True), ('positionX', 'integer', True), ('positionY', 'integer', True), ('screenOrientation', 'Emulation.ScreenOrientation', True)), ()),
+    'Page.clearDeviceMetricsOverride': ((), ()),
+    'Page.setGeolocationOverride': ((('latitude', 'number', True), ('longitude', 'number', True), ('accuracy', 'number', True)), ()),
+    'Page.clearGeolocationOverride': ((), ()),
+    'Page.setDeviceOrientationOverride': ((('alpha', 'number', False), ('beta', 'number', False), ('gamma', 'number', False)), ()),
+    'Page.clearDeviceOrientationOverride': ((), ()),
+    'Page.setTouchEmulationEnabled': ((('enabled', 'boolean', False), ('configuration', 'string', True)), ()),
+    'Page.captureScreenshot': ((), (('data', 'string', False),)),
+    'Page.startScreencast': ((('format', 'string', True), ('quality', 'integer', True), ('maxWidth', 'integer', True), ('maxHeight', 'integer', True), ('everyNthFrame', 'integer', True)), ()),
+    'Page.stopScreencast': ((), ()),
+    'Page.screencastFrameAck': ((('sessionId', 'integer', False),), ()),
+    'Page.handleJavaScriptDialog': ((('accept', 'boolean', False), ('promptText', 'string', True)), ()),
+    'Page.setColorPickerEnabled': ((('enabled', 'boolean', False),), ()),
+    'Page.configureOverlay': ((('suspended', 'boolean', True), ('message', 'string', True)), ()),
+    'Page.getAppManifest': ((), (('url', 'string', False), ('errors', ['Page.AppManifestError'], False), ('data', 'string', True))),
+    'Page.requestAppBanner': ((), ()),
+    'Page.setControlNavigations': ((('enabled', 'boolean', False),), ()),
+    'Page.processNavigation': ((('response', 'Page.NavigationResponse', False), ('navigationId', 'integer', False)), ()),
+    'Page.getLayoutMetrics': ((), (('layoutViewport', 'Page.LayoutViewport', False), ('visualViewport', 'Page.VisualViewport', False))),
+    'Rendering.setShowPaintRects': ((('result', 'boolean', False),), ()),
+    'Rendering.setShowDebugBorders': ((('show', 'boolean', False),), ()),
+    'Rendering.setShowFPSCounter': ((('show', 'boolean', False),), ()),
+    'Rendering.setShowScrollBottleneckRects': ((('show', 'boolean', False),), ()),
+    'Rendering.setShowViewportSizeOnResize': ((('show', 'boolean', False),), ()),
+    'Emulation.setDeviceMetricsOverride': ((('width', 'integer', False), ('height', 'integer', False), ('deviceScaleFactor', 'number', False), ('mobile', 'boolean', False), ('fitWindow', 'boolean', False), ('scale', 'number', True), ('offsetX', 'number', True), ('offsetY', 'number', True), ('screenWidth', 'integer', True), ('screenHeight', 'integer', True), ('positionX', 'integer', True), ('positionY', 'integer', True), ('screenOrientation', 'Emulation.ScreenOrientation', True)), ()),
+    'Emulation.clearDeviceMetricsOverride': ((), ()),
+    'Emulation.forceViewport': ((('x', 'number', False), ('y', 'number', False), ('scale', 'number', False)), ()),
+    'Emulation.resetViewport': ((), ()),
+    'Emulation.resetPageScaleFactor': ((), ()),
+    'Emulation.setPageScaleFactor': ((('pageScaleFactor', 'number', False),), ()),
+    'Emulation.setVisibleSize': ((('width', 'integer', False), ('height', 'integer', False)), ()),
+    'Emulation.setScriptExecutionDisabled': ((('value', 'boolean', False),), ()),
+    'Emulation.setGeolocationOverride': ((('latitude', 'number', True), ('longitude', 'number', True), ('accuracy', 'number', True)), ()),
+    'Emulation.clearGeolocationOverride': ((), ()),
+    'Emulation.setTouchEmulationEnabled': ((('enabled', 'boolean', False), ('configuration', 'string', True)), ()),
+    'Emulation.setEmulatedMedia': ((('media', 'string', False),), ()),
+    'Emulation.setCPUThrottlingRate': ((('rate', 'number', False),), ()),
+    'Emulation.canEmulate': ((), (('result', 'boolean', False),)),
+    'Emulation.setVirtualTimePolicy': ((('policy', 'Emulation.VirtualTimePolicy', False), ('budget', 'integer', True)), ()),
+    'Security.enable': ((), ()),
+    'Security.disable': ((), ()),
+    'Security.showCertificateViewer': ((), ()),
+    'Network.enable': ((('maxTotalBufferSize', 'integer', True), ('maxResourceBufferSize', 'integer', True)), ()),
+    'Network.disable': ((), ()),
+    'Network.setUserAgentOverride': ((('userAgent', 'string', False),), ()),
+    'Network.setExtraHTTPHeaders': ((('headers', 'Network.Headers', False),), ()),
+    'Network.getResponseBody': ((('requestId', 'Network.RequestId', False),), (('body', 'string', False), ('base64Encoded', 'boolean', False))),
+    'Network.addBlockedURL': ((('url', 'string', False),), ()),
+    'Network.removeBlockedURL': ((('url', 'string', False),), ()),
+    'Network.replayXHR': ((('requestId', 'Network.RequestId', False),), ()),
+    'Network.setMonitoringXHREnabled': ((('enabled', 'boolean', False),), ()),
+    'Network.canClearBrowserCache': ((), (('result', 'boolean', False),)),
+    'Network.clearBrowserCache': ((), ()),
+    'Network.canClearBrowserCookies': ((), (('result', 'boolean', False),)),
+    'Network.clearBrowserCookies': ((), ()),
+    'Network.getCookies': ((), (('cookies', ['Network.Cookie'], False),)),
+    'Network.getAllCookies': ((), (('cookies', ['Network.Cookie'], False),)),
+    'Network.deleteCookie': ((('cookieName', 'string', False), ('url', 'string', False)), ()),
+    'Network.setCookie': ((('url', 'string', False), ('name', 'string', False), ('value', 'string', False), ('domain', 'string', True), ('path', 'string', True), ('secure', 'boolean', True), ('httpOnly', 'boolean', True), ('sameSite', 'Network.CookieSameSite', True), ('expirationDate', 'Network.Timestamp', True)), (('success', 'boolean', False),)),
+    'Network.canEmulateNetworkConditions': ((), (('result', 'boolean', False),)),
+    'Network.emulateNetworkConditions': ((('offline', 'boolean', False), ('latency', 'number', False), ('downloadThroughput', 'number', False), ('uploadThroughput', 'number', False), ('connectionType', 'Network.ConnectionType', True)), ()),
+    'Network.setCacheDisabled': ((('cacheDisabled', 'boolean', False),), ()),
+    'Network.setBypassServiceWorker': ((('bypass', 'boolean', False),), ()),
+    'Network.setDataSizeLimitsForTest': ((('maxTotalSize', 'integer', False), ('maxResourceSize', 'integer', False)), ()),
+    'Network.getCertificate': ((('origin', 'string', False),), (('tableNames', ['string'], False),)),
+    'Database.enable': ((), ()),
+    'Database.disable': ((), ()),
+    'Database.getDatabaseTableNames': ((('databaseId', 'Database.DatabaseId', False),), (('tableNames', ['string'], False),)),
+    'Database.executeSQL': ((('databaseId', 'Database.DatabaseId', False), ('query', 'string', False)), (('columnNames', ['string'], True), ('values', ['any'], True), ('sqlError', 'Database.Error', True))),
+    'IndexedDB.enable': ((), ()),
+    'IndexedDB.disable': ((), ()),
+    'IndexedDB.requestDatabaseNames': ((('securityOrigin', 'string', False),), (('databaseNames', ['string'], False),)),
+    'IndexedDB.requestDatabase': ((('securityOrigin', 'string', False), ('databaseName', 'string', False)), (('databaseWithObjectStores', 'IndexedDB.DatabaseWithObjectStores', False),)),
+    'IndexedDB.requestData': ((('securityOrigin', 'string', False), ('databaseName', 'string', False), ('objectStoreName', 'string', False), ('indexName', 'string', False), ('skipCount', 'integer', False), ('pageSize', 'integer', False), ('keyRange', 'IndexedDB.KeyRange', True)), (('objectStoreDataEntries', ['IndexedDB.DataEntry'], False), ('hasMore', 'boolean', False))),
+    'IndexedDB.clearObjectStore': ((('securityOrigin', 'string', False), ('databaseName', 'string', False), ('objectStoreName', 'string', False)), ()),
+    'CacheStorage.requestCacheNames': ((('securityOrigin', 'string', False),), (('caches', ['CacheStorage.Cache'], False),)),
+    'CacheStorage.requestEntries': ((('cacheId', 'CacheStorage.CacheId', False), ('skipCount', 'integer', False), ('pageSize', 'integer', False)), (('cacheDataEntries', ['CacheStorage.DataEntry'], False), ('hasMore', 'boolean', False))),
+    'CacheStorage.deleteCache': ((('cacheId', 'CacheStorage.CacheId', False),), ()),
+    'CacheStorage.deleteEntry': ((('cacheId', 'CacheStorage.CacheId', False), ('request', 'string', False)), ()),
+    'DOMStorage.enable': ((), ()),
+    'DOMStorage.disable': ((), ()),
+    'DOMStorage.getDOMStorageItems': ((('storageId', 'DOMStorage.StorageId', False),), (('entries', ['DOMStorage.Item'], False),)),
+    'DOMStorage.setDOMStorageItem': ((('storageId', 'DOMStorage.StorageId', False), ('key', 'string', False), ('value', 'string', False)), ()),
+    'DOMStorage.removeDOMStorageItem': ((('storageId', 'DOMStorage.StorageId', False), ('key', 'string', False)), ()),
+    'ApplicationCache.getFramesWithManifests': ((), (('frameIds', ['ApplicationCache.FrameWithManifest'], False),)),
+    'ApplicationCache.enable': ((), ()),
+    'ApplicationCache.getManifestForFrame': ((('frameId', 'Page.FrameId', False),), (('manifestURL', 'string', False),)),
+    'ApplicationCache.getApplicationCacheForFrame': ((('frameId', 'Page.FrameId', False),), (('applicationCache', 'ApplicationCache.ApplicationCache', False),)),
+    'DOM.enable': ((), ()),
+    'DOM.disable': ((), ()),
+    'DOM.getDocument': ((('depth', 'integer', True), ('pierce', 'boolean', True)), (('root', 'DOM.Node', False),)),
+    'DOM.collectClassNamesFromSubtree': ((('nodeId', 'DOM.NodeId', False),), (('classNames', ['string'], False),)),
+    'DOM.requestChildNodes': ((('nodeId', 'DOM.NodeId', False), ('depth', 'integer', True), ('pierce', 'boolean', True)), ()),
+    'DOM.querySelector': ((('nodeId', 'DOM.NodeId', False), ('selector', 'string', False)), (('nodeId', 'DOM.NodeId', False),)),
+    'DOM.querySelectorAll': ((('nodeId', 'DOM.NodeId', False), ('selector', 'string', False)), (('nodeIds', ['DOM.NodeId'], False),)),
+    'DOM.setNodeName': ((('nodeId', 'DOM.NodeId', False), ('name', 'string', False)), (('nodeId', 'DOM.NodeId', False),)),
+    'DOM.setNodeValue': ((('nodeId', 'DOM.NodeId', False), ('value', 'string', False)), ()),
+    'DOM.removeNode': ((('nodeId', 'DOM.NodeId', False),), ()),
+    'DOM.setAttributeValue': ((('nodeId', 'DOM.NodeId', False), ('name', 'string', False), ('value', 'string', False)), ()),
+    'DOM.setAttributesAsText': ((('nodeId', 'DOM.NodeId', False), ('text', 'string', False), ('name', 'string', True)), ()),
+    'DOM.removeAttribute': ((('nodeId', 'DOM.NodeId', False), ('name', 'string', False)), ()),
+    'DOM.getOuterHTML': ((('nodeId', 'DOM.NodeId', False),), (('outerHTML', 'string', False),)),
+    'DOM.setOuterHTML': ((('nodeId', 'DOM.NodeId', False), ('outerHTML', 'string', False)), ()),
+    'DOM.performSearch': ((('query', 'string', False), ('includeUserAgentShadowDOM', 'boolean', True)), (('searchId', 'string', False), ('resultCount', 'integer', False))),
+    'DOM.getSearchResults': ((('searchId', 'string', False), ('fromIndex', 'integer', False), ('toIndex', 'integer', False)), (('nodeIds', ['DOM.NodeId'], False),)),
+    'DOM.discardSearchResults': ((('searchId', 'string', False),), ()),
+    'DOM.requestNode': ((('objectId', 'Runtime.RemoteObjectId', False),), (('nodeId', 'DOM.NodeId', False),)),
+    'DOM.setInspectMode': ((('mode', 'DOM.InspectMode', False), ('highlightConfig', 'DOM.HighlightConfig', True)), ()),
+    'DOM.highlightRect': ((('x', 'integer', False), ('y', 'integer', False), ('width', 'integer', False), ('height', 'integer', False), ('color', 'DOM.RGBA', True), ('outlineColor', 'DOM.RGBA', True)), ()),
+    'DOM.highlightQuad': ((('quad', 'DOM.Quad', False), ('color', 'DOM.RGBA', True), ('outlineColor', 'DOM.RGBA', True)), ()),
+    'DOM.highlightNode': ((('highlightConfig', 'DOM.HighlightConfig', False), ('nodeId', 'DOM.NodeId', True), ('backendNodeId', 'DOM.BackendNodeId', True), ('objectId', 'Runtime.RemoteObjectId', True)), ()),
+    'DOM.hideHighlight': ((), ()),
+    'DOM.highlightFrame': ((('frameId', 'Page.FrameId', False), ('contentColor', 'DOM.RGBA', True), ('contentOutlineColor', 'DOM.RGBA', True)), ()),
+    'DOM.pushNodeByPathToFrontend': ((('path', 'string', False),), (('nodeId', 'DOM.NodeId', False),)),
+    'DOM.pushNodesByBackendIdsToFrontend': ((('backendNodeIds', ['DOM.BackendNodeId'], False),), (('nodeIds', ['DOM.NodeId'], False),)),
+    'DOM.setInspectedNode': ((('nodeId', 'DOM.NodeId', False),), ()),
+    'DOM.resolveNode': ((('nodeId', 'DOM.NodeId', False), ('objectGroup', 'string', True)), (('object', 'Runtime.RemoteObject', False),)),
+    'DOM.getAttributes': ((('nodeId', 'DOM.NodeId', False),), (('attributes', ['string'], False),)),
+    'DOM.copyTo': ((('nodeId', 'DOM.NodeId', False), ('targetNodeId', 'DOM.NodeId', False), ('insertBeforeNodeId', 'DOM.NodeId', True)), (('nodeId', 'DOM.NodeId', False),)),
+    'DOM.moveTo': ((('nodeId', 'DOM.NodeId', False), ('targetNodeId', 'DOM.NodeId', False), ('insertBeforeNodeId', 'DOM.NodeId', True)), (('nodeId', 'DOM.NodeId', False),)),
+    'DOM.undo': ((), ()),
+    'DOM.redo': ((), ()),
+    'DOM.markUndoableState': ((), ()),
+    'DOM.focus': ((('nodeId', 'DOM.NodeId', False),), ()),
+    'DOM.setFileInputFiles': ((('nodeId', 'DOM.NodeId', False), ('files', ['string'], False)), ()),
+    'DOM.getBoxModel': ((('nodeId', 'DOM.NodeId', False),), (('model', 'DOM.BoxModel', False),)),
+    'DOM.getNodeForLocation': ((('x', 'integer', False), ('y', 'integer', False)), (('nodeId', 'DOM.NodeId', False),)),
+    'DOM.getRelayoutBoundary': ((('nodeId', 'DOM.NodeId', False),), (('nodeId', 'DOM.NodeId', False),)),
+    'DOM.getHighlightObjectForTest': ((('nodeId', 'DOM.NodeId', False),), (('highlight', 'object', False),)),
+    'CSS.enable': ((), ()),
+    'CSS.disable': ((), ()),
+    'CSS.getMatchedStylesForNode': ((('nodeId', 'DOM.NodeId', False),), (('inlineStyle', 'CSS.CSSStyle', True), ('attributesStyle', 'CSS.CSSStyle', True), ('matchedCSSRules', ['CSS.RuleMatch'], True), ('pseudoElements', ['CSS.PseudoElementMatches'], True), ('inherited', ['CSS.InheritedStyleEntry'], True), ('cssKeyframesRules', ['CSS.CSSKeyframesRule'], True))),
+    'CSS.getInlineStylesForNode': ((('nodeId', 'DOM.NodeId', False),), (('inlineStyle', 'CSS.CSSStyle', True), ('attributesStyle', 'CSS.CSSStyle', True))),
+    'CSS.getComputedStyleForNode': ((('nodeId', 'DOM.NodeId', False),), (('computedStyle', ['CSS.CSSComputedStyleProperty'], False),)),
+    'CSS.getPlatformFontsForNode': ((('nodeId', 'DOM.NodeId', False),), (('fonts', ['CSS.PlatformFontUsage'], False),)),
+    'CSS.getStyleSheetText': ((('styleSheetId', 'CSS.StyleSheetId', False),), (('text', 'string', False),)),
+    'CSS.collectClassNames': ((('styleSheetId', 'CSS.StyleSheetId', False),), (('classNames', ['string'], False),)),
+    'CSS.setStyleSheetText': ((('styleSheetId', 'CSS.StyleSheetId', False), ('text', 'string', False)), (('sourceMapURL', 'string', True),)),
+    'CSS.setRuleSelector': ((('styleSheetId', 'CSS.StyleSheetId', False), ('range', 'CSS.SourceRange', False), ('selector', 'string', False)), (('selectorList', 'CSS.SelectorList', False),)),
+    'CSS.setKeyframeKey': ((('styleSheetId', 'CSS.StyleSheetId', False), ('range', 'CSS.SourceRange', False), ('keyText', 'string', False)), (('keyText', 'CSS.Value', False),)),
+    'CSS.setStyleTexts': ((('edits', ['CSS.StyleDeclarationEdit'], False),), (('styles', ['CSS.CSSStyle'], False),)),
+    'CSS.setMediaText': ((('styleSheetId', 'CSS.StyleSheetId', False), ('range', 'CSS.SourceRange', False), ('text', 'string', False)), (('media', 'CSS.CSSMedia', False),)),
+    'CSS.createStyleSheet': ((('frameId', 'Page.FrameId', False),), (('styleSheetId', 'CSS.StyleSheetId', False),)),
+    'CSS.addRule': ((('styleSheetId', 'CSS.StyleSheetId', False), ('ruleText', 'string', False), ('location', 'CSS.SourceRange', False)), (('rule', 'CSS.CSSRule', False),)),
+    'CSS.forcePseudoState': ((('nodeId', 'DOM.NodeId', False), ('forcedPseudoClasses', ['string'], False)), ()),
+    'CSS.getMediaQueries': ((), (('medias', ['CSS.CSSMedia'], False),)),
+    'CSS.setEffectivePropertyValueForNode': ((('nodeId', 'DOM.NodeId', False), ('propertyName', 'string', False), ('value', 'string', False)), ()),
+    'CSS.getBackgroundColors': ((('nodeId', 'DOM.NodeId', False),), (('backgroundColors', ['string'], True),)),
+    'CSS.getLayoutTreeAndStyles': ((('computedStyleWhitelist', ['string'], False),), (('layoutTreeNodes', ['CSS.LayoutTreeNode'], False), ('computedStyles', ['CSS.ComputedStyle'], False))),
+    'CSS.startRuleUsageTracking': ((), ()),
+    'CSS.stopRuleUsageTracking': ((), (('ruleUsage', ['CSS.RuleUsage'], False),)),
+    'IO.read': ((('handle', 'IO.StreamHandle', False), ('offset', 'integer', True), ('size', 'integer', True)), (('data', 'string', False), ('eof', 'boolean', False))),
+    'IO.close': ((('handle', 'IO.StreamHandle', False),), ()),
+    'DOMDebugger.setDOMBreakpoint': ((('nodeId', 'DOM.NodeId', False), ('type', 'DOMDebugger.DOMBreakpointType', False)), ()),
+    'DOMDebugger.removeDOMBreakpoint': ((('nodeId', 'DOM.NodeId', False), ('type', 'DOMDebugger.DOMBreakpointType', False)), ()),
+    'DOMDebugger.setEventListenerBreakpoint': ((('eventName', 'string', False), ('targetName', 'string', True)), ()),
+    'DOMDebugger.removeEventListenerBreakpoint': ((('eventName', 'string', False), ('targetName', 'string', True)), ()),
+    'DOMDebugger.setInstrumentationBreakpoint': ((('eventName', 'string', False),), ()),
+    'DOMDebugger.removeInstrumentationBreakpoint': ((('eventName', 'string', False),), ()),
+    'DOMDebugger.setXHRBreakpoint': ((('url', 'string', False),), ()),
+    'DOMDebugger.removeXHRBreakpoint': ((('url', 'string', False),), ()),
+    'DOMDebugger.getEventListeners': ((('objectId', 'Runtime.RemoteObjectId', False),), (('listeners', ['DOMDebugger.EventListener'], False),)),
+    'Target.setDiscoverTargets': ((('discover', 'boolean', False),), ()),
+    'Target.setAutoAttach': ((('autoAttach', 'boolean', False), ('waitForDebuggerOnStart', 'boolean', False)), ()),
+    'Target.setAttachToFrames': ((('value', 'boolean', False),), ()),
+    'Target.setRemoteLocations': ((('locations', ['Target.RemoteLocation'], False),), ()),
+    'Target.sendMessageToTarget': ((('targetId', 'string', False), ('message', 'string', False)), ()),
+    'Target.getTargetInfo': ((('targetId', 'Target.TargetID', False),), (('targetInfo', 'Target.TargetInfo', False),)),
+    'Target.activateTarget': ((('targetId', 'Target.TargetID', False),), ()),
+    'Target.closeTarget': ((('targetId', 'Target.TargetID', False),), (('success', 'boolean', False),)),
+    'Target.attachToTarget': ((('targetId', 'Target.TargetID', False),), (('success', 'boolean', False),)),
+    'Target.detachFromTarget': ((('targetId', 'Target.TargetID', False),), ()),
+    'Target.createBrowserContext': ((), (('browserContextId', 'Target.BrowserContextID', False),)),
+    'Target.disposeBrowserContext': ((('browserContextId', 'Target.BrowserContextID', False),), (('success', 'boolean', False),)),
+    'Target.createTarget': ((('url', 'string', False), ('width', 'integer', True), ('height', 'integer', True), ('browserContextId', 'Target.BrowserContextID', True)), (('targetId', 'Target.TargetID', False),)),
+    'Target.getTargets': ((), (('targetInfos', ['Target.TargetInfo'], False),)),
+    'ServiceWorker.enable': ((), ()),
+    'ServiceWorker.disable': ((), ()),
+    'ServiceWorker.unregister': ((('scopeURL', 'string', False),), ()),
+    'ServiceWorker.updateRegistration': ((('scopeURL', 'string', False),), ()),
+    'ServiceWorker.startWorker': ((('scopeURL', 'string', False),), ()),
+    'ServiceWorker.skipWaiting': ((('scopeURL', 'string', False),), ()),
+    'ServiceWorker.stopWorker': ((('versionId', 'string', False),), ()),
+    'ServiceWorker.inspectWorker': ((('versionId', 'string', False),), ()),
+    'ServiceWorker.setForceUpdateOnPageLoad': ((('forceUpdateOnPageLoad', 'boolean', False),), ()),
+    'ServiceWorker.deliverPushMessage': ((('origin', 'string', False), ('registrationId', 'string', False), ('data', 'string', False)), ()),
+    'ServiceWorker.dispatchSyncEvent': ((('origin', 'string', False), ('registrationId', 'string', False), ('tag', 'string', False), ('lastChance', 'boolean', False)), ()),
+    'Input.dispatchKeyEvent': ((('type', 'string', False), ('modifiers', 'integer', True), ('timestamp', 'number', True), ('text', 'string', True), ('unmodifiedText', 'string', True), ('keyIdentifier', 'string', True), ('code', 'string', True), ('key', 'string', True), ('windowsVirtualKeyCode', 'integer', True), ('nativeVirtualKeyCode', 'integer', True), ('autoRepeat', 'boolean', True), ('isKeypad', 'boolean', True), ('isSystemKey', 'boolean', True)), ()),
+    'Input.dispatchMouseEvent': ((('type', 'string', False), ('x', 'integer', False), ('y', 'integer', False), ('modifiers', 'integer', True), ('timestamp', 'number', True), ('button', 'string', True), ('clickCount', 'integer', True)), ()),
+    'Input.dispatchTouchEvent': ((('type', 'string', False), ('touchPoints', ['Input.TouchPoint'], False), ('modifiers', 'integer', True), ('timestamp', 'number', True)), ()),
+    'Input.emulateTouchFromMouseEvent': ((('type', 'string', False), ('x', 'integer', False), ('y', 'integer', False), ('timestamp', 'number', False), ('button', 'string', False), ('deltaX', 'number', True), ('deltaY', 'number', True), ('modifiers', 'integer', True), ('clickCount', 'integer', True)), ()),
+    'Input.synthesizePinchGesture': ((('x', 'integer', False), ('y', 'integer', False), ('scaleFactor', 'number', False), ('relativeSpeed', 'integer', True), ('gestureSourceType', 'Input.GestureSourceType', True)), ()),
+    'Input.synthesizeScrollGesture': ((('x', 'integer', False), ('y', 'integer', False), ('xDistance', 'integer', True), ('yDistance', 'integer', True), ('xOverscroll', 'integer', True), ('yOverscroll', 'integer', True), ('preventFling', 'boolean', True), ('speed', 'integer', True), ('gestureSourceType', 'Input.GestureSourceType', True), ('repeatCount', 'integer', True), ('repeatDelayMs', 'integer', True), ('interactionMarkerName', 'string', True)), ()),
+    'Input.synthesizeTapGesture': ((('x', 'integer', False), ('y', 'integer', False), ('duration', 'integer', True), ('tapCount', 'integer', True), ('gestureSourceType', 'Input.GestureSourceType', True)), ()),
+    'LayerTree.enable': ((), ()),
+    'LayerTree.disable': ((), ()),
+    'LayerTree.compositingReasons': ((('layerId', 'LayerTree.LayerId', False),), (('compositingReasons', ['string'], False),)),
+    'LayerTree.makeSnapshot': ((('layerId', 'LayerTree.LayerId', False),), (('snapshotId', 'LayerTree.SnapshotId', False),)),
+    'LayerTree.loadSnapshot': ((('tiles', ['LayerTree.PictureTile'], False),), (('snapshotId', 'LayerTree.SnapshotId', False),)),
+    'LayerTree.releaseSnapshot': ((('snapshotId', 'LayerTree.SnapshotId', False),), ()),
+    'LayerTree.profileSnapshot': ((('snapshotId', 'LayerTree.SnapshotId', False), ('minRepeatCount', 'integer', True), ('minDuration', 'number', True), ('clipRect', 'DOM.Rect', True)), (('timings', ['LayerTree.PaintProfile'], False),)),
+    'LayerTree.replaySnapshot': ((('snapshotId', 'LayerTree.SnapshotId', False), ('fromStep', 'integer', True), ('toStep', 'integer', True), ('scale', 'number', True)), (('dataURL', 'string', False),)),
+    'LayerTree.snapshotCommandLog': ((('snapshotId', 'LayerTree.SnapshotId', False),), (('commandLog', ['object'], False),)),
+    'DeviceOrientation.setDeviceOrientationOverride': ((('alpha', 'number', False), ('beta', 'number', False), ('gamma', 'number', False)), ()),
+    'DeviceOrientation.clearDeviceOrientationOverride': ((), ()),
+    'Tracing.start': ((('categories', 'string', True), ('options', 'string', True), ('bufferUsageReportingInterval', 'number', True), ('transferMode', 'string', True), ('traceConfig', 'Tracing.TraceConfig', True)), ()),
+    'Tracing.end': ((), ()),
+    'Tracing.getCategories': ((), (('categories', ['string'], False),)),
+    'Tracing.requestMemoryDump': ((), (('dumpGuid', 'string', False), ('success', 'boolean', False))),
+    'Tracing.recordClockSyncMarker': ((('syncId', 'string', False),), ()),
+    'Animation.enable': ((), ()),
+    'Animation.disable': ((), ()),
+    'Animation.getPlaybackRate': ((), (('playbackRate', 'number', False),)),
+    'Animation.setPlaybackRate': ((('playbackRate', 'number', False),), ()),
+    'Animation.getCurrentTime': ((('id', 'string', False),), (('currentTime', 'number', False),)),
+    'Animation.setPaused': ((('animations', ['string'], False), ('paused', 'boolean', False)), ()),
+    'Animation.setTiming': ((('animationId', 'string', False), ('duration', 'number', False), ('delay', 'number', False)), ()),
+    'Animation.seekAnimations': ((('animations', ['string'], False), ('currentTime', 'number', False)), ()),
+    'Animation.releaseAnimations': ((('animations', ['string'], False),), ()),
+    'Animation.resolveAnimation': ((('animationId', 'string', False),), (('remoteObject', 'Runtime.RemoteObject', False),)),
+    'Accessibility.getPartialAXTree': ((('nodeId', 'DOM.NodeId', False), ('fetchRelatives', 'boolean', True)), (('nodes', ['Accessibility.AXNode'], False),)),
+    'Storage.clearDataForOrigin': ((('origin', 'string', False), ('storageTypes', 'string', False)), ()),
+    'Log.enable': ((), ()),
+    'Log.disable': ((), ()),
+    'Log.clear': ((), ()),
+    'Log.startViolationsReport': ((('config', ['Log.ViolationSetting'], False),), ()),
+    'Log.stopViolationsReport': ((), ()),
+    'SystemInfo.getInfo': ((), (('gpu', 'SystemInfo.GPUInfo', False), ('modelName', 'string', False), ('modelVersion', 'string', False))),
+    'Tethering.bind': ((('port', 'integer', False),), ()),
+    'Tethering.unbind': ((('port', 'integer', False),), ()),
+    'Schema.getDomains': ((), (('domains', ['Schema.Domain'], False),)),
+    'Runtime.evaluate': ((('expression', 'string', False), ('objectGroup', 'string', True), ('includeCommandLineAPI', 'boolean', True), ('silent', 'boolean', True), ('contextId', 'Runtime.ExecutionContextId', True), ('returnByValue', 'boolean', True), ('generatePreview', 'boolean', True), ('userGesture', 'boolean', True), ('awaitPromise', 'boolean', True)), (('result', 'Runtime.RemoteObject', False), ('exceptionDetails', 'Runtime.ExceptionDetails', True))),
+    'Runtime.awaitPromise': ((('promiseObjectId', 'Runtime.RemoteObjectId', False), ('returnByValue', 'boolean', True), ('generatePreview', 'boolean', True)), (('result', 'Runtime.RemoteObject', False), ('exceptionDetails', 'Runtime.ExceptionDetails', True))),
+    'Runtime.callFunctionOn': ((('objectId', 'Runtime.RemoteObjectId', False), ('functionDeclaration', 'string', False), ('arguments', ['Runtime.CallArgument'], True), ('silent', 'boolean', True), ('returnByValue', 'boolean', True), ('generatePreview', 'boolean', True), ('userGesture', 'boolean', True), ('awaitPromise', 'boolean', True)), (('result', 'Runtime.RemoteObject', False), ('exceptionDetails', 'Runtime.ExceptionDetails', True))),
+    'Runtime.getProperties': ((('objectId', 'Runtime.RemoteObjectId', False), ('ownProperties', 'boolean', True), ('accessorPropertiesOnly', 'boolean', True), ('generatePreview', 'boolean', True)), (('result', ['Runtime.PropertyDescriptor'], False), ('internalProperties', ['Runtime.InternalPropertyDescriptor'], True), ('exceptionDetails', 'Runtime.ExceptionDetails', True))),
+    'Runtime.releaseObject': ((('objectId', 'Runtime.RemoteObjectId', False),), ()),
+    'Runtime.releaseObjectGroup': ((('objectGroup', 'string', False),), ()),
+    'Runtime.runIfWaitingForDebugger': ((), ()),
+    'Runtime.enable': ((), ()),
+    'Runtime.disable': ((), ()),
+    'Runtime.discardConsoleEntries': ((), ()),
+    'Runtime.setCustomObjectFormatterEnabled': ((('enabled', 'boolean', False),), ()),
+    'Runtime.compileScript': ((('expression', 'string', False), ('sourceURL', 'string', False), ('persistScript', 'boolean', False), ('executionContextId', 'Runtime.ExecutionContextId', True)), (('scriptId', 'Runtime.ScriptId', True), ('exceptionDetails', 'Runtime.ExceptionDetails', True))),
+    'Runtime.runScript': ((('scriptId', 'Runtime.ScriptId', False), ('executionContextId', 'Runtime.ExecutionContextId', True), ('objectGroup', 'string', True), ('silent', 'boolean', True), ('includeCommandLineAPI', 'boolean', True), ('returnByValue', 'boolean', True), ('generatePreview', 'boolean', True), ('awaitPromise', 'boolean', True)), (('result', 'Runtime.RemoteObject', False), ('exceptionDetails', 'Runtime.ExceptionDetails', True))),
+    'Debugger.enable': ((), ()),
+    'Debugger.disable': ((), ()),
+    'Debugger.setBreakpointsActive': ((('active', 'boolean', False),), ()),
+    'Debugger.setSkipAllPauses': ((('skip', 'boolean', False),), ()),
+    'Debugger.setBreakpointByUrl': ((('lineNumber', 'integer', False), ('url', 'string', True), ('urlRegex', 'string', True), ('columnNumber', 'integer', True), ('condition', 'string', True)), (('breakpointId', 'Debugger.BreakpointId', False), ('locations', ['Debugger.Location'], False))),
+    'Debugger.setBreakpoint': ((('location', 'Debugger.Location', False), ('condition', 'string', True)), (('breakpointId', 'Debugger.BreakpointId', False), ('actualLocation', 'Debugger.Location', False))),
+    'Debugger.removeBreakpoint': ((('breakpointId', 'Debugger.BreakpointId', False),), ()),
+    'Debugger.getPossibleBreakpoints': ((('start', 'Debugger.Location', False), ('end', 'Debugger.Location', True)), (('locations', ['Debugger.Location'], False),)),
+    'Debugger.continueToLocation': ((('location', 'Debugger.Location', False),), ()),
+    'Debugger.stepOver': ((), ()),
+    'Debugger.stepInto': ((), ()),
+    'Debugger.stepOut': ((), ()),
+    'Debugger.pause': ((), ()),
+    'Debugger.resume': ((), ()),
+    'Debugger.searchInContent': ((('scriptId', 'Runtime.ScriptId', False), ('query', 'string', False), ('caseSensitive', 'boolean', True), ('isRegex', 'boolean', True)), (('result', ['Debugger.SearchMatch'], False),)),
+    'Debugger.setScriptSource': ((('scriptId', 'Runtime.ScriptId', False), ('scriptSource', 'string', False), ('dryRun', 'boolean', True)), (('callFrames', ['Debugger.CallFrame'], True), ('stackChanged', 'boolean', True), ('asyncStackTrace', 'Runtime.StackTrace', True), ('exceptionDetails', 'Runtime.ExceptionDetails', True))),
+    'Debugger.restartFrame': ((('callFrameId', 'Debugger.CallFrameId', False),), (('callFrames', ['Debugger.CallFrame'], False), ('asyncStackTrace', 'Runtime.StackTrace', True))),
+    'Debugger.getScriptSource': ((('scriptId', 'Runtime.ScriptId', False),), (('scriptSource', 'string', False),)),
+    'Debugger.setPauseOnExceptions': ((('state', 'string', False),), ()),
+    'Debugger.evaluateOnCallFrame': ((('callFrameId', 'Debugger.CallFrameId', False), ('expression', 'string', False), ('objectGroup', 'string', True), ('includeCommandLineAPI', 'boolean', True), ('silent', 'boolean', True), ('returnByValue', 'boolean', True), ('generatePreview', 'boolean', True)), (('result', 'Runtime.RemoteObject', False), ('exceptionDetails', 'Runtime.ExceptionDetails', True))),
+    'Debugger.setVariableValue': ((('scopeNumber', 'integer', False), ('variableName', 'string', False), ('newValue', 'Runtime.CallArgument', False), ('callFrameId', 'Debugger.CallFrameId', False)), ()),
+    'Debugger.setAsyncCallStackDepth': ((('maxDepth', 'integer', False),), ()),
+    'Debugger.setBlackboxPatterns': ((('patterns', ['string'], False),), ()),
+    'Debugger.setBlackboxedRanges': ((('scriptId', 'Runtime.ScriptId', False), ('positions', ['Debugger.ScriptPosition'], False)), ()),
+    'Console.enable': ((), ()),
+    'Console.disable': ((), ()),
+    'Console.clearMessages': ((), ()),
+    'Profiler.enable': ((), ()),
+    'Profiler.disable': ((), ()),
+    'Profiler.setSamplingInterval': ((('interval', 'integer', False),), ()),
+    'Profiler.start': ((), ()),
+    'Profiler.stop': ((), (('profile', 'Profiler.Profile', False),)),
+    'HeapProfiler.enable': ((), ()),
+    'HeapProfiler.disable': ((), ()),
+    'HeapProfiler.startTrackingHeapObjects': ((('trackAllocations', 'boolean', True),), ()),
+    'HeapProfiler.stopTrackingHeapObjects': ((('reportProgress', 'boolean', True),), ()),
+    'HeapProfiler.takeHeapSnapshot': ((('reportProgress', 'boolean', True),), ()),
+    'HeapProfiler.collectGarbage': ((), ()),
+    'HeapProfiler.getObjectByHeapObjectId': ((('objectId', 'HeapProfiler.HeapSnapshotObjectId', False), ('objectGroup', 'string', True)), (('result', 'Runtime.RemoteObject', False),)),
+    'HeapProfiler.addInspectedHeapObject': ((('heapObjectId', 'HeapProfiler.HeapSnapshotObjectId', False),), ()),
+    'HeapProfiler.getHeapObjectId': ((('objectId', 'Runtime.RemoteObjectId', False),), (('heapSnapshotObjectId', 'HeapProfiler.HeapSnapshotObjectId', False),)),
+    'HeapProfiler.startSampling': ((('samplingInterval', 'number', True),), ()),
+    'HeapProfiler.stopSampling': ((), (('profile', 'HeapProfiler.SamplingHeapProfile', False),)),
+}
+
+# "Domain.event" -> params
+events = {
+    'Inspector.detached': (('reason', 'string', False),),
+    'Inspector.targetCrashed': (),
+    'Page.domContentEventFired': (('timestamp', 'number', False),),
+    'Page.loadEventFired': (('timestamp', 'number', False),),
+    'Page.frameAttached': (('frameId', 'Page.FrameId', False), ('parentFrameId', 'Page.FrameId', False)),
+    'Page.frameNavigated': (('frame', 'Page.Frame', False),),
+    'Page.frameDetached': (('frameId', 'Page.FrameId', False),),
+    'Page.frameStartedLoading': (('frameId', 'Page.FrameId', False),),
+    'Page.frameStoppedLoading': (('frameId', 'Page.FrameId', False),),
+    'Page.frameScheduledNavigation': (('frameId', 'Page.FrameId', False), ('delay', 'number', False)),
+    'Page.frameClearedScheduledNavigation': (('frameId', 'Page.FrameId', False),),
+    'Page.frameResized': (),
+    'Page.javascriptDialogOpening': (('message', 'string', False), ('type', 'Page.DialogType', False)),
+    'Page.javascriptDialogClosed': (('result', 'boolean', False),),
+    'Page.screencastFrame': (('data', 'string', False), ('metadata', 'Page.ScreencastFrameMetadata', False), ('sessionId', 'integer', False)),
+    'Page.screencastVisibilityChanged': (('visible', 'boolean', False),),
+    'Page.colorPicked': (('color', 'DOM.RGBA', False),),
+    'Page.interstitialShown': (),
+    'Page.interstitialHidden': (),
+    'Page.navigationRequested': (('isInMainFrame', 'boolean', False), ('isRedirect', 'boolean', False), ('navigationId', 'integer', False), ('url', 'string', False)),
+    'Emulation.virtualTimeBudgetExpired': (),
+    'Security.securityStateChanged': (('securityState', 'Security.SecurityState', False), ('schemeIsCryptographic', 'boolean', False), ('explanations', ['Security.SecurityStateExplanation'], False), ('insecureContentStatus', 'Security.InsecureContentStatus', False), ('summary', 'string', True)),
+    'Network.resourceChangedPriority': (('requestId', 'Network.RequestId', False), ('newPriority', 'Network.ResourcePriority', False), ('timestamp', 'Network.Timestamp', False)),
+    'Network.requestWillBeSent': (('requestId', 'Network.RequestId', False), ('frameId', 'Page.FrameId', False), ('loaderId', 'Network.LoaderId', False), ('documentURL', 'string', False), ('request', 'Network.Request', False), ('timestamp', 'Network.Timestamp', False), ('wallTime', 'Network.Timestamp', False), ('initiator', 'Network.Initiator', False), ('redirectResponse', 'Network.Response', True), ('type', 'Page.ResourceType', True)),
+    'Network.requestServedFromCache': (('requestId', 'Network.RequestId', False),),
+    'Network.responseReceived': (('requestId', 'Network.RequestId', False), ('frameId', 'Page.FrameId', False), ('loaderId', 'Network.LoaderId', False), ('timestamp', 'Network.Timestamp', False), ('type', 'Page.ResourceType', False), ('response', 'Network.Response', False)),
+    'Network.dataReceived': (('requestId', 'Network.RequestId', False), ('timestamp', 'Network.Timestamp', False), ('dataLength', 'integer', False), ('encodedDataLength', 'integer', False)),
+    'Network.loadingFinished': (('requestId', 'Network.RequestId', False), ('timestamp', 'Network.Timestamp', False), ('encodedDataLength', 'number', False)),
+    'Network.loadingFailed': (('requestId', 'Network.RequestId', False), ('timestamp', 'Network.Timestamp', False), ('type', 'Page.ResourceType', False), ('errorText', 'string', False), ('canceled', 'boolean', True), ('blockedReason', 'Network.BlockedReason', True)),
+    'Network.webSocketWillSendHandshakeRequest': (('requestId', 'Network.RequestId', False), ('timestamp', 'Network.Timestamp', False), ('wallTime', 'Network.Timestamp', False), ('request', 'Network.WebSocketRequest', False)),
+    'Network.webSocketHandshakeResponseReceived': (('requestId', 'Network.RequestId', False), ('timestamp', 'Network.Timestamp', False), ('response', 'Network.WebSocketResponse', False)),
+    'Network.webSocketCreated': (('requestId', 'Network.RequestId', False), ('url', 'string', False), ('initiator', 'Network.Initiator', True)),
+    'Network.webSocketClosed': (('requestId', 'Network.RequestId', False), ('timestamp', 'Network.Timestamp', False)),
+    'Network.webSocketFrameReceived': (('requestId', 'Network.RequestId', False), ('timestamp', 'Network.Timestamp', False), ('response', 'Network.WebSocketFrame', False)),
+    'Network.webSocketFrameError': (('requestId', 'Network.RequestId', False), ('timestamp', 'Network.Timestamp', False), ('errorMessage', 'string', False)),
+    'Network.webSocketFrameSent': (('requestId', 'Network.RequestId', False), ('timestamp', 'Network.Timestamp', False), ('response', 'Network.WebSocketFrame', False)),
+    'Network.eventSourceMessageReceived': (('requestId', 'Network.RequestId', False), ('timestamp', 'Network.Timestamp', False), ('eventName', 'string', False), ('eventId', 'string', False), ('data', 'string', False)),
+    'Database.addDatabase': (('database', 'Database.Database', False),),
+    'DOMStorage.domStorageItemsCleared': (('storageId', 'DOMStorage.StorageId', False),),
+    'DOMStorage.domStorageItemRemoved': (('storageId', 'DOMStorage.StorageId', False), ('key', 'string', False)),
+    'DOMStorage.domStorageItemAdded': (('storageId', 'DOMStorage.StorageId', False), ('key', 'string', False), ('newValue', 'string', False)),
+    'DOMStorage.domStorageItemUpdated': (('storageId', 'DOMStorage.StorageId', False), ('key', 'string', False), ('oldValue', 'string', False), ('newValue', 'string', False)),
+    'ApplicationCache.applicationCacheStatusUpdated': (('frameId', 'Page.FrameId', False), ('manifestURL', 'string', False), ('status', 'integer', False)),
+    'ApplicationCache.networkStateUpdated': (('isNowOnline', 'boolean', False),),
+    'DOM.documentUpdated': (),
+    'DOM.inspectNodeRequested': (('backendNodeId', 'DOM.BackendNodeId', False),),
+    'DOM.setChildNodes': (('parentId', 'DOM.NodeId', False), ('nodes', ['DOM.Node'], False)),
+    'DOM.attributeModified': (('nodeId', 'DOM.NodeId', False), ('name', 'string', False), ('value', 'string', False)),
+    'DOM.attributeRemoved': (('nodeId', 'DOM.NodeId', False), ('name', 'string', False)),
+    'DOM.inlineStyleInvalidated': (('nodeIds', ['DOM.NodeId'], False),),
+    'DOM.characterDataModified': (('nodeId', 'DOM.NodeId', False), ('characterData', 'string', False)),
+    'DOM.childNodeCountUpdated': (('nodeId', 'DOM.NodeId', False), ('childNodeCount', 'integer', False)),
+    'DOM.childNodeInserted': (('parentNodeId', 'DOM.NodeId', False), ('previousNodeId', 'DOM.NodeId', False), ('node', 'DOM.Node', False)),
+    'DOM.childNodeRemoved': (('parentNodeId', 'DOM.NodeId', False), ('nodeId', 'DOM.NodeId', False)),
+    'DOM.shadowRootPushed': (('hostId', 'DOM.NodeId', False), ('root', 'DOM.Node', False)),
+    'DOM.shadowRootPopped': (('hostId', 'DOM.NodeId', False), ('rootId', 'DOM.NodeId', False)),
+    'DOM.pseudoElementAdded': (('parentId', 'DOM.NodeId', False), ('pseudoElement', 'DOM.Node', False)),
+    'DOM.pseudoElementRemoved': (('parentId', 'DOM.NodeId', False), ('pseudoElementId', 'DOM.NodeId', False)),
+    'DOM.distributedNodesUpdated': (('insertionPointId', 'DOM.NodeId', False), ('distributedNodes', ['DOM.BackendNode'], False)),
+    'DOM.nodeHighlightRequested': (('nodeId', 'DOM.NodeId', False),),
+    'CSS.mediaQueryResultChanged': (),
+    'CSS.fontsUpdated': (),
+    'CSS.styleSheetChanged': (('styleSheetId', 'CSS.StyleSheetId', False),),
+    'CSS.styleSheetAdded': (('header', 'CSS.CSSStyleSheetHeader', False),),
+    'CSS.styleSheetRemoved': (('styleSheetId', 'CSS.StyleSheetId', False),),
+    'Target.targetCreated': (('targetInfo', 'Target.TargetInfo', False),),
+    'Target.targetDestroyed': (('targetId', 'Target.TargetID', False),),
+    'Target.attachedToTarget': (('targetInfo', 'Target.TargetInfo', False), ('waitingForDebugger', 'boolean', False)),
+    'Target.detachedFromTarget': (('targetId', 'Target.TargetID', False),),
+    'Target.receivedMessageFromTarget': (('targetId', 'Target.TargetID', False), ('message', 'string', False)),
+    'ServiceWorker.workerRegistrationUpdated': (('registrations', ['ServiceWorker.ServiceWorkerRegistration'], False),),
+    'ServiceWorker.workerVersionUpdated': (('versions', ['ServiceWorker.ServiceWorkerVersion'], False),),
+    'ServiceWorker.workerErrorReported': (('errorMessage', 'ServiceWorker.ServiceWorkerErrorMessage', False),),
+    'LayerTree.layerTreeDidChange': (('layers', ['LayerTree.Layer'], True),),
+    'LayerTree.layerPainted': (('layerId', 'LayerTree.LayerId', False), ('clip', 'DOM.Rect', False)),
+    'Tracing.dataCollected': (('value', ['object'], False),),
+    'Tracing.tracingComplete': (('stream', 'IO.StreamHandle', True),),
+    'Tracing.bufferUsage': (('percentFull', 'number', True), ('eventCount', 'number', True), ('value', 'number', True)),
+    'Animation.animationCreated': (('id', 'string', False),),
+    'Animation.animationStarted': (('animation', 'Animation.Animation', False),),
+    'Animation.animationCanceled': (('id', 'string', False),),
+    'Log.entryAdded': (('entry', 'Log.LogEntry', False),),
+    'Tethering.accepted': (('port', 'integer', False), ('connectionId', 'string', False)),
+    'Runtime.executionContextCreated': (('context', 'Runtime.ExecutionContextDescription', False),),
+    'Runtime.executionContextDestroyed': (('executionContextId', 'Runtime.ExecutionContextId', False),),
+    'Runtime.executionContextsCleared': (),
+    'Runtime.exceptionThrown': (('timestamp', 'Runtime.Timestamp', False), ('exceptionDetails', 'Runtime.ExceptionDetails', False)),
+    'Runtime.exceptionRevoked': (('reason', 'string', False), ('exceptionId', 'integer', False)),
+    'Runtime.consoleAPICalled': (('type', 'string', False), ('args', ['Runtime.RemoteObject'], False), ('executionContextId', 'Runtime.ExecutionContextId', False), ('timestamp', 'Runtime.Timestamp', False), ('stackTrace', 'Runtime.StackTrace', True)),
+    'Runtime.inspectRequested': (('object', 'Runtime.RemoteObject', False), ('hints', 'object', False)),
+    'Debugger.scriptParsed': (('scriptId', 'Runtime.ScriptId', False), ('url', 'string', False), ('startLine', 'integer', False), ('startColumn', 'integer', False), ('endLine', 'integer', False), ('endColumn', 'integer', False), ('executionContextId', 'Runtime.ExecutionContextId', False), ('hash', 'string', False), ('executionContextAuxData', 'object', True), ('isLiveEdit', 'boolean', True), ('sourceMapURL', 'string', True), ('hasSourceURL', 'boolean', True)),
+    'Debugger.scriptFailedToParse': (('scriptId', 'Runtime.ScriptId', False), ('url', 'string', False), ('startLine', 'integer', False), ('startColumn', 'integer', False), ('endLine', 'integer', False), ('endColumn', 'integer', False), ('executionContextId', 'Runtime.ExecutionContextId', False), ('hash', 'string', False), ('executionContextAuxData', 'object', True), ('sourceMapURL', 'string', True), ('hasSourceURL', 'boolean', True)),
+    'Debugger.breakpointResolved': (('breakpointId', 'Debugger.BreakpointId', False), ('location', 'Debugger.Location', False)),
+    'Debugger.paused': (('callFrames', ['Debugger.CallFrame'], False), ('reason', 'string', False), ('data', 'object', True), ('hitBreakpoints', ['string'], True), ('asyncStackTrace', 'Runtime.StackTrace', True)),
+    'Debugger.resumed': (),
+    'Console.messageAdded': (('message', 'Console.ConsoleMessage', False),),
+    'Profiler.consoleProfileStarted': (('id', 'string', False), ('location', 'Debugger.Location', False), ('title', 'string', True)),
+    'Profiler.consoleProfileFinished': (('id', 'string', False), ('location', 'Debugger.Location', False), ('profile', 'Profiler.Profile', False), ('title', 'string', True)),
+    'HeapProfiler.addHeapSnapshotChunk': (('chunk', 'string', False),),
+    'HeapProfiler.resetProfiles': (),
+    'HeapProfiler.reportHeapSnapshotProgress': (('done', 'integer', False), ('total', 'integer', False), ('finished', 'boolean', True)),
+    'HeapProfiler.lastSeenObjectId': (('lastSeenObjectId', 'integer', False), ('timestamp', 'number', False)),
+    'HeapProfiler.heapStatsUpdate': (('statsUpdate', ['integer'], False),),
+}
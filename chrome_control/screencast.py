@@ -0,0 +1,201 @@
+import asyncio
+import binascii
+import collections
+import threading
+
+from chrome_control import Page
+from chrome_control.chrome import Chrome, Client
+from chrome_control.deadline import Deadline
+
+class Frame:
+    """A screencast frame: the image, decoded, and Page.ScreencastFrameMetadata
+    for it."""
+    __slots__ = ("data", "metadata", "number")
+
+    def __init__(self, data: bytes, metadata: Page.ScreencastFrameMetadata, number: int):
+        self.data = data
+        self.metadata = metadata
+        self.number = number
+
+class Screencast:
+    """The frames of a tab's screencast, as they're painted:
+
+        with Screencast(chrome, format="jpeg", quality=80) as frames:
+            for frame in frames:
+                ...
+
+    or `async for frame in frames` from a coroutine, which waits on the event
+    loop rather than tying up a thread.
+
+    Chrome stops painting frames until the last one is acked, so frames are
+    acked on the reader thread as soon as they arrive, not when they're
+    consumed. A consumer that falls behind doesn't hold the page up; instead
+    at most `buffer` frames are kept waiting, and the rest are dropped. With
+    `policy="coalesce"`, the oldest waiting frame makes way for the new one,
+    so the consumer always gets the latest picture; with `policy="drop"`, the
+    new frame is dropped. `dropped` counts them. Frames are only decoded from
+    base64 when they're consumed, so dropped ones cost next to nothing.
+
+    Iteration ends once `stop` has been called and the waiting frames have
+    been consumed. If the connection is lost, the waiting frames are still
+    handed out, then ConnectionError is raised; a resilient Chrome restarts
+    the screencast when it reconnects, and frames keep coming."""
+    def __init__(self, client: Client, format: str="png", quality: int=None, max_width: int=None, max_height: int=None, every_nth_frame: int=None, buffer: int=2, policy: str="coalesce"):
+        if policy not in ("coalesce", "drop"):
+            raise ValueError(f"unknown policy {policy!r}")
+        self.client = client
+        self.start_cmd = Page.startScreencast(format, quality, max_width, max_height, every_nth_frame)
+        self.buffer = buffer
+        self.policy = policy
+
+        # events of the frames that haven't been consumed yet
+        self.frames = collections.deque()
+        self.cond = threading.Condition()
+        # (loop, future) of each coroutine waiting for a frame
+        self.waiters = []
+        self.dropped = 0
+        self.running = False
+
+    def start(self):
+        self.running = True
+        self.client.on("Page.screencastFrame", self._frame)
+        self.client.on_disconnect(self._disconnected)
+        try:
+            self.client.do(self.start_cmd)
+        except Exception:
+            self.client.off("Page.screencastFrame", self._frame)
+            self.client.off_disconnect(self._disconnected)
+            self.running = False
+            raise
+        if isinstance(self.client, Chrome):
+            # re-sent after a reconnect, like the enables
+            self.client.restore["Page.startScreencast"] = self.start_cmd
+        return self
+
+    def stop(self):
+        if not self.running:
+            return
+        try:
+            if isinstance(self.client, Chrome):
+                self.client.restore.pop("Page.startScreencast", None)
+            # there's no screencast left to stop on a lost connection
+            if not self.client.disconnected.is_set():
+                self.client.do(Page.stopScreencast())
+        finally:
+            self.client.off("Page.screencastFrame", self._frame)
+            self.client.off_disconnect(self._disconnected)
+            with self.cond:
+                self.running = False
+                self._wake()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def _frame(self, event):
+        # before anything else, so Chrome can get on with the next one
+        self.client._post(Page.screencastFrameAck(event.sessionId))
+        with self.cond:
+            if len(self.frames) >= self.buffer:
+                self.dropped += 1
+                if self.policy == "drop":
+                    return
+                self.frames.popleft()
+            self.frames.append(event)
+            self._wake()
+
+    def _disconnected(self):
+        with self.cond:
+            self._wake()
+
+    def _wake(self):
+        # with self.cond held
+        self.cond.notify_all()
+        waiters, self.waiters = self.waiters, []
+        for loop, fut in waiters:
+            loop.call_soon_threadsafe(_resolve, fut)
+
+    def _take(self):
+        # with self.cond held: the next frame, or None if there isn't one
+        if not self.frames:
+            return None
+        event = self.frames.popleft()
+        return Frame(binascii.a2b_base64(event.data), event.metadata, event.sessionId)
+
+    def _check_connected(self):
+        # with self.cond held
+        if self.client.disconnected.is_set():
+            raise ConnectionError("lost the connection to Chrome during the screencast")
+
+    def get(self, timeout=None):
+        """The next frame. Raises StopIteration once the screencast has been
+        stopped and every frame consumed, ConnectionError once the connection
+        has been lost and every frame consumed, and TimeoutError if `timeout`
+        (seconds, or a Deadline) passes first."""
+        deadline = Deadline.of(timeout)
+        with self.cond:
+            while True:
+                frame = self._take()
+                if frame is not None:
+                    return frame
+                if not self.running:
+                    raise StopIteration
+                self._check_connected()
+                if not self.cond.wait(deadline and deadline.remaining()):
+                    raise TimeoutError(f"no screencast frame within {deadline.timeout}s")
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        return self.get()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            with self.cond:
+                frame = self._take()
+                if frame is not None:
+                    return frame
+                if not self.running:
+                    raise StopAsyncIteration
+                self._check_connected()
+                fut = loop.create_future()
+                self.waiters.append((loop, fut))
+            await fut
+
+    def save(self, pattern: str, limit: int=None):
+        """Write frames to a sequence of image files named after `pattern`,
+        e.g. "frame-{:05}.png", until the screencast is stopped or `limit`
+        frames have been written. Returns the number written."""
+        n = 0
+        for frame in self:
+            with open(pattern.format(n), "wb") as f:
+                f.write(frame.data)
+            n += 1
+            if n == limit:
+                break
+        return n
+
+    def pipe(self, stream, limit: int=None):
+        """Write frames back to back to `stream`, a binary file object such as
+        the stdin of `ffmpeg -f image2pipe -i - out.mp4`, until the screencast
+        is stopped or `limit` frames have been written. Returns the number
+        written."""
+        n = 0
+        for frame in self:
+            stream.write(frame.data)
+            n += 1
+            if n == limit:
+                break
+        stream.flush()
+        return n
+
+def _resolve(fut):
+    if not fut.done():
+        fut.set_result(None)
@@ -0,0 +1,124 @@
+import binascii
+import collections
+import io
+
+from chrome_control import IO
+from chrome_control.chrome import Client
+
+class IOStream(io.RawIOBase):
+    """A stream Chrome hands out a handle to, such as a trace recorded with
+    transferMode="ReturnAsStream", read as a binary file:
+
+        with IOStream(chrome, event.stream) as stream:
+            stream.save("trace.json")
+
+    Rather than one IO.read round trip per chunk, `ahead` reads of
+    `chunk_size` bytes are kept in flight, each at its own offset. If Chrome
+    returns less than was asked for, the gap is read next and `chunk_size`
+    shrinks to what it returned, so no read is wasted. Chunks are decoded as
+    they're needed, and `readinto` copies them straight into the caller's
+    buffer, so nothing is held in memory twice. `chunks()` and `save` avoid
+    even that copy.
+
+    Closing it closes the handle in Chrome too."""
+    def __init__(self, client: Client, handle: str, chunk_size: int=1 << 20, ahead: int=4, timeout=None):
+        super().__init__()
+        self.client = client
+        self.handle = handle
+        self.chunk_size = chunk_size
+        self.ahead = ahead
+        self.timeout = timeout
+
+        # (command id, offset, size) of the reads in flight, in order
+        self.inflight = collections.deque()
+        # where the next read to be sent starts
+        self.offset = 0
+        self.eof = False
+        # what's left of the last chunk after readinto
+        self.rest = memoryview(b"")
+
+    def readable(self):
+        return True
+
+    def _fill(self):
+        while len(self.inflight) < self.ahead:
+            id_ = self.client.send(IO.read(self.handle, self.offset, self.chunk_size))
+            self.inflight.append((id_, self.offset, self.chunk_size))
+            self.offset += self.chunk_size
+
+    def _cancel(self):
+        while self.inflight:
+            self.client.cancel(self.inflight.popleft()[0])
+
+    def _chunk(self):
+        # the next chunk, or b"" at the end of the stream
+        data = b""
+        while not data and not self.eof:
+            data = self._next()
+        return data
+
+    def _next(self):
+        self._fill()
+        id_, offset, size = self.inflight.popleft()
+        try:
+            result = self.client.recv(id_, self.timeout)
+        except BaseException:
+            self._cancel()
+            raise
+
+        try:
+            base64 = result["base64Encoded"]
+        except KeyError:
+            # only newer versions of Chrome say, older ones always send text
+            base64 = False
+        data = binascii.a2b_base64(result.data) if base64 else result.data.encode()
+
+        if result.eof:
+            self.eof = True
+            self._cancel()
+        elif len(data) < size:
+            # Chrome is free to return less than was asked for. The reads
+            # queued behind this one are still good, so rather than throwing
+            # them away, read just the gap before them next, and ask for no
+            # more than Chrome is willing to hand out from now on.
+            id_ = self.client.send(IO.read(self.handle, offset + len(data), size - len(data)))
+            self.inflight.appendleft((id_, offset + len(data), size - len(data)))
+            if data:
+                self.chunk_size = min(self.chunk_size, len(data))
+        return data
+
+    def readinto(self, b):
+        if not self.rest:
+            self.rest = memoryview(self._chunk())
+        n = min(len(b), len(self.rest))
+        b[:n] = self.rest[:n]
+        self.rest = self.rest[n:]
+        return n
+
+    def chunks(self):
+        """Iterate over the rest of the stream, a chunk at a time."""
+        if self.rest:
+            rest, self.rest = self.rest, memoryview(b"")
+            yield rest
+        while True:
+            chunk = self._chunk()
+            if not chunk:
+                return
+            yield chunk
+
+    def save(self, path: str):
+        """Write the rest of the stream to the file at `path`, and return the
+        path."""
+        with open(path, "wb") as f:
+            for chunk in self.chunks():
+                f.write(chunk)
+        return path
+
+    def close(self):
+        if self.closed:
+            return
+        try:
+            self._cancel()
+            self.client.do(IO.close(self.handle), self.timeout)
+        finally:
+            super().close()
@@ -0,0 +1,111 @@
+import gzip
+import threading
+
+from chrome_control import Tracing
+from chrome_control.chrome import Client, log
+from chrome_control.deadline import Deadline
+from chrome_control.stream import IOStream
+
+class TraceRecorder:
+    """Records a trace of whatever happens in the with block to a file that
+    chrome://tracing and DevTools can load:
+
+        with TraceRecorder(chrome, "trace.json.gz", categories="devtools.timeline"):
+            chrome.do(Page.navigate("http://bananas.com"))
+
+    Trace events are written out as each Tracing.dataCollected event arrives,
+    as one long json array, so memory use doesn't grow with the length of the
+    trace. With `stream`, Chrome keeps the trace until the end and it's copied
+    from an IOStream instead, which is quicker for big traces but gives
+    Chrome's buffer no relief.
+
+    The file is gzipped if `compress` is true, which by default it is when
+    `path` ends in .gz.
+
+    Chrome drops events once its trace buffer is full. A warning is logged
+    when a Tracing.bufferUsage report says it's more than `warn_at` full;
+    `buffer_usage` is the highest usage reported."""
+    def __init__(self, client: Client, path: str, categories: str=None, trace_config: Tracing.TraceConfig=None, compress: bool=None, stream: bool=False, buffer_usage_interval: float=1000, warn_at: float=0.9, timeout=None):
+        self.client = client
+        self.path = path
+        self.start_cmd = Tracing.start(categories=categories, bufferUsageReportingInterval=buffer_usage_interval, transferMode="ReturnAsStream" if stream else None, traceConfig=trace_config)
+        self.compress = path.endswith(".gz") if compress is None else compress
+        self.stream = stream
+        self.warn_at = warn_at
+        self.timeout = timeout
+
+        self.file = None
+        self.complete = threading.Event()
+        self.stream_handle = None
+        # trace events written so far
+        self.events = 0
+        self.buffer_usage = 0.0
+
+    def start(self):
+        self.file = gzip.open(self.path, "wb") if self.compress else open(self.path, "wb")
+        if not self.stream:
+            self.file.write(b"[")
+        self.client.on("Tracing.dataCollected", self._data)
+        self.client.on("Tracing.bufferUsage", self._usage)
+        self.client.on("Tracing.tracingComplete", self._complete)
+        try:
+            self.client.do(self.start_cmd, self.timeout)
+        except Exception:
+            self._close()
+            raise
+        return self
+
+    def stop(self):
+        """Stop tracing, wait for the rest of the trace to arrive, and return
+        the path it was written to. Raises TimeoutError if it hasn't all
+        arrived within `timeout` (seconds, or a Deadline)."""
+        deadline = Deadline.of(self.timeout)
+        try:
+            self.client.do(Tracing.end(), deadline)
+            if not self.complete.wait(deadline and deadline.remaining()):
+                raise TimeoutError(f"tracing didn't complete within {deadline.timeout}s")
+            if self.stream:
+                with IOStream(self.client, self.stream_handle, timeout=deadline) as stream:
+                    for chunk in stream.chunks():
+                        self.file.write(chunk)
+            else:
+                self.file.write(b"]\n")
+        finally:
+            self._close()
+        return self.path
+
+    def _close(self):
+        self.client.off("Tracing.dataCollected", self._data)
+        self.client.off("Tracing.bufferUsage", self._usage)
+        self.client.off("Tracing.tracingComplete", self._complete)
+        self.file.close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def _data(self, event):
+        if not event.value:
+            return
+        # serialize the whole bucket at once, and splice it into the array
+        data = self.client.codec.dumps(event.value)
+        if isinstance(data, str):
+            data = data.encode()
+        if self.events:
+            self.file.write(b",")
+        self.file.write(data[1:-1])
+        self.events += len(event.value)
+
+    def _usage(self, event):
+        usage = event.percentFull if event.percentFull is not None else event.value
+        if usage is None:
+            return
+        if usage >= self.warn_at and self.buffer_usage < self.warn_at:
+            log.warning("trace buffer is %d%% full, events will be dropped once it fills up", usage * 100)
+        self.buffer_usage = max(self.buffer_usage, usage)
+
+    def _complete(self, event):
+        self.stream_handle = event.stream
+        self.complete.set()
@@ -1,4 +1,20 @@
+import ast
+import glob
+import hashlib
 import json
+import os
+import sys
+
+# every type in protocol.json by its qualified name, e.g. "DOM.Node"
+schema = {}
+
+# the subpackage of chrome_control the build being generated goes in, e.g.
+# "v1_3", or "" for chrome_control itself
+package = ""
+
+# the types of the domain being generated that have been written out so far,
+# which can be referred to by name rather than as a string
+defined = set()
 
 # given a json schema enum, return an equivalent python enum
 def enum(type_):
@@ -23,27 +39,86 @@ def typemap(typ):
         "object": "dict",
     }[typ]
 
+def ref_type(ref):
+    """How a type annotation refers to the type `ref`: by name if it's already
+    been defined, else as a string."""
+    return ref if ref in defined else f'"{ref}"'
+
+def property_type(p, dependencies):
+    if "$ref" in p:
+        ref = p["$ref"].split(".")
+        if len(ref) > 1:
+            dependencies.append(ref[0])
+        ptype = ref_type(p["$ref"])
+    else:
+        # TODO: handle array sub-types here
+        # TODO: handle enum sub-types above
+        ptype = typemap(p["type"])
+
+    if p.get("type") == "object" and "properties" in p:
+        # allow objects to pass as long as the spec means
+        # dict<any, any> and not a recursive object
+        print(p)
+        1/0
+
+    return ptype
+
+def decode_spec(p, domain):
+    """How a value of property `p` gets decoded off the wire: None if it can be
+    used as it is, "Domain.Type" for a generated class or enum, or [spec] for a
+    list of those."""
+    if "$ref" in p:
+        ref = p["$ref"] if "." in p["$ref"] else f'{domain}.{p["$ref"]}'
+        type_ = schema[ref]
+        if "enum" in type_:
+            return ref
+        if type_["type"] == "object":
+            # objects without properties are plain dicts
+            return ref if "properties" in type_ else None
+        return decode_spec(type_, ref.split(".")[0])
+
+    if p.get("type") == "array":
+        spec = decode_spec(p["items"], domain)
+        return [spec] if spec is not None else None
+
+    return None
+
+def qualify(spec):
+    """A decode spec that resolves to the build being generated."""
+    if not package:
+        return spec
+    if isinstance(spec, list):
+        return [qualify(spec[0])]
+    return f'{package}.{spec}'
+
+def spec_source(spec, domain):
+    """The source of a decode spec. Classes and enums that are already defined
+    are bound directly; the others (those of other domains, which are
+    imported lazily, and recursive ones) are left as "Domain.Type" strings,
+    which base.bind resolves the first time the field is read."""
+    if isinstance(spec, list):
+        return f'[{spec_source(spec[0], domain)}]'
+    spec_domain, name = spec.split(".")
+    if spec_domain == domain and name in defined:
+        return name
+    return repr(qualify(spec))
+
+def decode_specs(properties, domain):
+    specs = []
+    for p in properties:
+        spec = decode_spec(p, domain)
+        if spec is not None:
+            specs.append(f'{p["name"]!r}: {spec_source(spec, domain)}')
+
+    return '_types = {' + ', '.join(specs) + '}' if specs else None
+
 def handle_properties(properties):
     dependencies = []
     constructor_args = ["self"]
     args = []
 
     for p in properties:
-        if "$ref" in p:
-            ref = p["$ref"].split(".")
-            if len(ref) > 1:
-                dependencies.append(ref[0])
-            ptype = f'"{p["$ref"]}"'
-        else:
-            # TODO: handle array sub-types here
-            # TODO: handle enum sub-types above
-            ptype = typemap(p["type"])
-
-        if p.get("type") == "object" and "properties" in p:
-            # allow objects to pass as long as the spec means
-            # dict<any, any> and not a recursive object
-            print(p)
-            1/0
+        ptype = property_type(p, dependencies)
 
         if p.get("optional"):
             constructor_args.append(f'{p["name"]}: {ptype}=None')
@@ -57,18 +132,104 @@ def handle_properties(properties):
 
     return dependencies, constructor_args, args
 
-def object_(type_):
+def to_wire(properties, domain):
+    """The body of a to_wire method that turns an instance with these
+    properties back into a json-ready dict."""
+    def value(p):
+        if decode_spec(p, domain) is None:
+            return f'self.{p["name"]}'
+        # generated types, enums, or lists of them
+        return f'encode(self.{p["name"]})'
+
+    required = [p for p in properties if not p.get("optional")]
+    optional = [p for p in properties if p.get("optional")]
+
+    lines = ['wire = {' + ', '.join(f'"{p["name"]}": {value(p)}' for p in required) + '}']
+    for p in optional:
+        lines.append(f'if self.{p["name"]} is not None:')
+        lines.append(f'    wire["{p["name"]}"] = {value(p)}')
+    lines.append('return wire')
+
+    return '''
+    def to_wire(self):
+        ''' + '\n        '.join(lines) + '\n'
+
+def foreign_refs(properties, domain):
+    """The classes and enums of other domains that properties refer to, as
+    qualified specs, in order."""
+    refs = []
+    for p in properties:
+        spec = decode_spec(p, domain)
+        while isinstance(spec, list):
+            spec = spec[0]
+        if spec is not None and spec.split(".")[0] != domain and qualify(spec) not in refs:
+            refs.append(qualify(spec))
+    return refs
+
+def from_wire(properties, domain):
+    """The body of a from_wire classmethod that decodes a whole dict off the
+    wire into an instance, nested types and all, with the field table worked
+    out here rather than looked up at runtime."""
+    refs = foreign_refs(properties, domain)
+
+    def value(spec, v, depth=0):
+        if isinstance(spec, list):
+            x = f'x{depth}'
+            return f'[{value(spec[0], x, depth + 1)} for {x} in {v}]'
+        spec_domain, name = spec.split(".")
+        # other domains aren't imported until they're needed, see _refs
+        cls = name if spec_domain == domain else f'refs[{refs.index(qualify(spec))}]'
+        if "enum" in schema[spec]:
+            # see base.decode
+            return f'{cls}.__members__.get({v}, {v})'
+        return f'{cls}.from_wire({v})'
+
+    lines = []
+    if refs:
+        lines.append('refs = cls._refs')
+        lines.append('if refs[0].__class__ is str:')
+        lines.append('    refs = cls._refs = tuple(map(resolve, refs))')
+    lines.append('obj = cls.__new__(cls)')
+    for p in properties:
+        name = p["name"]
+        field = f'wire["{name}"]'
+        spec = decode_spec(p, domain)
+        if spec is None:
+            lines.append(f'obj.{name} = wire.get("{name}")' if p.get("optional") else f'obj.{name} = {field}')
+        elif p.get("optional"):
+            lines.append(f'obj.{name} = {value(spec, field)} if "{name}" in wire else None')
+        else:
+            lines.append(f'obj.{name} = {value(spec, field)}')
+    lines.append('return obj')
+
+    return '''
+    @classmethod
+    def from_wire(cls, wire: dict):
+        ''' + '\n        '.join(lines) + '\n'
+
+def object_(type_, domain):
     if "properties" not in type_:
         return ([], f'class {type_["id"]}: pass\n\n')
 
     props = sorted(type_["properties"], key=lambda x: x.get("optional", False))
     dependencies, constructor_args, args = handle_properties(props)
 
-    docstring = f'\n    """{type_["description"]}"""' if "description" in type_ else ""
+    header = [f'"""{type_["description"]}"""'] if "description" in type_ else []
+    header.append(f'_fields = {tuple(p["name"] for p in props)!r}')
+    header.append('__slots__ = _fields')
+    types = decode_specs(props, domain)
+    if types:
+        header.append(types)
+    refs = foreign_refs(props, domain)
+    if refs:
+        header.append(f'_refs = {tuple(refs)!r}')
+    header = '\n    '.join(header)
+
+    return (dependencies, f'''class {type_["id"]}(ChromeType):
+    {header}
 
-    return (dependencies, f'''class {type_["id"]}:{docstring}
     def __init__({', '.join(constructor_args)}):
-        ''' + '\n        '.join(args) + "\n\n")
+        ''' + '\n        '.join(args) + "\n" + to_wire(props, domain) + from_wire(props, domain) + "\n")
 
 def array(type_):
     # TODO: convert to ta tuple if there is minitems and maxitems?
@@ -79,7 +240,7 @@ def array(type_):
     if "type" in type_["items"]:
         eltype = typemap(type_["items"]["type"])
     else:
-        eltype = f'"{type_["items"]["$ref"]}"'
+        eltype = ref_type(type_["items"]["$ref"])
 
     if "description" in type_:
         out.append(f'# {type_["description"]}\n')
@@ -99,60 +260,373 @@ def simple(type_):
 
     return "".join(out)
 
+def result(cmd, domain):
+    name = f'{cmd["name"]}Result'
+
+    dependencies = []
+    # the result is kept in the ChromeResult, so there's nothing to store
+    fields = ["__slots__ = ()", f'_fields = {tuple(p["name"] for p in cmd["returns"])!r}']
+    for p in cmd["returns"]:
+        ptype = property_type(p, dependencies)
+        if "description" in p:
+            fields.append(f'# {p["description"]}')
+        fields.append(f'{p["name"]}: {ptype}')
+
+    types = decode_specs(cmd["returns"], domain)
+    if types:
+        fields.append(types)
+
+    body = '\n    ' + '\n    '.join(fields)
+
+    return (dependencies, f'''class {name}(ChromeResult):{body}
+
+''')
+
 def command(cmd, domain):
     name = cmd["name"]
-    docstr = f'\n    """{cmd["description"]}"""\n' if "description" in cmd else ''
-
     props = sorted(cmd.get("parameters", []), key=lambda x: x.get("optional", False))
     dependencies, constructor_args, args = handle_properties(props)
 
+    header = [f'"""{cmd["description"]}"""'] if "description" in cmd else []
+    header.append(f'_fields = {tuple(p["name"] for p in props)!r}')
+    header.append('__slots__ = _fields')
+    if "returns" in cmd:
+        header.append(f'_result = {name}Result')
+    header = '\n    '.join(header)
+
+    # commands without params use ChromeCommand.to_wire
     if args:
-        argcode = '\n        ' + '\n        '.join(args) + "\n\n"
+        argcode = '\n        ' + '\n        '.join(args) + "\n" + to_wire(props, domain) + "\n"
     else:
         argcode = " pass"
 
-    return f'''class {name}(ChromeCommand):{docstr}
+    return f'''class {name}(ChromeCommand):
+    {header}
+
     def __init__({", ".join(constructor_args)}):{argcode}
 
 '''
 
-if __name__=="__main__":
-    protocol = json.loads(open("protocol.json", ).read())
+def event(evt, domain):
+    name = evt["name"]
+    docstr = f'\n    """{evt["description"]}"""' if "description" in evt else ''
+
+    dependencies = []
+    # the params are kept in the ChromeEvent, so there's nothing to store
+    fields = ["__slots__ = ()", f'_fields = {tuple(p["name"] for p in evt.get("parameters", []))!r}']
+    for p in evt.get("parameters", []):
+        ptype = property_type(p, dependencies)
+        if "description" in p:
+            fields.append(f'# {p["description"]}')
+        fields.append(f'{p["name"]}: {ptype}')
+
+    types = decode_specs(evt.get("parameters", []), domain)
+    if types:
+        fields.append(types)
+
+    body = '\n    ' + '\n    '.join(fields)
+
+    return (dependencies, f'''class {name}(ChromeEvent):{docstr}{body}
+
+''')
+
+def ordered(types, domain):
+    """`types` in an order where each comes after the types of its own domain
+    that it refers to, so they can be referred to by name. Recursive types
+    can't be, and otherwise the order of the protocol file is kept."""
+    by_id = {t["id"]: t for t in types}
+    out = []
+    seen = set()
+
+    def visit(type_):
+        if type_["id"] in seen:
+            return
+        seen.add(type_["id"])
+        for ref in refs(type_):
+            if ref.startswith(f'{domain}.'):
+                ref = ref.split(".")[1]
+            if ref in by_id:
+                visit(by_id[ref])
+        out.append(type_)
+
+    for type_ in types:
+        visit(type_)
+    return out
+
+def module(domain):
+    """The source of the generated module for `domain`."""
+    name = domain["domain"]
+    types = []
+    commands = []
+    events = []
+    dependencies = set()
+    defined.clear()
+    for type_ in ordered(domain.get("types", []), name):
+        if "enum" in type_: types.append(enum(type_))
+        elif type_["type"] in ["string", "integer", "number"]:
+            types.append(simple(type_))
+        elif type_["type"] == "object":
+            deps, typeobj = object_(type_, name)
+            dependencies.update(deps)
+            types.append(typeobj)
+        # TODO array
+        elif type_["type"] == "array": types.append(array(type_))
+        else: 1/0
+        defined.add(type_["id"])
+
+    for cmd in domain.get("commands", []):
+        if "returns" in cmd:
+            deps, resultobj = result(cmd, name)
+            dependencies.update(deps)
+            commands.append(resultobj)
+        commands.append(command(cmd, name))
+
+    for evt in domain.get("events", []):
+        deps, eventobj = event(evt, name)
+        dependencies.update(deps)
+        events.append(eventobj)
+
+    base = "..base" if package else ".base"
+    out = [f"""from enum import Enum
+from typing import TYPE_CHECKING, Any, List
+
+from {base} import ChromeCommand, ChromeEvent, ChromeResult, ChromeType, encode, resolve
+
+"""]
+
+    # other domains are only referred to in annotations, and decoding
+    # imports them when it needs them, so don't import them up front; that
+    # would drag in most of the protocol with every domain
+    if dependencies:
+        out.append('if TYPE_CHECKING:\n')
+    for dep in sorted(dependencies):
+        out.append(f'    from . import {dep}\n')
+
+    # types come out in dependency order, see ordered()
+    out.append('\n')
+    out.extend(types)
+    out.extend(commands)
+    out.extend(events)
+
+    return ''.join(out)
+
+def refs(value):
+    """Every $ref in a piece of the schema."""
+    if isinstance(value, dict):
+        if "$ref" in value:
+            yield value["$ref"]
+        for v in value.values():
+            yield from refs(v)
+    elif isinstance(value, list):
+        for v in value:
+            yield from refs(v)
+
+def domain_hash(domain, generator):
+    """A hash of everything the module for `domain` is generated from: its own
+    schema, the types it uses from other domains (their decode specs depend on
+    them), and the generator itself."""
+    name = domain["domain"]
+    foreign = {}
+    todo = [r for r in refs(domain) if "." in r]
+    while todo:
+        ref = todo.pop()
+        ref_domain = ref.split(".")[0]
+        if ref in foreign or ref_domain == name:
+            continue
+        foreign[ref] = schema[ref]
+        todo.extend(r if "." in r else f'{ref_domain}.{r}' for r in refs(schema[ref]))
+
+    h = hashlib.sha1(generator)
+    h.update(json.dumps([package, domain, foreign], sort_keys=True).encode())
+    return h.hexdigest()
+
+def index_type(p, domain):
+    """The type of a property in the index: a json type, a qualified
+    "Domain.Type", or [type] for a list."""
+    if "$ref" in p:
+        return p["$ref"] if "." in p["$ref"] else f'{domain}.{p["$ref"]}'
+    if p["type"] == "array":
+        return [index_type(p["items"], domain)]
+    return p["type"]
+
+def index(protocol, source_hash):
+    """The source of the build's protocol.py, a summary of its protocol file
+    that can be imported without parsing it."""
+    def props(ps, domain):
+        return tuple((p["name"], index_type(p, domain), p.get("optional", False)) for p in ps)
+
+    types = {}
+    commands = {}
+    events = {}
     for domain in protocol["domains"]:
         name = domain["domain"]
-        types = []
-        commands = []
-        dependencies = set()
         for type_ in domain.get("types", []):
-            if "enum" in type_: types.append(enum(type_))
-            elif type_["type"] in ["string", "integer", "number"]:
-                types.append(simple(type_))
-            elif type_["type"] == "object":
-                deps, typeobj = object_(type_)
-                dependencies.update(deps)
-                types.append(typeobj)
-            # TODO array
-            elif type_["type"] == "array": types.append(array(type_))
-            else: 1/0
-
+            if "enum" in type_:
+                types[f'{name}.{type_["id"]}'] = tuple(type_["enum"])
+            else:
+                types[f'{name}.{type_["id"]}'] = index_type(type_, name)
         for cmd in domain.get("commands", []):
-            commands.append(command(cmd, domain["domain"]))
+            commands[f'{name}.{cmd["name"]}'] = (props(cmd.get("parameters", []), name), props(cmd.get("returns", []), name))
+        for evt in domain.get("events", []):
+            events[f'{name}.{evt["name"]}'] = props(evt.get("parameters", []), name)
 
-        mod = open(f"chrome_control/{name}.py", 'w')
-        mod.write("""from enum import Enum
-from typing import Any, List
+    def entries(d):
+        return ''.join(f'    {k!r}: {v!r},\n' for k, v in d.items())
 
-from .base import ChromeCommand
+    version = (protocol["version"]["major"], protocol["version"]["minor"])
+    return f'''# generated by gen.py, don't edit it by hand.
+#
+# A type is a json type ("string", "integer", "number", "boolean", "object" or
+# "any"), a qualified "Domain.Type", or [type] for a list. Params and returns
+# are tuples of (name, type, optional).
 
-""")
+# a hash of the protocol file and gen.py this was built from
+source = {source_hash!r}
 
-        for dep in dependencies:
-            mod.write(f'from . import {dep}\n')
+version = {version!r}
 
-        # TODO: objects have to be defined before being referenced fffuuuuu
-        #       so if class A has a parameter of type B, type B must appear
-        #       in the source file above type A
-        mod.write('\n')
-        mod.write(''.join(types))
+# "Domain.Type" -> its underlying type, or a tuple of its values for enums
+types = {{
+{entries(types)}}}
 
-        mod.write(''.join(commands))
+# "Domain.command" -> (params, returns)
+commands = {{
+{entries(commands)}}}
+
+# "Domain.event" -> params
+events = {{
+{entries(events)}}}
+'''
+
+HASH_PREFIX = "# schema hash: "
+
+def generated_hash(path):
+    """The hash the module at `path` was generated from, if there is one."""
+    try:
+        with open(path) as f:
+            line = f.readline()
+    except FileNotFoundError:
+        return None
+    return line[len(HASH_PREFIX):].strip() if line.startswith(HASH_PREFIX) else None
+
+def built_version(path, source_hash):
+    """The protocol version of the build whose protocol.py is at `path`, if it
+    was generated from `source_hash`. Only the top of the file is read."""
+    try:
+        with open(path) as f:
+            head = [f.readline() for _ in range(12)]
+    except FileNotFoundError:
+        return None
+    if f'source = {source_hash!r}\n' not in head:
+        return None
+    for line in head:
+        if line.startswith("version = "):
+            return ".".join(ast.literal_eval(line[len("version = "):]))
+    return None
+
+def build_name(version):
+    """The subpackage a protocol version's build goes in, e.g. "v1_3"."""
+    return "v" + version.replace(".", "_")
+
+def package_init(domains):
+    """The source of a build subpackage's __init__.py, which imports its
+    domains lazily, like chrome_control's own."""
+    names = ''.join(f'    {d!r},\n' for d in sorted(domains))
+    return f'''# generated by gen.py, don't edit it by hand.
+import importlib
+
+_domains = {{
+{names}}}
+
+__all__ = sorted(_domains)
+
+def __getattr__(name):
+    if name in _domains:
+        return importlib.import_module(f'.{{name}}', __name__)
+    raise AttributeError(f'module {{__name__!r}} has no attribute {{name!r}}')
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+'''
+
+def generate(protocol, generator, source_hash, force=False):
+    """Generate the build for `protocol`, the parsed protocol file, into the
+    subpackage `package`."""
+    out = os.path.join("chrome_control", package)
+    index_path = os.path.join(out, "protocol.py")
+
+    schema.clear()
+    for domain in protocol["domains"]:
+        for type_ in domain.get("types", []):
+            schema[f'{domain["domain"]}.{type_["id"]}'] = type_
+
+    os.makedirs(out, exist_ok=True)
+    if package:
+        with open(os.path.join(out, "__init__.py"), 'w') as f:
+            f.write(package_init(d["domain"] for d in protocol["domains"]))
+
+    # only rewrite the modules whose part of the schema changed
+    for domain in protocol["domains"]:
+        mod_path = os.path.join(out, f'{domain["domain"]}.py')
+        h = domain_hash(domain, generator)
+        if not force and generated_hash(mod_path) == h:
+            continue
+        print(f'generating {mod_path}')
+        with open(mod_path, 'w') as mod:
+            mod.write(f'{HASH_PREFIX}{h}\n')
+            mod.write(module(domain))
+
+    with open(index_path, 'w') as f:
+        f.write(index(protocol, source_hash))
+
+def main(paths, force=False):
+    """Generate a build for each protocol file. The first one goes in
+    chrome_control itself, and is what gets used when Chrome speaks a version
+    there's no build for; the others each go in a subpackage named after
+    their version."""
+    global package
+
+    with open(__file__, "rb") as f:
+        generator = f.read()
+
+    builds = {}
+    for i, path in enumerate(paths):
+        with open(path, "rb") as f:
+            source = f.read()
+        # a build's package is where it is, so it doesn't need hashing
+        source_hash = hashlib.sha1(generator + source).hexdigest()
+
+        # nothing has changed since the last run, so don't even parse it:
+        # the version comes from the build
+        version = None
+        if not force:
+            candidates = glob.glob(os.path.join("chrome_control", "v*", "protocol.py")) if i else [os.path.join("chrome_control", "protocol.py")]
+            for candidate in candidates:
+                version = built_version(candidate, source_hash)
+                if version is not None:
+                    break
+        protocol = None
+        if version is None:
+            protocol = json.loads(source)
+            version = f'{protocol["version"]["major"]}.{protocol["version"]["minor"]}'
+
+        if version in builds:
+            raise SystemExit(f'{path}: there is already a build for protocol version {version}')
+        builds[version] = package = build_name(version) if i else ""
+        if protocol is not None:
+            generate(protocol, generator, source_hash, force)
+
+    entries = ''.join(f'    {v!r}: {p!r},\n' for v, p in builds.items())
+    with open("chrome_control/builds.py", 'w') as f:
+        f.write(f'''# generated by gen.py, don't edit it by hand.
+
+# protocol version -> the subpackage of chrome_control generated from it, ""
+# being chrome_control itself. See Discovery.build.
+builds = {{
+{entries}}}
+''')
+
+if __name__=="__main__":
+    args = sys.argv[1:]
+    force = "--force" in args
+    main([a for a in args if a != "--force"] or ["protocol.json"], force)
@@ -1,16 +1,13 @@
-import time
-
 from chrome_control import Chrome, Page, Runtime
 
-c = Chrome()
-c.do(Page.navigate("http://adhocteam.us/our-team"))
+c = Chrome(debug=True)
+c.do(Page.enable())
 
 # if we don't wait for the page to load, then we can run the script too
-# early and get an empty array.
-#
-# TODO a great next step would be to figure out how to receive pageLoad
-#      event from Page and only run the command at that time
-time.sleep(2)
+# early and get an empty array. Listening starts before navigating, so a
+# quick load isn't missed.
+with c.expect("Page.loadEventFired", timeout=30):
+    c.do(Page.navigate("http://adhocteam.us/our-team"))
 
 cmd = '[].map.call(document.querySelectorAll("h3.centered"), n => n.textContent)'
 c.do(Runtime.evaluate(cmd, returnByValue=True))
@@ -0,0 +1,96 @@
+import json
+
+import pytest
+
+from chrome_control import heap
+from chrome_control.heap import Aggregate, HeapSnapshot
+
+NODE_TYPES = ["hidden", "array", "string", "object", "code", "closure", "regexp", "number", "native", "synthetic"]
+EDGE_TYPES = ["context", "element", "property", "internal", "hidden", "shortcut", "weak"]
+STRINGS = ["", "Foo", "Bar", "Baz", "Qux", "a"]
+NODE_FIELDS = ["type", "name", "id", "self_size", "edge_count", "trace_node_id"]
+EDGE_FIELDS = ["type", "name_or_index", "to_node"]
+
+# node: (type, name, self_size, [(edge type, to node)])
+#
+#   root ─> Foo(1) ─> Foo(3) ─> Baz(5)
+#     │       └─────────┐
+#     └───> Bar(2) ─> Baz(4)
+#             └ ─weak─> Qux(6)
+GRAPH = [
+    ("synthetic", "", 0, [("property", 1), ("property", 2)]),
+    ("object", "Foo", 100, [("property", 3), ("property", 4)]),
+    ("object", "Bar", 50, [("property", 4), ("weak", 6)]),
+    ("object", "Foo", 30, [("property", 5)]),
+    ("object", "Baz", 20, []),
+    ("object", "Baz", 10, []),
+    ("object", "Qux", 7, []),
+]
+
+def write_snapshot(path, graph):
+    nodes, edges = [], []
+    for i, (type_, name, size, out) in enumerate(graph):
+        nodes += [NODE_TYPES.index(type_), STRINGS.index(name), i * 2 + 1, size, len(out), 0]
+        for edge_type, to in out:
+            edges += [EDGE_TYPES.index(edge_type), STRINGS.index("a"), to * len(NODE_FIELDS)]
+    snapshot = {
+        "snapshot": {
+            "meta": {
+                "node_fields": NODE_FIELDS,
+                "node_types": [NODE_TYPES, "string", "number", "number", "number", "number"],
+                "edge_fields": EDGE_FIELDS,
+                "edge_types": [EDGE_TYPES, "string_or_number", "node"],
+            },
+            "node_count": len(graph),
+            "edge_count": len(edges) // len(EDGE_FIELDS),
+        },
+        "nodes": nodes,
+        "edges": edges,
+        "strings": STRINGS,
+    }
+    with open(path, "w") as f:
+        json.dump(snapshot, f, indent=1)
+    return str(path)
+
+@pytest.fixture
+def snapshot(tmp_path):
+    return HeapSnapshot(write_snapshot(tmp_path / "graph.heapsnapshot", GRAPH))
+
+def test_parse_in_chunks(tmp_path, monkeypatch):
+    monkeypatch.setattr(heap, "CHUNK_SIZE", 5)
+    path = write_snapshot(tmp_path / "graph.heapsnapshot", GRAPH)
+    with open(path) as f:
+        whole = json.load(f)
+    s = HeapSnapshot(path)
+    assert list(s.nodes) == whole["nodes"]
+    assert list(s.edges) == whole["edges"]
+    assert s.strings == STRINGS
+    assert s.node_count == len(GRAPH)
+
+def test_dominators(snapshot):
+    # Baz(4) is reached through both Foo(1) and Bar(2), so only the root
+    # dominates it; Qux(6) is only reachable through a weak edge
+    assert list(snapshot.dominators()) == [0, 0, 0, 1, 0, 3, -1]
+
+def test_retained_sizes(snapshot):
+    assert list(snapshot.retained_sizes()) == [210, 140, 50, 40, 20, 10, 0]
+
+def test_constructors(snapshot):
+    classes = {name: (a.count, a.self_size, a.retained_size) for name, a in snapshot.constructors().items()}
+    assert classes == {
+        "(synthetic)": (1, 0, 210),
+        # Foo(3) is retained by Foo(1), so it only counts once, through it
+        "Foo": (2, 130, 140),
+        "Bar": (1, 50, 50),
+        # Baz(5) is retained by a Foo rather than a Baz, so it does count
+        "Baz": (2, 30, 30),
+    }
+
+def test_diff(snapshot, tmp_path):
+    # Foo(3) no longer retains Baz(5)
+    smaller = GRAPH[:3] + [("object", "Foo", 30, [])] + GRAPH[4:]
+    base = HeapSnapshot(write_snapshot(tmp_path / "base.heapsnapshot", smaller))
+    deltas = {name: (a.count, a.self_size, a.retained_size) for name, a in snapshot.diff(base).items()}
+    # the base's Baz(5) isn't reachable at all
+    assert deltas == {"(synthetic)": (0, 0, 10), "Foo": (0, 0, 10), "Baz": (1, 10, 10)}
+    assert isinstance(snapshot.diff(base)["Foo"], Aggregate)